@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark für generierte Datenbank-MCP-Server
+
+Dieses Skript erzeugt einen Server aus der Vorlage "database" und misst den Durchsatz
+(Zeilen pro Sekunde) beim Einfügen und Abfragen. Als Vergleich dient der frühere
+Zugriff mit einer neuen Verbindung und einem Commit pro Aufruf. Zusätzlich werden
+die Aufrufe über TCP gemessen, so wie Clients den Server verwenden.
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import sqlite3
+import argparse
+import tempfile
+import importlib.util
+from pathlib import Path
+
+# Füge das Verzeichnis des Generators zum Pfad hinzu
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BASE_DIR / "src" / "mcp"))
+
+from generator_server import MCPServerGenerator
+
+
+def load_server(generator: MCPServerGenerator, servers_dir: str):
+    """
+    Erzeuge einen Datenbank-Server und lade seine Klasse.
+
+    Args:
+        generator: Der MCP-Server-Generator
+        servers_dir: Verzeichnis für generierte Server
+
+    Returns:
+        Instanz des generierten Servers
+    """
+    result = generator._create_server_from_template({"name": "Benchmark", "template": "database"})
+    server_id = result["server_id"]
+
+    spec = importlib.util.spec_from_file_location(
+        "benchmark_server", os.path.join(servers_dir, server_id, "server.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    server = module.BenchmarkMCPServer(server_id=server_id)
+    server.servers_dir = servers_dir
+    return server
+
+
+def baseline_insert(db_path: str, rows: list) -> None:
+    """
+    Füge Zeilen wie bisher mit einer Verbindung und einem Commit pro Zeile ein.
+
+    Args:
+        db_path: Pfad zur Datenbank
+        rows: Einzufügende Zeilen
+    """
+    for row in rows:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        columns = list(row.keys())
+        placeholders = ", ".join(["?" for _ in columns])
+        cursor.execute(f"INSERT INTO items ({', '.join(columns)}) VALUES ({placeholders})", list(row.values()))
+        conn.commit()
+        conn.close()
+
+
+def baseline_query(db_path: str) -> list:
+    """
+    Frage alle Zeilen wie bisher ab.
+
+    Args:
+        db_path: Pfad zur Datenbank
+
+    Returns:
+        Die Zeilen
+    """
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    cursor.execute("SELECT * FROM items")
+
+    results = []
+    for row in cursor.fetchall():
+        result = {}
+        for key in row.keys():
+            result[key] = row[key]
+        results.append(result)
+
+    conn.close()
+    return results
+
+
+def measure(label: str, rows: int, function) -> None:
+    """
+    Miss den Durchsatz einer Funktion und gib ihn aus.
+
+    Args:
+        label: Bezeichnung der Messung
+        rows: Anzahl der verarbeiteten Zeilen
+        function: Die zu messende Funktion
+    """
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {rows / elapsed:>12,.0f} Zeilen/s")
+
+
+async def call_over_socket(reader, writer, request_id: int, function_name: str, parameters: dict) -> dict:
+    """
+    Rufe eine Funktion über die TCP-Verbindung auf.
+
+    Args:
+        reader: StreamReader der Verbindung
+        writer: StreamWriter der Verbindung
+        request_id: ID der Anfrage
+        function_name: Name der Funktion
+        parameters: Parameter der Funktion
+
+    Returns:
+        Das Ergebnis der Funktion
+
+    Raises:
+        RuntimeError: Wenn der Server einen Fehler meldet
+    """
+    request = {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "mcp.call_function",
+        "params": {"function_name": function_name, "parameters": parameters},
+    }
+    writer.write(json.dumps(request).encode() + b"\n")
+    await writer.drain()
+    response = json.loads(await reader.readline())
+    if "error" in response:
+        raise RuntimeError(response["error"]["message"])
+    return response["result"]
+
+
+async def benchmark_socket(server, rows: list) -> None:
+    """
+    Miss Einfügen und Abfragen über TCP.
+
+    Args:
+        server: Der generierte Server
+        rows: Einzufügende Zeilen
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        server.host, server.port = sock.getsockname()
+
+    server_task = asyncio.create_task(server.start())
+    for _ in range(100):
+        try:
+            reader, writer = await asyncio.open_connection(server.host, server.port, limit=2 ** 26)
+            break
+        except ConnectionError:
+            await asyncio.sleep(0.05)
+    else:
+        raise RuntimeError("Server nicht erreichbar")
+
+    try:
+        start = time.perf_counter()
+        result = await call_over_socket(reader, writer, 1, "insert_many", {"table_name": "items", "rows": rows})
+        elapsed = time.perf_counter() - start
+        print(f"{'insert_many über TCP (eine Anfrage)':<40} {result['inserted'] / elapsed:>12,.0f} Zeilen/s")
+
+        start = time.perf_counter()
+        cursor, count, request_id = None, 0, 2
+        while True:
+            page = await call_over_socket(
+                reader, writer, request_id, "query_data", {"table_name": "items", "limit": 1000, "cursor": cursor}
+            )
+            count += len(page["results"])
+            cursor, request_id = page["next_cursor"], request_id + 1
+            if cursor is None:
+                break
+        elapsed = time.perf_counter() - start
+        print(f"{'query_data über TCP (Seiten zu 1000)':<40} {count / elapsed:>12,.0f} Zeilen/s")
+    finally:
+        writer.close()
+        await writer.wait_closed()
+        server_task.cancel()
+        await asyncio.gather(server_task, return_exceptions=True)
+
+
+def main():
+    """
+    Main function.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark für generierte Datenbank-MCP-Server")
+    parser.add_argument("--rows", type=int, default=2000, help="Anzahl der Zeilen")
+    args = parser.parse_args()
+
+    rows = [{"name": f"item-{i}", "value": i} for i in range(args.rows)]
+    columns = [{"name": "name", "type": "TEXT"}, {"name": "value", "type": "INTEGER"}]
+
+    with tempfile.TemporaryDirectory() as servers_dir:
+        server = load_server(MCPServerGenerator(servers_dir=servers_dir), servers_dir)
+        server.call_function("create_table", {"table_name": "items", "columns": columns})
+
+        baseline_db = os.path.join(servers_dir, "baseline.db")
+        conn = sqlite3.connect(baseline_db)
+        conn.execute("CREATE TABLE items (name TEXT, value INTEGER)")
+        conn.close()
+
+        print("Vorher")
+        measure("insert_data (Verbindung pro Zeile)", args.rows, lambda: baseline_insert(baseline_db, rows))
+        measure("query_data (alle Zeilen)", args.rows, lambda: baseline_query(baseline_db))
+
+        print("Nachher")
+        measure(
+            "insert_data (Verbindungspool)",
+            args.rows,
+            lambda: [server.call_function("insert_data", {"table_name": "items", "data": row}) for row in rows]
+        )
+        measure(
+            "insert_many (eine Transaktion)",
+            args.rows,
+            lambda: server.call_function("insert_many", {"table_name": "items", "rows": rows})
+        )
+
+        def query_pages():
+            cursor = None
+            while True:
+                page = server.call_function(
+                    "query_data", {"table_name": "items", "limit": 1000, "cursor": cursor}
+                )
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    break
+
+        measure("query_data (Seiten zu 1000 Zeilen)", args.rows * 2, query_pages)
+
+        print("Über TCP")
+        asyncio.run(benchmark_socket(server, rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,18 @@ die Konfigurationen validiert werden.
 """
 
 import os
+import re
+import copy
 import json
+import time
 import logging
+import threading
+import weakref
+import functools
 import yaml
-from typing import Dict, List, Any, Optional, Union, Callable, Type, TypeVar, Generic
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Union, Callable, Type, TypeVar, Generic, Tuple
 
 # Konfiguriere Logging
 logging.basicConfig(
@@ -38,12 +46,222 @@ class ConfigValidationError(Exception):
         super().__init__(message)
 
 
+# Python-Typen für die Typangaben im Schema
+_SCHEMA_TYPES = {
+    'string': str,
+    'number': (int, float),
+    'integer': int,
+    'boolean': bool,
+    'array': list,
+    'object': dict,
+    'null': type(None),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> "re.Pattern":
+    """
+    Kompiliere ein Muster und speichere es zwischen.
+    
+    Args:
+        pattern: Muster
+        
+    Returns:
+        Kompiliertes Muster
+    """
+    return re.compile(pattern)
+
+
+def _compile_type_check(expected_type: str) -> Callable[[Any], bool]:
+    """
+    Erstelle eine Typprüfung für eine Typangabe.
+    
+    Args:
+        expected_type: Erwarteter Typ
+        
+    Returns:
+        Funktion, die True liefert, wenn ein Wert den erwarteten Typ hat
+    """
+    python_type = _SCHEMA_TYPES.get(expected_type)
+    if python_type is None:
+        return lambda value: False
+    return lambda value: isinstance(value, python_type)
+
+
+def _compile_field(key: str, value_schema: Dict[str, Any]) -> Callable[[Dict[str, Any], Dict[str, Any]], None]:
+    """
+    Kompiliere die Prüfung eines Feldes.
+    
+    Args:
+        key: Name des Feldes
+        value_schema: Schema des Feldes
+        
+    Returns:
+        Funktion, die die Konfiguration prüft und Fehler in ein Dict einträgt
+    """
+    required = value_schema.get('required', False)
+    value_type = value_schema.get('type')
+    type_check = _compile_type_check(value_type) if value_type else None
+    enum = value_schema.get('enum')
+    has_enum = 'enum' in value_schema
+    minimum = value_schema.get('min')
+    has_min = 'min' in value_schema
+    maximum = value_schema.get('max')
+    has_max = 'max' in value_schema
+    pattern = value_schema.get('pattern')
+    regex = _compile_pattern(pattern) if 'pattern' in value_schema else None
+    
+    properties = []
+    for sub_key, sub_schema in value_schema.get('properties', {}).items():
+        sub_type = sub_schema.get('type')
+        properties.append((
+            sub_key,
+            sub_schema.get('required', False),
+            sub_type,
+            _compile_type_check(sub_type) if sub_type else None
+        ))
+    has_properties = 'properties' in value_schema
+    
+    def check(config: Dict[str, Any], errors: Dict[str, Any]) -> None:
+        if key not in config:
+            if required:
+                errors[key] = f"Pflichtfeld {key} fehlt"
+            return
+        
+        value = config[key]
+        
+        if type_check is not None and not type_check(value):
+            errors[key] = f"Ungültiger Typ für {key}: {type(value).__name__}, erwartet: {value_type}"
+            return
+        
+        if has_enum and value not in enum:
+            errors[key] = f"Ungültiger Wert für {key}: {value}, erwartet: {enum}"
+            return
+        
+        if has_min and value < minimum:
+            errors[key] = f"Wert für {key} zu klein: {value}, Minimum: {minimum}"
+            return
+        
+        if has_max and value > maximum:
+            errors[key] = f"Wert für {key} zu groß: {value}, Maximum: {maximum}"
+            return
+        
+        if regex is not None and not regex.match(value):
+            errors[key] = f"Wert für {key} entspricht nicht dem Muster: {pattern}"
+            return
+        
+        if has_properties and isinstance(value, dict):
+            sub_errors = {}
+            for sub_key, sub_required, sub_type, sub_check in properties:
+                if sub_key not in value:
+                    if sub_required:
+                        sub_errors[sub_key] = f"Pflichtfeld {sub_key} fehlt"
+                    continue
+                
+                sub_value = value[sub_key]
+                if sub_check is not None and not sub_check(sub_value):
+                    sub_errors[sub_key] = f"Ungültiger Typ für {sub_key}: {type(sub_value).__name__}, erwartet: {sub_type}"
+            
+            if sub_errors:
+                errors[key] = sub_errors
+    
+    return check
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Kompiliere ein Schema in eine Validierungsfunktion.
+    
+    Das Schema wird einmal ausgewertet; reguläre Ausdrücke werden dabei kompiliert.
+    
+    Args:
+        schema: Schema für die Validierung
+        
+    Returns:
+        Funktion, die eine Konfiguration prüft und die gefundenen Fehler liefert
+    """
+    checks = [_compile_field(key, value_schema) for key, value_schema in schema.items()]
+    
+    def validate(config: Dict[str, Any]) -> Dict[str, Any]:
+        errors: Dict[str, Any] = {}
+        for check in checks:
+            check(config, errors)
+        return errors
+    
+    return validate
+
+
+def freeze(value: Any) -> Any:
+    """
+    Erstelle eine unveränderliche Kopie eines Konfigurationswertes.
+    
+    Dicts werden zu schreibgeschützten Mappings, Listen zu Tupeln.
+    
+    Args:
+        value: Wert, der eingefroren werden soll
+        
+    Returns:
+        Unveränderliche Kopie
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+class ConfigSnapshot:
+    """
+    Unveränderlicher Stand einer Konfiguration.
+    
+    Ein Snapshot wird bei jedem Laden einmal erzeugt und kann danach ohne
+    Sperren von beliebig vielen Tasks und Threads gelesen werden.
+    """
+    
+    __slots__ = ('name', 'version', 'data', 'loaded_at')
+    
+    def __init__(self, name: str, version: int, data: Dict[str, Any]):
+        """
+        Initialisiere den Snapshot.
+        
+        Args:
+            name: Name der Konfiguration
+            version: Version der Konfiguration
+            data: Inhalt der Konfiguration
+        """
+        self.name = name
+        self.version = version
+        self.data = freeze(data)
+        self.loaded_at = time.time()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Hole einen Wert aus dem Snapshot.
+        
+        Args:
+            key: Schlüssel
+            default: Standardwert, falls der Schlüssel fehlt
+            
+        Returns:
+            Wert oder Standardwert
+        """
+        return self.data.get(key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.data
+
+
 class ConfigManager:
     """
     Manager für Konfigurationen aus verschiedenen Quellen.
     
     Diese Klasse bietet Methoden zum Laden, Validieren und Speichern von Konfigurationen
-    aus verschiedenen Quellen wie Dateien und Umgebungsvariablen.
+    aus verschiedenen Quellen wie Dateien und Umgebungsvariablen. Geladene
+    Konfigurationsdateien können überwacht und bei Änderungen automatisch neu
+    geladen werden.
     """
     
     def __init__(self, config_dir: str = "config"):
@@ -56,46 +274,160 @@ class ConfigManager:
         self.config_dir = config_dir
         self.configs = {}
         
+        # Versionen, Snapshots und Quelldateien der geladenen Konfigurationen
+        self._versions: Dict[str, int] = {}
+        self._snapshots: Dict[str, ConfigSnapshot] = {}
+        self._sources: Dict[str, Dict[str, Any]] = {}
+        
+        # Kompilierte Validatoren und typisierte Ansichten. Schemas sind Dicts und damit
+        # nicht hashbar; der Eintrag hält das Schema, damit seine id nicht wiederverwendet wird.
+        self._schemas: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+        self._validators: "OrderedDict[int, Tuple[Dict[str, Any], Callable[[Dict[str, Any]], Dict[str, Any]]]]" = OrderedDict()
+        self._typed: "weakref.WeakKeyDictionary[ConfigSchema, Dict[str, Tuple[int, Any]]]" = weakref.WeakKeyDictionary()
+        
+        # Listener für Änderungen: Name -> Liste von Callbacks
+        self._listeners: Dict[str, List[Callable[[str, Optional[Dict[str, Any]], Dict[str, Any]], None]]] = {}
+        
+        self._lock = threading.RLock()
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+        
         # Erstelle das Konfigurationsverzeichnis, falls es nicht existiert
         os.makedirs(config_dir, exist_ok=True)
     
-    def load_json_config(self, name: str, default: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _file_signature(path: str) -> Optional[Tuple[int, int, int]]:
         """
-        Lade eine JSON-Konfigurationsdatei.
+        Ermittle eine Signatur, die sich bei jeder Änderung einer Datei ändert.
         
         Args:
-            name: Name der Konfigurationsdatei (ohne .json-Erweiterung)
-            default: Standardkonfiguration, falls die Datei nicht existiert
+            path: Pfad zur Datei
+            
+        Returns:
+            Signatur oder None, wenn die Datei nicht existiert
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    
+    @staticmethod
+    def _read_file(path: str, file_format: str) -> Dict[str, Any]:
+        """
+        Lese und parse eine Konfigurationsdatei.
+        
+        Args:
+            path: Pfad zur Datei
+            file_format: Format der Datei (json oder yaml)
             
         Returns:
             Dict mit der Konfiguration
         """
-        config_file = os.path.join(self.config_dir, f"{name}.json")
+        with open(path, 'r') as f:
+            if file_format == 'yaml':
+                return yaml.safe_load(f)
+            return json.load(f)
+    
+    def _load_config(self, name: str, config_file: str, file_format: str, default: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Lade eine Konfigurationsdatei und merke sie für die Überwachung vor.
         
+        Args:
+            name: Name der Konfiguration
+            config_file: Pfad zur Konfigurationsdatei
+            file_format: Format der Datei (json oder yaml)
+            default: Standardkonfiguration, falls die Datei nicht existiert; es wird
+                eine Kopie übernommen
+            
+        Returns:
+            Dict mit der Konfiguration
+        """
         if name in self.configs:
             return self.configs[name]
         
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                self.configs[name] = config
-                return config
-            except Exception as e:
-                logger.error(f"Fehler beim Laden der Konfigurationsdatei {config_file}: {e}")
-                if default is not None:
-                    logger.info(f"Verwende Standardkonfiguration für {name}")
-                    self.configs[name] = default
-                    return default
-                raise
-        else:
-            if default is not None:
-                logger.info(f"Konfigurationsdatei {config_file} nicht gefunden. Verwende Standardkonfiguration.")
-                self.configs[name] = default
-                return default
+        with self._lock:
+            if name in self.configs:
+                return self.configs[name]
+            
+            self._sources[name] = {
+                "path": config_file,
+                "format": file_format,
+                "signature": self._file_signature(config_file)
+            }
+            
+            if os.path.exists(config_file):
+                try:
+                    config = self._read_file(config_file, file_format)
+                    self._publish(name, config, notify=False)
+                    return config
+                except Exception as e:
+                    logger.error(f"Fehler beim Laden der Konfigurationsdatei {config_file}: {e}")
+                    if default is not None:
+                        logger.info(f"Verwende Standardkonfiguration für {name}")
+                        config = copy.deepcopy(default)
+                        self._publish(name, config, notify=False)
+                        return config
+                    del self._sources[name]
+                    raise
             else:
-                logger.error(f"Konfigurationsdatei {config_file} nicht gefunden und keine Standardkonfiguration angegeben.")
-                raise FileNotFoundError(f"Konfigurationsdatei {config_file} nicht gefunden")
+                if default is not None:
+                    logger.info(f"Konfigurationsdatei {config_file} nicht gefunden. Verwende Standardkonfiguration.")
+                    config = copy.deepcopy(default)
+                    self._publish(name, config, notify=False)
+                    return config
+                else:
+                    del self._sources[name]
+                    logger.error(f"Konfigurationsdatei {config_file} nicht gefunden und keine Standardkonfiguration angegeben.")
+                    raise FileNotFoundError(f"Konfigurationsdatei {config_file} nicht gefunden")
+    
+    def _publish(self, name: str, config: Dict[str, Any], notify: bool = True) -> None:
+        """
+        Übernimm eine neue Konfiguration und erstelle ihren Snapshot.
+        
+        Der Snapshot wird vollständig aufgebaut, bevor er ersetzt wird, sodass Leser
+        immer einen konsistenten Stand sehen.
+        
+        Args:
+            name: Name der Konfiguration
+            config: Neue Konfiguration
+            notify: Ob die Listener benachrichtigt werden sollen
+        """
+        with self._lock:
+            old_snapshot = self._snapshots.get(name)
+            version = self._versions.get(name, 0) + 1
+            snapshot = ConfigSnapshot(name, version, config)
+            
+            self.configs[name] = config
+            self._versions[name] = version
+            self._snapshots[name] = snapshot
+            listeners = list(self._listeners.get(name, ()))
+            
+            # Verwirf die Modelle der alten Fassung
+            for models in list(self._typed.values()):
+                models.pop(name, None)
+        
+        if notify:
+            old = dict(old_snapshot.data) if old_snapshot else None
+            for listener in listeners:
+                try:
+                    listener(name, old, config)
+                except Exception as e:
+                    logger.error(f"Fehler im Listener für Konfiguration {name}: {e}")
+    
+    def load_json_config(self, name: str, default: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Lade eine JSON-Konfigurationsdatei.
+        
+        Args:
+            name: Name der Konfigurationsdatei (ohne .json-Erweiterung)
+            default: Standardkonfiguration, falls die Datei nicht existiert
+            
+        Returns:
+            Dict mit der Konfiguration
+        """
+        config_file = os.path.join(self.config_dir, f"{name}.json")
+        return self._load_config(name, config_file, 'json', default)
     
     def load_yaml_config(self, name: str, default: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -109,31 +441,39 @@ class ConfigManager:
             Dict mit der Konfiguration
         """
         config_file = os.path.join(self.config_dir, f"{name}.yaml")
+        return self._load_config(name, config_file, 'yaml', default)
+    
+    def _write_file(self, name: str, config_file: str, file_format: str, config: Dict[str, Any]) -> None:
+        """
+        Schreibe eine Konfigurationsdatei atomar.
         
-        if name in self.configs:
-            return self.configs[name]
+        Die Datei wird zunächst in eine temporäre Datei geschrieben und dann ersetzt,
+        sodass Leser nie eine halb geschriebene Datei sehen.
         
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, 'r') as f:
-                    config = yaml.safe_load(f)
-                self.configs[name] = config
-                return config
-            except Exception as e:
-                logger.error(f"Fehler beim Laden der Konfigurationsdatei {config_file}: {e}")
-                if default is not None:
-                    logger.info(f"Verwende Standardkonfiguration für {name}")
-                    self.configs[name] = default
-                    return default
-                raise
-        else:
-            if default is not None:
-                logger.info(f"Konfigurationsdatei {config_file} nicht gefunden. Verwende Standardkonfiguration.")
-                self.configs[name] = default
-                return default
-            else:
-                logger.error(f"Konfigurationsdatei {config_file} nicht gefunden und keine Standardkonfiguration angegeben.")
-                raise FileNotFoundError(f"Konfigurationsdatei {config_file} nicht gefunden")
+        Args:
+            name: Name der Konfiguration
+            config_file: Pfad zur Konfigurationsdatei
+            file_format: Format der Datei (json oder yaml)
+            config: Konfiguration, die gespeichert werden soll
+        """
+        tmp_file = f"{config_file}.tmp"
+        
+        with self._lock:
+            with open(tmp_file, 'w') as f:
+                if file_format == 'yaml':
+                    yaml.dump(config, f, default_flow_style=False)
+                else:
+                    json.dump(config, f, indent=2)
+            os.replace(tmp_file, config_file)
+            
+            # Die eigene Änderung soll keinen erneuten Ladevorgang auslösen
+            self._sources[name] = {
+                "path": config_file,
+                "format": file_format,
+                "signature": self._file_signature(config_file)
+            }
+        
+        self._publish(name, config)
     
     def save_json_config(self, name: str, config: Dict[str, Any]) -> None:
         """
@@ -146,9 +486,7 @@ class ConfigManager:
         config_file = os.path.join(self.config_dir, f"{name}.json")
         
         try:
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            self.configs[name] = config
+            self._write_file(name, config_file, 'json', config)
             logger.info(f"Konfiguration {name} erfolgreich gespeichert")
         except Exception as e:
             logger.error(f"Fehler beim Speichern der Konfigurationsdatei {config_file}: {e}")
@@ -165,9 +503,7 @@ class ConfigManager:
         config_file = os.path.join(self.config_dir, f"{name}.yaml")
         
         try:
-            with open(config_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
-            self.configs[name] = config
+            self._write_file(name, config_file, 'yaml', config)
             logger.info(f"Konfiguration {name} erfolgreich gespeichert")
         except Exception as e:
             logger.error(f"Fehler beim Speichern der Konfigurationsdatei {config_file}: {e}")
@@ -208,9 +544,10 @@ class ConfigManager:
         if name not in self.configs:
             raise KeyError(f"Konfiguration {name} wurde nicht geladen")
         
-        config = self.configs[name]
-        self._deep_update(config, updates)
-        self.configs[name] = config
+        with self._lock:
+            config = self.configs[name]
+            self._deep_update(config, updates)
+            self._publish(name, config)
         
         return config
     
@@ -246,61 +583,38 @@ class ConfigManager:
         if name not in self.configs:
             raise KeyError(f"Konfiguration {name} wurde nicht geladen")
         
-        config = self.configs[name]
-        errors = {}
-        
-        # Validiere die Konfiguration
-        for key, value_schema in schema.items():
-            if key not in config:
-                if value_schema.get('required', False):
-                    errors[key] = f"Pflichtfeld {key} fehlt"
-                continue
-            
-            value = config[key]
-            value_type = value_schema.get('type')
-            
-            if value_type and not self._check_type(value, value_type):
-                errors[key] = f"Ungültiger Typ für {key}: {type(value).__name__}, erwartet: {value_type}"
-                continue
-            
-            if 'enum' in value_schema and value not in value_schema['enum']:
-                errors[key] = f"Ungültiger Wert für {key}: {value}, erwartet: {value_schema['enum']}"
-                continue
-            
-            if 'min' in value_schema and value < value_schema['min']:
-                errors[key] = f"Wert für {key} zu klein: {value}, Minimum: {value_schema['min']}"
-                continue
-            
-            if 'max' in value_schema and value > value_schema['max']:
-                errors[key] = f"Wert für {key} zu groß: {value}, Maximum: {value_schema['max']}"
-                continue
-            
-            if 'pattern' in value_schema and not self._check_pattern(value, value_schema['pattern']):
-                errors[key] = f"Wert für {key} entspricht nicht dem Muster: {value_schema['pattern']}"
-                continue
-            
-            if 'properties' in value_schema and isinstance(value, dict):
-                sub_errors = {}
-                for sub_key, sub_schema in value_schema['properties'].items():
-                    if sub_key not in value:
-                        if sub_schema.get('required', False):
-                            sub_errors[sub_key] = f"Pflichtfeld {sub_key} fehlt"
-                        continue
-                    
-                    sub_value = value[sub_key]
-                    sub_type = sub_schema.get('type')
-                    
-                    if sub_type and not self._check_type(sub_value, sub_type):
-                        sub_errors[sub_key] = f"Ungültiger Typ für {sub_key}: {type(sub_value).__name__}, erwartet: {sub_type}"
-                
-                if sub_errors:
-                    errors[key] = sub_errors
+        errors = self._get_validator(schema)(self.configs[name])
         
         if errors:
             raise ConfigValidationError(f"Konfiguration {name} ist ungültig", errors)
         
         return True
     
+    def _get_validator(self, schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Hole den kompilierten Validator eines Schemas.
+        
+        Validatoren werden pro Schema-Objekt einmal kompiliert. Es bleiben die
+        128 zuletzt verwendeten Validatoren erhalten.
+        
+        Args:
+            schema: Schema für die Validierung
+            
+        Returns:
+            Validierungsfunktion
+        """
+        with self._lock:
+            entry = self._validators.get(id(schema))
+            if entry is not None and entry[0] is schema:
+                self._validators.move_to_end(id(schema))
+                return entry[1]
+            
+            entry = (schema, compile_schema(schema))
+            self._validators[id(schema)] = entry
+            if len(self._validators) > 128:
+                self._validators.popitem(last=False)
+            return entry[1]
+    
     def _check_type(self, value: Any, expected_type: str) -> bool:
         """
         Überprüfe, ob ein Wert den erwarteten Typ hat.
@@ -340,8 +654,7 @@ class ConfigManager:
         Returns:
             True, wenn der Wert dem Muster entspricht, sonst False
         """
-        import re
-        return bool(re.match(pattern, value))
+        return bool(_compile_pattern(pattern).match(value))
     
     def get_env_config(self, prefix: str, schema: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -408,6 +721,183 @@ class ConfigManager:
         
         return result
 
+    
+    def register_schema(self, name: str, schema: Dict[str, Any]) -> None:
+        """
+        Registriere ein Schema für eine Konfiguration.
+        
+        Geänderte Dateien werden vor dem Neuladen gegen das Schema geprüft. Ist die
+        neue Fassung ungültig, bleibt die bisherige Konfiguration aktiv.
+        
+        Args:
+            name: Name der Konfiguration
+            schema: Schema für die Validierung
+        """
+        self._schemas[name] = compile_schema(schema)
+    
+    def get_snapshot(self, name: str) -> ConfigSnapshot:
+        """
+        Hole den unveränderlichen Snapshot einer Konfiguration.
+        
+        Args:
+            name: Name der Konfiguration
+            
+        Returns:
+            Snapshot der Konfiguration
+            
+        Raises:
+            KeyError: Wenn die Konfiguration nicht geladen wurde
+        """
+        snapshot = self._snapshots.get(name)
+        if snapshot is None:
+            raise KeyError(f"Konfiguration {name} wurde nicht geladen")
+        return snapshot
+    
+    def get_typed(self, name: str, schema: 'ConfigSchema[T]') -> T:
+        """
+        Hole eine Konfiguration als Modell.
+        
+        Das Modell wird pro Schema und Version der Konfiguration einmal erzeugt und beim
+        Neuladen der Konfiguration verworfen.
+        
+        Args:
+            name: Name der Konfiguration
+            schema: Schema mit der Modellklasse
+            
+        Returns:
+            Modell der Konfiguration
+            
+        Raises:
+            KeyError: Wenn die Konfiguration nicht geladen wurde
+            ConfigValidationError: Wenn die Konfiguration ungültig ist
+        """
+        snapshot = self.get_snapshot(name)
+        
+        with self._lock:
+            cached = self._typed.get(schema, {}).get(name)
+        if cached is not None and cached[0] == snapshot.version:
+            return cached[1]
+        
+        model = schema.to_model(self.configs[name])
+        with self._lock:
+            self._typed.setdefault(schema, {})[name] = (snapshot.version, model)
+        return model
+    
+    def add_listener(self, name: str, callback: Callable[[str, Optional[Dict[str, Any]], Dict[str, Any]], None]) -> None:
+        """
+        Registriere einen Listener für Änderungen einer Konfiguration.
+        
+        Der Listener wird mit dem Namen, der alten und der neuen Konfiguration
+        aufgerufen. Bei Änderungen an Dateien geschieht das im Überwachungs-Thread.
+        
+        Args:
+            name: Name der Konfiguration
+            callback: Funktion, die bei Änderungen aufgerufen wird
+        """
+        with self._lock:
+            self._listeners.setdefault(name, []).append(callback)
+    
+    def remove_listener(self, name: str, callback: Callable[[str, Optional[Dict[str, Any]], Dict[str, Any]], None]) -> None:
+        """
+        Entferne einen Listener.
+        
+        Args:
+            name: Name der Konfiguration
+            callback: Zuvor registrierte Funktion
+        """
+        with self._lock:
+            listeners = self._listeners.get(name, [])
+            if callback in listeners:
+                listeners.remove(callback)
+    
+    def reload(self, name: str) -> bool:
+        """
+        Lade eine Konfiguration erneut aus ihrer Datei.
+        
+        Args:
+            name: Name der Konfiguration
+            
+        Returns:
+            True, wenn die Konfiguration neu geladen wurde
+            
+        Raises:
+            KeyError: Wenn die Konfiguration nicht aus einer Datei geladen wurde
+        """
+        source = self._sources.get(name)
+        if source is None:
+            raise KeyError(f"Konfiguration {name} wurde nicht aus einer Datei geladen")
+        
+        try:
+            config = self._read_file(source["path"], source["format"])
+        except Exception as e:
+            logger.error(f"Fehler beim Neuladen der Konfigurationsdatei {source['path']}: {e}")
+            return False
+        
+        validator = self._schemas.get(name)
+        if validator is not None:
+            errors = validator(config)
+            if errors:
+                logger.error(f"Neue Fassung der Konfiguration {name} ist ungültig und wird ignoriert: {errors}")
+                return False
+        
+        self._publish(name, config)
+        logger.info(f"Konfiguration {name} neu geladen")
+        return True
+    
+    def check_for_changes(self) -> List[str]:
+        """
+        Prüfe die Konfigurationsdateien auf Änderungen und lade geänderte neu.
+        
+        Returns:
+            Namen der neu geladenen Konfigurationen
+        """
+        reloaded = []
+        
+        for name, source in list(self._sources.items()):
+            signature = self._file_signature(source["path"])
+            if signature == source["signature"]:
+                continue
+            
+            source["signature"] = signature
+            if signature is None:
+                logger.warning(f"Konfigurationsdatei {source['path']} wurde entfernt, behalte letzte Fassung")
+                continue
+            
+            if self.reload(name):
+                reloaded.append(name)
+        
+        return reloaded
+    
+    def start_watching(self, interval: float = 1.0) -> None:
+        """
+        Überwache die geladenen Konfigurationsdateien in einem Hintergrund-Thread.
+        
+        Args:
+            interval: Abstand zwischen zwei Prüfungen in Sekunden
+        """
+        if self._watch_thread is not None and self._watch_thread.is_alive():
+            return
+        
+        self._watch_stop.clear()
+        
+        def watch() -> None:
+            while not self._watch_stop.wait(interval):
+                try:
+                    self.check_for_changes()
+                except Exception as e:
+                    logger.error(f"Fehler bei der Überwachung der Konfigurationsdateien: {e}")
+        
+        self._watch_thread = threading.Thread(target=watch, name="config-watcher", daemon=True)
+        self._watch_thread.start()
+    
+    def stop_watching(self) -> None:
+        """
+        Beende die Überwachung der Konfigurationsdateien.
+        """
+        self._watch_stop.set()
+        if self._watch_thread is not None:
+            self._watch_thread.join()
+            self._watch_thread = None
 
 class ConfigSchema(Generic[T]):
     """
@@ -427,6 +917,7 @@ class ConfigSchema(Generic[T]):
         """
         self.schema = schema
         self.model_class = model_class
+        self._validator = compile_schema(schema)
     
     def validate(self, config: Dict[str, Any]) -> bool:
         """
@@ -441,54 +932,7 @@ class ConfigSchema(Generic[T]):
         Raises:
             ConfigValidationError: Wenn die Konfiguration ungültig ist
         """
-        errors = {}
-        
-        # Validiere die Konfiguration
-        for key, value_schema in self.schema.items():
-            if key not in config:
-                if value_schema.get('required', False):
-                    errors[key] = f"Pflichtfeld {key} fehlt"
-                continue
-            
-            value = config[key]
-            value_type = value_schema.get('type')
-            
-            if value_type and not self._check_type(value, value_type):
-                errors[key] = f"Ungültiger Typ für {key}: {type(value).__name__}, erwartet: {value_type}"
-                continue
-            
-            if 'enum' in value_schema and value not in value_schema['enum']:
-                errors[key] = f"Ungültiger Wert für {key}: {value}, erwartet: {value_schema['enum']}"
-                continue
-            
-            if 'min' in value_schema and value < value_schema['min']:
-                errors[key] = f"Wert für {key} zu klein: {value}, Minimum: {value_schema['min']}"
-                continue
-            
-            if 'max' in value_schema and value > value_schema['max']:
-                errors[key] = f"Wert für {key} zu groß: {value}, Maximum: {value_schema['max']}"
-                continue
-            
-            if 'pattern' in value_schema and not self._check_pattern(value, value_schema['pattern']):
-                errors[key] = f"Wert für {key} entspricht nicht dem Muster: {value_schema['pattern']}"
-                continue
-            
-            if 'properties' in value_schema and isinstance(value, dict):
-                sub_errors = {}
-                for sub_key, sub_schema in value_schema['properties'].items():
-                    if sub_key not in value:
-                        if sub_schema.get('required', False):
-                            sub_errors[sub_key] = f"Pflichtfeld {sub_key} fehlt"
-                        continue
-                    
-                    sub_value = value[sub_key]
-                    sub_type = sub_schema.get('type')
-                    
-                    if sub_type and not self._check_type(sub_value, sub_type):
-                        sub_errors[sub_key] = f"Ungültiger Typ für {sub_key}: {type(sub_value).__name__}, erwartet: {sub_type}"
-                
-                if sub_errors:
-                    errors[key] = sub_errors
+        errors = self._validator(config)
         
         if errors:
             raise ConfigValidationError("Konfiguration ist ungültig", errors)
@@ -534,8 +978,7 @@ class ConfigSchema(Generic[T]):
         Returns:
             True, wenn der Wert dem Muster entspricht, sonst False
         """
-        import re
-        return bool(re.match(pattern, value))
+        return bool(_compile_pattern(pattern).match(value))
     
     def to_model(self, config: Dict[str, Any]) -> T:
         """
@@ -11,7 +11,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple, Union, cast
 
 from src.core.error_handling import BaseError, ErrorCategory, ErrorHandler
 from src.core.logging import get_logger
@@ -28,16 +28,18 @@ class ConnectorError(BaseError):
         message: str,
         connector_type: Optional[str] = None,
         service_name: Optional[str] = None,
+        code: str = "ERR_CONNECTOR",
+        details: Optional[Dict[str, Any]] = None,
         **kwargs
     ):
         super().__init__(
             message,
             category=ErrorCategory.CONNECTOR,
-            code="ERR_CONNECTOR",
+            code=code,
             details={
                 "connector_type": connector_type,
                 "service_name": service_name,
-                **kwargs.get("details", {})
+                **(details or {})
             },
             **kwargs
         )
@@ -278,6 +280,10 @@ class HttpConnector(BaseConnector):
         self.status = ConnectorStatus.CONNECTING
 
         try:
+            # Replace any session left over from a failed connection attempt
+            if self._session and not self._session.closed:
+                await self._session.close()
+
             # Create a new session
             self._session = aiohttp.ClientSession(
                 headers=self.config.headers,
@@ -334,6 +340,106 @@ class HttpConnector(BaseConnector):
         except Exception:
             return False
 
+    async def _ensure_session(self) -> None:
+        """Connect if there is no usable session.
+
+        Requests issued by ``_test_connection`` while connecting reuse the
+        session that is being set up.
+        """
+        if (
+            self._session is None
+            or self._session.closed
+            or self.status not in (ConnectorStatus.CONNECTED, ConnectorStatus.CONNECTING)
+        ):
+            await self.connect()
+
+    def _build_url(self, url: str) -> str:
+        """Resolve a URL relative to the configured base URL.
+
+        Args:
+            url: Absolute URL or path relative to the base URL.
+
+        Returns:
+            The absolute URL.
+        """
+        if self.config.base_url and not url.startswith(("http://", "https://")):
+            return f"{self.config.base_url.rstrip('/')}/{url.lstrip('/')}"
+        return url
+
+    async def stream_events(
+        self,
+        method: str,
+        url: str,
+        read_timeout: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream server-sent events from an endpoint.
+
+        Args:
+            method: HTTP method.
+            url: URL to request.
+            read_timeout: Maximum time to wait for the next chunk, in seconds.
+            **kwargs: Additional arguments for the request.
+
+        Yields:
+            Events with ``event``, ``id`` and ``data`` keys. ``data`` is decoded
+            from JSON when possible.
+
+        Raises:
+            ConnectorNotFoundError: If the endpoint does not exist.
+            ConnectorError: If the endpoint does not serve an event stream.
+        """
+        import aiohttp
+
+        await self._ensure_session()
+        url = self._build_url(url)
+
+        headers = {"Accept": "text/event-stream", **(kwargs.pop("headers", {}) or {})}
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=read_timeout)
+
+        async with self._session.request(method, url, headers=headers, timeout=timeout, **kwargs) as response:
+            if response.status in (404, 405, 406, 501):
+                raise ConnectorNotFoundError(
+                    f"Event stream not available: {url}",
+                    connector_type=self.connector_type,
+                    service_name=self.service_name,
+                )
+            if response.status >= 400 or not response.content_type.startswith("text/event-stream"):
+                raise ConnectorError(
+                    f"Unexpected event stream response from {url}: {response.status} {response.content_type}",
+                    connector_type=self.connector_type,
+                    service_name=self.service_name,
+                    details={"status_code": response.status},
+                )
+
+            event: Dict[str, Any] = {}
+            data_lines: List[str] = []
+            async for raw_line in response.content:
+                line = raw_line.decode("utf-8").rstrip("\r\n")
+
+                # A blank line terminates an event
+                if not line:
+                    if data_lines:
+                        data = "\n".join(data_lines)
+                        try:
+                            event["data"] = json.loads(data)
+                        except ValueError:
+                            event["data"] = data
+                        event.setdefault("event", "message")
+                        yield event
+                    event, data_lines = {}, []
+                    continue
+
+                if line.startswith(":"):
+                    continue
+
+                name, _, value = line.partition(":")
+                value = value[1:] if value.startswith(" ") else value
+                if name == "data":
+                    data_lines.append(value)
+                elif name in ("event", "id"):
+                    event[name] = value
+
     @abstractmethod
     async def _test_connection(self) -> None:
         """Test the connection to the service.
@@ -365,13 +471,12 @@ class HttpConnector(BaseConnector):
         """
         import aiohttp
 
-        # Ensure we're connected
-        if not await self.is_connected():
-            await self.connect()
+        # Ensure we're connected. This only checks local state: running a
+        # connection test before every request would double the round-trips.
+        await self._ensure_session()
 
         # Prepare the URL
-        if self.config.base_url and not url.startswith(("http://", "https://")):
-            url = f"{self.config.base_url.rstrip('/')}/{url.lstrip('/')}"
+        url = self._build_url(url)
 
         # Add default parameters
         params = {**self.config.params, **(kwargs.pop("params", {}) or {})}
@@ -8,9 +8,11 @@ import asyncio
 import json
 import logging
 import os
+import weakref
 from typing import Any, Dict, List, Optional, Union
 
 from src.connectors.base import ConnectorConfig, ConnectorError, HttpConnector
+from src.connectors.run_tracker import RunTracker
 from src.core.logging import get_logger
 from src.core.performance import async_cached, async_profiled, async_timed
 
@@ -51,6 +53,11 @@ class OpenHandsConnector(HttpConnector):
             "Accept": "application/json",
         })
 
+        # One run tracker per event loop, so concurrent waiters share a poller
+        self._run_trackers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, RunTracker]" = (
+            weakref.WeakKeyDictionary()
+        )
+
     async def _test_connection(self) -> None:
         """Test the connection to OpenHands.
 
@@ -919,10 +926,15 @@ class OpenHandsConnector(HttpConnector):
     ) -> Dict[str, Any]:
         """Wait for a run to complete.
 
+        Completion is pushed over the run-events stream when the server offers
+        one. Otherwise the run is polled with exponential backoff, starting at
+        a few tens of milliseconds. Concurrent waiters on the same event loop
+        share one poller.
+
         Args:
             thread_id: ID of the thread.
             run_id: ID of the run.
-            poll_interval: Interval between polls in seconds.
+            poll_interval: Maximum interval between polls in seconds.
             timeout: Maximum time to wait in seconds.
 
         Returns:
@@ -931,25 +943,22 @@ class OpenHandsConnector(HttpConnector):
         Raises:
             ConnectorError: If the request fails or times out.
         """
-        start_time = asyncio.get_event_loop().time()
-        
-        while True:
-            run = await self.get_run(thread_id, run_id)
-            
-            if run["status"] in ["completed", "failed", "cancelled", "expired"]:
-                return run
-            
-            # Check timeout
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > timeout:
-                raise ConnectorError(
-                    f"Timeout waiting for run to complete: {run_id}",
-                    connector_type=self.connector_type,
-                    service_name=self.service_name,
-                )
-            
-            # Wait before polling again
-            await asyncio.sleep(poll_interval)
+        return await self.get_run_tracker().wait(
+            thread_id, run_id, timeout=timeout, max_interval=poll_interval
+        )
+
+    def get_run_tracker(self) -> RunTracker:
+        """Get the run tracker for the running event loop.
+
+        Returns:
+            The run tracker.
+        """
+        loop = asyncio.get_running_loop()
+        tracker = self._run_trackers.get(loop)
+        if tracker is None:
+            tracker = RunTracker(self)
+            self._run_trackers[loop] = tracker
+        return tracker
 
     @async_timed
     async def create_thread_and_run(
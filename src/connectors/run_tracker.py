@@ -0,0 +1,268 @@
+"""
+Run completion tracking for OpenHands.
+
+This module provides a tracker that resolves waiters as soon as an OpenHands
+run reaches a terminal status. Completion is pushed over the server's
+server-sent events (SSE) endpoint for a run when it exists. Otherwise the
+tracker falls back to adaptive exponential-backoff polling. All waiters on one
+event loop share a single poller task, which starts each due poll as its own
+task so that a slow request does not hold back the other runs.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from src.connectors.base import ConnectorError, ConnectorNotFoundError
+from src.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from src.connectors.openhands import OpenHandsConnector
+
+# Set up logging
+logger = get_logger(__name__)
+
+# Run statuses after which a run will not change anymore
+TERMINAL_RUN_STATUSES = frozenset({"completed", "failed", "cancelled", "expired"})
+
+
+@dataclass
+class TrackedRun:
+    """A run with at least one waiter."""
+    thread_id: str
+    run_id: str
+    interval: float
+    max_interval: float
+    next_poll_at: float
+    waiters: List[asyncio.Future] = field(default_factory=list)
+    stream_task: Optional[asyncio.Task] = None
+    poll_task: Optional[asyncio.Task] = None
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Get the tracking key of the run."""
+        return (self.thread_id, self.run_id)
+
+
+class RunTracker:
+    """Tracks runs of one connector on one event loop."""
+
+    def __init__(
+        self,
+        connector: "OpenHandsConnector",
+        initial_interval: float = 0.05,
+        backoff_factor: float = 2.0,
+        use_streaming: bool = True,
+        max_concurrent_polls: int = 10,
+    ):
+        """Initialize the run tracker.
+
+        Args:
+            connector: Connector used to stream and fetch runs.
+            initial_interval: Delay before the first poll of a run, in seconds.
+            backoff_factor: Factor by which the poll interval grows after each
+                poll that finds the run still in progress.
+            use_streaming: Whether to try the SSE run-events endpoint first.
+            max_concurrent_polls: Maximum number of concurrent poll requests.
+        """
+        self.connector = connector
+        self.initial_interval = initial_interval
+        self.backoff_factor = backoff_factor
+        # None means not yet known; set once the server answers a stream request
+        self.streaming_supported: Optional[bool] = None if use_streaming else False
+        self._runs: Dict[Tuple[str, str], TrackedRun] = {}
+        self._poller: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._poll_semaphore = asyncio.Semaphore(max_concurrent_polls)
+        self.stats: Dict[str, int] = {"polls": 0, "stream_events": 0, "completed": 0}
+
+    async def wait(
+        self,
+        thread_id: str,
+        run_id: str,
+        timeout: float = 300.0,
+        max_interval: float = 1.0,
+    ) -> Dict[str, Any]:
+        """Wait for a run to reach a terminal status.
+
+        Args:
+            thread_id: ID of the thread.
+            run_id: ID of the run.
+            timeout: Maximum time to wait in seconds.
+            max_interval: Upper bound for the poll interval in seconds.
+
+        Returns:
+            Final run data.
+
+        Raises:
+            ConnectorError: If the run cannot be fetched or the wait times out.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        tracked = self._runs.get((thread_id, run_id))
+        if tracked is None:
+            tracked = TrackedRun(
+                thread_id=thread_id,
+                run_id=run_id,
+                interval=min(self.initial_interval, max_interval),
+                max_interval=max_interval,
+                next_poll_at=loop.time() + min(self.initial_interval, max_interval),
+            )
+            self._runs[tracked.key] = tracked
+            if self.streaming_supported is not False:
+                tracked.stream_task = asyncio.ensure_future(self._stream(tracked))
+                # Keep a slow safety-net poll in case the run finished before the stream attached
+                tracked.interval = max_interval
+                tracked.next_poll_at = loop.time() + max_interval
+            self._schedule()
+        tracked.waiters.append(future)
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            raise ConnectorError(
+                f"Timeout waiting for run to complete: {run_id}",
+                connector_type=self.connector.connector_type,
+                service_name=self.connector.service_name,
+            )
+        finally:
+            self._discard_waiter(tracked, future)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tracker statistics.
+
+        Returns:
+            Dictionary with tracked run count, streaming support and counters.
+        """
+        return {
+            "tracked_runs": len(self._runs),
+            "streaming_supported": self.streaming_supported,
+            **self.stats,
+        }
+
+    def _schedule(self) -> None:
+        """Start the shared poller, or wake it up to pick up new deadlines."""
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.ensure_future(self._poll_loop())
+        else:
+            self._wakeup.set()
+
+    def _discard_waiter(self, tracked: TrackedRun, future: asyncio.Future) -> None:
+        """Remove a waiter and stop tracking the run when nobody waits anymore."""
+        if future in tracked.waiters:
+            tracked.waiters.remove(future)
+        if not future.done():
+            future.cancel()
+        if not tracked.waiters and self._runs.get(tracked.key) is tracked:
+            self._stop_tracking(tracked)
+
+    def _stop_tracking(self, tracked: TrackedRun) -> None:
+        """Stop tracking a run."""
+        self._runs.pop(tracked.key, None)
+        for task in (tracked.stream_task, tracked.poll_task):
+            if task and task is not asyncio.current_task():
+                task.cancel()
+        tracked.stream_task = None
+        tracked.poll_task = None
+        self._wakeup.set()
+
+    def _resolve(self, tracked: TrackedRun, run: Dict[str, Any]) -> None:
+        """Hand the final run to every waiter."""
+        self.stats["completed"] += 1
+        self._stop_tracking(tracked)
+        for waiter in tracked.waiters:
+            if not waiter.done():
+                waiter.set_result(run)
+
+    def _reject(self, tracked: TrackedRun, error: Exception) -> None:
+        """Fail every waiter of a run."""
+        self._stop_tracking(tracked)
+        for waiter in tracked.waiters:
+            if not waiter.done():
+                waiter.set_exception(error)
+
+    async def _stream(self, tracked: TrackedRun) -> None:
+        """Consume the run-events stream until the run reaches a terminal status."""
+        try:
+            async for event in self.connector.stream_events(
+                "GET",
+                f"threads/{tracked.thread_id}/runs/{tracked.run_id}/events",
+            ):
+                self.streaming_supported = True
+                self.stats["stream_events"] += 1
+                run = event.get("data")
+                if isinstance(run, dict) and run.get("status") in TERMINAL_RUN_STATUSES:
+                    self._resolve(tracked, run)
+                    return
+        except asyncio.CancelledError:
+            raise
+        except ConnectorNotFoundError:
+            logger.info(f"{self.connector.service_name} has no run-events stream, polling instead")
+            self.streaming_supported = False
+        except Exception as e:
+            logger.debug(f"Run-events stream for {tracked.run_id} failed, polling instead: {e}")
+
+        # The stream ended early: poll this run with the normal backoff
+        tracked.stream_task = None
+        if self._runs.get(tracked.key) is tracked:
+            tracked.interval = min(self.initial_interval, tracked.max_interval)
+            tracked.next_poll_at = asyncio.get_running_loop().time()
+            self._schedule()
+
+    async def _poll(self, tracked: TrackedRun) -> None:
+        """Poll a run once and reschedule it with exponential backoff.
+
+        A failed request fails the waiters of the run, since the connector
+        already retries transient errors.
+        """
+        try:
+            async with self._poll_semaphore:
+                self.stats["polls"] += 1
+                run = await self.connector.get_run(tracked.thread_id, tracked.run_id)
+        except asyncio.CancelledError:
+            raise
+        except ConnectorError as e:
+            self._reject(tracked, e)
+            return
+        except Exception as e:
+            logger.warning(f"Error polling run {tracked.run_id}: {e}")
+            self._reject(tracked, ConnectorError(
+                f"Error polling run {tracked.run_id}: {e}",
+                connector_type=self.connector.connector_type,
+                service_name=self.connector.service_name,
+            ))
+            return
+        finally:
+            if tracked.poll_task is asyncio.current_task():
+                tracked.poll_task = None
+            self._wakeup.set()
+
+        if self._runs.get(tracked.key) is not tracked:
+            return
+        if run.get("status") in TERMINAL_RUN_STATUSES:
+            self._resolve(tracked, run)
+            return
+
+        if tracked.stream_task is None:
+            tracked.interval = min(tracked.interval * self.backoff_factor, tracked.max_interval)
+        tracked.next_poll_at = asyncio.get_running_loop().time() + tracked.interval
+
+    async def _poll_loop(self) -> None:
+        """Poll due runs until no run is tracked anymore."""
+        loop = asyncio.get_running_loop()
+        while self._runs:
+            self._wakeup.clear()
+            now = loop.time()
+            idle = [tracked for tracked in self._runs.values() if tracked.poll_task is None]
+            for tracked in idle:
+                if tracked.next_poll_at <= now:
+                    tracked.poll_task = asyncio.ensure_future(self._poll(tracked))
+
+            # Runs with a poll in flight are rescheduled when their poll finishes
+            deadlines = [tracked.next_poll_at for tracked in idle if tracked.poll_task is None]
+            timeout = max(0.0, min(deadlines) - now) if deadlines else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
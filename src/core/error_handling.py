@@ -5,13 +5,21 @@ This module provides structured error classes and utilities for consistent error
 
 import logging
 import sys
+import threading
+import time
 import traceback
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from datetime import datetime
 from enum import Enum
-from typing import Dict, Any, Optional, List, Type, Union
+from typing import Dict, Any, Optional, List, Type, Union, Callable, Deque, Tuple, Hashable
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Set while ErrorHandler wraps an exception, so the wrapper does not log on construction
+_suppress_construction_log: ContextVar[bool] = ContextVar("suppress_construction_log", default=False)
+
 class ErrorSeverity(Enum):
     """Enum representing the severity of an error."""
     DEBUG = 10
@@ -30,6 +38,8 @@ class ErrorCategory(Enum):
     VALIDATION = "validation"
     RESOURCE = "resource"
     EXTERNAL_SERVICE = "external_service"
+    CONNECTOR = "connector"
+    WORKFLOW = "workflow"
     INTERNAL = "internal"
     UNKNOWN = "unknown"
 
@@ -63,16 +73,36 @@ class BaseError(Exception):
         self.details = details or {}
         self.cause = cause
         
-        # Capture stack trace
-        self.stack_trace = traceback.format_exc()
+        # Keep the exception being handled; the stack trace is only formatted when requested
+        exc_info = sys.exc_info()
+        self._exc_info = exc_info if exc_info[0] is not None else None
+        self._stack_trace: Optional[str] = None
         
         # Log the error based on severity
-        self._log_error()
+        if not _suppress_construction_log.get():
+            self._log_error()
         
         super().__init__(message)
     
+    @property
+    def stack_trace(self) -> str:
+        """Formatted stack trace of the exception being handled when the error was created."""
+        if self._stack_trace is None:
+            if self._exc_info is None:
+                self._stack_trace = "NoneType: None\n"
+            else:
+                self._stack_trace = "".join(traceback.format_exception(*self._exc_info))
+        return self._stack_trace
+    
+    @stack_trace.setter
+    def stack_trace(self, value: str) -> None:
+        self._stack_trace = value
+    
     def _log_error(self) -> None:
         """Log the error based on its severity."""
+        if not logger.isEnabledFor(self.severity.value):
+            return
+        
         log_message = f"{self.code}: {self.message}"
         
         if self.details:
@@ -81,16 +111,7 @@ class BaseError(Exception):
         if self.cause:
             log_message += f" - Caused by: {str(self.cause)}"
         
-        if self.severity == ErrorSeverity.DEBUG:
-            logger.debug(log_message)
-        elif self.severity == ErrorSeverity.INFO:
-            logger.info(log_message)
-        elif self.severity == ErrorSeverity.WARNING:
-            logger.warning(log_message)
-        elif self.severity == ErrorSeverity.ERROR:
-            logger.error(log_message)
-        elif self.severity == ErrorSeverity.CRITICAL:
-            logger.critical(log_message)
+        logger.log(self.severity.value, log_message)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -373,27 +394,343 @@ class MCPServerError(MCPError):
         self.code = "ERR_MCP_SERVER"
         self.server_type = server_type
 
+# Error Aggregation
+def _origin(error: BaseException) -> Optional[Tuple[str, int]]:
+    """
+    Get the location an exception was raised from.
+    
+    Args:
+        error: The exception
+    
+    Returns:
+        Tuple of file name and line number, or None if the exception was never raised
+    """
+    tb = error.__traceback__
+    if tb is None:
+        return None
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    return tb.tb_frame.f_code.co_filename, tb.tb_lineno
+
+class ErrorAggregate:
+    """Occurrences of one error fingerprint."""
+    
+    __slots__ = (
+        "fingerprint", "error", "code", "category", "count", "first_seen", "last_seen",
+        "window_start", "window_count", "previous_window_count", "_error_dict"
+    )
+    
+    def __init__(self, fingerprint: Hashable, error: BaseError, now: float):
+        """
+        Initialize a new ErrorAggregate.
+        
+        Args:
+            fingerprint: Fingerprint identifying identical errors
+            error: The first occurrence of the error, replaced by the occurrence starting each window
+            now: Time of the first occurrence
+        """
+        self.fingerprint = fingerprint
+        self.error = error
+        self.code = error.code
+        self.category = error.category
+        self.count = 1
+        self.first_seen = now
+        self.last_seen = now
+        self.window_start = now
+        self.window_count = 1
+        self.previous_window_count = 0
+        self._error_dict: Optional[Dict[str, Any]] = None
+    
+    def error_dict(self) -> Dict[str, Any]:
+        """
+        Get the dictionary representation of the error, built on first use.
+        
+        Returns:
+            A copy of the dictionary representation of the error
+        """
+        if self._error_dict is None:
+            self._error_dict = self.error.to_dict()
+        return dict(self._error_dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the aggregate to a dictionary representation.
+        
+        Returns:
+            Dictionary representation of the error including its occurrence counts
+        """
+        result = self.error_dict()
+        result["count"] = self.count
+        result["first_seen"] = datetime.fromtimestamp(self.first_seen).isoformat()
+        result["last_seen"] = datetime.fromtimestamp(self.last_seen).isoformat()
+        return result
+
+class ErrorAggregator:
+    """Deduplicates identical errors within a time window and tracks error rates per category."""
+    
+    def __init__(
+        self,
+        window: float = 60.0,
+        rate_window: float = 60.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize a new ErrorAggregator.
+        
+        Args:
+            window: Seconds during which repeated occurrences of an error are only counted
+            rate_window: Seconds over which error rates are calculated
+            max_entries: Maximum number of fingerprints to keep
+            clock: Function returning the current time in seconds
+        """
+        self.window = window
+        self.rate_window = rate_window
+        self.max_entries = max_entries
+        self.clock = clock
+        
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, ErrorAggregate]" = OrderedDict()
+        self._totals: Dict[ErrorCategory, int] = {}
+        self._buckets: Dict[ErrorCategory, Deque[List[int]]] = {}
+        self._suppressed = 0
+    
+    @staticmethod
+    def fingerprint(
+        error: BaseException,
+        error_class: Optional[Type[BaseError]] = None
+    ) -> Hashable:
+        """
+        Calculate the fingerprint of an error.
+        
+        Errors share a fingerprint if they have the same type, code, message and origin.
+        
+        Args:
+            error: The error
+            error_class: BaseError type the error will be converted to, if any
+        
+        Returns:
+            The fingerprint
+        """
+        if isinstance(error, BaseError):
+            origin = _origin(error.cause) if error.cause is not None else _origin(error)
+            return type(error), error.code, error.message, origin
+        return error_class, type(error), str(error), _origin(error)
+    
+    def record(
+        self,
+        fingerprint: Hashable,
+        error: BaseError
+    ) -> Tuple[ErrorAggregate, bool]:
+        """
+        Record an occurrence of an error.
+        
+        Args:
+            fingerprint: Fingerprint of the error
+            error: The occurrence
+        
+        Returns:
+            Tuple of the aggregate and whether this is the first occurrence in the current window
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is not None and now - entry.window_start < self.window:
+                entry.count += 1
+                entry.window_count += 1
+                entry.last_seen = now
+                self._suppressed += 1
+                self._count(entry.category, now)
+                return entry, False
+            
+            if entry is None:
+                entry = ErrorAggregate(fingerprint, error, now)
+                self._entries[fingerprint] = entry
+                self._evict()
+            else:
+                # Start a new window and remember how often the error occurred in the last one
+                entry.error = error
+                entry._error_dict = None
+                entry.count += 1
+                entry.last_seen = now
+                entry.window_start = now
+                entry.previous_window_count = entry.window_count
+                entry.window_count = 1
+                self._entries.move_to_end(fingerprint)
+            
+            self._count(entry.category, now)
+            return entry, True
+    
+    def _count(self, category: ErrorCategory, now: float) -> None:
+        """
+        Count an error for its category.
+        
+        Args:
+            category: Category of the error
+            now: Time of the occurrence
+        """
+        self._totals[category] = self._totals.get(category, 0) + 1
+        
+        second = int(now)
+        buckets = self._buckets.get(category)
+        if buckets is None:
+            buckets = self._buckets[category] = deque()
+        if buckets and buckets[-1][0] == second:
+            buckets[-1][1] += 1
+        else:
+            buckets.append([second, 1])
+            self._trim(buckets, now)
+    
+    def _trim(self, buckets: Deque[List[int]], now: float) -> None:
+        """
+        Drop rate buckets that are outside the rate window.
+        
+        Args:
+            buckets: Per-second counts of a category
+            now: The current time
+        """
+        cutoff = now - self.rate_window
+        while buckets and buckets[0][0] <= cutoff:
+            buckets.popleft()
+    
+    def _evict(self) -> None:
+        """Drop the fingerprints with the oldest windows once there are too many."""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def get_errors(self) -> List[Dict[str, Any]]:
+        """
+        Get all aggregated errors, most recently seen first.
+        
+        Returns:
+            List of dictionary representations of the aggregated errors
+        """
+        with self._lock:
+            entries = sorted(self._entries.values(), key=lambda entry: entry.last_seen, reverse=True)
+        return [entry.to_dict() for entry in entries]
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get error metrics.
+        
+        Returns:
+            Dictionary with the number of unique and suppressed errors and totals and rates per category
+        """
+        now = self.clock()
+        with self._lock:
+            categories = {}
+            for category, total in self._totals.items():
+                buckets = self._buckets.get(category, deque())
+                self._trim(buckets, now)
+                categories[category.value] = {
+                    "total": total,
+                    "rate_per_second": sum(count for _, count in buckets) / self.rate_window,
+                }
+            return {
+                "unique_errors": len(self._entries),
+                "suppressed": self._suppressed,
+                "categories": categories,
+            }
+    
+    def render_prometheus(self) -> str:
+        """
+        Render the error metrics in the Prometheus text exposition format.
+        
+        Returns:
+            The metrics as text
+        """
+        metrics = self.get_metrics()
+        lines = [
+            "# HELP errors_total Number of handled errors by category",
+            "# TYPE errors_total counter",
+        ]
+        for category, values in metrics["categories"].items():
+            lines.append(f'errors_total{{category="{category}"}} {values["total"]}')
+        lines += [
+            "# HELP error_rate_per_second Rate of handled errors by category",
+            "# TYPE error_rate_per_second gauge",
+        ]
+        for category, values in metrics["categories"].items():
+            lines.append(f'error_rate_per_second{{category="{category}"}} {values["rate_per_second"]}')
+        lines += [
+            "# HELP errors_suppressed_total Number of duplicate errors that were not logged",
+            "# TYPE errors_suppressed_total counter",
+            f"errors_suppressed_total {metrics['suppressed']}",
+        ]
+        return "\n".join(lines) + "\n"
+    
+    def reset(self) -> None:
+        """Forget all aggregated errors and metrics."""
+        with self._lock:
+            self._entries.clear()
+            self._totals.clear()
+            self._buckets.clear()
+            self._suppressed = 0
+
+# Aggregator used by ErrorHandler unless another one is given
+error_aggregator = ErrorAggregator()
+
 # Error Handler
 class ErrorHandler:
     """Utility class for handling errors consistently."""
     
+    @staticmethod
+    def _wrap(
+        error: Exception,
+        default_message: str,
+        error_map: Optional[Dict[Type[Exception], Type[BaseError]]]
+    ) -> BaseError:
+        """
+        Convert a standard exception to a BaseError without logging it.
+        
+        Args:
+            error: The error to convert
+            default_message: Default message to use if the error has no message
+            error_map: Mapping of exception types to BaseError types
+        
+        Returns:
+            The converted error
+        """
+        if isinstance(error, BaseError):
+            return error
+        
+        token = _suppress_construction_log.set(True)
+        try:
+            if error_map and type(error) in error_map:
+                error_class = error_map[type(error)]
+                return error_class(str(error), cause=error)
+            return BaseError(
+                message=str(error) or default_message,
+                category=ErrorCategory.UNKNOWN,
+                severity=ErrorSeverity.ERROR,
+                code="ERR_UNKNOWN",
+                cause=error
+            )
+        finally:
+            _suppress_construction_log.reset(token)
+    
     @staticmethod
     def handle_error(
         error: Union[BaseError, Exception],
         default_message: str = "An unexpected error occurred",
         log_error: bool = True,
         raise_error: bool = False,
-        error_map: Optional[Dict[Type[Exception], Type[BaseError]]] = None
+        error_map: Optional[Dict[Type[Exception], Type[BaseError]]] = None,
+        aggregator: Optional[ErrorAggregator] = None
     ) -> Dict[str, Any]:
         """
         Handle an error consistently.
         
+        Identical errors are only logged once per aggregation window; repeated
+        occurrences are counted.
+        
         Args:
             error: The error to handle
             default_message: Default message to use if error is not a BaseError
             log_error: Whether to log the error
             raise_error: Whether to re-raise the error after handling
             error_map: Mapping of exception types to BaseError types
+            aggregator: Aggregator to record the error in, defaults to the global one
         
         Returns:
             Dictionary representation of the error
@@ -401,26 +738,32 @@ class ErrorHandler:
         Raises:
             The original error if raise_error is True
         """
+        if aggregator is None:
+            aggregator = error_aggregator
+        
         # Convert standard exceptions to BaseError if needed
-        if not isinstance(error, BaseError):
-            if error_map and type(error) in error_map:
-                error_class = error_map[type(error)]
-                error = error_class(str(error), cause=error)
+        error_class = error_map.get(type(error)) if error_map and not isinstance(error, BaseError) else None
+        fingerprint = aggregator.fingerprint(error, error_class)
+        error = ErrorHandler._wrap(error, default_message, error_map)
+        entry, first = aggregator.record(fingerprint, error)
+        
+        # Log the error once per window
+        if log_error and first:
+            cause = error.cause
+            if entry.previous_window_count > 1:
+                logger.error(
+                    "Handled error: %s - %s%s (repeated %d times in the last window)",
+                    error.code, error.message,
+                    f" - Caused by: {cause}" if cause else "",
+                    entry.previous_window_count
+                )
             else:
-                error = BaseError(
-                    message=str(error) or default_message,
-                    category=ErrorCategory.UNKNOWN,
-                    severity=ErrorSeverity.ERROR,
-                    code="ERR_UNKNOWN",
-                    cause=error
+                logger.error(
+                    "Handled error: %s - %s%s",
+                    error.code, error.message,
+                    f" - Caused by: {cause}" if cause else ""
                 )
         
-        # Log the error if requested
-        if log_error:
-            logger.error(f"Handled error: {error.code} - {error.message}")
-            if error.cause:
-                logger.error(f"Caused by: {error.cause}")
-        
         # Re-raise the error if requested
         if raise_error:
             raise error
@@ -3,15 +3,20 @@ Structured logging module for the Dev-Server-Workflow application.
 This module provides utilities for consistent logging across the application.
 """
 
+import atexit
 import json
 import logging
 import logging.config
 import logging.handlers
 import os
+import queue
+import re
 import sys
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Tuple
 
 # Default log format
 DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -29,6 +34,16 @@ JSON_LOG_FORMAT = {
     "thread": "%(thread)d"
 }
 
+# Attributes of a LogRecord that are not treated as extra fields
+RESERVED_RECORD_ATTRS = frozenset([
+    "args", "asctime", "created", "exc_info", "exc_text", "filename",
+    "funcName", "id", "levelname", "levelno", "lineno", "module",
+    "msecs", "message", "msg", "name", "pathname", "process",
+    "processName", "relativeCreated", "stack_info", "taskName", "thread", "threadName"
+])
+
+_FIELD_PATTERN = re.compile(r"%\((\w+)\)")
+
 class JSONFormatter(logging.Formatter):
     """Formatter for JSON-structured logs."""
     
@@ -36,11 +51,20 @@ class JSONFormatter(logging.Formatter):
         """
         Initialize a new JSONFormatter.
         
+        The field templates are analysed once, so formatting a record only
+        computes the message and timestamp when a template needs them.
+        
         Args:
             fmt_dict: Dictionary of format strings for log record attributes
         """
         self.fmt_dict = fmt_dict or JSON_LOG_FORMAT
         super().__init__()
+        
+        self._fields: List[Tuple[str, str]] = list(self.fmt_dict.items())
+        used = {name for fmt in self.fmt_dict.values() for name in _FIELD_PATTERN.findall(fmt)}
+        self._needs_message = "message" in used
+        self._needs_asctime = "asctime" in used
+        self._encode = json.JSONEncoder(separators=(",", ":"), default=str).encode
     
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -52,41 +76,233 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON-formatted log record
         """
-        log_dict = {}
+        if self._needs_message:
+            record.message = record.getMessage()
+        if self._needs_asctime:
+            record.asctime = self.formatTime(record, self.datefmt)
         
         # Add standard fields from format dictionary
-        for key, fmt in self.fmt_dict.items():
-            log_dict[key] = self._format_field(record, fmt)
+        values = record.__dict__
+        log_dict = {key: fmt % values for key, fmt in self._fields}
         
         # Add exception info if present
         if record.exc_info:
-            log_dict["exception"] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_dict["exception"] = record.exc_text
         
         # Add extra fields from record
-        for key, value in record.__dict__.items():
-            if key not in ["args", "asctime", "created", "exc_info", "exc_text", "filename",
-                          "funcName", "id", "levelname", "levelno", "lineno", "module",
-                          "msecs", "message", "msg", "name", "pathname", "process",
-                          "processName", "relativeCreated", "stack_info", "thread", "threadName"]:
+        for key, value in values.items():
+            if key not in RESERVED_RECORD_ATTRS:
                 log_dict[key] = value
         
         # Convert to JSON
-        return json.dumps(log_dict)
+        return self._encode(log_dict)
+
+class RateLimitFilter(logging.Filter):
+    """
+    Filter that samples and rate-limits high-volume log messages.
+    
+    Records are grouped by logger and call site (``pathname`` and ``lineno``),
+    so a message logged in a loop is limited as one stream even if it is built
+    with an f-string. Records above ``max_level`` always pass. The state of at
+    most ``max_keys`` call sites is kept; the least recently logged ones are
+    forgotten first.
+    """
     
-    def _format_field(self, record: logging.LogRecord, fmt: str) -> str:
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_level: int = logging.INFO,
+        max_keys: int = 1024
+    ):
         """
-        Format a single field of a log record.
+        Initialize a new RateLimitFilter.
         
         Args:
-            record: Log record to format
-            fmt: Format string for the field
+            sample_rate: Fraction of records to keep (1.0 keeps all)
+            rate_limit: Maximum records per second per message (None disables rate limiting)
+            burst: Number of records that may exceed the rate at once (defaults to rate_limit)
+            max_level: Highest level the filter applies to
+            max_keys: Maximum number of call sites whose state is kept
+        """
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.rate_limit = rate_limit
+        self.burst = burst if burst is not None else max(1, int(rate_limit or 1))
+        self.max_level = max_level
+        self.max_keys = max_keys
+        
+        self.sampled_out = 0
+        self.rate_limited = 0
+        
+        self._lock = threading.Lock()
+        self._sample_counters: "OrderedDict[Tuple[str, str, int], float]" = OrderedDict()
+        self._buckets: "OrderedDict[Tuple[str, str, int], Tuple[float, float]]" = OrderedDict()
+    
+    def _store(self, mapping: OrderedDict, key: Tuple[str, str, int], value: Any) -> None:
+        """
+        Store the state of a call site, evicting the least recently used one if needed.
+        
+        Args:
+            mapping: Sample counters or token buckets
+            key: Call site
+            value: New state
+        """
+        mapping[key] = value
+        mapping.move_to_end(key)
+        if len(mapping) > self.max_keys:
+            mapping.popitem(last=False)
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decide whether a record is logged.
+        
+        Args:
+            record: Log record to check
         
         Returns:
-            Formatted field value
+            True if the record should be logged
         """
-        # Create a temporary formatter for this field
-        formatter = logging.Formatter(fmt)
-        return formatter.format(record)
+        if record.levelno > self.max_level:
+            return True
+        
+        key = (record.name, record.pathname, record.lineno)
+        with self._lock:
+            # Deterministic sampling: keep every (1 / sample_rate)-th record
+            if self.sample_rate < 1.0:
+                credit = self._sample_counters.get(key, 1.0) + self.sample_rate
+                if credit < 1.0:
+                    self._store(self._sample_counters, key, credit)
+                    self.sampled_out += 1
+                    return False
+                self._store(self._sample_counters, key, credit - 1.0)
+            
+            # Token bucket per message
+            if self.rate_limit is not None:
+                now = time.monotonic()
+                tokens, last = self._buckets.get(key, (float(self.burst), now))
+                tokens = min(float(self.burst), tokens + (now - last) * self.rate_limit)
+                if tokens < 1.0:
+                    self._store(self._buckets, key, (tokens, now))
+                    self.rate_limited += 1
+                    return False
+                self._store(self._buckets, key, (tokens - 1.0, now))
+        
+        return True
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that never blocks the logging thread.
+    
+    Records are put on a bounded queue without formatting; a QueueListener
+    formats and writes them on a background thread. When the queue is full the
+    record is dropped and counted.
+    """
+    
+    def __init__(self, log_queue: queue.Queue):
+        """
+        Initialize a new NonBlockingQueueHandler.
+        
+        Args:
+            log_queue: Queue to put records on
+        """
+        super().__init__(log_queue)
+        self.queued = 0
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for queuing.
+        
+        The listener runs in the same process, so the record is passed on
+        unchanged and formatted by the listener's handlers.
+        
+        Args:
+            record: Log record to prepare
+        
+        Returns:
+            The unchanged record
+        """
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Put a record on the queue, dropping it if the queue is full.
+        
+        Args:
+            record: Log record to enqueue
+        """
+        try:
+            self.queue.put_nowait(record)
+            self.queued += 1
+        except queue.Full:
+            self.dropped += 1
+
+# Active queue pipeline, if any
+_queue_handler: Optional[NonBlockingQueueHandler] = None
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_rate_limit_filter: Optional[RateLimitFilter] = None
+
+def start_queue_logging(
+    handlers: List[logging.Handler],
+    queue_size: int = 10000
+) -> NonBlockingQueueHandler:
+    """
+    Move formatting and I/O of the given handlers to a background thread.
+    
+    Args:
+        handlers: Handlers that write the records
+        queue_size: Maximum number of records waiting to be written
+    
+    Returns:
+        Handler that puts records on the queue
+    """
+    global _queue_handler, _queue_listener
+    
+    stop_queue_logging()
+    
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    
+    return _queue_handler
+
+def stop_queue_logging() -> None:
+    """Write all queued records, stop the background thread and detach the queue handler."""
+    global _queue_handler, _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+    
+    # Nothing drains the queue anymore, so records must not be put on it
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler.close()
+        _queue_handler = None
+
+atexit.register(stop_queue_logging)
+
+def get_logging_stats() -> Dict[str, int]:
+    """
+    Get counters of the logging pipeline.
+    
+    Returns:
+        Dictionary with queued, dropped, pending, sampled-out and rate-limited records
+    """
+    return {
+        "queued": _queue_handler.queued if _queue_handler else 0,
+        "dropped": _queue_handler.dropped if _queue_handler else 0,
+        "pending": _queue_handler.queue.qsize() if _queue_handler else 0,
+        "sampled_out": _rate_limit_filter.sampled_out if _rate_limit_filter else 0,
+        "rate_limited": _rate_limit_filter.rate_limited if _rate_limit_filter else 0
+    }
 
 class ContextAdapter(logging.LoggerAdapter):
     """Logger adapter that adds context to log records."""
@@ -113,7 +329,11 @@ def configure_logging(
     log_dir: Optional[str] = None,
     max_bytes: int = 10485760,  # 10 MB
     backup_count: int = 5,
-    enable_console: bool = True
+    enable_console: bool = True,
+    use_queue: bool = False,
+    queue_size: int = 10000,
+    sample_rate: float = 1.0,
+    rate_limit: Optional[float] = None
 ) -> None:
     """
     Configure logging for the application.
@@ -126,7 +346,13 @@ def configure_logging(
         max_bytes: Maximum size of log file before rotation
         backup_count: Number of backup log files to keep
         enable_console: Whether to enable console logging
+        use_queue: Whether to format and write records on a background thread
+        queue_size: Maximum number of queued records when use_queue is set
+        sample_rate: Fraction of INFO and DEBUG records to keep per message
+        rate_limit: Maximum INFO and DEBUG records per second per message
     """
+    global _rate_limit_filter
+    
     # Convert log level string to logging level
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
     
@@ -134,6 +360,9 @@ def configure_logging(
     if log_dir and not os.path.exists(log_dir):
         os.makedirs(log_dir)
     
+    # Flush and stop a queue pipeline configured before, also if no queue is used now
+    stop_queue_logging()
+    
     # Configure handlers
     handlers = []
     
@@ -164,10 +393,22 @@ def configure_logging(
         
         handlers.append(file_handler)
     
-    # Configure logging
+    # Move formatting and I/O off the calling thread
+    if use_queue:
+        handlers = [start_queue_logging(handlers, queue_size)]
+    
+    # Sample and rate-limit high-volume messages before they are queued
+    _rate_limit_filter = None
+    if sample_rate < 1.0 or rate_limit is not None:
+        _rate_limit_filter = RateLimitFilter(sample_rate=sample_rate, rate_limit=rate_limit)
+        for handler in handlers:
+            handler.addFilter(_rate_limit_filter)
+    
+    # Configure logging, replacing handlers installed before, e.g. by src.core.logger
     logging.basicConfig(
         level=numeric_level,
-        handlers=handlers
+        handlers=handlers,
+        force=True
     )
 
 def get_logger(
@@ -536,6 +536,182 @@ def async_rate_limited(max_calls: int, period: float) -> Callable:
     return decorator
 
 
+class RetryBudget:
+    """Token bucket limiting retries relative to the number of attempts.
+    
+    Every attempt deposits `ratio` tokens and every retry withdraws one token.
+    A minimum number of retries per second is always allowed.
+    """
+    
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        capacity: float = 20.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize the retry budget.
+        
+        Args:
+            ratio: Tokens deposited per attempt.
+            min_per_second: Tokens added per second regardless of attempts.
+            capacity: Maximum number of tokens.
+            clock: Function returning the current time in seconds.
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+    
+    def deposit(self) -> None:
+        """Record an attempt."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+    
+    def try_withdraw(self) -> bool:
+        """Try to take a token for a retry.
+        
+        Returns:
+            True if the retry is allowed, False if the budget is exhausted.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+    
+    @property
+    def tokens(self) -> float:
+        """Number of tokens currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class TimerWheel:
+    """Hashed timer wheel for scheduling many callbacks on the event loop.
+    
+    Scheduling and cancelling are O(1). Timers fire with a resolution of one tick,
+    and the wheel only runs while timers are pending. The wheel runs on the event
+    loop of the latest schedule() call; timers left over from an earlier loop are
+    dropped when it moves to another one.
+    """
+    
+    def __init__(self, tick: float = 0.05, size: int = 512):
+        """Initialize the timer wheel.
+        
+        Args:
+            tick: Duration of one tick in seconds.
+            size: Number of buckets.
+        """
+        self.tick = tick
+        self.size = size
+        self._buckets: List[List[List[Any]]] = [[] for _ in range(size)]
+        self._cursor = 0
+        self._pending = 0
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def __len__(self) -> int:
+        return self._pending
+    
+    def schedule(self, delay: float, callback: Callable[[], None]) -> List[Any]:
+        """Schedule a callback.
+        
+        Args:
+            delay: Delay in seconds.
+            callback: Function to call on the event loop after the delay.
+            
+        Returns:
+            Handle that can be passed to cancel().
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Timers of the previous loop cannot fire anymore, e.g. after asyncio.run() returned
+            self._clear()
+            self._task = None
+            self._loop = loop
+        
+        ticks = max(1, int(-(-delay // self.tick)))
+        rounds = (ticks - 1) // self.size
+        timer = [rounds, callback, False]
+        self._buckets[(self._cursor + ticks) % self.size].append(timer)
+        self._pending += 1
+        
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        return timer
+    
+    def cancel(self, timer: List[Any]) -> None:
+        """Cancel a scheduled callback.
+        
+        Args:
+            timer: Handle returned by schedule().
+        """
+        if not timer[2]:
+            timer[2] = True
+            self._pending -= 1
+    
+    def _clear(self) -> None:
+        """Drop all timers."""
+        for bucket in self._buckets:
+            for timer in bucket:
+                # Cancelling the handle later must not change the pending count
+                timer[2] = True
+            bucket.clear()
+        self._pending = 0
+    
+    def _advance(self) -> None:
+        """Move to the next bucket and fire its due timers."""
+        self._cursor = (self._cursor + 1) % self.size
+        bucket = self._buckets[self._cursor]
+        if not bucket:
+            return
+        
+        remaining = []
+        due = []
+        for timer in bucket:
+            if timer[2]:
+                continue
+            if timer[0] > 0:
+                timer[0] -= 1
+                remaining.append(timer)
+            else:
+                timer[2] = True
+                self._pending -= 1
+                due.append(timer[1])
+        self._buckets[self._cursor] = remaining
+        
+        for callback in due:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in timer callback: {e}")
+    
+    async def _run(self) -> None:
+        """Advance the wheel once per tick while timers are pending."""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while self._pending > 0:
+            next_tick += self.tick
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            self._advance()
+        
+        # Drop cancelled timers so the buckets do not grow while idle
+        for bucket in self._buckets:
+            bucket.clear()
+
+
 class CircuitBreaker:
     """Circuit breaker to prevent calls to failing services."""
     
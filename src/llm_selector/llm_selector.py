@@ -39,6 +39,8 @@ from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field, asdict
 import requests
 
+from token_counter import get_token_counter
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -46,6 +48,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger("llm_selector")
 
+# Shared token counter (BPE if a local vocabulary is configured, heuristic otherwise)
+TOKEN_COUNTER = get_token_counter(
+    encoding=os.environ.get("LLM_SELECTOR_TOKENIZER_ENCODING", "cl100k_base"),
+    vocab_dir=os.environ.get("LLM_SELECTOR_TOKENIZER_VOCAB_DIR"),
+)
+
 # Task complexity categories
 COMPLEXITY_CATEGORIES = {
     "very_simple": {
@@ -357,9 +365,8 @@ class TaskComplexityAnalyzer:
     
     @staticmethod
     def estimate_token_count(text: str) -> int:
-        """Estimate token count based on text length"""
-        # Simple estimation: approx. 4 characters per token (for German/English)
-        return max(1, len(text) // 4)
+        """Estimate token count with the shared token counter"""
+        return max(1, TOKEN_COUNTER.count(text))
     
     @staticmethod
     def detect_task_type(description: str) -> str:
@@ -30,16 +30,20 @@ basierend auf benutzerdefinierten Konfigurationen.
 
 import os
 import sys
+import ast
 import json
+import time
 import uuid
 import shutil
+import signal
 import logging
 import asyncio
 import argparse
-import subprocess
+import textwrap
 import importlib.util
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Callable
 
 # Konfiguriere Logging
 logging.basicConfig(
@@ -49,6 +53,358 @@ logging.basicConfig(
 logger = logging.getLogger('mcp-generator-server')
 
 
+# Bootstrap für vorgewärmte Interpreter. Der Interpreter importiert die Module, die
+# generierte Server benötigen, und wartet dann auf den Auftrag, einen Server auszuführen.
+# Die Ausgabe des Servers geht direkt in seine Logdatei, damit er auch weiterläuft, wenn
+# der Generator beendet wird und eine neue Generator-Instanz den Server übernimmt.
+WARM_INTERPRETER_BOOTSTRAP = """
+import os, sys, json, runpy, typing, asyncio, logging, argparse
+line = sys.stdin.readline()
+if not line:
+    sys.exit(0)
+spec = json.loads(line)
+log_fd = os.open(spec["log"], os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+os.dup2(log_fd, 1)
+os.dup2(log_fd, 2)
+os.close(log_fd)
+os.chdir(spec["cwd"])
+sys.path.insert(0, spec["cwd"])
+sys.argv = [spec["path"]] + spec.get("args", [])
+runpy.run_path(spec["path"], run_name="__main__")
+"""
+
+
+def rotate_log(path: str, max_bytes: int = 10485760, backup_count: int = 5) -> None:
+    """
+    Rotiere eine Logdatei, wenn sie größer als max_bytes ist (server.log -> server.log.1 -> ... -> server.log.N).
+    
+    Args:
+        path: Pfad zur Logdatei
+        max_bytes: Maximale Größe der Logdatei vor der Rotation
+        backup_count: Anzahl der aufbewahrten rotierten Logdateien
+    """
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return
+    
+    if max_bytes <= 0 or size <= max_bytes:
+        return
+    
+    if backup_count > 0:
+        for index in range(backup_count - 1, 0, -1):
+            source = f"{path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{path}.{index + 1}")
+        os.replace(path, f"{path}.1")
+    else:
+        os.remove(path)
+
+
+class SupervisedProcess:
+    """
+    Ein vom Supervisor verwalteter Serverprozess.
+    """
+    
+    def __init__(self, server_id: str, pid: int, process: Optional[asyncio.subprocess.Process] = None):
+        """
+        Initialisiere den verwalteten Prozess.
+        
+        Args:
+            server_id: ID des Servers
+            pid: PID des Prozesses
+            process: Der Kindprozess oder None, wenn der Prozess von einer früheren
+                Generator-Instanz gestartet wurde
+        """
+        self.server_id = server_id
+        self.pid = pid
+        self.process = process
+        self.started_at = time.time()
+        self.tasks: List[asyncio.Task] = []
+    
+    @property
+    def running(self) -> bool:
+        """
+        Überprüfe, ob der Prozess läuft.
+        
+        Returns:
+            True, wenn der Prozess läuft
+        """
+        if self.process is not None:
+            return self.process.returncode is None
+        
+        # Fremder Prozess: keine Exit-Benachrichtigung möglich
+        try:
+            os.kill(self.pid, 0)
+            return True
+        except OSError:
+            return False
+    
+    @property
+    def returncode(self) -> Optional[int]:
+        """
+        Rufe den Exit-Code des Prozesses ab.
+        
+        Returns:
+            Exit-Code oder None, wenn der Prozess läuft oder unbekannt ist
+        """
+        return self.process.returncode if self.process is not None else None
+
+
+class ProcessSupervisor:
+    """
+    Supervisor für die Prozesse generierter MCP-Server.
+    
+    Die Server laufen als Kindprozesse der Event-Loop. Ihr Ende wird über die
+    Child-Watcher von asyncio gemeldet, sodass der Status ohne PID-Dateien und
+    Systemaufrufe im Speicher vorliegt. Neue Server werden in vorgewärmten
+    Interpretern gestartet und schreiben ihre Ausgabe direkt in ihre Logdatei, die
+    vor jedem Start rotiert wird, wenn sie zu groß geworden ist.
+    """
+    
+    def __init__(
+        self,
+        servers_dir: str,
+        warm_pool_size: int = 2,
+        log_max_bytes: int = 10485760,
+        log_backup_count: int = 5,
+        stop_timeout: float = 5.0,
+        on_exit: Optional[Callable[[str, Optional[int]], None]] = None
+    ):
+        """
+        Initialisiere den Supervisor.
+        
+        Args:
+            servers_dir: Verzeichnis für generierte Server
+            warm_pool_size: Anzahl vorgewärmter Interpreter (0 deaktiviert das Vorwärmen)
+            log_max_bytes: Maximale Größe einer Logdatei, ab der sie beim Start rotiert wird
+            log_backup_count: Anzahl der aufbewahrten rotierten Logdateien
+            stop_timeout: Wartezeit nach SIGTERM, bevor ein Server mit SIGKILL beendet wird
+            on_exit: Callback, der mit Server-ID und Exit-Code aufgerufen wird, wenn ein Server endet
+        """
+        self.servers_dir = servers_dir
+        self.warm_pool_size = warm_pool_size
+        self.log_max_bytes = log_max_bytes
+        self.log_backup_count = log_backup_count
+        self.stop_timeout = stop_timeout
+        self.on_exit = on_exit
+        
+        self.processes: Dict[str, SupervisedProcess] = {}
+        self._warm_pool: deque = deque()
+        self._fill_task: Optional[asyncio.Task] = None
+    
+    def adopt(self, server_id: str, pid: int) -> bool:
+        """
+        Übernimm einen Server, der von einer früheren Generator-Instanz gestartet wurde.
+        
+        Args:
+            server_id: ID des Servers
+            pid: PID des Prozesses
+            
+        Returns:
+            True, wenn der Prozess noch läuft und übernommen wurde
+        """
+        supervised = SupervisedProcess(server_id, pid)
+        if not supervised.running:
+            return False
+        
+        self.processes[server_id] = supervised
+        return True
+    
+    def is_running(self, server_id: str) -> bool:
+        """
+        Überprüfe, ob ein Server läuft.
+        
+        Args:
+            server_id: ID des Servers
+            
+        Returns:
+            True, wenn der Server läuft
+        """
+        supervised = self.processes.get(server_id)
+        return supervised is not None and supervised.running
+    
+    def get_status(self, server_id: str) -> Dict[str, Any]:
+        """
+        Rufe den Status eines Servers ab.
+        
+        Args:
+            server_id: ID des Servers
+            
+        Returns:
+            Dict mit dem Status
+        """
+        supervised = self.processes.get(server_id)
+        if supervised is None or not supervised.running:
+            return {
+                "status": "stopped",
+                "returncode": supervised.returncode if supervised else None
+            }
+        
+        return {
+            "status": "running",
+            "pid": supervised.pid,
+            "uptime": time.time() - supervised.started_at
+        }
+    
+    async def prewarm(self) -> None:
+        """
+        Fülle den Pool vorgewärmter Interpreter im Hintergrund auf.
+        """
+        if self.warm_pool_size <= 0:
+            return
+        
+        if self._fill_task is None or self._fill_task.done():
+            self._fill_task = asyncio.create_task(self._fill_warm_pool())
+    
+    async def _fill_warm_pool(self) -> None:
+        """
+        Starte Interpreter, bis der Pool voll ist.
+        """
+        while len(self._warm_pool) < self.warm_pool_size:
+            try:
+                self._warm_pool.append(await self._spawn_interpreter())
+            except Exception as e:
+                logger.error(f"Fehler beim Vorwärmen eines Interpreters: {e}")
+                return
+    
+    async def _spawn_interpreter(self) -> asyncio.subprocess.Process:
+        """
+        Starte einen Interpreter, der auf einen Server wartet.
+        
+        Returns:
+            Der Interpreterprozess
+        """
+        return await asyncio.create_subprocess_exec(
+            sys.executable, "-c", WARM_INTERPRETER_BOOTSTRAP,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+            env={**os.environ, "PYTHONUNBUFFERED": "1"}
+        )
+    
+    async def _take_interpreter(self) -> asyncio.subprocess.Process:
+        """
+        Entnimm einen vorgewärmten Interpreter oder starte einen neuen.
+        
+        Returns:
+            Der Interpreterprozess
+        """
+        while self._warm_pool:
+            process = self._warm_pool.popleft()
+            if process.returncode is None:
+                return process
+        
+        return await self._spawn_interpreter()
+    
+    async def start(self, server_id: str, args: Optional[List[str]] = None) -> int:
+        """
+        Starte einen Server.
+        
+        Args:
+            server_id: ID des Servers
+            args: Zusätzliche Kommandozeilenargumente für den Server
+            
+        Returns:
+            PID des Serverprozesses
+        """
+        if self.is_running(server_id):
+            return self.processes[server_id].pid
+        
+        server_dir = os.path.abspath(os.path.join(self.servers_dir, server_id))
+        spec = {
+            "cwd": server_dir,
+            "path": os.path.join(server_dir, "server.py"),
+            "args": args or [],
+            "log": os.path.join(server_dir, "server.log")
+        }
+        rotate_log(spec["log"], self.log_max_bytes, self.log_backup_count)
+        
+        process = await self._take_interpreter()
+        supervised = SupervisedProcess(server_id, process.pid, process)
+        
+        # Übergib dem Interpreter den Server und schließe stdin
+        process.stdin.write(f"{json.dumps(spec)}\n".encode())
+        await process.stdin.drain()
+        process.stdin.close()
+        
+        self.processes[server_id] = supervised
+        supervised.tasks.append(asyncio.create_task(self._watch(supervised)))
+        
+        # Ersetze den entnommenen Interpreter
+        await self.prewarm()
+        
+        return process.pid
+    
+    async def _watch(self, supervised: SupervisedProcess) -> None:
+        """
+        Warte auf das Ende eines Servers und melde es.
+        
+        Args:
+            supervised: Der verwaltete Prozess
+        """
+        returncode = await supervised.process.wait()
+        logger.info(f"Server {supervised.server_id} beendet (Exit-Code {returncode})")
+        
+        if self.processes.get(supervised.server_id) is supervised and self.on_exit:
+            self.on_exit(supervised.server_id, returncode)
+    
+    async def stop(self, server_id: str) -> bool:
+        """
+        Stoppe einen Server.
+        
+        Der Server erhält SIGTERM und nach Ablauf von stop_timeout SIGKILL.
+        
+        Args:
+            server_id: ID des Servers
+            
+        Returns:
+            True, wenn der Server lief und gestoppt wurde
+        """
+        supervised = self.processes.pop(server_id, None)
+        if supervised is None or not supervised.running:
+            return False
+        
+        if supervised.process is None:
+            # Übernommener Prozess ohne Exit-Benachrichtigung
+            os.kill(supervised.pid, signal.SIGTERM)
+            deadline = time.monotonic() + self.stop_timeout
+            while supervised.running and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+            if supervised.running:
+                os.kill(supervised.pid, signal.SIGKILL)
+            return True
+        
+        supervised.process.terminate()
+        try:
+            await asyncio.wait_for(supervised.process.wait(), timeout=self.stop_timeout)
+        except asyncio.TimeoutError:
+            supervised.process.kill()
+            await supervised.process.wait()
+        
+        await asyncio.gather(*supervised.tasks, return_exceptions=True)
+        return True
+    
+    async def shutdown(self) -> None:
+        """
+        Stoppe alle Server und beende die vorgewärmten Interpreter.
+        """
+        if self._fill_task is not None:
+            self._fill_task.cancel()
+        
+        while self._warm_pool:
+            process = self._warm_pool.popleft()
+            if process.returncode is None:
+                # Ohne Auftrag beendet sich der Interpreter selbst
+                process.stdin.close()
+                await process.wait()
+        
+        await asyncio.gather(
+            *(self.stop(server_id) for server_id in list(self.processes)),
+            return_exceptions=True
+        )
+
+
 class MCPServerGenerator:
     """
     Generator für MCP-Server.
@@ -73,6 +429,9 @@ class MCPServerGenerator:
         # Erstelle das Verzeichnis für generierte Server, falls es nicht existiert
         os.makedirs(servers_dir, exist_ok=True)
         
+        # Initialisiere den Supervisor für die Serverprozesse
+        self.supervisor = ProcessSupervisor(servers_dir, on_exit=self._on_server_exit)
+        
         # Initialisiere die Server
         self.servers = {}
         self._load_existing_servers()
@@ -196,6 +555,11 @@ class MCPServerGenerator:
                     }
                 }
             },
+            {
+                "name": "get_all_server_status",
+                "description": "Ruft den Status aller MCP-Server ab",
+                "parameters": {}
+            },
             {
                 "name": "get_server_logs",
                 "description": "Ruft die Logs eines MCP-Servers ab",
@@ -600,9 +964,23 @@ def _list_directory(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
                             }
                         }
                     },
+                    {
+                        "name": "insert_many",
+                        "description": "Fügt mehrere Zeilen in einer Transaktion in eine Tabelle ein",
+                        "parameters": {
+                            "table_name": {
+                                "type": "string",
+                                "description": "Name der Tabelle"
+                            },
+                            "rows": {
+                                "type": "array",
+                                "description": "Zeilen, die eingefügt werden sollen"
+                            }
+                        }
+                    },
                     {
                         "name": "query_data",
-                        "description": "Fragt Daten aus einer Tabelle ab",
+                        "description": "Fragt Daten aus einer Tabelle seitenweise ab",
                         "parameters": {
                             "table_name": {
                                 "type": "string",
@@ -611,6 +989,14 @@ def _list_directory(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
                             "query": {
                                 "type": "object",
                                 "description": "Abfrage"
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Maximale Anzahl von Zeilen pro Seite"
+                            },
+                            "cursor": {
+                                "type": "integer",
+                                "description": "Cursor der nächsten Seite aus einem vorherigen Ergebnis"
                             }
                         }
                     },
@@ -632,19 +1018,137 @@ def _list_directory(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
                 "implementation": """
 import os
 import json
+import queue
 import sqlite3
+import threading
 from pathlib import Path
+from contextlib import contextmanager
+
+# Einstellungen für den Datenbankzugriff
+DB_POOL_SIZE = int(os.environ.get("MCP_DB_POOL_SIZE", "4"))
+DB_STATEMENT_CACHE_SIZE = int(os.environ.get("MCP_DB_STATEMENT_CACHE_SIZE", "256"))
+DB_BUSY_TIMEOUT = float(os.environ.get("MCP_DB_BUSY_TIMEOUT", "5.0"))
+DB_DEFAULT_PAGE_SIZE = int(os.environ.get("MCP_DB_PAGE_SIZE", "1000"))
+
+
+class ConnectionPool:
+    \"\"\"
+    Pool langlebiger SQLite-Verbindungen.
+    
+    Die Verbindungen laufen im WAL-Modus und cachen vorbereitete Anweisungen,
+    sodass wiederholte Abfragen nicht erneut kompiliert werden.
+    \"\"\"
+    
+    def __init__(self, path: str, size: int = DB_POOL_SIZE):
+        \"\"\"
+        Initialisiere den Pool.
+        
+        Args:
+            path: Pfad zur Datenbank
+            size: Maximale Anzahl von Verbindungen
+        \"\"\"
+        self.path = path
+        self.size = max(1, size)
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        \"\"\"
+        Öffne eine neue Verbindung.
+        
+        Returns:
+            Die Verbindung
+        \"\"\"
+        conn = sqlite3.connect(
+            self.path,
+            timeout=DB_BUSY_TIMEOUT,
+            check_same_thread=False,
+            cached_statements=DB_STATEMENT_CACHE_SIZE
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    @contextmanager
+    def connection(self):
+        \"\"\"
+        Leihe eine Verbindung aus dem Pool.
+        
+        Yields:
+            Die Verbindung
+        \"\"\"
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._lock:
+                if self._created < self.size:
+                    self._created += 1
+                    conn = self._connect()
+            if conn is None:
+                conn = self._idle.get()
+        
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _quote_identifier(name: str) -> str:
+    \"\"\"
+    Setze einen Tabellen- oder Spaltennamen in Anführungszeichen.
+    
+    Args:
+        name: Der Name
+        
+    Returns:
+        Der maskierte Name
+    \"\"\"
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _build_where(query: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    \"\"\"
+    Erstelle eine WHERE-Klausel aus Gleichheitsbedingungen.
+    
+    Args:
+        query: Spaltennamen und Werte
+        
+    Returns:
+        Die Bedingungen und ihre Werte
+    \"\"\"
+    conditions = [f"{_quote_identifier(key)} = ?" for key in query]
+    return " AND ".join(conditions), list(query.values())
 
 def _get_db_path(self) -> str:
     \"\"\"
-    Gibt den Pfad zur Datenbank zurück.
+    Gibt den Pfad zur Datenbank im Verzeichnis des Servers zurück.
     
     Returns:
         Pfad zur Datenbank
     \"\"\"
-    db_dir = Path(self.servers_dir) / self.server_id
-    os.makedirs(db_dir, exist_ok=True)
-    return str(db_dir / "database.db")
+    return str(Path(self.servers_dir) / "database.db")
+
+def _get_pool(self) -> ConnectionPool:
+    \"\"\"
+    Gibt den Verbindungspool der Datenbank zurück.
+    
+    Returns:
+        Der Verbindungspool
+    \"\"\"
+    path = self._get_db_path()
+    with _POOLS_LOCK:
+        pool = _POOLS.get(path)
+        if pool is None:
+            pool = _POOLS[path] = ConnectionPool(path)
+    return pool
 
 def _create_table(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
     \"\"\"
@@ -670,21 +1174,18 @@ def _create_table(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         }
     
     try:
-        conn = sqlite3.connect(self._get_db_path())
-        cursor = conn.cursor()
-        
         # Erstelle die Tabelle
         column_defs = []
         for column in columns:
             name = column.get("name", "")
             type = column.get("type", "TEXT")
-            column_defs.append(f"{name} {type}")
+            column_defs.append(f"{_quote_identifier(name)} {type}")
         
-        sql = f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(column_defs)})"
-        cursor.execute(sql)
+        sql = f"CREATE TABLE IF NOT EXISTS {_quote_identifier(table_name)} ({', '.join(column_defs)})"
         
-        conn.commit()
-        conn.close()
+        with self._get_pool().connection() as conn:
+            with conn:
+                conn.execute(sql)
         
         return {
             "success": True,
@@ -719,23 +1220,69 @@ def _insert_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         }
     
     try:
-        conn = sqlite3.connect(self._get_db_path())
-        cursor = conn.cursor()
-        
         # Füge die Daten ein
-        columns = list(data.keys())
-        values = list(data.values())
-        placeholders = ", ".join(["?" for _ in values])
+        columns = ", ".join(_quote_identifier(column) for column in data)
+        placeholders = ", ".join(["?" for _ in data])
+        
+        sql = f"INSERT INTO {_quote_identifier(table_name)} ({columns}) VALUES ({placeholders})"
+        
+        with self._get_pool().connection() as conn:
+            with conn:
+                cursor = conn.execute(sql, list(data.values()))
+        
+        return {
+            "success": True,
+            "message": f"Data inserted into {table_name}",
+            "row_id": cursor.lastrowid
+        }
+    except Exception as e:
+        return {
+            "error": f"Error inserting data: {str(e)}"
+        }
+
+def _insert_many(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    \"\"\"
+    Fügt mehrere Zeilen in einer Transaktion in eine Tabelle ein.
+    
+    Die Spalten ergeben sich aus den Schlüsseln aller Zeilen; fehlende Werte werden
+    als NULL eingefügt.
+    
+    Args:
+        parameters: Parameter für die Funktion
+        
+    Returns:
+        Dict mit dem Ergebnis
+    \"\"\"
+    table_name = parameters.get("table_name", "")
+    rows = parameters.get("rows", [])
+    
+    if not table_name:
+        return {
+            "error": "Table name is required"
+        }
+    
+    if not rows:
+        return {
+            "error": "Rows are required"
+        }
+    
+    try:
+        # Ermittle die Spalten in der Reihenfolge ihres ersten Auftretens
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+        placeholders = ", ".join(["?" for _ in columns])
+        column_list = ", ".join(_quote_identifier(column) for column in columns)
         
-        sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
-        cursor.execute(sql, values)
+        sql = f"INSERT INTO {_quote_identifier(table_name)} ({column_list}) VALUES ({placeholders})"
+        values = [tuple(row.get(column) for column in columns) for row in rows]
         
-        conn.commit()
-        conn.close()
+        with self._get_pool().connection() as conn:
+            with conn:
+                conn.executemany(sql, values)
         
         return {
             "success": True,
-            "message": f"Data inserted into {table_name}"
+            "message": f"{len(values)} rows inserted into {table_name}",
+            "inserted": len(values)
         }
     except Exception as e:
         return {
@@ -746,6 +1293,9 @@ def _query_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
     \"\"\"
     Fragt Daten aus einer Tabelle ab.
     
+    Die Ergebnisse werden seitenweise geliefert. Ist "next_cursor" im Ergebnis
+    gesetzt, liefert ein weiterer Aufruf mit diesem Wert als "cursor" die nächste Seite.
+    
     Args:
         parameters: Parameter für die Funktion
         
@@ -754,6 +1304,8 @@ def _query_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
     \"\"\"
     table_name = parameters.get("table_name", "")
     query = parameters.get("query", {})
+    limit = max(1, int(parameters.get("limit") or DB_DEFAULT_PAGE_SIZE))
+    after = parameters.get("cursor")
     
     if not table_name:
         return {
@@ -761,40 +1313,29 @@ def _query_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         }
     
     try:
-        conn = sqlite3.connect(self._get_db_path())
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        # Erstelle die WHERE-Klausel
-        where_clause = ""
-        values = []
-        
-        if query:
-            conditions = []
-            for key, value in query.items():
-                conditions.append(f"{key} = ?")
-                values.append(value)
-            
-            where_clause = f"WHERE {' AND '.join(conditions)}"
+        conditions, values = _build_where(query or {})
         
-        # Führe die Abfrage aus
-        sql = f"SELECT * FROM {table_name} {where_clause}"
-        cursor.execute(sql, values)
+        # Blättere über die rowid, damit jede Seite ohne OFFSET gelesen wird
+        if after is not None:
+            conditions = " AND ".join(filter(None, [conditions, "rowid > ?"]))
+            values.append(int(after))
         
-        # Hole die Ergebnisse
-        rows = cursor.fetchall()
-        results = []
+        where_clause = f"WHERE {conditions}" if conditions else ""
+        sql = f"SELECT rowid, * FROM {_quote_identifier(table_name)} {where_clause} ORDER BY rowid LIMIT ?"
+        values.append(limit + 1)
         
-        for row in rows:
-            result = {}
-            for key in row.keys():
-                result[key] = row[key]
-            results.append(result)
+        with self._get_pool().connection() as conn:
+            cursor = conn.execute(sql, values)
+            columns = [description[0] for description in cursor.description[1:]]
+            rows = cursor.fetchall()
         
-        conn.close()
+        # Eine zusätzliche Zeile zeigt an, ob es eine weitere Seite gibt
+        next_cursor = rows[limit - 1][0] if len(rows) > limit else None
+        results = [dict(zip(columns, row[1:])) for row in rows[:limit]]
         
         return {
-            "results": results
+            "results": results,
+            "next_cursor": next_cursor
         }
     except Exception as e:
         return {
@@ -820,31 +1361,21 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         }
     
     try:
-        conn = sqlite3.connect(self._get_db_path())
-        cursor = conn.cursor()
-        
         # Erstelle die WHERE-Klausel
-        where_clause = ""
-        values = []
-        
-        if query:
-            conditions = []
-            for key, value in query.items():
-                conditions.append(f"{key} = ?")
-                values.append(value)
-            
-            where_clause = f"WHERE {' AND '.join(conditions)}"
+        conditions, values = _build_where(query or {})
+        where_clause = f"WHERE {conditions}" if conditions else ""
         
         # Führe die Löschung aus
-        sql = f"DELETE FROM {table_name} {where_clause}"
-        cursor.execute(sql, values)
+        sql = f"DELETE FROM {_quote_identifier(table_name)} {where_clause}"
         
-        conn.commit()
-        conn.close()
+        with self._get_pool().connection() as conn:
+            with conn:
+                cursor = conn.execute(sql, values)
         
         return {
             "success": True,
-            "message": f"Data deleted from {table_name}"
+            "message": f"Data deleted from {table_name}",
+            "deleted": cursor.rowcount
         }
     except Exception as e:
         return {
@@ -868,10 +1399,77 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
                             config = json.load(f)
                         
                         self.servers[server_dir] = config
+                        self._reconcile_server(server_dir)
                         logger.info(f"Loaded server {config['name']} (ID: {server_dir})")
                     except Exception as e:
                         logger.error(f"Error loading server {server_dir}: {e}")
     
+    def _reconcile_server(self, server_id: str) -> None:
+        """
+        Gleiche den gespeicherten Status eines Servers mit dem laufenden Prozess ab.
+        
+        Server, die von einer früheren Generator-Instanz gestartet wurden und noch
+        laufen, werden vom Supervisor übernommen.
+        
+        Args:
+            server_id: ID des Servers
+        """
+        server = self.servers[server_id]
+        pid_path = os.path.join(self.servers_dir, server_id, "server.pid")
+        
+        running = False
+        if os.path.isfile(pid_path):
+            try:
+                with open(pid_path, "r") as f:
+                    running = self.supervisor.adopt(server_id, int(f.read().strip()))
+            except (OSError, ValueError):
+                running = False
+            
+            if not running:
+                os.remove(pid_path)
+        
+        status = "running" if running else "stopped"
+        if server.get("status") != status:
+            self._set_server_status(server_id, status)
+    
+    def _save_server_config(self, server_id: str) -> None:
+        """
+        Speichere die Konfiguration eines Servers.
+        
+        Args:
+            server_id: ID des Servers
+        """
+        with open(os.path.join(self.servers_dir, server_id, "config.json"), "w") as f:
+            json.dump(self.servers[server_id], f, indent=2)
+    
+    def _set_server_status(self, server_id: str, status: str) -> None:
+        """
+        Setze den Status eines Servers und speichere ihn.
+        
+        Args:
+            server_id: ID des Servers
+            status: Neuer Status
+        """
+        self.servers[server_id]["status"] = status
+        self._save_server_config(server_id)
+    
+    def _on_server_exit(self, server_id: str, returncode: Optional[int]) -> None:
+        """
+        Verarbeite das unerwartete Ende eines Servers.
+        
+        Args:
+            server_id: ID des Servers
+            returncode: Exit-Code des Servers
+        """
+        if server_id not in self.servers:
+            return
+        
+        pid_path = os.path.join(self.servers_dir, server_id, "server.pid")
+        if os.path.isfile(pid_path):
+            os.remove(pid_path)
+        
+        self._set_server_status(server_id, "stopped")
+    
     def get_server_info(self) -> Dict[str, Any]:
         """
         Rufe Informationen über den MCP-Server-Generator ab.
@@ -906,7 +1504,7 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
             parameters: Parameter für die Funktion
             
         Returns:
-            Dict mit dem Ergebnis der Funktion
+            Dict mit dem Ergebnis der Funktion oder eine Koroutine, die es liefert
             
         Raises:
             Exception: Wenn die Funktion nicht gefunden wurde oder ein Fehler auftrat
@@ -946,6 +1544,9 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         port = parameters.get("port", 3100)
         implementation = parameters.get("implementation", "")
         
+        # Generiere den Code, bevor Dateien angelegt werden
+        server_code = self._generate_server_code(name, description, functions, port, implementation)
+        
         # Generiere eine ID für den Server
         server_id = str(uuid.uuid4())
         
@@ -966,8 +1567,6 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
             json.dump(config, f, indent=2)
         
         # Erstelle die Implementierungsdatei
-        server_code = self._generate_server_code(name, description, functions, port, implementation)
-        
         with open(os.path.join(server_dir, "server.py"), "w") as f:
             f.write(server_code)
         
@@ -1108,7 +1707,7 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
             "status": server["status"]
         }
     
-    def _delete_server(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def _delete_server(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
         Lösche einen MCP-Server.
         
@@ -1131,7 +1730,7 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         # Stoppe den Server, falls er läuft
         server = self.servers[server_id]
         if server["status"] == "running":
-            self._stop_server({"server_id": server_id})
+            await self._stop_server({"server_id": server_id})
         
         # Lösche das Verzeichnis
         shutil.rmtree(os.path.join(self.servers_dir, server_id))
@@ -1144,7 +1743,7 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
             "message": f"Server {server_id} erfolgreich gelöscht"
         }
     
-    def _start_server(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def _start_server(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
         Starte einen MCP-Server.
         
@@ -1164,42 +1763,27 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         if server_id not in self.servers:
             raise Exception(f"Server {server_id} nicht gefunden")
         
-        server = self.servers[server_id]
-        
         # Überprüfe, ob der Server bereits läuft
-        if server["status"] == "running":
+        if self.supervisor.is_running(server_id):
             return {
                 "success": True,
                 "message": f"Server {server_id} läuft bereits"
             }
         
-        # Starte den Server
-        server_path = os.path.join(self.servers_dir, server_id, "server.py")
-        log_path = os.path.join(self.servers_dir, server_id, "server.log")
-        
         try:
-            process = subprocess.Popen(
-                [sys.executable, server_path],
-                stdout=open(log_path, "a"),
-                stderr=subprocess.STDOUT,
-                cwd=os.path.join(self.servers_dir, server_id)
-            )
+            pid = await self.supervisor.start(server_id, ["--server-id", server_id])
             
-            # Speichere die PID
+            # Speichere die PID für externe Skripte
             with open(os.path.join(self.servers_dir, server_id, "server.pid"), "w") as f:
-                f.write(str(process.pid))
+                f.write(str(pid))
             
             # Aktualisiere den Status
-            server["status"] = "running"
-            
-            # Speichere die Konfiguration
-            with open(os.path.join(self.servers_dir, server_id, "config.json"), "w") as f:
-                json.dump(server, f, indent=2)
+            self._set_server_status(server_id, "running")
             
             return {
                 "success": True,
                 "message": f"Server {server_id} erfolgreich gestartet",
-                "pid": process.pid
+                "pid": pid
             }
         except Exception as e:
             return {
@@ -1207,7 +1791,7 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
                 "message": f"Fehler beim Starten des Servers {server_id}: {e}"
             }
     
-    def _stop_server(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def _stop_server(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
         Stoppe einen MCP-Server.
         
@@ -1227,39 +1811,25 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         if server_id not in self.servers:
             raise Exception(f"Server {server_id} nicht gefunden")
         
-        server = self.servers[server_id]
-        
         # Überprüfe, ob der Server läuft
-        if server["status"] != "running":
+        if not self.supervisor.is_running(server_id):
+            if self.servers[server_id]["status"] != "stopped":
+                self._set_server_status(server_id, "stopped")
             return {
                 "success": True,
                 "message": f"Server {server_id} läuft nicht"
             }
         
-        # Hole die PID
-        pid_path = os.path.join(self.servers_dir, server_id, "server.pid")
-        if not os.path.isfile(pid_path):
-            return {
-                "success": False,
-                "message": f"PID-Datei für Server {server_id} nicht gefunden"
-            }
-        
         try:
-            with open(pid_path, "r") as f:
-                pid = int(f.read().strip())
-            
-            # Töte den Prozess
-            os.kill(pid, 9)
+            await self.supervisor.stop(server_id)
             
             # Lösche die PID-Datei
-            os.remove(pid_path)
+            pid_path = os.path.join(self.servers_dir, server_id, "server.pid")
+            if os.path.isfile(pid_path):
+                os.remove(pid_path)
             
             # Aktualisiere den Status
-            server["status"] = "stopped"
-            
-            # Speichere die Konfiguration
-            with open(os.path.join(self.servers_dir, server_id, "config.json"), "w") as f:
-                json.dump(server, f, indent=2)
+            self._set_server_status(server_id, "stopped")
             
             return {
                 "success": True,
@@ -1271,7 +1841,7 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
                 "message": f"Fehler beim Stoppen des Servers {server_id}: {e}"
             }
     
-    def _restart_server(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def _restart_server(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
         Starte einen MCP-Server neu.
         
@@ -1289,17 +1859,20 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
             raise Exception("Parameter server_id fehlt")
         
         # Stoppe den Server
-        stop_result = self._stop_server({"server_id": server_id})
+        stop_result = await self._stop_server({"server_id": server_id})
         if not stop_result["success"]:
             return stop_result
         
         # Starte den Server
-        return self._start_server({"server_id": server_id})
+        return await self._start_server({"server_id": server_id})
     
     def _get_server_status(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
         Rufe den Status eines MCP-Servers ab.
         
+        Der Status stammt vom Supervisor, der das Ende eines Serverprozesses sofort
+        erfährt. Es werden weder PID-Dateien gelesen noch Konfigurationen geschrieben.
+        
         Args:
             parameters: Parameter für die Funktion
             
@@ -1316,34 +1889,31 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         if server_id not in self.servers:
             raise Exception(f"Server {server_id} nicht gefunden")
         
-        server = self.servers[server_id]
-        
-        # Überprüfe, ob der Server läuft
-        pid_path = os.path.join(self.servers_dir, server_id, "server.pid")
-        if os.path.isfile(pid_path):
-            try:
-                with open(pid_path, "r") as f:
-                    pid = int(f.read().strip())
-                
-                # Überprüfe, ob der Prozess läuft
-                try:
-                    os.kill(pid, 0)
-                    server["status"] = "running"
-                except OSError:
-                    server["status"] = "stopped"
-                    os.remove(pid_path)
-            except Exception:
-                server["status"] = "stopped"
-        else:
-            server["status"] = "stopped"
-        
-        # Speichere die Konfiguration
-        with open(os.path.join(self.servers_dir, server_id, "config.json"), "w") as f:
-            json.dump(server, f, indent=2)
-        
         return {
             "server_id": server_id,
-            "status": server["status"]
+            **self.supervisor.get_status(server_id)
+        }
+    
+    def _get_all_server_status(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Rufe den Status aller MCP-Server ab.
+        
+        Args:
+            parameters: Parameter für die Funktion
+            
+        Returns:
+            Dict mit dem Status aller Server
+        """
+        return {
+            "servers": [
+                {
+                    "server_id": server_id,
+                    "name": server["name"],
+                    "port": server["port"],
+                    **self.supervisor.get_status(server_id)
+                }
+                for server_id, server in self.servers.items()
+            ]
         }
     
     def _get_server_logs(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
@@ -1440,7 +2010,25 @@ def _delete_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
             
         Returns:
             Generierter Code
+            
+        Raises:
+            Exception: Wenn die Implementierung kein gültiger Python-Code ist
         """
+        # Die Implementierung steht auf Modulebene, ihre Funktionen werden als Methoden gebunden
+        class_name = f"{name.replace(' ', '')}MCPServer"
+        implementation = textwrap.dedent(implementation or "").strip("\n")
+        
+        try:
+            tree = ast.parse(implementation)
+        except SyntaxError as e:
+            raise Exception(f"Ungültige Implementierung: {e}")
+        
+        bindings = "\n".join(
+            f"{class_name}.{node.name} = {node.name}"
+            for node in tree.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        )
+        
         # Erstelle den Code
         code = f"""#!/usr/bin/env python3
 \"\"\"
@@ -1454,6 +2042,9 @@ import sys
 import json
 import logging
 import asyncio
+import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Union, Tuple
 
 # Konfiguriere Logging
@@ -1463,6 +2054,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger('{name.lower()}-mcp-server')
 
+# Standardwerte für die Verarbeitung von Anfragen
+DEFAULT_MAX_WORKERS = int(os.environ.get("MCP_MAX_WORKERS", "8"))
+DEFAULT_MAX_IN_FLIGHT = int(os.environ.get("MCP_MAX_IN_FLIGHT", "32"))
+# Maximale Größe einer Anfrage in Bytes, z. B. für insert_many mit vielen Zeilen
+DEFAULT_MAX_REQUEST_SIZE = int(os.environ.get("MCP_MAX_REQUEST_SIZE", str(16 * 1024 * 1024)))
+
+
+# Implementierung der Funktionen
+{implementation}
+
 
 class {name.replace(' ', '')}MCPServer:
     \"\"\"
@@ -1471,7 +2072,15 @@ class {name.replace(' ', '')}MCPServer:
     {description}
     \"\"\"
     
-    def __init__(self, host: str = "0.0.0.0", port: int = {port}, server_id: str = ""):
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = {port},
+        server_id: str = "",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_request_size: int = DEFAULT_MAX_REQUEST_SIZE
+    ):
         \"\"\"
         Initialisiere den {name} MCP-Server.
         
@@ -1479,11 +2088,17 @@ class {name.replace(' ', '')}MCPServer:
             host: Host für den MCP-Server
             port: Port für den MCP-Server
             server_id: ID des Servers
+            max_workers: Anzahl der Threads für Funktionsaufrufe
+            max_in_flight: Maximale Anzahl offener Anfragen pro Verbindung
+            max_request_size: Maximale Größe einer Anfrage in Bytes
         \"\"\"
         self.host = host
         self.port = port
         self.server_id = server_id
         self.servers_dir = os.path.dirname(os.path.abspath(__file__))
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_request_size = max(1, max_request_size)
+        self.executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
         
         # Definiere die verfügbaren Funktionen
         self.functions = {json.dumps(functions, indent=4)}
@@ -1538,28 +2153,37 @@ class {name.replace(' ', '')}MCPServer:
         else:
             raise Exception(f"Methode {{method_name}} nicht implementiert")
     
-{implementation}
-    
     async def start(self):
         \"\"\"
         Starte den MCP-Server.
         \"\"\"
+        # Ohne limit bricht asyncio Zeilen über 64 KiB ab
         server = await asyncio.start_server(
             self._handle_client,
             self.host,
-            self.port
+            self.port,
+            limit=self.max_request_size
         )
         
         addr = server.sockets[0].getsockname()
         logger.info(f"MCP-Server gestartet auf {{addr}}")
         
-        async with server:
-            await server.serve_forever()
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.executor.shutdown(wait=False)
     
     async def _handle_client(self, reader, writer):
         \"\"\"
         Behandle eine Client-Verbindung.
         
+        Jede Anfrage wird als eigene Task verarbeitet, sodass ein Client mehrere
+        Anfragen senden kann, ohne auf die Antworten zu warten. Antworten werden in
+        der Reihenfolge ihrer Fertigstellung gesendet und über die ID zugeordnet.
+        Sind max_in_flight Anfragen offen, werden keine weiteren gelesen. Anfragen
+        über max_request_size werden verworfen und mit einem Fehler beantwortet.
+        
         Args:
             reader: StreamReader für die Verbindung
             writer: StreamWriter für die Verbindung
@@ -1567,55 +2191,143 @@ class {name.replace(' ', '')}MCPServer:
         addr = writer.get_extra_info('peername')
         logger.info(f"Verbindung von {{addr}}")
         
-        while True:
-            try:
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+        write_lock = asyncio.Lock()
+        tasks = set()
+        
+        try:
+            while True:
                 # Lese eine Zeile vom Client
-                data = await reader.readline()
-                if not data:
-                    break
-                
-                # Parse die Anfrage
                 try:
-                    request = json.loads(data.decode())
-                except json.JSONDecodeError:
-                    logger.error(f"Ungültige JSON-Anfrage: {{data.decode()}}")
-                    response = {{
+                    data = await reader.readuntil(b"\\n")
+                except asyncio.IncompleteReadError as e:
+                    # Letzte Zeile ohne Zeilenumbruch
+                    data = e.partial
+                    if not data:
+                        break
+                except asyncio.LimitOverrunError:
+                    await self._discard_line(reader)
+                    logger.warning(f"Anfrage von {{addr}} ist größer als {{self.max_request_size}} Bytes")
+                    await self._send_response(writer, write_lock, {{
                         "error": {{
-                            "code": -32700,
-                            "message": "Parse error"
-                        }}
-                    }}
-                    writer.write(f"{{json.dumps(response)}}\\n".encode())
-                    await writer.drain()
+                            "code": -32600,
+                            "message": f"Request too large (limit: {{self.max_request_size}} bytes)"
+                        }},
+                        "id": None
+                    }})
                     continue
                 
-                # Verarbeite die Anfrage
-                response = self._process_request(request)
-                
-                # Sende die Antwort
+                # Warte, bis eine weitere Anfrage bearbeitet werden darf
+                await in_flight.acquire()
+                task = asyncio.create_task(self._dispatch(data, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                task.add_done_callback(lambda _: in_flight.release())
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            logger.warning(f"Verbindung zu {{addr}} unterbrochen: {{e}}")
+        except Exception as e:
+            # Unerwartete Fehler beenden nur diese Verbindung, nicht als unbehandelte Task-Ausnahme
+            logger.error(f"Fehler in der Verbindung zu {{addr}}: {{e}}")
+            await self._send_response(writer, write_lock, {{
+                "error": {{
+                    "code": -32603,
+                    "message": f"Internal error: {{str(e)}}"
+                }},
+                "id": None
+            }})
+        finally:
+            # Beantworte die offenen Anfragen, bevor die Verbindung geschlossen wird
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Schließe die Verbindung
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            logger.info(f"Verbindung zu {{addr}} geschlossen")
+    
+    @staticmethod
+    async def _discard_line(reader) -> None:
+        \"\"\"
+        Verwerfe den Rest einer zu langen Zeile, ohne sie im Speicher zu halten.
+        
+        Args:
+            reader: StreamReader für die Verbindung
+        \"\"\"
+        while True:
+            try:
+                await reader.readuntil(b"\\n")
+                return
+            except asyncio.LimitOverrunError as e:
+                await reader.readexactly(e.consumed)
+    
+    @staticmethod
+    async def _send_response(writer, write_lock: asyncio.Lock, response: Dict[str, Any]) -> None:
+        \"\"\"
+        Sende eine Antwort.
+        
+        Args:
+            writer: StreamWriter für die Verbindung
+            write_lock: Verhindert, dass sich gleichzeitige Antworten überlagern
+            response: Die Antwort
+        \"\"\"
+        async with write_lock:
+            try:
                 writer.write(f"{{json.dumps(response)}}\\n".encode())
                 await writer.drain()
-            except Exception as e:
-                logger.error(f"Fehler bei der Verarbeitung der Anfrage: {{e}}")
+            except ConnectionError as e:
+                logger.warning(f"Antwort konnte nicht gesendet werden: {{e}}")
+    
+    async def _dispatch(self, data: bytes, writer, write_lock: asyncio.Lock) -> None:
+        \"\"\"
+        Verarbeite eine Anfrage und sende die Antwort.
+        
+        Args:
+            data: Die empfangene Zeile
+            writer: StreamWriter für die Verbindung
+            write_lock: Verhindert, dass sich gleichzeitige Antworten überlagern
+        \"\"\"
+        request_id = None
+        try:
+            # Parse die Anfrage
+            try:
+                request = json.loads(data.decode())
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.error(f"Ungültige JSON-Anfrage: {{data!r}}")
                 response = {{
                     "error": {{
-                        "code": -32603,
-                        "message": f"Internal error: {{str(e)}}"
+                        "code": -32700,
+                        "message": "Parse error"
                     }}
                 }}
-                writer.write(f"{{json.dumps(response)}}\\n".encode())
-                await writer.drain()
-                break
+            else:
+                if isinstance(request, dict):
+                    request_id = request.get("id")
+                
+                # Verarbeite die Anfrage
+                response = await self._process_request(request)
+        except Exception as e:
+            logger.error(f"Fehler bei der Verarbeitung der Anfrage: {{e}}")
+            response = {{
+                "error": {{
+                    "code": -32603,
+                    "message": f"Internal error: {{str(e)}}"
+                }},
+                "id": request_id
+            }}
         
-        # Schließe die Verbindung
-        writer.close()
-        await writer.wait_closed()
-        logger.info(f"Verbindung zu {{addr}} geschlossen")
+        # Sende die Antwort
+        await self._send_response(writer, write_lock, response)
     
-    def _process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    async def _process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         \"\"\"
         Verarbeite eine Anfrage.
         
+        Funktionen werden im Thread-Pool ausgeführt, damit blockierende
+        Implementierungen die Event-Loop nicht anhalten.
+        
         Args:
             request: Anfrage
             
@@ -1623,7 +2335,7 @@ class {name.replace(' ', '')}MCPServer:
             Dict mit der Antwort
         \"\"\"
         # Überprüfe, ob die Anfrage gültig ist
-        if "method" not in request:
+        if not isinstance(request, dict) or "method" not in request:
             return {{
                 "error": {{
                     "code": -32600,
@@ -1654,7 +2366,13 @@ class {name.replace(' ', '')}MCPServer:
                 }}
             
             try:
-                result = self.call_function(function_name, function_params)
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    self.executor,
+                    functools.partial(self.call_function, function_name, function_params)
+                )
+                if asyncio.iscoroutine(result):
+                    result = await result
             except Exception as e:
                 return {{
                     "error": {{
@@ -1683,6 +2401,10 @@ class {name.replace(' ', '')}MCPServer:
         return response
 
 
+# Binde die implementierten Funktionen als Methoden an den Server
+{bindings}
+
+
 def parse_args():
     \"\"\"
     Parse command line arguments.
@@ -1694,6 +2416,9 @@ def parse_args():
     parser.add_argument('--host', default='0.0.0.0', help='Host für den MCP-Server')
     parser.add_argument('--port', type=int, default={port}, help='Port für den MCP-Server')
     parser.add_argument('--server-id', help='ID des Servers')
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS, help='Anzahl der Threads für Funktionsaufrufe')
+    parser.add_argument('--max-in-flight', type=int, default=DEFAULT_MAX_IN_FLIGHT, help='Maximale Anzahl offener Anfragen pro Verbindung')
+    parser.add_argument('--max-request-size', type=int, default=DEFAULT_MAX_REQUEST_SIZE, help='Maximale Größe einer Anfrage in Bytes')
     parser.add_argument('--verbose', '-v', action='store_true', help='Ausführliche Ausgabe')
     return parser.parse_args()
 
@@ -1709,7 +2434,14 @@ async def main():
         logging.getLogger().setLevel(logging.DEBUG)
     
     # Starte den MCP-Server
-    server = {name.replace(' ', '')}MCPServer(args.host, args.port, args.server_id)
+    server = {name.replace(' ', '')}MCPServer(
+        args.host,
+        args.port,
+        args.server_id,
+        max_workers=args.max_workers,
+        max_in_flight=args.max_in_flight,
+        max_request_size=args.max_request_size
+    )
     await server.start()
 
 
@@ -1732,8 +2464,14 @@ if __name__ == "__main__":
         addr = server.sockets[0].getsockname()
         logger.info(f"MCP-Server-Generator gestartet auf {addr}")
         
-        async with server:
-            await server.serve_forever()
+        # Wärme Interpreter für generierte Server vor
+        await self.supervisor.prewarm()
+        
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.supervisor.shutdown()
     
     async def _handle_client(self, reader, writer):
         """
@@ -1769,7 +2507,7 @@ if __name__ == "__main__":
                     continue
                 
                 # Verarbeite die Anfrage
-                response = self._process_request(request)
+                response = await self._process_request(request)
                 
                 # Sende die Antwort
                 writer.write(f"{json.dumps(response)}\n".encode())
@@ -1791,7 +2529,7 @@ if __name__ == "__main__":
         await writer.wait_closed()
         logger.info(f"Verbindung zu {addr} geschlossen")
     
-    def _process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    async def _process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Verarbeite eine Anfrage.
         
@@ -1834,6 +2572,10 @@ if __name__ == "__main__":
             
             try:
                 result = self.call_function(function_name, function_params)
+                
+                # Funktionen zur Prozessverwaltung sind Koroutinen
+                if asyncio.iscoroutine(result):
+                    result = await result
             except Exception as e:
                 return {
                     "error": {
@@ -195,9 +195,9 @@ async def get_server_info(server_name: str):
 
 
 @router.get("/discover", response_model=List[ServerInfo])
-async def discover_servers():
+async def discover_servers(refresh: bool = False):
     """Entdecke MCP-Server im Netzwerk."""
-    return await hub_manager.discover_servers()
+    return await hub_manager.discover_servers(refresh=refresh)
 
 
 @router.get("/repositories", response_model=List[str])
@@ -0,0 +1,379 @@
+"""
+MCP Artifact Cache - Inhaltsadressierter Cache für Installationen und Builds von MCP Servern.
+
+Diese Klasse verwaltet Git-Spiegel, gemeinsame Wheel- und npm-Caches, zwischengespeicherte
+node_modules sowie Tags vorgebauter Docker-Images. Schlüssel sind Hashes aus Commit und
+Lockfiles, sodass unveränderte Server weder neu heruntergeladen noch neu gebaut werden.
+"""
+
+import os
+import sys
+import json
+import shutil
+import hashlib
+import logging
+import platform
+import tempfile
+import subprocess
+from functools import lru_cache
+from typing import Dict, List, Optional, Any
+
+# Erstelle Logger
+logger = logging.getLogger(__name__)
+
+# Dateien, die die Abhängigkeiten eines Servers festlegen
+NPM_LOCKFILES = ["package.json", "package-lock.json", "npm-shrinkwrap.json", "yarn.lock"]
+PIP_LOCKFILES = ["requirements.txt", "pyproject.toml", "poetry.lock", "setup.py", "setup.cfg"]
+
+# Verzeichnisse, die nicht zum Build-Kontext gehören
+IGNORED_DIRS = {".git", "node_modules", "__pycache__"}
+
+# Arten von Artefakten, für die Statistiken geführt werden
+ARTIFACT_KINDS = ["git", "npm", "pip", "image"]
+
+
+@lru_cache(maxsize=None)
+def node_version() -> str:
+    """
+    Ermittle die Version der installierten Node.js-Laufzeit.
+
+    Returns:
+        Die Version, z. B. "v20.11.0", oder ein leerer String, wenn Node.js fehlt
+    """
+    try:
+        result = subprocess.run(["node", "--version"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+class ArtifactCache:
+    """Inhaltsadressierter Artefakt-Cache."""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialisiere den Artefakt-Cache.
+
+        Args:
+            cache_dir: Optionaler Pfad zum Cache-Verzeichnis
+        """
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser("~"), ".cache", "mcp_hub")
+        self.mirrors_dir = os.path.join(self.cache_dir, "mirrors")
+        self.wheels_dir = os.path.join(self.cache_dir, "wheels")
+        self.pip_cache_dir = os.path.join(self.cache_dir, "pip")
+        self.npm_cache_dir = os.path.join(self.cache_dir, "npm")
+        self.node_modules_dir = os.path.join(self.cache_dir, "node_modules")
+        self.stamps_dir = os.path.join(self.cache_dir, "stamps")
+        self._create_dirs()
+
+        self.stats_file = os.path.join(self.cache_dir, "stats.json")
+        self.stats = self._load_stats()
+
+    def _create_dirs(self) -> None:
+        """Erstelle die Verzeichnisse des Caches."""
+        for directory in (
+            self.mirrors_dir, self.wheels_dir, self.pip_cache_dir,
+            self.npm_cache_dir, self.node_modules_dir, self.stamps_dir,
+        ):
+            os.makedirs(directory, exist_ok=True)
+
+    def _load_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Lade die Trefferstatistik.
+
+        Returns:
+            Treffer und Fehlschläge je Artefaktart
+        """
+        stats = {kind: {"hits": 0, "misses": 0} for kind in ARTIFACT_KINDS}
+        try:
+            if os.path.exists(self.stats_file):
+                with open(self.stats_file, "r") as f:
+                    for kind, counts in json.load(f).items():
+                        stats.setdefault(kind, {"hits": 0, "misses": 0}).update(counts)
+        except Exception as e:
+            logger.warning(f"Fehler beim Laden der Cache-Statistik: {e}")
+        return stats
+
+    def record(self, kind: str, hit: bool) -> None:
+        """
+        Zähle einen Treffer oder Fehlschlag und speichere die Statistik.
+
+        Args:
+            kind: Die Artefaktart
+            hit: Ob das Artefakt im Cache gefunden wurde
+        """
+        counts = self.stats.setdefault(kind, {"hits": 0, "misses": 0})
+        counts["hits" if hit else "misses"] += 1
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".stats.", suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.stats, f)
+            os.replace(tmp_path, self.stats_file)
+        except Exception as e:
+            logger.warning(f"Fehler beim Speichern der Cache-Statistik: {e}")
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Hole die Trefferstatistik.
+
+        Returns:
+            Treffer, Fehlschläge und Trefferquote je Artefaktart
+        """
+        result = {}
+        for kind, counts in self.stats.items():
+            total = counts["hits"] + counts["misses"]
+            result[kind] = {**counts, "hit_rate": counts["hits"] / total if total else 0.0}
+        return result
+
+    def clear(self) -> None:
+        """Leere den Cache einschließlich der Statistik."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self._create_dirs()
+        self.stats = {kind: {"hits": 0, "misses": 0} for kind in ARTIFACT_KINDS}
+
+    @staticmethod
+    def hash_files(directory: str, names: List[str], *extra: str) -> str:
+        """
+        Berechne einen Hash über den Inhalt der angegebenen Dateien.
+
+        Args:
+            directory: Das Verzeichnis der Dateien
+            names: Die Dateinamen; fehlende Dateien werden übersprungen
+            *extra: Weitere Werte, die in den Hash eingehen
+
+        Returns:
+            Der SHA-256-Hash als Hex-String
+        """
+        digest = hashlib.sha256()
+        for value in extra:
+            digest.update(value.encode())
+            digest.update(b"\0")
+        for name in names:
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                digest.update(name.encode())
+                digest.update(b"\0")
+                with open(path, "rb") as f:
+                    digest.update(hashlib.sha256(f.read()).digest())
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_commit(repo_dir: str) -> Optional[str]:
+        """
+        Hole den aktuellen Commit eines Git-Repositories.
+
+        Args:
+            repo_dir: Der Pfad zum Repository
+
+        Returns:
+            Der Commit-SHA, oder None, wenn das Verzeichnis kein Git-Repository ist
+        """
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "HEAD"], cwd=repo_dir, capture_output=True, text=True, check=True
+            )
+            return result.stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def source_key(self, server_dir: str) -> str:
+        """
+        Berechne den Schlüssel des Build-Kontexts eines Servers.
+
+        Für saubere Git-Arbeitsverzeichnisse ist das der Commit, sonst ein Hash über
+        alle Dateien des Build-Kontexts.
+
+        Args:
+            server_dir: Der Pfad zum Server
+
+        Returns:
+            Der Schlüssel als Hex-String
+        """
+        commit = self.get_commit(server_dir)
+        if commit:
+            status = subprocess.run(
+                ["git", "status", "--porcelain"], cwd=server_dir, capture_output=True, text=True
+            )
+            if status.returncode == 0 and not status.stdout.strip():
+                return commit
+
+        digest = hashlib.sha256()
+        for root, dirs, files in os.walk(server_dir):
+            dirs[:] = sorted(d for d in dirs if d not in IGNORED_DIRS)
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, server_dir).encode())
+                digest.update(b"\0")
+                with open(path, "rb") as f:
+                    digest.update(hashlib.sha256(f.read()).digest())
+        return digest.hexdigest()
+
+    def mirror_path(self, repo_url: str) -> str:
+        """
+        Ermittle den Pfad des Git-Spiegels eines Repositories.
+
+        Args:
+            repo_url: Die URL des Repositories
+
+        Returns:
+            Der Pfad des Spiegels
+        """
+        name = repo_url.rstrip("/").split("/")[-1]
+        return os.path.join(self.mirrors_dir, f"{hashlib.sha256(repo_url.encode()).hexdigest()[:16]}-{name}.git")
+
+    def update_mirror(self, repo_url: str) -> Optional[str]:
+        """
+        Lege den Git-Spiegel eines Repositories an oder aktualisiere ihn inkrementell.
+
+        Args:
+            repo_url: Die URL des Repositories
+
+        Returns:
+            Der Pfad des Spiegels, oder None, wenn er nicht verfügbar ist
+        """
+        mirror = self.mirror_path(repo_url)
+        try:
+            if os.path.isdir(mirror):
+                subprocess.run(["git", "fetch", "--prune", "origin"], cwd=mirror, check=True, capture_output=True)
+                self.record("git", True)
+            else:
+                subprocess.run(["git", "clone", "--mirror", repo_url, mirror], check=True, capture_output=True)
+                self.record("git", False)
+            return mirror
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning(f"Git-Spiegel für {repo_url} nicht verfügbar: {e}")
+            shutil.rmtree(mirror, ignore_errors=True)
+            return None
+
+    def pip_args(self) -> List[str]:
+        """
+        Hole die Argumente, mit denen pip den gemeinsamen Cache verwendet.
+
+        Returns:
+            Die Argumente für ``pip install``
+        """
+        return ["--cache-dir", self.pip_cache_dir, "--find-links", self.wheels_dir]
+
+    def npm_args(self) -> List[str]:
+        """
+        Hole die Argumente, mit denen npm den gemeinsamen Cache verwendet.
+
+        Returns:
+            Die Argumente für ``npm install`` und ``npm ci``
+        """
+        return ["--cache", self.npm_cache_dir, "--prefer-offline"]
+
+    def pip_key(self, server_dir: str, commit: Optional[str], editable: bool) -> str:
+        """
+        Berechne den Schlüssel der Python-Abhängigkeiten eines Servers.
+
+        Die Abhängigkeiten werden in die laufende Python-Umgebung installiert, daher geht
+        sie in den Schlüssel ein. Bei editierbaren Installationen zählt auch der Commit.
+
+        Args:
+            server_dir: Der Pfad zum Server
+            commit: Der Commit des Servers
+            editable: Ob das Projekt selbst installiert wird
+
+        Returns:
+            Der Schlüssel als Hex-String
+        """
+        extra = ["pip", sys.prefix, server_dir]
+        if editable:
+            extra.append(commit or "")
+        return self.hash_files(server_dir, PIP_LOCKFILES, *extra)
+
+    def npm_key(self, server_dir: str) -> str:
+        """
+        Berechne den Schlüssel der Node.js-Abhängigkeiten eines Servers.
+
+        Native Addons in node_modules sind für eine Node.js-Version, Plattform und
+        Architektur gebaut, daher gehen diese in den Schlüssel ein.
+
+        Args:
+            server_dir: Der Pfad zum Server
+
+        Returns:
+            Der Schlüssel als Hex-String
+        """
+        return self.hash_files(
+            server_dir, NPM_LOCKFILES, "npm", node_version(), sys.platform, platform.machine()
+        )
+
+    def has_stamp(self, key: str) -> bool:
+        """
+        Prüfe, ob für einen Schlüssel bereits erfolgreich installiert wurde.
+
+        Args:
+            key: Der Schlüssel
+
+        Returns:
+            True, wenn eine Markierung existiert
+        """
+        return os.path.exists(os.path.join(self.stamps_dir, key))
+
+    def write_stamp(self, key: str) -> None:
+        """
+        Markiere einen Schlüssel als erfolgreich installiert.
+
+        Args:
+            key: Der Schlüssel
+        """
+        with open(os.path.join(self.stamps_dir, key), "w") as f:
+            f.write("")
+
+    def restore_node_modules(self, key: str, server_dir: str) -> bool:
+        """
+        Stelle zwischengespeicherte node_modules für einen Schlüssel wieder her.
+
+        Args:
+            key: Der Schlüssel der Node.js-Abhängigkeiten
+            server_dir: Der Pfad zum Server
+
+        Returns:
+            True, wenn die node_modules wiederhergestellt wurden
+        """
+        cached = os.path.join(self.node_modules_dir, key)
+        if not os.path.isdir(cached):
+            return False
+        target = os.path.join(server_dir, "node_modules")
+        shutil.rmtree(target, ignore_errors=True)
+        # Kopien statt harter Links, damit Änderungen eines Servers (z. B. durch patch-package
+        # oder postinstall-Skripte) nicht den gemeinsamen Cache-Eintrag verändern
+        shutil.copytree(cached, target, symlinks=True)
+        return True
+
+    def save_node_modules(self, key: str, server_dir: str) -> None:
+        """
+        Speichere die node_modules eines Servers unter einem Schlüssel.
+
+        Args:
+            key: Der Schlüssel der Node.js-Abhängigkeiten
+            server_dir: Der Pfad zum Server
+        """
+        source = os.path.join(server_dir, "node_modules")
+        cached = os.path.join(self.node_modules_dir, key)
+        if not os.path.isdir(source) or os.path.isdir(cached):
+            return
+        tmp_dir = tempfile.mkdtemp(dir=self.node_modules_dir, prefix=f".{key}.")
+        try:
+            shutil.copytree(source, os.path.join(tmp_dir, "node_modules"), symlinks=True)
+            os.replace(os.path.join(tmp_dir, "node_modules"), cached)
+        except OSError as e:
+            logger.warning(f"Fehler beim Zwischenspeichern von node_modules: {e}")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    @staticmethod
+    def image_tag(server_id: str, key: str) -> str:
+        """
+        Ermittle den Tag des vorgebauten Images für einen Build-Kontext.
+
+        Args:
+            server_id: Die ID des MCP Servers
+            key: Der Schlüssel des Build-Kontexts
+
+        Returns:
+            Der Image-Tag
+        """
+        return f"mcp-{server_id}:{key[:12]}"
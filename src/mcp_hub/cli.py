@@ -53,6 +53,9 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     # Befehl: search
     search_parser = subparsers.add_parser("search", help="Suche nach MCP Servern")
     search_parser.add_argument("query", help="Die Suchanfrage")
+    search_parser.add_argument("--tag", "-t", action="append", dest="tags", help="Nur Server mit diesem Tag (mehrfach möglich)")
+    search_parser.add_argument("--limit", "-n", type=int, help="Maximale Anzahl von Ergebnissen")
+    search_parser.add_argument("--refresh", action="store_true", help="Aktualisiere die Registry vor der Suche")
     
     # Befehl: install
     install_parser = subparsers.add_parser("install", help="Installiere einen MCP Server")
@@ -77,6 +80,22 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     status_parser = subparsers.add_parser("status", help="Zeige den Status eines MCP Servers an")
     status_parser.add_argument("server_id", help="Die ID des MCP Servers")
     
+    # Befehl: start-all
+    start_all_parser = subparsers.add_parser("start-all", help="Starte alle oder die angegebenen MCP Server parallel")
+    start_all_parser.add_argument("server_ids", nargs="*", help="Optionale IDs der MCP Server")
+    
+    # Befehl: stop-all
+    stop_all_parser = subparsers.add_parser("stop-all", help="Stoppe alle oder die angegebenen MCP Server parallel")
+    stop_all_parser.add_argument("server_ids", nargs="*", help="Optionale IDs der MCP Server")
+    
+    # Befehl: status-all
+    status_all_parser = subparsers.add_parser("status-all", help="Zeige den Status aller oder der angegebenen MCP Server an")
+    status_all_parser.add_argument("server_ids", nargs="*", help="Optionale IDs der MCP Server")
+    
+    # Befehl: cache
+    cache_parser = subparsers.add_parser("cache", help="Verwalte den Artefakt-Cache")
+    cache_parser.add_argument("action", choices=["stats", "clear"], help="Zeige die Statistik an oder leere den Cache")
+    
     # Befehl: update
     update_parser = subparsers.add_parser("update", help="Aktualisiere die Registry")
     
@@ -120,11 +139,12 @@ def main(args: Optional[List[str]] = None) -> int:
     
     # Führe den Befehl aus
     if parsed_args.command == "search":
-        # Aktualisiere die Registry
-        hub_manager.update_registry()
+        # Aktualisiere die Registry nur, wenn noch kein Suchindex vorhanden ist
+        if parsed_args.refresh or not hub_manager.registry.servers:
+            hub_manager.update_registry()
         
         # Suche nach MCP Servern
-        results = hub_manager.search_servers(parsed_args.query)
+        results = hub_manager.search_servers(parsed_args.query, tags=parsed_args.tags, limit=parsed_args.limit)
         
         # Zeige die Ergebnisse an
         if results:
@@ -134,6 +154,8 @@ def main(args: Optional[List[str]] = None) -> int:
                 print(f"   Beschreibung: {server['description']}")
                 print(f"   URL: {server['url']}")
                 print(f"   Quelle: {server['source']}")
+                if server.get("tags"):
+                    print(f"   Tags: {', '.join(server['tags'])}")
                 print()
         else:
             print(f"Keine MCP Server für '{parsed_args.query}' gefunden.")
@@ -206,6 +228,40 @@ def main(args: Optional[List[str]] = None) -> int:
         if "error" in status:
             print(f"Fehler: {status['error']}")
     
+    elif parsed_args.command in ("start-all", "stop-all"):
+        # Starte oder stoppe die MCP Server parallel
+        if parsed_args.command == "start-all":
+            results = hub_manager.start_all_servers(parsed_args.server_ids or None)
+        else:
+            results = hub_manager.stop_all_servers(parsed_args.server_ids or None)
+        
+        for server_id, success in results.items():
+            print(f"{server_id}: {'OK' if success else 'Fehler'}")
+        
+        if not results or not all(results.values()):
+            return 1
+    
+    elif parsed_args.command == "status-all":
+        # Zeige den Status der MCP Server an
+        statuses = hub_manager.get_all_servers_status(parsed_args.server_ids or None)
+        
+        for server_id, status in statuses.items():
+            line = f"{server_id}: {status.get('status', 'unbekannt')} ({status.get('type', 'unbekannt')})"
+            if "error" in status:
+                line += f" - Fehler: {status['error']}"
+            print(line)
+    
+    elif parsed_args.command == "cache":
+        if parsed_args.action == "clear":
+            # Leere den Artefakt-Cache
+            hub_manager.clear_cache()
+            print("Artefakt-Cache geleert.")
+        else:
+            # Zeige die Trefferstatistik an
+            print("Artefakt-Cache:")
+            for kind, stats in hub_manager.get_cache_stats().items():
+                print(f"  {kind}: {stats['hits']} Treffer, {stats['misses']} Fehlschläge ({stats['hit_rate']:.0%})")
+    
     elif parsed_args.command == "update":
         # Aktualisiere die Registry
         hub_manager.update_registry()
@@ -245,10 +245,12 @@ def update_server(
 
 
 @app.command("discover")
-def discover_servers():
+def discover_servers(
+    refresh: bool = typer.Option(False, "--refresh", "-r", help="Zwischengespeicherte Ergebnisse ignorieren"),
+):
     """Entdecke MCP-Server im Netzwerk."""
     # Entdecke Server
-    servers = asyncio.run(hub_manager.discover_servers())
+    servers = asyncio.run(hub_manager.discover_servers(refresh=refresh))
     
     if not servers:
         typer.echo("Keine MCP-Server gefunden.")
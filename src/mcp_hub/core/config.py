@@ -44,6 +44,19 @@ class HubSettings(BaseSettings):
         ]
     )
     
+    # Discovery-Einstellungen
+    # Hosts als Hostnamen, IP-Adressen oder CIDR-Netze, Ports einzeln oder als Bereich "von-bis"
+    DISCOVERY_HOSTS: List[str] = Field(default=["localhost", "127.0.0.1"])
+    DISCOVERY_PORTS: List[str] = Field(default=["3456-3460", "8000", "8080"])
+    DISCOVERY_MAX_TARGETS: int = Field(default=65536)
+    DISCOVERY_CONCURRENCY: int = Field(default=256)
+    DISCOVERY_CONNECT_TIMEOUT: float = Field(default=0.5)
+    DISCOVERY_HTTP_TIMEOUT: float = Field(default=2.0)
+    # Wie lange gefundene bzw. nicht erreichbare Ziele nicht erneut geprüft werden (Sekunden)
+    DISCOVERY_CACHE_TTL: float = Field(default=60.0)
+    DISCOVERY_NEGATIVE_CACHE_TTL: float = Field(default=30.0)
+    DISCOVERY_DOCKER_LABEL: str = Field(default="mcp.server")
+
     # Logging-Einstellungen
     LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
     
@@ -0,0 +1,368 @@
+"""
+MCP-Server-Discovery-Modul.
+
+Dieses Modul bietet Funktionen zum Entdecken von MCP-Servern im Netzwerk und in Docker.
+"""
+
+import time
+import asyncio
+import ipaddress
+import aiohttp
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+from datetime import datetime
+
+from ..models.server import ServerInfo, ServerStatus, ServerType, ServerProtocol
+from ..utils.logger import logger
+from ..core.config import settings
+
+
+def expand_hosts(entries: Iterable[str], limit: Optional[int] = None) -> List[str]:
+    """
+    Erweitere Hostnamen, IP-Adressen und CIDR-Netze zu einer Liste von Hosts.
+
+    Args:
+        entries: Die Hosteinträge
+        limit: Optionale Höchstzahl von Hosts; große Netze werden nicht erst vollständig erweitert
+
+    Returns:
+        Die Hosts ohne Duplikate
+
+    Raises:
+        ValueError: Wenn die Anzahl der Hosts limit überschreitet
+    """
+    hosts: Dict[str, None] = {}
+    for entry in entries:
+        try:
+            network = ipaddress.ip_network(entry, strict=False)
+        except ValueError:
+            # Kein Netz, sondern ein Hostname
+            hosts[entry] = None
+        else:
+            if network.num_addresses == 1:
+                hosts[str(network.network_address)] = None
+            elif limit is not None and network.num_addresses - 2 > limit:
+                raise ValueError(f"Netz {entry} enthält mehr als {limit} Hosts")
+            else:
+                for address in network.hosts():
+                    hosts[str(address)] = None
+
+        if limit is not None and len(hosts) > limit:
+            raise ValueError(f"Mehr als {limit} Hosts angegeben")
+    return list(hosts)
+
+
+def expand_ports(entries: Iterable[str]) -> List[int]:
+    """
+    Erweitere Ports und Portbereiche der Form "von-bis" zu einer Liste von Ports.
+
+    Args:
+        entries: Die Porteinträge
+
+    Returns:
+        Die Ports ohne Duplikate
+
+    Raises:
+        ValueError: Wenn ein Eintrag kein gültiger Port oder Portbereich ist
+    """
+    ports: Dict[int, None] = {}
+    for entry in entries:
+        start, _, end = str(entry).partition("-")
+        first, last = int(start), int(end or start)
+        if not 1 <= first <= last <= 65535:
+            raise ValueError(f"Ungültiger Port oder Portbereich: {entry}")
+        for port in range(first, last + 1):
+            ports[port] = None
+    return list(ports)
+
+
+class DiscoveryEngine:
+    """Engine zur Entdeckung von MCP-Servern."""
+
+    def __init__(
+        self,
+        hosts: Optional[List[str]] = None,
+        ports: Optional[List[str]] = None,
+        concurrency: Optional[int] = None,
+        connect_timeout: Optional[float] = None,
+        http_timeout: Optional[float] = None,
+        cache_ttl: Optional[float] = None,
+        negative_cache_ttl: Optional[float] = None,
+        docker_label: Optional[str] = None,
+    ):
+        """
+        Initialisiere die Discovery-Engine.
+
+        Nicht angegebene Werte werden aus den Einstellungen übernommen.
+
+        Args:
+            hosts: Die zu scannenden Hostnamen, IP-Adressen oder CIDR-Netze
+            ports: Die zu scannenden Ports oder Portbereiche
+            concurrency: Maximale Anzahl gleichzeitiger Prüfungen
+            connect_timeout: Timeout für die TCP-Vorprüfung in Sekunden
+            http_timeout: Timeout für die HTTP-Prüfung in Sekunden
+            cache_ttl: Wie lange gefundene Server nicht erneut geprüft werden
+            negative_cache_ttl: Wie lange nicht erreichbare Ziele nicht erneut geprüft werden
+            docker_label: Das Label, über das Docker-Container als MCP-Server markiert sind
+        """
+        self.hosts = hosts if hosts is not None else settings.DISCOVERY_HOSTS
+        self.ports = ports if ports is not None else settings.DISCOVERY_PORTS
+        self.concurrency = concurrency or settings.DISCOVERY_CONCURRENCY
+        self.connect_timeout = connect_timeout or settings.DISCOVERY_CONNECT_TIMEOUT
+        self.http_timeout = http_timeout or settings.DISCOVERY_HTTP_TIMEOUT
+        self.cache_ttl = cache_ttl if cache_ttl is not None else settings.DISCOVERY_CACHE_TTL
+        self.negative_cache_ttl = (
+            negative_cache_ttl if negative_cache_ttl is not None else settings.DISCOVERY_NEGATIVE_CACHE_TTL
+        )
+        self.docker_label = docker_label or settings.DISCOVERY_DOCKER_LABEL
+
+        # Cache der zuletzt geprüften Ziele: (host, port) -> (Zeitpunkt, Server oder None)
+        self._cache: Dict[Tuple[str, int], Tuple[float, Optional[ServerInfo]]] = {}
+
+    def get_targets(self) -> List[Tuple[str, int]]:
+        """
+        Ermittle die zu scannenden Ziele.
+
+        Returns:
+            Die Kombinationen aus Host und Port
+
+        Raises:
+            ValueError: Wenn die Anzahl der Ziele DISCOVERY_MAX_TARGETS überschreitet
+        """
+        ports = expand_ports(self.ports)
+        try:
+            hosts = expand_hosts(self.hosts, limit=settings.DISCOVERY_MAX_TARGETS // max(len(ports), 1))
+        except ValueError as e:
+            raise ValueError(f"Zu viele Discovery-Ziele (Maximum {settings.DISCOVERY_MAX_TARGETS}): {e}")
+        return [(host, port) for host in hosts for port in ports]
+
+    def clear_cache(self) -> None:
+        """Leere den Cache der geprüften Ziele."""
+        self._cache.clear()
+
+    def _cached(self, target: Tuple[str, int], now: float) -> Tuple[bool, Optional[ServerInfo]]:
+        """
+        Schlage ein Ziel im Cache nach.
+
+        Args:
+            target: Das Ziel
+            now: Der aktuelle Zeitpunkt
+
+        Returns:
+            Ob ein gültiger Eintrag existiert, und der zwischengespeicherte Server
+        """
+        entry = self._cache.get(target)
+        if entry is None:
+            return False, None
+        checked_at, server_info = entry
+        ttl = self.cache_ttl if server_info is not None else self.negative_cache_ttl
+        if now - checked_at >= ttl:
+            return False, None
+        return True, server_info
+
+    async def discover_http_servers(self, refresh: bool = False) -> List[ServerInfo]:
+        """
+        Entdecke MCP-Server über HTTP.
+
+        Alle Ziele werden parallel geprüft. Ein Ziel wird nur dann per HTTP abgefragt,
+        wenn zuvor eine TCP-Verbindung zustande kommt. Ergebnisse werden bis zum Ablauf
+        ihrer TTL wiederverwendet.
+
+        Args:
+            refresh: Ob der Cache ignoriert werden soll
+
+        Returns:
+            Liste der entdeckten Server
+        """
+        now = time.monotonic()
+        discovered_servers = []
+        pending = []
+
+        for target in self.get_targets():
+            hit, server_info = (False, None) if refresh else self._cached(target, now)
+            if hit:
+                if server_info is not None:
+                    discovered_servers.append(server_info)
+            else:
+                pending.append(target)
+
+        if pending:
+            semaphore = asyncio.Semaphore(self.concurrency)
+            connector = aiohttp.TCPConnector(limit=self.concurrency)
+            timeout = aiohttp.ClientTimeout(total=self.http_timeout)
+
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                results = await asyncio.gather(
+                    *(self._probe(session, semaphore, host, port) for host, port in pending)
+                )
+
+            checked_at = time.monotonic()
+            for target, server_info in zip(pending, results):
+                self._cache[target] = (checked_at, server_info)
+                if server_info is not None:
+                    discovered_servers.append(server_info)
+
+        logger.debug(
+            f"HTTP-Discovery: {len(pending)} Ziele geprüft, "
+            f"{len(discovered_servers)} Server gefunden"
+        )
+        return discovered_servers
+
+    async def _probe(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        host: str,
+        port: int,
+    ) -> Optional[ServerInfo]:
+        """
+        Prüfe, ob unter einem Host und Port ein MCP-Server läuft.
+
+        Args:
+            session: Die HTTP-Session
+            semaphore: Begrenzt die Anzahl gleichzeitiger Prüfungen
+            host: Der Host
+            port: Der Port
+
+        Returns:
+            Die Serverinformationen oder None, wenn kein Server gefunden wurde
+        """
+        async with semaphore:
+            # Prüfe zuerst, ob der Port überhaupt offen ist
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(host, port), timeout=self.connect_timeout
+                )
+            except (OSError, asyncio.TimeoutError):
+                return None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+            url = f"http://{host}:{port}"
+            try:
+                async with session.get(f"{url}/health") as response:
+                    if response.status != 200:
+                        return None
+                    data = await response.json(content_type=None)
+            except Exception:
+                # Ignoriere Fehler beim Scannen
+                return None
+
+            try:
+                return ServerInfo(
+                    name=data.get("name", f"mcp-server-{host}-{port}"),
+                    description=data.get("description", "Entdeckter MCP-Server"),
+                    version=data.get("version", "0.1.0"),
+                    type=ServerType(data.get("type", "custom")),
+                    protocol=ServerProtocol.HTTP,
+                    url=url,
+                    status=ServerStatus.ONLINE,
+                    last_seen=datetime.now(),
+                )
+            except Exception as e:
+                logger.error(f"Fehler beim Parsen der Serverinformationen von {url}: {e}")
+                return None
+
+    async def discover_docker_servers(self) -> List[ServerInfo]:
+        """
+        Entdecke MCP-Server über Docker-Labels.
+
+        Container werden über das Label DISCOVERY_DOCKER_LABEL als MCP-Server erkannt.
+        Weitere Labels mit diesem Präfix (".name", ".description", ".version", ".type",
+        ".protocol", ".port") beschreiben den Server.
+
+        Returns:
+            Liste der entdeckten Server
+        """
+        try:
+            import docker
+        except ImportError:
+            logger.debug("Docker-SDK nicht installiert, überspringe Docker-Discovery")
+            return []
+
+        def list_containers() -> List[Any]:
+            client = docker.from_env()
+            try:
+                return client.containers.list(filters={"label": self.docker_label})
+            finally:
+                client.close()
+
+        try:
+            loop = asyncio.get_running_loop()
+            containers = await loop.run_in_executor(None, list_containers)
+        except Exception as e:
+            logger.debug(f"Docker-Discovery nicht möglich: {e}")
+            return []
+
+        discovered_servers = []
+        for container in containers:
+            server_info = self._server_from_container(container)
+            if server_info is not None:
+                discovered_servers.append(server_info)
+        return discovered_servers
+
+    def _server_from_container(self, container: Any) -> Optional[ServerInfo]:
+        """
+        Erstelle Serverinformationen aus den Labels eines Docker-Containers.
+
+        Args:
+            container: Der Docker-Container
+
+        Returns:
+            Die Serverinformationen oder None, wenn die Labels ungültig sind
+        """
+        labels = container.labels or {}
+        prefix = f"{self.docker_label}."
+
+        try:
+            protocol = ServerProtocol(labels.get(f"{prefix}protocol", "http"))
+            url = None
+            container_port = labels.get(f"{prefix}port")
+            if container_port and protocol != ServerProtocol.STDIO:
+                url = self._container_url(container, container_port)
+
+            return ServerInfo(
+                name=labels.get(f"{prefix}name", container.name),
+                description=labels.get(f"{prefix}description", "Entdeckter Docker-MCP-Server"),
+                version=labels.get(f"{prefix}version", "0.1.0"),
+                type=ServerType(labels.get(f"{prefix}type", "docker")),
+                protocol=protocol,
+                url=url,
+                status=ServerStatus.ONLINE if container.status == "running" else ServerStatus.OFFLINE,
+                last_seen=datetime.now(),
+                metadata={"container_id": container.id, "image": labels.get(f"{prefix}image", "")},
+            )
+        except Exception as e:
+            logger.error(f"Fehler beim Auswerten der Labels von Container {container.name}: {e}")
+            return None
+
+    @staticmethod
+    def _container_url(container: Any, container_port: str) -> Optional[str]:
+        """
+        Ermittle die URL, unter der ein Container-Port erreichbar ist.
+
+        Veröffentlichte Ports werden bevorzugt, sonst wird die Container-IP verwendet.
+
+        Args:
+            container: Der Docker-Container
+            container_port: Der Port im Container
+
+        Returns:
+            Die URL oder None, wenn der Port nicht erreichbar ist
+        """
+        network_settings = container.attrs.get("NetworkSettings", {})
+
+        bindings = (network_settings.get("Ports") or {}).get(f"{container_port}/tcp") or []
+        for binding in bindings:
+            if binding.get("HostPort"):
+                host_ip = binding.get("HostIp") or "0.0.0.0"
+                host = "localhost" if host_ip in ("0.0.0.0", "::") else host_ip
+                return f"http://{host}:{binding['HostPort']}"
+
+        for network in (network_settings.get("Networks") or {}).values():
+            if network.get("IPAddress"):
+                return f"http://{network['IPAddress']}:{container_port}"
+
+        return None
@@ -181,14 +181,17 @@ class HubManager:
         
         return await self.registry_manager.get_server_info(server)
     
-    async def discover_servers(self) -> List[ServerInfo]:
+    async def discover_servers(self, refresh: bool = False) -> List[ServerInfo]:
         """
         Entdecke MCP-Server im Netzwerk.
         
+        Args:
+            refresh: Ob zwischengespeicherte Discovery-Ergebnisse ignoriert werden sollen
+        
         Returns:
             Liste der entdeckten Server
         """
-        return await self.registry_manager.discover_servers()
+        return await self.registry_manager.discover_servers(refresh=refresh)
     
     def list_servers(self) -> List[ServerConfig]:
         """
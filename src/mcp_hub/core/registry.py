@@ -8,6 +8,7 @@ import os
 import re
 import json
 import logging
+import sqlite3
 import tempfile
 import subprocess
 import requests
@@ -21,6 +22,8 @@ from urllib.parse import urlparse
 from ..models.server import ServerRegistry, ServerConfig, ServerInfo, ServerStatus, ServerType, ServerProtocol
 from ..utils.logger import logger
 from ..core.config import settings
+from ..core.discovery import DiscoveryEngine
+from ..core.store import RegistryStore
 
 
 class RegistryManager:
@@ -30,33 +33,44 @@ class RegistryManager:
         """
         Initialisiere den Registry-Manager.
         
+        Die Registry wird in einer SQLite-Datenbank neben der Registry-Datei gespeichert.
+        Eine vorhandene JSON-Registry wird beim ersten Start übernommen.
+        
         Args:
             registry_file: Pfad zur Registry-Datei
         """
-        self.registry_file = registry_file or settings.MCP_SERVER_REGISTRY_FILE
+        self.registry_file = Path(registry_file or settings.MCP_SERVER_REGISTRY_FILE)
+        self.store = RegistryStore(self.registry_file.with_suffix(".db"))
         self.registry = self._load_registry()
+        self.discovery = DiscoveryEngine()
     
     def _load_registry(self) -> ServerRegistry:
         """
-        Lade die Registry aus der Registry-Datei.
+        Lade die Registry aus der Datenbank.
+        
+        Existiert noch keine Datenbank, wird die JSON-Registry-Datei migriert. Die
+        JSON-Datei bleibt als Sicherung erhalten, wird aber nicht mehr geschrieben.
         
         Returns:
             Die geladene Registry
         """
         try:
+            if self.store.initialized:
+                return self.store.load()
+            
             if self.registry_file.exists():
                 with open(self.registry_file, "r") as f:
                     data = json.load(f)
                 
-                # Konvertiere das Dictionary in ein ServerRegistry-Objekt
-                return ServerRegistry.parse_obj(data)
+                # Konvertiere das Dictionary in ein ServerRegistry-Objekt und übernimm es
+                registry = ServerRegistry.parse_obj(data)
+                self.store.replace(registry, source=str(self.registry_file))
+                logger.info(f"Registry aus {self.registry_file} nach {self.store.db_file} migriert")
+                
+                return registry
             else:
                 # Erstelle eine neue Registry
-                registry = ServerRegistry(
-                    repositories=settings.DEFAULT_REPOSITORIES,
-                    docker_hub_users=settings.DEFAULT_DOCKER_HUB_USERS,
-                    last_updated=datetime.now(),
-                )
+                registry = self._create_default_registry()
                 
                 # Speichere die Registry
                 self._save_registry(registry)
@@ -66,36 +80,74 @@ class RegistryManager:
             logger.error(f"Fehler beim Laden der Registry: {e}")
             
             # Erstelle eine neue Registry
-            registry = ServerRegistry(
-                repositories=settings.DEFAULT_REPOSITORIES,
-                docker_hub_users=settings.DEFAULT_DOCKER_HUB_USERS,
-                last_updated=datetime.now(),
-            )
+            registry = self._create_default_registry()
             
             # Speichere die Registry
             self._save_registry(registry)
             
             return registry
     
+    @staticmethod
+    def _create_default_registry() -> ServerRegistry:
+        """
+        Erstelle eine neue Registry mit den Standardquellen.
+        
+        Returns:
+            Die neue Registry
+        """
+        return ServerRegistry(
+            repositories=list(settings.DEFAULT_REPOSITORIES),
+            docker_hub_users=list(settings.DEFAULT_DOCKER_HUB_USERS),
+            last_updated=datetime.now(),
+        )
+    
     def _save_registry(self, registry: Optional[ServerRegistry] = None) -> None:
         """
-        Speichere die Registry in der Registry-Datei.
+        Speichere die gesamte Registry in der Datenbank.
+        
+        Die Methoden zum Hinzufügen und Entfernen schreiben nur die geänderten
+        Einträge. Diese Methode ist für Änderungen gedacht, die direkt an
+        self.registry vorgenommen wurden.
         
         Args:
             registry: Die zu speichernde Registry
         """
         try:
             registry = registry or self.registry
-            
-            # Stelle sicher, dass das Verzeichnis existiert
-            self.registry_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Speichere die Registry
-            with open(self.registry_file, "w") as f:
-                json.dump(registry.dict(), f, indent=2, default=str)
+            self.store.replace(registry)
         except Exception as e:
             logger.error(f"Fehler beim Speichern der Registry: {e}")
     
+    def _write(self, write, *args) -> bool:
+        """
+        Führe eine Einzelaktualisierung der Datenbank aus.
+        
+        Die Aufrufer ändern self.registry erst danach, sodass Speicher und Datenbank
+        auch bei einem Fehler übereinstimmen.
+        
+        Args:
+            write: Die Methode des Speichers, z. B. self.store.put_server
+            *args: Die Argumente der Methode
+            
+        Returns:
+            True, wenn die Änderung gespeichert wurde
+        """
+        try:
+            write(*args)
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Fehler beim Speichern der Registry: {e}")
+            return False
+    
+    def export_registry(self, path: Optional[Path] = None) -> None:
+        """
+        Exportiere die Registry im JSON-Format.
+        
+        Args:
+            path: Pfad zur JSON-Datei, standardmäßig die Registry-Datei
+        """
+        self.store.export_json(Path(path or self.registry_file))
+    
     def add_repository(self, repo_url: str) -> None:
         """
         Füge ein Repository zur Registry hinzu.
@@ -104,9 +156,10 @@ class RegistryManager:
             repo_url: Die URL des Repositories
         """
         if repo_url not in self.registry.repositories:
-            self.registry.repositories.append(repo_url)
-            self.registry.last_updated = datetime.now()
-            self._save_registry()
+            last_updated = datetime.now()
+            if self._write(self.store.add_repository, repo_url, last_updated):
+                self.registry.repositories.append(repo_url)
+                self.registry.last_updated = last_updated
     
     def remove_repository(self, repo_url: str) -> None:
         """
@@ -116,9 +169,10 @@ class RegistryManager:
             repo_url: Die URL des Repositories
         """
         if repo_url in self.registry.repositories:
-            self.registry.repositories.remove(repo_url)
-            self.registry.last_updated = datetime.now()
-            self._save_registry()
+            last_updated = datetime.now()
+            if self._write(self.store.remove_repository, repo_url, last_updated):
+                self.registry.repositories.remove(repo_url)
+                self.registry.last_updated = last_updated
     
     def add_docker_hub_user(self, username: str) -> None:
         """
@@ -128,9 +182,10 @@ class RegistryManager:
             username: Der Benutzername
         """
         if username not in self.registry.docker_hub_users:
-            self.registry.docker_hub_users.append(username)
-            self.registry.last_updated = datetime.now()
-            self._save_registry()
+            last_updated = datetime.now()
+            if self._write(self.store.add_docker_hub_user, username, last_updated):
+                self.registry.docker_hub_users.append(username)
+                self.registry.last_updated = last_updated
     
     def remove_docker_hub_user(self, username: str) -> None:
         """
@@ -140,9 +195,10 @@ class RegistryManager:
             username: Der Benutzername
         """
         if username in self.registry.docker_hub_users:
-            self.registry.docker_hub_users.remove(username)
-            self.registry.last_updated = datetime.now()
-            self._save_registry()
+            last_updated = datetime.now()
+            if self._write(self.store.remove_docker_hub_user, username, last_updated):
+                self.registry.docker_hub_users.remove(username)
+                self.registry.last_updated = last_updated
     
     def add_server(self, server: ServerConfig) -> None:
         """
@@ -151,9 +207,10 @@ class RegistryManager:
         Args:
             server: Die Serverkonfiguration
         """
-        self.registry.servers[server.name] = server
-        self.registry.last_updated = datetime.now()
-        self._save_registry()
+        last_updated = datetime.now()
+        if self._write(self.store.put_server, server, last_updated):
+            self.registry.servers[server.name] = server
+            self.registry.last_updated = last_updated
     
     def remove_server(self, server_name: str) -> None:
         """
@@ -163,9 +220,10 @@ class RegistryManager:
             server_name: Der Name des Servers
         """
         if server_name in self.registry.servers:
-            del self.registry.servers[server_name]
-            self.registry.last_updated = datetime.now()
-            self._save_registry()
+            last_updated = datetime.now()
+            if self._write(self.store.delete_server, server_name, last_updated):
+                del self.registry.servers[server_name]
+                self.registry.last_updated = last_updated
     
     def get_server(self, server_name: str) -> Optional[ServerConfig]:
         """
@@ -188,73 +246,50 @@ class RegistryManager:
         """
         return list(self.registry.servers.values())
     
-    async def discover_servers(self) -> List[ServerInfo]:
+    async def discover_servers(self, refresh: bool = False) -> List[ServerInfo]:
         """
         Entdecke MCP-Server im Netzwerk.
         
+        HTTP- und Docker-Discovery laufen gleichzeitig.
+        
+        Args:
+            refresh: Ob zwischengespeicherte Ergebnisse der HTTP-Discovery ignoriert werden sollen
+            
         Returns:
             Liste der entdeckten Server
         """
-        # Implementiere die Logik zur Entdeckung von MCP-Servern
-        # Hier könnte eine komplexere Logik implementiert werden
+        http_servers, docker_servers = await asyncio.gather(
+            self._discover_http_servers(refresh=refresh),
+            self._discover_docker_servers(),
+        )
         
+        # Entferne Server, die über beide Wege gefunden wurden
         discovered_servers = []
-        
-        # Entdecke Server über HTTP
-        discovered_servers.extend(await self._discover_http_servers())
-        
-        # Entdecke Server über Docker
-        discovered_servers.extend(await self._discover_docker_servers())
+        seen_urls = set()
+        for server_info in [*http_servers, *docker_servers]:
+            if server_info.url is not None:
+                if server_info.url in seen_urls:
+                    continue
+                seen_urls.add(server_info.url)
+            discovered_servers.append(server_info)
         
         return discovered_servers
     
-    async def _discover_http_servers(self) -> List[ServerInfo]:
+    async def _discover_http_servers(self, refresh: bool = False) -> List[ServerInfo]:
         """
         Entdecke MCP-Server über HTTP.
         
+        Args:
+            refresh: Ob zwischengespeicherte Ergebnisse ignoriert werden sollen
+        
         Returns:
             Liste der entdeckten Server
         """
-        discovered_servers = []
-        
-        # Definiere die zu scannenden Ports
-        ports = [3456, 3457, 3458, 3459, 3460, 8000, 8080]
-        
-        # Definiere die zu scannenden Hosts
-        hosts = ["localhost", "127.0.0.1"]
-        
-        # Scanne die Hosts und Ports
-        async with aiohttp.ClientSession() as session:
-            for host in hosts:
-                for port in ports:
-                    url = f"http://{host}:{port}/health"
-                    try:
-                        async with session.get(url, timeout=1) as response:
-                            if response.status == 200:
-                                # Versuche, die Serverinformationen zu erhalten
-                                try:
-                                    data = await response.json()
-                                    
-                                    # Erstelle ein ServerInfo-Objekt
-                                    server_info = ServerInfo(
-                                        name=data.get("name", f"mcp-server-{host}-{port}"),
-                                        description=data.get("description", "Entdeckter MCP-Server"),
-                                        version=data.get("version", "0.1.0"),
-                                        type=ServerType(data.get("type", "custom")),
-                                        protocol=ServerProtocol.HTTP,
-                                        url=f"http://{host}:{port}",
-                                        status=ServerStatus.ONLINE,
-                                        last_seen=datetime.now(),
-                                    )
-                                    
-                                    discovered_servers.append(server_info)
-                                except Exception as e:
-                                    logger.error(f"Fehler beim Parsen der Serverinformationen: {e}")
-                    except Exception as e:
-                        # Ignoriere Fehler beim Scannen
-                        pass
-        
-        return discovered_servers
+        try:
+            return await self.discovery.discover_http_servers(refresh=refresh)
+        except ValueError as e:
+            logger.error(f"Fehler bei der HTTP-Discovery: {e}")
+            return []
     
     async def _discover_docker_servers(self) -> List[ServerInfo]:
         """
@@ -263,12 +298,7 @@ class RegistryManager:
         Returns:
             Liste der entdeckten Server
         """
-        discovered_servers = []
-        
-        # Implementiere die Logik zur Entdeckung von MCP-Servern über Docker
-        # Hier könnte eine komplexere Logik implementiert werden
-        
-        return discovered_servers
+        return await self.discovery.discover_docker_servers()
     
     async def check_server_status(self, server: ServerConfig) -> ServerStatus:
         """
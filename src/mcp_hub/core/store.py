@@ -0,0 +1,290 @@
+"""
+MCP-Server-Registry-Speichermodul.
+
+Dieses Modul bietet eine SQLite-basierte Speicherung der Registry von MCP-Servern mit
+Einzelaktualisierungen und absturzsicheren Schreibvorgängen.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Iterator
+from datetime import datetime
+from contextlib import contextmanager
+
+from ..models.server import ServerRegistry, ServerConfig
+
+# Version des Datenbankschemas
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS servers (
+    name TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS repositories (
+    url TEXT PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS docker_hub_users (
+    username TEXT PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+"""
+
+
+class RegistryStore:
+    """SQLite-Speicher für die MCP-Server-Registry."""
+
+    def __init__(self, db_file: Path):
+        """
+        Initialisiere den Registry-Speicher.
+
+        Args:
+            db_file: Pfad zur Datenbankdatei
+        """
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(str(self.db_file), check_same_thread=False, isolation_level=None)
+
+        # WAL macht Schreibvorgänge absturzsicher, ohne bei jedem Commit die ganze Datei zu synchronisieren
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Führe Schreibvorgänge in einer Transaktion aus.
+
+        Yields:
+            Die Datenbankverbindung
+        """
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        """
+        Lese einen Metadatenwert.
+
+        Args:
+            key: Der Schlüssel
+
+        Returns:
+            Der Wert oder None, wenn er nicht existiert
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(connection: sqlite3.Connection, key: str, value: str) -> None:
+        """
+        Schreibe einen Metadatenwert innerhalb einer Transaktion.
+
+        Args:
+            connection: Die Datenbankverbindung
+            key: Der Schlüssel
+            value: Der Wert
+        """
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    @classmethod
+    def _touch(cls, connection: sqlite3.Connection, last_updated: Optional[datetime]) -> None:
+        """
+        Setze den Zeitpunkt der letzten Änderung innerhalb einer Transaktion.
+
+        Args:
+            connection: Die Datenbankverbindung
+            last_updated: Der Zeitpunkt der letzten Änderung
+        """
+        if last_updated is not None:
+            cls._set_meta(connection, "last_updated", last_updated.isoformat())
+
+    @property
+    def initialized(self) -> bool:
+        """Ob der Speicher bereits eine Registry enthält."""
+        return self._get_meta("schema_version") is not None
+
+    def load(self) -> ServerRegistry:
+        """
+        Lade die Registry.
+
+        Returns:
+            Die geladene Registry
+        """
+        with self._lock:
+            servers = {
+                name: ServerConfig.parse_raw(data)
+                for name, data in self._connection.execute("SELECT name, data FROM servers")
+            }
+            repositories = [
+                row[0] for row in self._connection.execute("SELECT url FROM repositories ORDER BY position")
+            ]
+            docker_hub_users = [
+                row[0] for row in self._connection.execute("SELECT username FROM docker_hub_users ORDER BY position")
+            ]
+
+        last_updated = self._get_meta("last_updated")
+        return ServerRegistry(
+            servers=servers,
+            repositories=repositories,
+            docker_hub_users=docker_hub_users,
+            last_updated=datetime.fromisoformat(last_updated) if last_updated else None,
+        )
+
+    def replace(self, registry: ServerRegistry, source: Optional[str] = None) -> None:
+        """
+        Ersetze den gesamten Inhalt des Speichers in einer Transaktion.
+
+        Args:
+            registry: Die zu speichernde Registry
+            source: Optionale Herkunft der Daten, z. B. die migrierte JSON-Datei
+        """
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM servers")
+            connection.execute("DELETE FROM repositories")
+            connection.execute("DELETE FROM docker_hub_users")
+            connection.executemany(
+                "INSERT INTO servers (name, data) VALUES (?, ?)",
+                ((name, server.json()) for name, server in registry.servers.items()),
+            )
+            connection.executemany(
+                "INSERT INTO repositories (url, position) VALUES (?, ?)",
+                ((url, position) for position, url in enumerate(registry.repositories)),
+            )
+            connection.executemany(
+                "INSERT INTO docker_hub_users (username, position) VALUES (?, ?)",
+                ((username, position) for position, username in enumerate(registry.docker_hub_users)),
+            )
+            self._set_meta(connection, "schema_version", str(SCHEMA_VERSION))
+            if source:
+                self._set_meta(connection, "migrated_from", source)
+            self._touch(connection, registry.last_updated)
+
+    def put_server(self, server: ServerConfig, last_updated: Optional[datetime] = None) -> None:
+        """
+        Speichere einen Server.
+
+        Args:
+            server: Die Serverkonfiguration
+            last_updated: Der Zeitpunkt der Änderung
+        """
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO servers (name, data) VALUES (?, ?)", (server.name, server.json())
+            )
+            self._touch(connection, last_updated)
+
+    def delete_server(self, name: str, last_updated: Optional[datetime] = None) -> None:
+        """
+        Lösche einen Server.
+
+        Args:
+            name: Der Name des Servers
+            last_updated: Der Zeitpunkt der Änderung
+        """
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM servers WHERE name = ?", (name,))
+            self._touch(connection, last_updated)
+
+    def _append(self, table: str, column: str, value: str, last_updated: Optional[datetime]) -> None:
+        """
+        Hänge einen Wert an eine geordnete Liste an.
+
+        Args:
+            table: Die Tabelle
+            column: Die Spalte des Werts
+            value: Der Wert
+            last_updated: Der Zeitpunkt der Änderung
+        """
+        with self._transaction() as connection:
+            connection.execute(
+                f"INSERT OR IGNORE INTO {table} ({column}, position) "
+                f"SELECT ?, COALESCE(MAX(position) + 1, 0) FROM {table}",
+                (value,),
+            )
+            self._touch(connection, last_updated)
+
+    def _remove(self, table: str, column: str, value: str, last_updated: Optional[datetime]) -> None:
+        """
+        Entferne einen Wert aus einer geordneten Liste.
+
+        Args:
+            table: Die Tabelle
+            column: Die Spalte des Werts
+            value: Der Wert
+            last_updated: Der Zeitpunkt der Änderung
+        """
+        with self._transaction() as connection:
+            connection.execute(f"DELETE FROM {table} WHERE {column} = ?", (value,))
+            self._touch(connection, last_updated)
+
+    def add_repository(self, repo_url: str, last_updated: Optional[datetime] = None) -> None:
+        """
+        Füge ein Repository hinzu.
+
+        Args:
+            repo_url: Die URL des Repositories
+            last_updated: Der Zeitpunkt der Änderung
+        """
+        self._append("repositories", "url", repo_url, last_updated)
+
+    def remove_repository(self, repo_url: str, last_updated: Optional[datetime] = None) -> None:
+        """
+        Entferne ein Repository.
+
+        Args:
+            repo_url: Die URL des Repositories
+            last_updated: Der Zeitpunkt der Änderung
+        """
+        self._remove("repositories", "url", repo_url, last_updated)
+
+    def add_docker_hub_user(self, username: str, last_updated: Optional[datetime] = None) -> None:
+        """
+        Füge einen Docker Hub-Benutzer hinzu.
+
+        Args:
+            username: Der Benutzername
+            last_updated: Der Zeitpunkt der Änderung
+        """
+        self._append("docker_hub_users", "username", username, last_updated)
+
+    def remove_docker_hub_user(self, username: str, last_updated: Optional[datetime] = None) -> None:
+        """
+        Entferne einen Docker Hub-Benutzer.
+
+        Args:
+            username: Der Benutzername
+            last_updated: Der Zeitpunkt der Änderung
+        """
+        self._remove("docker_hub_users", "username", username, last_updated)
+
+    def export_json(self, path: Path) -> None:
+        """
+        Exportiere die Registry im bisherigen JSON-Format.
+
+        Args:
+            path: Pfad zur JSON-Datei
+        """
+        registry = self.load()
+        with open(path, "w") as f:
+            json.dump(registry.dict(), f, indent=2, default=str)
+
+    def close(self) -> None:
+        """Schließe die Datenbankverbindung."""
+        with self._lock:
+            self._connection.close()
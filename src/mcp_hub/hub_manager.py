@@ -6,12 +6,14 @@ Diese Klasse bietet Funktionen zum Suchen, Installieren und Verwalten von MCP Se
 
 import os
 import json
+import asyncio
 import logging
-import subprocess
 from typing import Dict, List, Optional, Any, Union
 
 from .registry import MCPServerRegistry
 from .installer import MCPServerInstaller
+from .lifecycle import ServerLifecycle, DependencyError
+from .artifact_cache import ArtifactCache
 
 # Erstelle Logger
 logger = logging.getLogger(__name__)
@@ -29,8 +31,13 @@ class MCPHubManager:
         """
         self.config_path = config_path or os.path.join(os.path.dirname(__file__), "config", "hub_config.json")
         self.registry = MCPServerRegistry()
-        self.installer = MCPServerInstaller()
         self.config = self._load_config()
+        self.artifact_cache = ArtifactCache(self.config.get("cache_dir"))
+        self.installer = MCPServerInstaller(artifact_cache=self.artifact_cache)
+        self.lifecycle = ServerLifecycle(
+            max_parallel=self.config.get("max_parallel_operations", 8),
+            artifact_cache=self.artifact_cache,
+        )
         self.installed_servers = self._load_installed_servers()
 
     def _load_config(self) -> Dict[str, Any]:
@@ -56,7 +63,9 @@ class MCPHubManager:
                     ],
                     "local_servers_path": os.path.join(os.path.dirname(os.path.dirname(__file__)), "mcp_servers"),
                     "auto_update": True,
-                    "update_interval_hours": 24
+                    "update_interval_hours": 24,
+                    "max_parallel_operations": 8,
+                    "server_dependencies": {}
                 }
                 
                 # Erstelle Konfigurationsverzeichnis, falls es nicht existiert
@@ -103,18 +112,29 @@ class MCPHubManager:
             local_servers_path = self.config.get("local_servers_path", "")
             if os.path.exists(local_servers_path):
                 for server_dir in os.listdir(local_servers_path):
-                    server_path = os.path.join(local_servers_path, server_dir)
-                    if os.path.isdir(server_path):
-                        # Prüfe, ob es sich um einen MCP Server handelt
-                        if self._is_mcp_server(server_path):
-                            server_info = self._get_server_info(server_path)
-                            if server_info:
-                                installed_servers[server_dir] = server_info
+                    server_info = self._load_installed_server(os.path.join(local_servers_path, server_dir))
+                    if server_info:
+                        installed_servers[server_dir] = server_info
         except Exception as e:
             logger.exception(f"Fehler beim Laden der installierten MCP Server: {e}")
         
         return installed_servers
 
+    def _load_installed_server(self, server_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Lade einen installierten MCP Server.
+
+        Args:
+            server_path: Der Pfad zum Serververzeichnis
+
+        Returns:
+            Informationen über den MCP Server, oder None, wenn dort kein MCP Server installiert ist
+        """
+        # Prüfe, ob es sich um einen MCP Server handelt
+        if os.path.isdir(server_path) and self._is_mcp_server(server_path):
+            return self._get_server_info(server_path)
+        return None
+
     def _is_mcp_server(self, server_path: str) -> bool:
         """
         Prüfe, ob es sich bei dem angegebenen Pfad um einen MCP Server handelt.
@@ -222,19 +242,26 @@ class MCPHubManager:
         except Exception as e:
             logger.exception(f"Fehler bei der Aktualisierung der Registry: {e}")
 
-    def search_servers(self, query: str) -> List[Dict[str, Any]]:
+    def search_servers(
+        self,
+        query: str,
+        tags: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Suche nach MCP Servern in der Registry.
 
         Args:
             query: Die Suchanfrage
+            tags: Optionale Tags, die alle Ergebnisse tragen müssen
+            limit: Optionale maximale Anzahl von Ergebnissen
 
         Returns:
-            Eine Liste von MCP Servern, die der Suchanfrage entsprechen
+            Eine nach Relevanz sortierte Liste von MCP Servern, die der Suchanfrage entsprechen
         """
         try:
             # Suche in der Registry
-            return self.registry.search(query)
+            return self.registry.search(query, tags=tags, limit=limit)
         except Exception as e:
             logger.exception(f"Fehler bei der Suche nach MCP Servern: {e}")
             return []
@@ -257,10 +284,17 @@ class MCPHubManager:
                 return False
             
             # Installiere den Server
-            success = self.installer.install(server_info, self.config.get("local_servers_path", ""))
+            local_servers_path = self.config.get("local_servers_path", "")
+            success = self.installer.install(server_info, local_servers_path)
             if success:
-                # Aktualisiere die Liste der installierten Server
-                self.installed_servers = self._load_installed_servers()
+                # Aktualisiere nur den Eintrag des installierten Servers
+                server_path = self.installer.get_install_dir(server_info, local_servers_path)
+                if server_path:
+                    installed_info = self._load_installed_server(server_path)
+                    if installed_info:
+                        self.installed_servers[os.path.basename(server_path)] = installed_info
+                else:
+                    self.installed_servers = self._load_installed_servers()
                 return True
             else:
                 logger.error(f"Fehler bei der Installation von MCP Server {server_id}")
@@ -291,8 +325,8 @@ class MCPHubManager:
             # Deinstalliere den Server
             success = self.installer.uninstall(server_info)
             if success:
-                # Aktualisiere die Liste der installierten Server
-                self.installed_servers = self._load_installed_servers()
+                # Entferne nur den Eintrag des deinstallierten Servers
+                self.installed_servers.pop(server_id, None)
                 return True
             else:
                 logger.error(f"Fehler bei der Deinstallation von MCP Server {server_id}")
@@ -317,43 +351,8 @@ class MCPHubManager:
                 logger.error(f"MCP Server {server_id} ist nicht installiert")
                 return False
             
-            # Hole Serverinformationen
-            server_info = self.installed_servers[server_id]
-            
             # Starte den Server
-            server_path = server_info.get("path", "")
-            if not server_path or not os.path.exists(server_path):
-                logger.error(f"Serverpfad für {server_id} nicht gefunden")
-                return False
-            
-            # Prüfe, ob eine docker-compose.yml vorhanden ist
-            if os.path.exists(os.path.join(server_path, "docker-compose.yml")):
-                # Starte den Server mit Docker Compose
-                subprocess.run(["docker-compose", "up", "-d"], cwd=server_path, check=True)
-                return True
-            
-            # Prüfe, ob eine Dockerfile vorhanden ist
-            elif os.path.exists(os.path.join(server_path, "Dockerfile")):
-                # Baue und starte den Server mit Docker
-                subprocess.run(["docker", "build", "-t", f"mcp-{server_id}", "."], cwd=server_path, check=True)
-                subprocess.run(["docker", "run", "-d", "--name", f"mcp-{server_id}", f"mcp-{server_id}"], check=True)
-                return True
-            
-            # Prüfe, ob es sich um einen Python-Server handelt
-            elif server_info.get("type") == "python":
-                # Starte den Server mit Python
-                subprocess.Popen(["python", "main.py"], cwd=server_path)
-                return True
-            
-            # Prüfe, ob es sich um einen Node.js-Server handelt
-            elif server_info.get("type") == "nodejs":
-                # Starte den Server mit Node.js
-                subprocess.Popen(["npm", "start"], cwd=server_path)
-                return True
-            
-            else:
-                logger.error(f"Unbekannter Servertyp für {server_id}")
-                return False
+            return asyncio.run(self.lifecycle.start(server_id, self.installed_servers[server_id]))
         except Exception as e:
             logger.exception(f"Fehler beim Starten von MCP Server {server_id}: {e}")
             return False
@@ -374,34 +373,8 @@ class MCPHubManager:
                 logger.error(f"MCP Server {server_id} ist nicht installiert")
                 return False
             
-            # Hole Serverinformationen
-            server_info = self.installed_servers[server_id]
-            
             # Stoppe den Server
-            server_path = server_info.get("path", "")
-            if not server_path or not os.path.exists(server_path):
-                logger.error(f"Serverpfad für {server_id} nicht gefunden")
-                return False
-            
-            # Prüfe, ob eine docker-compose.yml vorhanden ist
-            if os.path.exists(os.path.join(server_path, "docker-compose.yml")):
-                # Stoppe den Server mit Docker Compose
-                subprocess.run(["docker-compose", "down"], cwd=server_path, check=True)
-                return True
-            
-            # Prüfe, ob eine Dockerfile vorhanden ist
-            elif os.path.exists(os.path.join(server_path, "Dockerfile")):
-                # Stoppe den Server mit Docker
-                subprocess.run(["docker", "stop", f"mcp-{server_id}"], check=True)
-                subprocess.run(["docker", "rm", f"mcp-{server_id}"], check=True)
-                return True
-            
-            # Für Python- und Node.js-Server: Finde und beende den Prozess
-            else:
-                # Hier müsste eine Prozesssuche und -beendigung implementiert werden
-                # Dies ist plattformabhängig und kann komplex sein
-                logger.warning(f"Automatisches Stoppen für {server_id} nicht implementiert")
-                return False
+            return asyncio.run(self.lifecycle.stop(server_id, self.installed_servers[server_id]))
         except Exception as e:
             logger.exception(f"Fehler beim Stoppen von MCP Server {server_id}: {e}")
             return False
@@ -430,41 +403,107 @@ class MCPHubManager:
             if server_id not in self.installed_servers:
                 return {"status": "not_installed", "error": f"MCP Server {server_id} ist nicht installiert"}
             
-            # Hole Serverinformationen
-            server_info = self.installed_servers[server_id]
-            
             # Prüfe, ob der Server läuft
-            server_path = server_info.get("path", "")
-            if not server_path or not os.path.exists(server_path):
-                return {"status": "error", "error": f"Serverpfad für {server_id} nicht gefunden"}
-            
-            # Prüfe, ob eine docker-compose.yml vorhanden ist
-            if os.path.exists(os.path.join(server_path, "docker-compose.yml")):
-                # Prüfe den Status mit Docker Compose
-                result = subprocess.run(["docker-compose", "ps", "-q"], cwd=server_path, capture_output=True, text=True)
-                if result.stdout.strip():
-                    return {"status": "running", "type": "docker-compose"}
-                else:
-                    return {"status": "stopped", "type": "docker-compose"}
-            
-            # Prüfe, ob eine Dockerfile vorhanden ist
-            elif os.path.exists(os.path.join(server_path, "Dockerfile")):
-                # Prüfe den Status mit Docker
-                result = subprocess.run(["docker", "ps", "-q", "-f", f"name=mcp-{server_id}"], capture_output=True, text=True)
-                if result.stdout.strip():
-                    return {"status": "running", "type": "docker"}
-                else:
-                    return {"status": "stopped", "type": "docker"}
-            
-            # Für Python- und Node.js-Server: Prüfe, ob der Prozess läuft
-            else:
-                # Hier müsste eine Prozesssuche implementiert werden
-                # Dies ist plattformabhängig und kann komplex sein
-                return {"status": "unknown", "type": server_info.get("type", "unknown")}
+            statuses = asyncio.run(self.lifecycle.status_all({server_id: self.installed_servers[server_id]}))
+            return statuses[server_id]
         except Exception as e:
             logger.exception(f"Fehler beim Abrufen des Status von MCP Server {server_id}: {e}")
             return {"status": "error", "error": str(e)}
 
+    def _select_installed_servers(self, server_ids: Optional[List[str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Wähle installierte MCP Server für eine Sammeloperation aus.
+
+        Args:
+            server_ids: Optionale IDs der MCP Server; ohne Angabe alle installierten Server
+
+        Returns:
+            Die ausgewählten installierten MCP Server
+        """
+        if server_ids is None:
+            return dict(self.installed_servers)
+        
+        for server_id in server_ids:
+            if server_id not in self.installed_servers:
+                logger.error(f"MCP Server {server_id} ist nicht installiert")
+        return {
+            server_id: self.installed_servers[server_id]
+            for server_id in server_ids
+            if server_id in self.installed_servers
+        }
+
+    def start_all_servers(self, server_ids: Optional[List[str]] = None) -> Dict[str, bool]:
+        """
+        Starte mehrere MCP Server parallel.
+
+        Abhängigkeiten aus ``server_dependencies`` in der Konfiguration werden vor den
+        abhängigen Servern gestartet.
+
+        Args:
+            server_ids: Optionale IDs der MCP Server; ohne Angabe alle installierten Server
+
+        Returns:
+            Ob der Start je MCP Server erfolgreich war
+        """
+        try:
+            return asyncio.run(self.lifecycle.start_all(
+                self._select_installed_servers(server_ids),
+                self.config.get("server_dependencies", {}),
+            ))
+        except DependencyError as e:
+            logger.error(str(e))
+            return {}
+
+    def stop_all_servers(self, server_ids: Optional[List[str]] = None) -> Dict[str, bool]:
+        """
+        Stoppe mehrere MCP Server parallel.
+
+        Abhängige Server werden vor ihren Abhängigkeiten gestoppt.
+
+        Args:
+            server_ids: Optionale IDs der MCP Server; ohne Angabe alle installierten Server
+
+        Returns:
+            Ob der Stopp je MCP Server erfolgreich war
+        """
+        try:
+            return asyncio.run(self.lifecycle.stop_all(
+                self._select_installed_servers(server_ids),
+                self.config.get("server_dependencies", {}),
+            ))
+        except DependencyError as e:
+            logger.error(str(e))
+            return {}
+
+    def get_all_servers_status(self, server_ids: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Hole den Status mehrerer MCP Server mit einem einzigen Docker-Aufruf.
+
+        Args:
+            server_ids: Optionale IDs der MCP Server; ohne Angabe alle installierten Server
+
+        Returns:
+            Der Status je MCP Server
+        """
+        try:
+            return asyncio.run(self.lifecycle.status_all(self._select_installed_servers(server_ids)))
+        except Exception as e:
+            logger.exception(f"Fehler beim Abrufen des Status der MCP Server: {e}")
+            return {}
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Hole die Trefferstatistik des Artefakt-Caches.
+
+        Returns:
+            Treffer, Fehlschläge und Trefferquote je Artefaktart
+        """
+        return self.artifact_cache.get_stats()
+
+    def clear_cache(self) -> None:
+        """Leere den Artefakt-Cache."""
+        self.artifact_cache.clear()
+
     def add_repository(self, repo_url: str) -> bool:
         """
         Füge ein Repository zur Konfiguration hinzu.
@@ -6,6 +6,7 @@ Diese Klasse bietet Funktionen zum Installieren und Verwalten von MCP Servern.
 
 import os
 import re
+import sys
 import json
 import logging
 import shutil
@@ -14,6 +15,8 @@ import subprocess
 import requests
 from typing import Dict, List, Optional, Any, Union
 
+from .artifact_cache import ArtifactCache
+
 # Erstelle Logger
 logger = logging.getLogger(__name__)
 
@@ -21,15 +24,17 @@ logger = logging.getLogger(__name__)
 class MCPServerInstaller:
     """MCP Server Installer Klasse."""
 
-    def __init__(self, temp_dir: Optional[str] = None):
+    def __init__(self, temp_dir: Optional[str] = None, artifact_cache: Optional[ArtifactCache] = None):
         """
         Initialisiere den MCP Server Installer.
 
         Args:
             temp_dir: Optionaler Pfad zum temporären Verzeichnis
+            artifact_cache: Optionaler Artefakt-Cache für Git-Spiegel und Abhängigkeiten
         """
         self.temp_dir = temp_dir or os.path.join(tempfile.gettempdir(), "mcp_installer_temp")
         os.makedirs(self.temp_dir, exist_ok=True)
+        self.artifact_cache = artifact_cache or ArtifactCache()
 
     def install(self, server_info: Dict[str, Any], target_dir: str) -> bool:
         """
@@ -60,6 +65,24 @@ class MCPServerInstaller:
             logger.exception(f"Fehler bei der Installation von MCP Server: {e}")
             return False
 
+    def get_install_dir(self, server_info: Dict[str, Any], target_dir: str) -> Optional[str]:
+        """
+        Ermittle das Verzeichnis, in das ein MCP Server installiert wird.
+
+        Args:
+            server_info: Informationen über den MCP Server
+            target_dir: Das Zielverzeichnis für die Installation
+
+        Returns:
+            Der Pfad zum Serververzeichnis, oder None, wenn er nicht bestimmt werden kann
+        """
+        source = server_info.get("source", "")
+        if source == "github" and server_info.get("url"):
+            return os.path.join(target_dir, server_info["url"].split("/")[-1])
+        if source == "docker_hub" and server_info.get("docker_image"):
+            return os.path.join(target_dir, server_info["docker_image"].split("/")[-1])
+        return None
+
     def _install_from_github(self, server_info: Dict[str, Any], target_dir: str) -> bool:
         """
         Installiere einen MCP Server von GitHub.
@@ -78,36 +101,83 @@ class MCPServerInstaller:
                 logger.error("Keine Repository-URL angegeben")
                 return False
             
-            # Extrahiere den Repository-Namen
-            repo_name = repo_url.split("/")[-1]
-            
             # Erstelle den Pfad zum Zielverzeichnis
-            server_dir = os.path.join(target_dir, repo_name)
+            server_dir = self.get_install_dir(server_info, target_dir)
             
-            # Klone das Repository
-            subprocess.run(["git", "clone", repo_url, server_dir], check=True)
+            # Klone das Repository aus dem lokalen Spiegel, sodass nur neue Objekte geladen werden
+            mirror = self.artifact_cache.update_mirror(repo_url)
+            if mirror:
+                subprocess.run(["git", "clone", mirror, server_dir], check=True)
+                subprocess.run(["git", "remote", "set-url", "origin", repo_url], cwd=server_dir, check=True)
+            else:
+                subprocess.run(["git", "clone", repo_url, server_dir], check=True)
             
             # Prüfe, ob das Repository erfolgreich geklont wurde
             if not os.path.exists(server_dir):
                 logger.error(f"Repository konnte nicht geklont werden: {repo_url}")
                 return False
             
-            # Prüfe, ob eine package.json oder pyproject.toml vorhanden ist
-            if os.path.exists(os.path.join(server_dir, "package.json")):
-                # Installiere Node.js-Abhängigkeiten
-                subprocess.run(["npm", "install"], cwd=server_dir, check=True)
-            elif os.path.exists(os.path.join(server_dir, "pyproject.toml")):
-                # Installiere Python-Abhängigkeiten
-                subprocess.run(["pip", "install", "-e", "."], cwd=server_dir, check=True)
-            elif os.path.exists(os.path.join(server_dir, "requirements.txt")):
-                # Installiere Python-Abhängigkeiten
-                subprocess.run(["pip", "install", "-r", "requirements.txt"], cwd=server_dir, check=True)
+            self._install_dependencies(server_dir)
             
             return True
         except Exception as e:
             logger.exception(f"Fehler bei der Installation von GitHub: {e}")
             return False
 
+    def _install_dependencies(self, server_dir: str) -> None:
+        """
+        Installiere die Abhängigkeiten eines MCP Servers über den Artefakt-Cache.
+
+        Unveränderte Abhängigkeiten werden nicht erneut installiert: node_modules werden
+        aus dem Cache wiederhergestellt, Python-Abhängigkeiten werden übersprungen, wenn
+        sie mit denselben Lockfiles bereits in diese Umgebung installiert wurden.
+
+        Args:
+            server_dir: Der Pfad zum Server
+        """
+        cache = self.artifact_cache
+        pip = [sys.executable, "-m", "pip"]
+        
+        # Prüfe, ob eine package.json oder pyproject.toml vorhanden ist
+        if os.path.exists(os.path.join(server_dir, "package.json")):
+            # Installiere Node.js-Abhängigkeiten
+            key = cache.npm_key(server_dir)
+            if cache.restore_node_modules(key, server_dir):
+                cache.record("npm", True)
+                return
+            has_lockfile = any(
+                os.path.exists(os.path.join(server_dir, name))
+                for name in ("package-lock.json", "npm-shrinkwrap.json")
+            )
+            subprocess.run(["npm", "ci" if has_lockfile else "install", *cache.npm_args()], cwd=server_dir, check=True)
+            cache.save_node_modules(key, server_dir)
+            cache.record("npm", False)
+        elif os.path.exists(os.path.join(server_dir, "pyproject.toml")):
+            # Installiere Python-Abhängigkeiten
+            key = cache.pip_key(server_dir, cache.get_commit(server_dir), editable=True)
+            if cache.has_stamp(key):
+                cache.record("pip", True)
+                return
+            subprocess.run([*pip, "install", *cache.pip_args(), "-e", "."], cwd=server_dir, check=True)
+            cache.write_stamp(key)
+            cache.record("pip", False)
+        elif os.path.exists(os.path.join(server_dir, "requirements.txt")):
+            # Installiere Python-Abhängigkeiten
+            key = cache.pip_key(server_dir, None, editable=False)
+            if cache.has_stamp(key):
+                cache.record("pip", True)
+                return
+            # Baue die Wheels einmal in den gemeinsamen Wheel-Cache
+            subprocess.run(
+                [*pip, "wheel", "--cache-dir", cache.pip_cache_dir, "--wheel-dir", cache.wheels_dir,
+                 "-r", "requirements.txt"],
+                cwd=server_dir,
+                check=True,
+            )
+            subprocess.run([*pip, "install", *cache.pip_args(), "-r", "requirements.txt"], cwd=server_dir, check=True)
+            cache.write_stamp(key)
+            cache.record("pip", False)
+
     def _install_from_docker_hub(self, server_info: Dict[str, Any], target_dir: str) -> bool:
         """
         Installiere einen MCP Server von Docker Hub.
@@ -130,7 +200,7 @@ class MCPServerInstaller:
             image_name = docker_image.split("/")[-1]
             
             # Erstelle den Pfad zum Zielverzeichnis
-            server_dir = os.path.join(target_dir, image_name)
+            server_dir = self.get_install_dir(server_info, target_dir)
             
             # Erstelle das Verzeichnis
             os.makedirs(server_dir, exist_ok=True)
@@ -0,0 +1,544 @@
+"""
+MCP Server Lifecycle - Asynchrones Starten, Stoppen und Überwachen von MCP Servern.
+
+Diese Klasse führt Lifecycle-Operationen für mehrere MCP Server parallel aus und
+berücksichtigt dabei die Abhängigkeiten zwischen den Servern.
+"""
+
+import os
+import re
+import time
+import signal
+import asyncio
+import logging
+import subprocess
+from typing import Dict, List, Optional, Any, Awaitable, Callable, Set, Tuple
+
+from .artifact_cache import ArtifactCache
+
+# Erstelle Logger
+logger = logging.getLogger(__name__)
+
+# Label, mit dem Docker Compose das Arbeitsverzeichnis eines Projekts markiert
+COMPOSE_WORKING_DIR_LABEL = "com.docker.compose.project.working_dir"
+COMPOSE_PROJECT_LABEL = "com.docker.compose.project"
+
+# PID-Datei im Serververzeichnis, damit spätere Hub-Aufrufe Python- und Node.js-Server
+# wiederfinden, die ein anderer Hub-Prozess gestartet hat
+PID_FILE = ".mcp-hub.pid"
+
+
+class DependencyError(Exception):
+    """Fehler in den Abhängigkeiten zwischen MCP Servern."""
+
+
+async def run_command(args: List[str], cwd: Optional[str] = None) -> Tuple[int, str, str]:
+    """
+    Führe einen Befehl asynchron aus.
+
+    Args:
+        args: Der Befehl und seine Argumente
+        cwd: Optionales Arbeitsverzeichnis
+
+    Returns:
+        Der Exit-Code, die Standardausgabe und die Fehlerausgabe
+    """
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+    return process.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+def dependency_levels(server_ids: List[str], dependencies: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Ordne Server nach ihren Abhängigkeiten in Ebenen an.
+
+    Alle Server einer Ebene hängen nur von Servern früherer Ebenen ab. Abhängigkeiten
+    auf Server außerhalb von server_ids werden ignoriert.
+
+    Args:
+        server_ids: Die Server
+        dependencies: Die Abhängigkeiten je Server
+
+    Returns:
+        Die Ebenen in Startreihenfolge
+
+    Raises:
+        DependencyError: Wenn die Abhängigkeiten einen Zyklus enthalten
+    """
+    selected = set(server_ids)
+    remaining = {
+        server_id: {dep for dep in dependencies.get(server_id, []) if dep in selected and dep != server_id}
+        for server_id in server_ids
+    }
+
+    levels = []
+    while remaining:
+        level = sorted(server_id for server_id, deps in remaining.items() if not deps)
+        if not level:
+            raise DependencyError(f"Zyklische Abhängigkeiten zwischen MCP Servern: {', '.join(sorted(remaining))}")
+        levels.append(level)
+        for server_id in level:
+            del remaining[server_id]
+        for deps in remaining.values():
+            deps.difference_update(level)
+    return levels
+
+
+def _process_alive(pid: int) -> bool:
+    """
+    Prüfe, ob ein Prozess läuft.
+
+    Args:
+        pid: Die PID des Prozesses
+
+    Returns:
+        True, wenn der Prozess läuft, sonst False
+    """
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _compose_project_name(server_path: str) -> str:
+    """
+    Ermittle den Standard-Projektnamen von Docker Compose für ein Verzeichnis.
+
+    Args:
+        server_path: Das Verzeichnis
+
+    Returns:
+        Der Projektname
+    """
+    return re.sub(r"[^a-z0-9_-]", "", os.path.basename(os.path.normpath(server_path)).lower())
+
+
+class ServerLifecycle:
+    """Asynchrone Lifecycle-Verwaltung für MCP Server."""
+
+    def __init__(self, max_parallel: int = 8, artifact_cache: Optional[ArtifactCache] = None):
+        """
+        Initialisiere die Lifecycle-Verwaltung.
+
+        Args:
+            max_parallel: Maximale Anzahl gleichzeitig ausgeführter Operationen
+            artifact_cache: Optionaler Artefakt-Cache für vorgebaute Images
+        """
+        self.max_parallel = max_parallel
+        self.artifact_cache = artifact_cache or ArtifactCache()
+        # Kindprozesse dieses Hubs; Prozesse anderer Hub-Aufrufe werden über PID_FILE gefunden
+        self.processes: Dict[str, subprocess.Popen] = {}
+
+    async def start(self, server_id: str, server_info: Dict[str, Any]) -> bool:
+        """
+        Starte einen MCP Server.
+
+        Args:
+            server_id: Die ID des MCP Servers
+            server_info: Informationen über den installierten MCP Server
+
+        Returns:
+            True, wenn der Start erfolgreich war, sonst False
+        """
+        server_path = server_info.get("path", "")
+        if not server_path or not os.path.exists(server_path):
+            logger.error(f"Serverpfad für {server_id} nicht gefunden")
+            return False
+
+        # Prüfe, ob eine docker-compose.yml vorhanden ist
+        if os.path.exists(os.path.join(server_path, "docker-compose.yml")):
+            return await self._run(server_id, ["docker-compose", "up", "-d"], cwd=server_path)
+
+        # Prüfe, ob eine Dockerfile vorhanden ist
+        if os.path.exists(os.path.join(server_path, "Dockerfile")):
+            return (
+                await self._ensure_image(server_id, server_path)
+                and await self._run(server_id, ["docker", "run", "-d", "--name", f"mcp-{server_id}", f"mcp-{server_id}"])
+            )
+
+        # Python- und Node.js-Server laufen als Kindprozesse weiter
+        if server_info.get("type") == "python":
+            command = ["python", "main.py"]
+        elif server_info.get("type") == "nodejs":
+            command = ["npm", "start"]
+        else:
+            logger.error(f"Unbekannter Servertyp für {server_id}")
+            return False
+
+        process = self.processes.get(server_id)
+        if process is not None and process.poll() is None:
+            return True
+        if self._read_pid(server_path) is not None:
+            return True
+        process = subprocess.Popen(command, cwd=server_path)
+        self.processes[server_id] = process
+        self._write_pid(server_path, process.pid)
+        return True
+
+    async def stop(self, server_id: str, server_info: Dict[str, Any]) -> bool:
+        """
+        Stoppe einen MCP Server.
+
+        Args:
+            server_id: Die ID des MCP Servers
+            server_info: Informationen über den installierten MCP Server
+
+        Returns:
+            True, wenn der Stopp erfolgreich war, sonst False
+        """
+        server_path = server_info.get("path", "")
+        if not server_path or not os.path.exists(server_path):
+            logger.error(f"Serverpfad für {server_id} nicht gefunden")
+            return False
+
+        # Prüfe, ob eine docker-compose.yml vorhanden ist
+        if os.path.exists(os.path.join(server_path, "docker-compose.yml")):
+            return await self._run(server_id, ["docker-compose", "down"], cwd=server_path)
+
+        # Prüfe, ob eine Dockerfile vorhanden ist
+        if os.path.exists(os.path.join(server_path, "Dockerfile")):
+            return (
+                await self._run(server_id, ["docker", "stop", f"mcp-{server_id}"])
+                and await self._run(server_id, ["docker", "rm", f"mcp-{server_id}"])
+            )
+
+        # Beende Kindprozesse dieses Hubs und Prozesse aus der PID-Datei
+        process = self.processes.pop(server_id, None)
+        if process is not None:
+            if process.poll() is None:
+                process.terminate()
+                try:
+                    await asyncio.wait_for(asyncio.get_running_loop().run_in_executor(None, process.wait), timeout=10)
+                except asyncio.TimeoutError:
+                    process.kill()
+            self._remove_pid(server_path)
+            return True
+
+        pid = self._read_pid(server_path)
+        if pid is None:
+            logger.warning(f"Automatisches Stoppen für {server_id} nicht möglich: kein vom Hub gestarteter Prozess gefunden")
+            return False
+
+        os.kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + 10
+        while _process_alive(pid) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        if _process_alive(pid):
+            os.kill(pid, signal.SIGKILL)
+        self._remove_pid(server_path)
+        return True
+
+    @staticmethod
+    def _read_pid(server_path: str) -> Optional[int]:
+        """
+        Lies die PID eines laufenden Servers aus seiner PID-Datei.
+
+        Eine PID-Datei, deren Prozess nicht mehr läuft, wird entfernt.
+
+        Args:
+            server_path: Der Pfad zum Server
+
+        Returns:
+            Die PID, oder None, wenn kein gestarteter Server läuft
+        """
+        pid_path = os.path.join(server_path, PID_FILE)
+        try:
+            with open(pid_path, "r") as f:
+                pid = int(f.read().strip())
+        except (OSError, ValueError):
+            return None
+
+        if _process_alive(pid):
+            return pid
+        ServerLifecycle._remove_pid(server_path)
+        return None
+
+    @staticmethod
+    def _write_pid(server_path: str, pid: int) -> None:
+        """
+        Schreibe die PID eines gestarteten Servers in seine PID-Datei.
+
+        Args:
+            server_path: Der Pfad zum Server
+            pid: Die PID des Servers
+        """
+        try:
+            with open(os.path.join(server_path, PID_FILE), "w") as f:
+                f.write(str(pid))
+        except OSError as e:
+            logger.warning(f"PID-Datei für {server_path} konnte nicht geschrieben werden: {e}")
+
+    @staticmethod
+    def _remove_pid(server_path: str) -> None:
+        """
+        Entferne die PID-Datei eines Servers.
+
+        Args:
+            server_path: Der Pfad zum Server
+        """
+        try:
+            os.remove(os.path.join(server_path, PID_FILE))
+        except FileNotFoundError:
+            pass
+
+    async def _ensure_image(self, server_id: str, server_path: str) -> bool:
+        """
+        Stelle sicher, dass das Image eines Servers zum aktuellen Build-Kontext passt.
+
+        Images werden mit dem Schlüssel ihres Build-Kontexts getaggt. Existiert das Image
+        für den aktuellen Schlüssel bereits, wird nur ``mcp-<id>`` darauf gesetzt, statt neu zu bauen.
+
+        Args:
+            server_id: Die ID des MCP Servers
+            server_path: Der Pfad zum Server
+
+        Returns:
+            True, wenn das Image verfügbar ist, sonst False
+        """
+        key = await asyncio.get_running_loop().run_in_executor(None, self.artifact_cache.source_key, server_path)
+        tag = self.artifact_cache.image_tag(server_id, key)
+
+        try:
+            returncode, _, _ = await run_command(["docker", "image", "inspect", tag])
+        except OSError as e:
+            logger.error(f"Docker ist nicht verfügbar: {e}")
+            return False
+
+        if returncode == 0:
+            self.artifact_cache.record("image", True)
+            return await self._run(server_id, ["docker", "tag", tag, f"mcp-{server_id}"])
+
+        self.artifact_cache.record("image", False)
+        return await self._run(
+            server_id, ["docker", "build", "-t", tag, "-t", f"mcp-{server_id}", "."], cwd=server_path
+        )
+
+    async def _run(self, server_id: str, args: List[str], cwd: Optional[str] = None) -> bool:
+        """
+        Führe einen Lifecycle-Befehl für einen Server aus.
+
+        Args:
+            server_id: Die ID des MCP Servers
+            args: Der Befehl und seine Argumente
+            cwd: Optionales Arbeitsverzeichnis
+
+        Returns:
+            True, wenn der Befehl erfolgreich war, sonst False
+        """
+        try:
+            returncode, _, stderr = await run_command(args, cwd=cwd)
+        except OSError as e:
+            logger.error(f"Befehl {' '.join(args)} für {server_id} konnte nicht ausgeführt werden: {e}")
+            return False
+        if returncode != 0:
+            logger.error(f"Befehl {' '.join(args)} für {server_id} fehlgeschlagen: {stderr.strip()}")
+            return False
+        return True
+
+    async def get_docker_snapshot(self) -> Optional[Dict[str, Set[str]]]:
+        """
+        Hole die laufenden Container mit einem einzigen ``docker ps``.
+
+        Returns:
+            Die Namen, Compose-Arbeitsverzeichnisse und Compose-Projekte der laufenden
+            Container, oder None, wenn Docker nicht verfügbar ist
+        """
+        try:
+            returncode, stdout, stderr = await run_command([
+                "docker", "ps",
+                "--format",
+                f'{{{{.Names}}}}\t{{{{.Label "{COMPOSE_WORKING_DIR_LABEL}"}}}}\t{{{{.Label "{COMPOSE_PROJECT_LABEL}"}}}}',
+            ])
+        except OSError as e:
+            logger.error(f"Docker ist nicht verfügbar: {e}")
+            return None
+        if returncode != 0:
+            logger.error(f"Fehler beim Abrufen der laufenden Container: {stderr.strip()}")
+            return None
+
+        snapshot: Dict[str, Set[str]] = {"names": set(), "working_dirs": set(), "projects": set()}
+        for line in stdout.splitlines():
+            name, _, rest = line.partition("\t")
+            working_dir, _, project = rest.partition("\t")
+            snapshot["names"].add(name)
+            if working_dir:
+                snapshot["working_dirs"].add(os.path.realpath(working_dir))
+            if project:
+                snapshot["projects"].add(project)
+        return snapshot
+
+    def status(
+        self,
+        server_id: str,
+        server_info: Dict[str, Any],
+        snapshot: Optional[Dict[str, Set[str]]],
+    ) -> Dict[str, Any]:
+        """
+        Ermittle den Status eines MCP Servers aus einem Docker-Snapshot.
+
+        Args:
+            server_id: Die ID des MCP Servers
+            server_info: Informationen über den installierten MCP Server
+            snapshot: Die laufenden Container aus get_docker_snapshot
+
+        Returns:
+            Ein Dictionary mit dem Status des MCP Servers
+        """
+        server_path = server_info.get("path", "")
+        if not server_path or not os.path.exists(server_path):
+            return {"status": "error", "error": f"Serverpfad für {server_id} nicht gefunden"}
+
+        if os.path.exists(os.path.join(server_path, "docker-compose.yml")):
+            server_type = "docker-compose"
+            if snapshot is None:
+                return {"status": "unknown", "type": server_type, "error": "Docker ist nicht verfügbar"}
+            running = (
+                os.path.realpath(server_path) in snapshot["working_dirs"]
+                or _compose_project_name(server_path) in snapshot["projects"]
+            )
+            return {"status": "running" if running else "stopped", "type": server_type}
+
+        if os.path.exists(os.path.join(server_path, "Dockerfile")):
+            server_type = "docker"
+            if snapshot is None:
+                return {"status": "unknown", "type": server_type, "error": "Docker ist nicht verfügbar"}
+            running = f"mcp-{server_id}" in snapshot["names"]
+            return {"status": "running" if running else "stopped", "type": server_type}
+
+        # Für Python- und Node.js-Server sind nur die vom Hub gestarteten Prozesse bekannt
+        server_type = server_info.get("type", "unknown")
+        process = self.processes.get(server_id)
+        if process is not None and process.poll() is None:
+            return {"status": "running", "type": server_type, "pid": process.pid}
+
+        pid = self._read_pid(server_path)
+        if pid is not None:
+            return {"status": "running", "type": server_type, "pid": pid}
+        if process is not None:
+            return {"status": "stopped", "type": server_type, "pid": process.pid}
+        return {"status": "unknown", "type": server_type}
+
+    async def status_all(self, servers: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Ermittle den Status mehrerer MCP Server mit einem einzigen Docker-Aufruf.
+
+        Args:
+            servers: Die installierten MCP Server
+
+        Returns:
+            Der Status je MCP Server
+        """
+        needs_docker = any(
+            os.path.exists(os.path.join(info.get("path", ""), "docker-compose.yml"))
+            or os.path.exists(os.path.join(info.get("path", ""), "Dockerfile"))
+            for info in servers.values()
+        )
+        snapshot = await self.get_docker_snapshot() if needs_docker else None
+        return {server_id: self.status(server_id, info, snapshot) for server_id, info in servers.items()}
+
+    async def start_all(
+        self,
+        servers: Dict[str, Dict[str, Any]],
+        dependencies: Dict[str, List[str]],
+    ) -> Dict[str, bool]:
+        """
+        Starte mehrere MCP Server parallel.
+
+        Ein Server wird erst gestartet, wenn alle seine Abhängigkeiten gestartet sind.
+        Schlägt eine Abhängigkeit fehl, wird der Server nicht gestartet.
+
+        Args:
+            servers: Die zu startenden MCP Server
+            dependencies: Die Abhängigkeiten je Server
+
+        Returns:
+            Ob der Start je Server erfolgreich war
+
+        Raises:
+            DependencyError: Wenn die Abhängigkeiten einen Zyklus enthalten
+        """
+        return await self._run_ordered(servers, dependencies, self.start, reverse=False)
+
+    async def stop_all(
+        self,
+        servers: Dict[str, Dict[str, Any]],
+        dependencies: Dict[str, List[str]],
+    ) -> Dict[str, bool]:
+        """
+        Stoppe mehrere MCP Server parallel.
+
+        Ein Server wird erst gestoppt, wenn alle von ihm abhängigen Server gestoppt sind.
+
+        Args:
+            servers: Die zu stoppenden MCP Server
+            dependencies: Die Abhängigkeiten je Server
+
+        Returns:
+            Ob der Stopp je Server erfolgreich war
+
+        Raises:
+            DependencyError: Wenn die Abhängigkeiten einen Zyklus enthalten
+        """
+        return await self._run_ordered(servers, dependencies, self.stop, reverse=True)
+
+    async def _run_ordered(
+        self,
+        servers: Dict[str, Dict[str, Any]],
+        dependencies: Dict[str, List[str]],
+        operation: Callable[[str, Dict[str, Any]], Awaitable[bool]],
+        reverse: bool,
+    ) -> Dict[str, bool]:
+        """
+        Führe eine Operation für mehrere Server in Abhängigkeitsreihenfolge aus.
+
+        Jeder Server wartet nur auf seine eigenen Vorgänger, nicht auf eine ganze Ebene.
+
+        Args:
+            servers: Die MCP Server
+            dependencies: Die Abhängigkeiten je Server
+            operation: Die Operation
+            reverse: Ob die Abhängigkeiten umgekehrt werden (Stoppen vor den Abhängigkeiten)
+
+        Returns:
+            Das Ergebnis je Server
+        """
+        server_ids = list(servers)
+        # Prüft zugleich auf Zyklen
+        dependency_levels(server_ids, dependencies)
+
+        predecessors: Dict[str, List[str]] = {server_id: [] for server_id in server_ids}
+        for server_id in server_ids:
+            for dep in dependencies.get(server_id, []):
+                if dep in servers and dep != server_id:
+                    if reverse:
+                        predecessors[dep].append(server_id)
+                    else:
+                        predecessors[server_id].append(dep)
+
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run(server_id: str) -> bool:
+            results = await asyncio.gather(*(tasks[pred] for pred in predecessors[server_id]))
+            if not reverse and not all(results):
+                logger.error(f"Überspringe {server_id}: eine Abhängigkeit konnte nicht gestartet werden")
+                return False
+            async with semaphore:
+                try:
+                    return await operation(server_id, servers[server_id])
+                except Exception as e:
+                    logger.exception(f"Fehler bei der Operation für MCP Server {server_id}: {e}")
+                    return False
+
+        for server_id in server_ids:
+            tasks[server_id] = asyncio.ensure_future(run(server_id))
+        results = await asyncio.gather(*tasks.values())
+        return dict(zip(tasks, results))
@@ -6,7 +6,7 @@ Dieses Modul definiert die Datenmodelle für MCP-Server.
 
 from enum import Enum
 from typing import Dict, List, Any, Optional
-from pydantic import BaseModel, Field, HttpUrl, validator
+from pydantic import AnyHttpUrl, BaseModel, Field, validator
 from datetime import datetime
 
 
@@ -55,7 +55,7 @@ class ServerInfo(BaseModel):
     version: str
     type: ServerType
     protocol: ServerProtocol
-    url: Optional[HttpUrl] = None
+    url: Optional[AnyHttpUrl] = None
     status: ServerStatus = ServerStatus.UNKNOWN
     tools: List[ServerTool] = []
     last_seen: Optional[datetime] = None
@@ -78,7 +78,7 @@ class ServerConfig(BaseModel):
     description: str
     type: ServerType
     protocol: ServerProtocol
-    url: Optional[HttpUrl] = None
+    url: Optional[AnyHttpUrl] = None
     auth_token: Optional[str] = None
     enabled: bool = True
     auto_start: bool = False
@@ -7,33 +7,64 @@ Diese Klasse bietet Funktionen zum Verwalten der Registry von MCP Servern.
 import os
 import re
 import json
+import bisect
+import hashlib
 import logging
 import tempfile
 import subprocess
+import time
 import requests
-from typing import Dict, List, Optional, Any, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any, Tuple, Union
 from urllib.parse import urlparse
 
+from .search_index import SearchIndex
+
 # Erstelle Logger
 logger = logging.getLogger(__name__)
 
+# Version des gespeicherten Registry-Zustands; ältere Zustände führen zu einer vollständigen Aktualisierung
+STATE_VERSION = 2
+
 
 class MCPServerRegistry:
     """MCP Server Registry Klasse."""
 
-    def __init__(self, cache_dir: Optional[str] = None):
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_workers: int = 8,
+        git_timeout: float = 300.0,
+        http_timeout: float = 30.0,
+    ):
         """
         Initialisiere die MCP Server Registry.
 
         Args:
             cache_dir: Optionaler Pfad zum Cache-Verzeichnis
+            max_workers: Maximale Anzahl parallel aktualisierter Quellen
+            git_timeout: Timeout für Git-Befehle in Sekunden
+            http_timeout: Timeout für Docker Hub Anfragen in Sekunden
         """
         self.cache_dir = cache_dir or os.path.join(tempfile.gettempdir(), "mcp_registry_cache")
         os.makedirs(self.cache_dir, exist_ok=True)
         
+        self.max_workers = max_workers
+        self.git_timeout = git_timeout
+        self.http_timeout = http_timeout
         self.repositories = []
         self.docker_hub_users = []
         self.servers = {}
+        self.last_update_stats: Dict[str, Dict[str, Any]] = {}
+
+        # Zustand der letzten Aktualisierung (Commit und Server je README.md) für inkrementelle Scans
+        self.state_file = os.path.join(self.cache_dir, "registry_state.json")
+        self._state = self._load_state()
+
+        # Suchindex der letzten Aktualisierung, damit Suchen ohne erneute Aktualisierung möglich sind
+        self.index_file = os.path.join(self.cache_dir, "search_index.json")
+        self.search_index = SearchIndex.load(self.index_file) or SearchIndex()
+        self.servers = self.search_index.documents
 
     def add_repository(self, repo_url: str) -> None:
         """
@@ -75,78 +106,303 @@ class MCPServerRegistry:
         if username in self.docker_hub_users:
             self.docker_hub_users.remove(username)
 
-    def update(self) -> None:
-        """Aktualisiere die Registry mit den neuesten MCP Servern aus den konfigurierten Repositories und Docker Hub Benutzern."""
+    def update(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aktualisiere die Registry mit den neuesten MCP Servern aus den konfigurierten Repositories und Docker Hub Benutzern.
+
+        Alle Quellen werden parallel aktualisiert. Die neue Server-Map wird separat aufgebaut
+        und erst am Ende ausgetauscht, sodass die Registry während der Aktualisierung
+        vollständig bleibt. Schlägt eine Quelle fehl, bleiben ihre zuletzt bekannten Server erhalten.
+
+        Returns:
+            Ein Dictionary mit Laufzeit und Ergebnis je Quelle
+        """
+        stats: Dict[str, Dict[str, Any]] = {}
+
         try:
-            # Leere die aktuelle Registry
-            self.servers = {}
-            
-            # Aktualisiere die Registry mit den konfigurierten Repositories
+            repo_results: Dict[str, Optional[Dict[str, Any]]] = {}
+            docker_results: Dict[str, Optional[Dict[str, Dict[str, Any]]]] = {}
+
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mcp-registry") as executor:
+                repo_futures = {
+                    executor.submit(self._timed, self._update_from_repository, repo_url): repo_url
+                    for repo_url in self.repositories
+                }
+                docker_futures = {
+                    executor.submit(self._timed, self._update_from_docker_hub, username): username
+                    for username in self.docker_hub_users
+                }
+
+                for future in as_completed(repo_futures):
+                    repo_url = repo_futures[future]
+                    repo_results[repo_url], stats[repo_url] = future.result()
+                for future in as_completed(docker_futures):
+                    username = docker_futures[future]
+                    docker_results[username], stats[f"docker:{username}"] = future.result()
+
+            # Behalte den letzten bekannten Stand fehlgeschlagener Quellen
+            repositories_state = {
+                repo_url: repo_results[repo_url] or self._state["repositories"].get(repo_url)
+                for repo_url in self.repositories
+            }
+            docker_state = {
+                username: docker_results[username] if docker_results[username] is not None
+                else self._state["docker_hub_users"].get(username)
+                for username in self.docker_hub_users
+            }
+
+            # Baue die neue Server-Map in der konfigurierten Reihenfolge auf
+            servers: Dict[str, Dict[str, Any]] = {}
             for repo_url in self.repositories:
-                self._update_from_repository(repo_url)
-            
-            # Aktualisiere die Registry mit den konfigurierten Docker Hub Benutzern
+                for readme_servers in (repositories_state[repo_url] or {}).get("readmes", {}).values():
+                    servers.update(readme_servers)
             for username in self.docker_hub_users:
-                self._update_from_docker_hub(username)
+                servers.update(docker_state[username] or {})
+
+            search_index = SearchIndex.build(servers)
+
+            # Tausche die Registry atomar aus
+            self.servers, self.search_index = servers, search_index
+            self._state = {
+                "version": STATE_VERSION,
+                "repositories": {url: state for url, state in repositories_state.items() if state},
+                "docker_hub_users": {user: state for user, state in docker_state.items() if state is not None},
+            }
+            self._save_state()
+            search_index.save(self.index_file)
+
+            for source, source_stats in stats.items():
+                logger.info(
+                    f"Registry-Quelle {source}: {source_stats['status']} in {source_stats['duration']:.2f}s"
+                    + (f" ({source_stats['mode']})" if "mode" in source_stats else "")
+                )
+            logger.info(f"Registry aktualisiert: {len(servers)} Server aus {len(stats)} Quellen")
         except Exception as e:
             logger.exception(f"Fehler bei der Aktualisierung der Registry: {e}")
 
-    def _update_from_repository(self, repo_url: str) -> None:
+        self.last_update_stats = stats
+        return stats
+
+    @staticmethod
+    def _timed(func, source: str) -> Tuple[Any, Dict[str, Any]]:
         """
-        Aktualisiere die Registry mit den MCP Servern aus einem Repository.
+        Führe die Aktualisierung einer Quelle aus und miss ihre Laufzeit.
+
+        Args:
+            func: Die Aktualisierungsfunktion, die das Ergebnis und zusätzliche Statistiken zurückgibt
+            source: Die Quelle
+
+        Returns:
+            Das Ergebnis (None bei Fehlern) und die Statistiken der Quelle
+        """
+        start_time = time.perf_counter()
+        result, source_stats = func(source)
+        source_stats["status"] = "error" if result is None else "ok"
+        source_stats["duration"] = time.perf_counter() - start_time
+        return result, source_stats
+
+    def _git(self, args: List[str], cwd: Optional[str] = None) -> str:
+        """
+        Führe einen Git-Befehl aus.
+
+        Args:
+            args: Die Argumente für Git
+            cwd: Optionales Arbeitsverzeichnis
+
+        Returns:
+            Die Standardausgabe des Befehls
+        """
+        result = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=self.git_timeout,
+        )
+        return result.stdout
+
+    def _repo_cache_dir(self, repo_url: str) -> str:
+        """
+        Bestimme das Cache-Verzeichnis eines Repositories.
+
+        Der Verzeichnisname enthält neben dem Repository-Namen einen Hash der vollständigen
+        URL, damit gleichnamige Repositories verschiedener Besitzer nicht kollidieren.
 
         Args:
             repo_url: Die URL des Repositories
+
+        Returns:
+            Der Pfad des Cache-Verzeichnisses
         """
+        repo_name = urlparse(repo_url).path.strip("/").split("/")[-1]
+        url_hash = hashlib.sha1(repo_url.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.cache_dir, f"{repo_name}-{url_hash}")
+
+    def _update_from_repository(self, repo_url: str) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Aktualisiere die MCP Server aus einem Repository.
+
+        Das Repository wird flach und ohne Blobs geklont. Bei späteren Aktualisierungen
+        werden nur README.md-Dateien neu gelesen, die sich seit dem zuletzt gelesenen
+        Commit geändert haben.
+
+        Args:
+            repo_url: Die URL des Repositories
+
+        Returns:
+            Der neue Zustand des Repositories (Commit und Server je README.md), oder None bei
+            Fehlern, sowie Statistiken zur Aktualisierung
+        """
+        source_stats: Dict[str, Any] = {}
+
         try:
-            # Parse die Repository-URL
-            parsed_url = urlparse(repo_url)
-            
-            # Extrahiere den Repository-Namen
-            repo_path = parsed_url.path.strip("/")
-            repo_name = repo_path.split("/")[-1]
-            
             # Erstelle den Cache-Pfad für das Repository
-            repo_cache_dir = os.path.join(self.cache_dir, repo_name)
+            repo_cache_dir = self._repo_cache_dir(repo_url)
             
             # Klone oder aktualisiere das Repository
-            if os.path.exists(repo_cache_dir):
-                # Aktualisiere das Repository
-                subprocess.run(["git", "pull"], cwd=repo_cache_dir, check=True)
+            if os.path.exists(os.path.join(repo_cache_dir, ".git")):
+                self._git(["fetch", "--depth", "1", "--filter=blob:none", "origin", "HEAD"], cwd=repo_cache_dir)
+                self._git(["reset", "--hard", "FETCH_HEAD"], cwd=repo_cache_dir)
             else:
-                # Klone das Repository
-                subprocess.run(["git", "clone", repo_url, repo_cache_dir], check=True)
-            
-            # Durchsuche das Repository nach MCP Servern
-            self._scan_repository(repo_cache_dir, repo_url)
+                self._git([
+                    "clone", "--depth", "1", "--filter=blob:none", "--single-branch",
+                    repo_url, repo_cache_dir,
+                ])
+
+            commit = self._git(["rev-parse", "HEAD"], cwd=repo_cache_dir).strip()
+            previous = self._state["repositories"].get(repo_url)
+
+            if previous and previous.get("commit") == commit:
+                source_stats["mode"] = "unchanged"
+                return previous, source_stats
+
+            readmes = None
+            if previous and previous.get("commit"):
+                readmes = self._rescan_changed_readmes(repo_cache_dir, repo_url, previous, commit, source_stats)
+            if readmes is None:
+                source_stats["mode"] = "full"
+                readmes = self._scan_repository(repo_cache_dir, repo_url)
+
+            return {"commit": commit, "readmes": readmes}, source_stats
         except Exception as e:
             logger.exception(f"Fehler bei der Aktualisierung aus Repository {repo_url}: {e}")
+            return None, source_stats
+
+    def _rescan_changed_readmes(
+        self,
+        repo_dir: str,
+        repo_url: str,
+        previous: Dict[str, Any],
+        commit: str,
+        source_stats: Dict[str, Any],
+    ) -> Optional[Dict[str, Dict[str, Dict[str, Any]]]]:
+        """
+        Lies nur die README.md-Dateien neu, die sich seit dem letzten Commit geändert haben.
+
+        Args:
+            repo_dir: Der Pfad zum Repository
+            repo_url: Die URL des Repositories
+            previous: Der bisherige Zustand des Repositories
+            commit: Der aktuelle Commit
+            source_stats: Statistiken, die um die Anzahl geänderter Dateien ergänzt werden
+
+        Returns:
+            Die Server je README.md, oder None, wenn der alte Commit nicht mehr verfügbar ist
+        """
+        try:
+            changed = self._git(
+                ["diff", "--name-only", "--no-renames", previous["commit"], commit], cwd=repo_dir
+            ).splitlines()
+        except subprocess.CalledProcessError:
+            return None
+
+        readmes = dict(previous.get("readmes", {}))
+        changed_readmes = [path for path in changed if os.path.basename(path) == "README.md"]
+        for path in changed_readmes:
+            readme_servers = self._read_readme(repo_dir, path, repo_url)
+            if readme_servers is None:
+                readmes.pop(path, None)
+            else:
+                readmes[path] = readme_servers
+
+        source_stats["mode"] = "incremental"
+        source_stats["changed_files"] = len(changed)
+        source_stats["changed_readmes"] = len(changed_readmes)
+        return readmes
 
-    def _scan_repository(self, repo_dir: str, repo_url: str) -> None:
+    def _read_readme(self, repo_dir: str, path: str, repo_url: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Lies eine README.md-Datei und extrahiere ihre MCP Server.
+
+        Args:
+            repo_dir: Der Pfad zum Repository
+            path: Der Pfad der README.md-Datei relativ zum Repository
+            repo_url: Die URL des Repositories
+
+        Returns:
+            Die MCP Server der Datei, oder None, wenn die Datei nicht existiert
+        """
+        file_path = os.path.join(repo_dir, path)
+        if not os.path.isfile(file_path):
+            return None
+        with open(file_path, "r") as f:
+            readme_content = f.read()
+        return self._extract_servers_from_readme(readme_content, repo_url)
+
+    def _scan_repository(self, repo_dir: str, repo_url: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
         """
         Durchsuche ein Repository nach MCP Servern.
 
         Args:
             repo_dir: Der Pfad zum Repository
             repo_url: Die URL des Repositories
+
+        Returns:
+            Die MCP Server je README.md-Datei
         """
+        readmes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
         try:
-            # Durchsuche das Repository nach README.md-Dateien
-            for root, dirs, files in os.walk(repo_dir):
-                if "README.md" in files:
-                    # Lese die README.md-Datei
-                    with open(os.path.join(root, "README.md"), "r") as f:
-                        readme_content = f.read()
-                    
-                    # Extrahiere MCP Server-Informationen aus der README.md-Datei
-                    servers = self._extract_servers_from_readme(readme_content, repo_url)
-                    
-                    # Füge die Server zur Registry hinzu
-                    for server_id, server_info in servers.items():
-                        self.servers[server_id] = server_info
+            # Git kennt die Dateien bereits, das erspart das Durchlaufen des Arbeitsverzeichnisses
+            for path in self._git(["ls-files"], cwd=repo_dir).splitlines():
+                if os.path.basename(path) == "README.md":
+                    readme_servers = self._read_readme(repo_dir, path, repo_url)
+                    if readme_servers is not None:
+                        readmes[path] = readme_servers
         except Exception as e:
             logger.exception(f"Fehler beim Scannen des Repositories {repo_dir}: {e}")
 
+        return readmes
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Lade den Zustand der letzten Aktualisierung aus dem Cache-Verzeichnis.
+
+        Returns:
+            Der Zustand je Repository und Docker Hub Benutzer
+        """
+        state = {"version": STATE_VERSION, "repositories": {}, "docker_hub_users": {}}
+        try:
+            if os.path.exists(self.state_file):
+                with open(self.state_file, "r") as f:
+                    saved_state = json.load(f)
+                if saved_state.get("version") == STATE_VERSION:
+                    state.update(saved_state)
+        except Exception as e:
+            logger.warning(f"Fehler beim Laden des Registry-Zustands, führe vollständige Aktualisierung durch: {e}")
+        return state
+
+    def _save_state(self) -> None:
+        """Speichere den Zustand der letzten Aktualisierung atomar im Cache-Verzeichnis."""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".registry_state.", suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._state, f)
+            os.replace(tmp_path, self.state_file)
+        except Exception as e:
+            logger.exception(f"Fehler beim Speichern des Registry-Zustands: {e}")
+
     def _extract_servers_from_readme(self, readme_content: str, repo_url: str) -> Dict[str, Dict[str, Any]]:
         """
         Extrahiere MCP Server-Informationen aus einer README.md-Datei.
@@ -161,6 +417,13 @@ class MCPServerRegistry:
         servers = {}
         
         try:
+            # Die Überschriften gliedern die Server in Kategorien, die als Tags dienen
+            headings = [
+                (match.start(), re.sub(r"[^\w\s-]", "", match.group(1)).strip().lower().replace(" ", "-"))
+                for match in re.finditer(r"^#{1,6}\s+(.+)$", readme_content, re.MULTILINE)
+            ]
+            heading_positions = [position for position, _ in headings]
+
             # Suche nach Links zu MCP Servern
             # Format: [Server Name](https://github.com/username/repo) - Beschreibung
             link_pattern = r"\[([^\]]+)\]\(([^)]+)\)(?:\s*-\s*([^\n]+))?"
@@ -171,6 +434,10 @@ class MCPServerRegistry:
                 
                 # Erstelle eine eindeutige ID für den Server
                 server_id = server_url.split("/")[-1].lower()
+
+                # Ordne den Server der nächsten vorangehenden Überschrift zu
+                heading_index = bisect.bisect_left(heading_positions, match.start()) - 1
+                tags = [headings[heading_index][1]] if heading_index >= 0 and headings[heading_index][1] else []
                 
                 # Füge den Server zur Registry hinzu
                 servers[server_id] = {
@@ -179,24 +446,30 @@ class MCPServerRegistry:
                     "url": server_url,
                     "description": server_description.strip(),
                     "source": "github",
-                    "source_url": repo_url
+                    "source_url": repo_url,
+                    "tags": tags
                 }
         except Exception as e:
             logger.exception(f"Fehler beim Extrahieren von Servern aus README: {e}")
         
         return servers
 
-    def _update_from_docker_hub(self, username: str) -> None:
+    def _update_from_docker_hub(self, username: str) -> Tuple[Optional[Dict[str, Dict[str, Any]]], Dict[str, Any]]:
         """
-        Aktualisiere die Registry mit den MCP Servern von Docker Hub.
+        Hole die MCP Server eines Benutzers von Docker Hub.
 
         Args:
             username: Der Docker Hub Benutzername
+
+        Returns:
+            Die MCP Server des Benutzers, oder None bei Fehlern, sowie Statistiken zur Aktualisierung
         """
+        servers: Dict[str, Dict[str, Any]] = {}
+
         try:
             # Rufe die Docker Hub API auf, um die Repositories des Benutzers zu erhalten
             url = f"https://hub.docker.com/v2/repositories/{username}/"
-            response = requests.get(url)
+            response = requests.get(url, timeout=self.http_timeout)
             response.raise_for_status()
             
             # Parse die Antwort
@@ -215,7 +488,7 @@ class MCPServerRegistry:
                     server_id = f"docker-{username}-{repo_name}".lower()
                     
                     # Füge den Server zur Registry hinzu
-                    self.servers[server_id] = {
+                    servers[server_id] = {
                         "id": server_id,
                         "name": repo_name,
                         "url": f"https://hub.docker.com/r/{username}/{repo_name}",
@@ -226,34 +499,44 @@ class MCPServerRegistry:
                     }
         except Exception as e:
             logger.exception(f"Fehler bei der Aktualisierung von Docker Hub für Benutzer {username}: {e}")
+            return None, {}
+
+        return servers, {}
 
-    def search(self, query: str) -> List[Dict[str, Any]]:
+    def search(
+        self,
+        query: str,
+        tags: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Suche nach MCP Servern in der Registry.
 
+        Die Suche verwendet den beim Aktualisieren aufgebauten Suchindex, findet auch
+        Präfixe und kleine Tippfehler und sortiert die Ergebnisse nach Relevanz.
+
         Args:
             query: Die Suchanfrage
+            tags: Optionale Tags, die alle Ergebnisse tragen müssen
+            limit: Optionale maximale Anzahl von Ergebnissen
 
         Returns:
             Eine Liste von MCP Servern, die der Suchanfrage entsprechen
         """
-        results = []
-        
         try:
-            # Normalisiere die Suchanfrage
-            query = query.lower()
-            
-            # Durchsuche die Registry nach Servern, die der Suchanfrage entsprechen
-            for server_id, server_info in self.servers.items():
-                # Prüfe, ob die Suchanfrage im Server-Namen, der Beschreibung oder der ID enthalten ist
-                if (query in server_id.lower() or
-                    query in server_info.get("name", "").lower() or
-                    query in server_info.get("description", "").lower()):
-                    results.append(server_info)
+            return self.search_index.search(query, tags=tags, limit=limit)
         except Exception as e:
             logger.exception(f"Fehler bei der Suche nach MCP Servern: {e}")
-        
-        return results
+            return []
+
+    def get_tags(self) -> Dict[str, int]:
+        """
+        Hole alle Tags der Registry.
+
+        Returns:
+            Die Anzahl der MCP Server je Tag
+        """
+        return self.search_index.get_tags()
 
     def get_server(self, server_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -0,0 +1,405 @@
+"""
+MCP Server Search Index - Invertierter Suchindex für die MCP Server Registry.
+
+Der Index wird beim Aktualisieren der Registry aufgebaut und im Cache-Verzeichnis
+gespeichert. Suchanfragen werden über Token- und Trigramm-Postings beantwortet,
+ohne die Server erneut zu durchlaufen, und nach BM25 gewichtet.
+"""
+
+import os
+import re
+import json
+import math
+import bisect
+import logging
+import tempfile
+from collections import defaultdict
+from typing import Dict, List, Optional, Any, Iterable, Set, Tuple
+
+# Erstelle Logger
+logger = logging.getLogger(__name__)
+
+# Version des gespeicherten Formats; ältere Indizes werden verworfen
+INDEX_VERSION = 1
+
+# Gewichtung der durchsuchten Felder
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "id": 2.0,
+    "description": 1.0,
+}
+
+# Gewichtung von Treffern je nach Art der Übereinstimmung
+EXACT_WEIGHT = 1.0
+PREFIX_WEIGHT = 0.7
+FUZZY_WEIGHT = 0.4
+
+# Maximale Anzahl von Termen, auf die ein Präfix oder Tippfehler erweitert wird
+MAX_EXPANSIONS = 50
+
+# BM25-Parameter
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Zerlege einen Text in normalisierte Tokens.
+
+    Args:
+        text: Der Text
+
+    Returns:
+        Die Tokens in Kleinbuchstaben
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def trigrams(term: str) -> Set[str]:
+    """
+    Bilde die Trigramme eines Terms, mit Randmarkierungen.
+
+    Args:
+        term: Der Term
+
+    Returns:
+        Die Trigramme des Terms
+    """
+    padded = f"^{term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Berechne die Levenshtein-Distanz zweier Terme mit frühem Abbruch.
+
+    Args:
+        a: Der erste Term
+        b: Der zweite Term
+        max_distance: Die größte relevante Distanz
+
+    Returns:
+        Die Distanz, oder max_distance + 1, wenn sie größer als max_distance ist
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+class SearchIndex:
+    """Invertierter Suchindex für MCP Server."""
+
+    def __init__(self):
+        """Initialisiere einen leeren Suchindex."""
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.postings: Dict[str, Dict[str, float]] = {}
+        self.doc_lengths: Dict[str, float] = {}
+        self.avg_doc_length = 0.0
+        self.tags: Dict[str, List[str]] = {}
+        self.ngrams: Dict[str, List[str]] = {}
+        self.vocabulary: List[str] = []
+
+    @classmethod
+    def build(cls, servers: Dict[str, Dict[str, Any]]) -> "SearchIndex":
+        """
+        Baue einen Suchindex für die gegebenen Server auf.
+
+        Args:
+            servers: Die Server der Registry
+
+        Returns:
+            Der Suchindex
+        """
+        index = cls()
+        index.documents = servers
+
+        postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        tags: Dict[str, List[str]] = defaultdict(list)
+
+        for server_id, server_info in servers.items():
+            doc_length = 0.0
+            for field, weight in FIELD_WEIGHTS.items():
+                value = server_id if field == "id" else server_info.get(field) or ""
+                for token in tokenize(value):
+                    postings[token][server_id] = postings[token].get(server_id, 0.0) + weight
+                    doc_length += weight
+            index.doc_lengths[server_id] = doc_length
+
+            for tag in cls._document_tags(server_info):
+                tags[tag].append(server_id)
+
+        index.postings = dict(postings)
+        index.tags = dict(tags)
+        index.avg_doc_length = (
+            sum(index.doc_lengths.values()) / len(index.doc_lengths) if index.doc_lengths else 0.0
+        )
+        index._build_term_indexes()
+        return index
+
+    @staticmethod
+    def _document_tags(server_info: Dict[str, Any]) -> Set[str]:
+        """
+        Ermittle die Tags eines Servers.
+
+        Args:
+            server_info: Die Informationen über den Server
+
+        Returns:
+            Die Tags des Servers in Kleinbuchstaben, einschließlich seiner Quelle
+        """
+        document_tags = {tag.lower() for tag in server_info.get("tags", [])}
+        if server_info.get("source"):
+            document_tags.add(server_info["source"].lower())
+        return document_tags
+
+    def _build_term_indexes(self) -> None:
+        """Baue die sortierte Termliste und den Trigramm-Index für Präfix- und Tippfehlersuche auf."""
+        self.vocabulary = sorted(self.postings)
+
+        ngrams: Dict[str, List[str]] = defaultdict(list)
+        for term in self.vocabulary:
+            for gram in trigrams(term):
+                ngrams[gram].append(term)
+        self.ngrams = dict(ngrams)
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        """
+        Finde die Terme, die mit einem Präfix beginnen.
+
+        Args:
+            prefix: Das Präfix
+
+        Returns:
+            Die passenden Terme ohne das Präfix selbst
+        """
+        terms = []
+        position = bisect.bisect_right(self.vocabulary, prefix)
+        while (
+            position < len(self.vocabulary)
+            and self.vocabulary[position].startswith(prefix)
+            and len(terms) < MAX_EXPANSIONS
+        ):
+            terms.append(self.vocabulary[position])
+            position += 1
+        return terms
+
+    def _fuzzy_terms(self, token: str) -> List[str]:
+        """
+        Finde Terme mit kleinem Tippfehlerabstand zu einem Token.
+
+        Kandidaten werden über gemeinsame Trigramme gefunden und anschließend
+        über die Levenshtein-Distanz geprüft.
+
+        Args:
+            token: Das Token
+
+        Returns:
+            Die passenden Terme ohne das Token selbst
+        """
+        if len(token) < 4:
+            return []
+
+        max_distance = 1 if len(token) <= 6 else 2
+        token_grams = trigrams(token)
+
+        shared: Dict[str, int] = defaultdict(int)
+        for gram in token_grams:
+            for term in self.ngrams.get(gram, ()):
+                shared[term] += 1
+
+        # Jede Änderung zerstört höchstens drei Trigramme
+        min_shared = max(1, len(token_grams) - 3 * max_distance)
+        candidates = sorted(
+            (term for term, count in shared.items() if count >= min_shared and term != token),
+            key=lambda term: -shared[term],
+        )
+
+        terms = []
+        for term in candidates:
+            if edit_distance(token, term, max_distance) <= max_distance:
+                terms.append(term)
+                if len(terms) >= MAX_EXPANSIONS:
+                    break
+        return terms
+
+    def _expand(self, token: str) -> List[Tuple[str, float]]:
+        """
+        Erweitere ein Token auf passende Terme des Index.
+
+        Args:
+            token: Das Token der Suchanfrage
+
+        Returns:
+            Die Terme mit der Gewichtung ihrer Übereinstimmung
+        """
+        expansions = []
+        if token in self.postings:
+            expansions.append((token, EXACT_WEIGHT))
+        expansions.extend((term, PREFIX_WEIGHT) for term in self._prefix_terms(token))
+
+        seen = {term for term, _ in expansions}
+        expansions.extend(
+            (term, FUZZY_WEIGHT) for term in self._fuzzy_terms(token) if term not in seen
+        )
+        return expansions
+
+    def _bm25(self, term: str, document_count: int) -> Dict[str, float]:
+        """
+        Berechne die BM25-Werte eines Terms für alle Dokumente, die ihn enthalten.
+
+        Args:
+            term: Der Term
+            document_count: Die Anzahl der Dokumente im Index
+
+        Returns:
+            Der BM25-Wert je Dokument
+        """
+        term_postings = self.postings[term]
+        idf = math.log(1 + (document_count - len(term_postings) + 0.5) / (len(term_postings) + 0.5))
+        scores = {}
+        for server_id, frequency in term_postings.items():
+            norm = 1 - BM25_B + BM25_B * self.doc_lengths[server_id] / (self.avg_doc_length or 1.0)
+            scores[server_id] = idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * norm)
+        return scores
+
+    def search(
+        self,
+        query: str,
+        tags: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Suche nach Servern.
+
+        Jedes Token der Suchanfrage muss auf einen Server passen, exakt, als Präfix
+        oder mit einem kleinen Tippfehler. Die Ergebnisse sind nach Relevanz sortiert.
+
+        Args:
+            query: Die Suchanfrage
+            tags: Optionale Tags, die alle Ergebnisse tragen müssen
+            limit: Optionale maximale Anzahl von Ergebnissen
+
+        Returns:
+            Die passenden Server
+        """
+        allowed: Optional[Set[str]] = None
+        for tag in tags or ():
+            tagged = set(self.tags.get(tag.lower(), ()))
+            allowed = tagged if allowed is None else allowed & tagged
+
+        tokens = tokenize(query)
+        if not tokens:
+            # Ohne Suchbegriff liefert die Suche alle Server mit den angegebenen Tags
+            server_ids = sorted(allowed) if allowed is not None else []
+            return [self.documents[server_id] for server_id in server_ids[:limit]]
+
+        document_count = len(self.documents)
+        scores: Optional[Dict[str, float]] = None
+
+        for token in dict.fromkeys(tokens):
+            token_scores: Dict[str, float] = {}
+            for term, weight in self._expand(token):
+                for server_id, score in self._bm25(term, document_count).items():
+                    if allowed is not None and server_id not in allowed:
+                        continue
+                    weighted = weight * score
+                    if weighted > token_scores.get(server_id, 0.0):
+                        token_scores[server_id] = weighted
+
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {
+                    server_id: score + token_scores[server_id]
+                    for server_id, score in scores.items()
+                    if server_id in token_scores
+                }
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [self.documents[server_id] for server_id, _ in ranked[:limit]]
+
+    def get_tags(self) -> Dict[str, int]:
+        """
+        Hole alle Tags des Index.
+
+        Returns:
+            Die Anzahl der Server je Tag
+        """
+        return {tag: len(server_ids) for tag, server_ids in sorted(self.tags.items())}
+
+    def save(self, path: str) -> None:
+        """
+        Speichere den Index atomar.
+
+        Args:
+            path: Der Pfad der Indexdatei
+        """
+        data = {
+            "version": INDEX_VERSION,
+            "documents": self.documents,
+            "postings": self.postings,
+            "doc_lengths": self.doc_lengths,
+            "avg_doc_length": self.avg_doc_length,
+            "tags": self.tags,
+            "ngrams": self.ngrams,
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".search_index.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> Optional["SearchIndex"]:
+        """
+        Lade einen gespeicherten Index.
+
+        Args:
+            path: Der Pfad der Indexdatei
+
+        Returns:
+            Der Index, oder None, wenn keine gültige Indexdatei existiert
+        """
+        try:
+            if not os.path.exists(path):
+                return None
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                return None
+
+            index = cls()
+            index.documents = data["documents"]
+            index.postings = data["postings"]
+            index.doc_lengths = data["doc_lengths"]
+            index.avg_doc_length = data["avg_doc_length"]
+            index.tags = data["tags"]
+            index.ngrams = data["ngrams"]
+            index.vocabulary = sorted(index.postings)
+            return index
+        except Exception as e:
+            logger.warning(f"Fehler beim Laden des Suchindex {path}: {e}")
+            return None
@@ -193,7 +193,8 @@ class BaseMCPServer(MCPServerInterface):
         method = request.get('method', '')
         params = request.get('params', {})
         
-        self.logger.info(f"Request #{self.request_counter}: Method={method}, ID={request_id}")
+        # Per-request logging is high volume; keep it at DEBUG and format lazily
+        self.logger.debug("Request #%d: Method=%s, ID=%s", self.request_counter, method, request_id)
         
         start_time = asyncio.get_event_loop().time()
         
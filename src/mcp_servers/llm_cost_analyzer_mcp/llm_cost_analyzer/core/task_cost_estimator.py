@@ -10,7 +10,9 @@ import re
 from typing import Dict, List, Optional, Any, Union
 
 from ..models.llm import LLMModel, ModelType, ComplexityLevel
+from .config import settings
 from .llm_selector import LLMSelector
+from .token_counter import CHARS_PER_TOKEN, get_token_counter
 
 # Erstelle Logger
 logger = logging.getLogger(__name__)
@@ -27,19 +29,38 @@ class TaskCostEstimator:
             llm_selector: Der LLM-Selektor
         """
         self.llm_selector = llm_selector
+        self.token_counter = get_token_counter(
+            encoding=settings.TOKENIZER_ENCODING,
+            vocab_dir=settings.TOKENIZER_VOCAB_DIRECTORY,
+            cache_size=settings.TOKEN_COUNT_CACHE_SIZE,
+        )
 
     def estimate_tokens(self, text: str) -> int:
         """
         Schätze die Anzahl der Tokens in einem Text.
 
+        Verwendet den konfigurierten BPE-Tokenizer oder, falls kein Vokabular
+        verfügbar ist, die Heuristik von 4 Zeichen pro Token.
+
         Args:
             text: Der Text, für den Tokens geschätzt werden sollen
 
         Returns:
             Die geschätzte Anzahl der Tokens
         """
-        # Einfache Schätzung: 1 Token ≈ 4 Zeichen für englischen Text
-        return len(text) // 4
+        return self.token_counter.count(text)
+
+    def estimate_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Schätze die Anzahl der Tokens in mehreren Texten.
+
+        Args:
+            texts: Die Texte, für die Tokens geschätzt werden sollen
+
+        Returns:
+            Die geschätzte Anzahl der Tokens je Text
+        """
+        return self.token_counter.count_batch(texts)
 
     async def estimate_cost(
         self,
@@ -64,7 +85,8 @@ class TaskCostEstimator:
             
             # Schätze Output-Tokens
             if expected_output_length:
-                output_tokens = self.estimate_tokens(expected_output_length)
+                # Die Ausgabe existiert noch nicht, bekannt ist nur ihre Länge
+                output_tokens = expected_output_length // CHARS_PER_TOKEN
             else:
                 # Standard: Ausgabe ist etwa 1,5x der Eingabe für die meisten Aufgaben
                 output_tokens = int(input_tokens * 1.5)
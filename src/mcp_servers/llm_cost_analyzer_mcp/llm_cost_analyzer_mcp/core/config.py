@@ -39,6 +39,11 @@ class Settings(BaseSettings):
     LOCAL_MODEL_ENDPOINT: Optional[str] = None
     LOCAL_MODELS: List[str] = Field(default_factory=list)
 
+    # Token-Zählung
+    TOKENIZER_ENCODING: str = "cl100k_base"
+    TOKENIZER_VOCAB_DIRECTORY: Optional[str] = None
+    TOKEN_COUNT_CACHE_SIZE: int = 4096
+
     # Logging-Einstellungen
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -0,0 +1,412 @@
+"""
+Token counting for cost estimation.
+
+This module provides pluggable token counters. The preferred counter is a
+byte-pair-encoding (BPE) tokenizer loaded once from a local ``.tiktoken``
+vocabulary file (``<vocab_dir>/<encoding>.tiktoken``, one ``base64-token rank``
+pair per line). When the ``tiktoken`` package is installed it is used as the
+encoding engine; otherwise a pure-Python BPE implementation is used. If no
+vocabulary file is available, counting falls back to the 4-characters-per-token
+heuristic.
+
+Counts are memoised by content hash, and large batches are counted either with
+``tiktoken``'s native thread pool (which releases the GIL) or with a process pool.
+"""
+
+import base64
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
+
+try:
+    import regex
+except ImportError:  # pragma: no cover - optional dependency
+    regex = None
+
+# Create logger
+logger = logging.getLogger(__name__)
+
+# Average number of characters per token used by the heuristic
+CHARS_PER_TOKEN = 4
+
+# Pre-tokenisation pattern of the cl100k/o200k family of encodings
+_PAT_STR = (
+    r"""(?i:'s|'t|'re|'ve|'m|'ll|'d)|[^\r\n\p{L}\p{N}]?\p{L}+|\p{N}{1,3}"""
+    r"""| ?[^\s\p{L}\p{N}]+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+"""
+)
+
+# Approximation of _PAT_STR for the standard library ``re`` module, which lacks \p{...}
+_FALLBACK_PAT_STR = (
+    r"""'(?:[sStT]|[rR][eE]|[vV][eE]|[mM]|[lL][lL]|[dD])|[^\r\n\w]?[^\W\d_]+|\d{1,3}"""
+    r"""| ?[^\s\w]+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+|_+"""
+)
+
+# Minimum total number of characters in a batch before work is spread over workers
+PARALLEL_BATCH_THRESHOLD = 256 * 1024
+
+
+class TokenCounter:
+    """Base class for token counters."""
+
+    name = "base"
+
+    def count(self, text: str) -> int:
+        """
+        Count the number of tokens in a text.
+
+        Args:
+            text: The text to count tokens for
+
+        Returns:
+            The number of tokens
+        """
+        raise NotImplementedError
+
+    def count_batch(self, texts: Sequence[str], max_workers: Optional[int] = None) -> List[int]:
+        """
+        Count the number of tokens in several texts.
+
+        Args:
+            texts: The texts to count tokens for
+            max_workers: Optional maximum number of parallel workers
+
+        Returns:
+            The number of tokens for each text, in input order
+        """
+        return [self.count(text) for text in texts]
+
+
+class HeuristicTokenCounter(TokenCounter):
+    """Token counter using the characters-per-token heuristic."""
+
+    name = "heuristic"
+
+    def count(self, text: str) -> int:
+        """Count tokens as ``len(text) // CHARS_PER_TOKEN``."""
+        return len(text) // CHARS_PER_TOKEN
+
+
+def load_vocab(path: Path) -> Dict[bytes, int]:
+    """
+    Load BPE mergeable ranks from a ``.tiktoken`` vocabulary file.
+
+    Args:
+        path: The vocabulary file path
+
+    Returns:
+        A mapping of token bytes to merge rank
+    """
+    ranks: Dict[bytes, int] = {}
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            token, rank = line.split()
+            ranks[base64.b64decode(token)] = int(rank)
+    return ranks
+
+
+class BPETokenCounter(TokenCounter):
+    """Token counter backed by a byte-pair-encoding vocabulary."""
+
+    name = "bpe"
+
+    def __init__(self, encoding: str, ranks: Dict[bytes, int], piece_cache_size: int = 65536):
+        """
+        Initialize the BPE token counter.
+
+        Args:
+            encoding: The encoding name
+            ranks: The BPE mergeable ranks
+            piece_cache_size: Maximum number of pre-tokenised pieces to memoise
+        """
+        self.encoding = encoding
+        self.ranks = ranks
+        self.piece_cache_size = piece_cache_size
+        self._piece_cache: Dict[bytes, int] = {}
+        self._tiktoken_encoding = None
+        if tiktoken is not None:
+            self._tiktoken_encoding = tiktoken.Encoding(
+                name=encoding,
+                pat_str=_PAT_STR,
+                mergeable_ranks=ranks,
+                special_tokens={},
+            )
+        self._pattern = regex.compile(_PAT_STR) if regex is not None else re.compile(_FALLBACK_PAT_STR)
+
+    def _count_piece(self, piece: bytes) -> int:
+        """Count the tokens of a single pre-tokenised piece by greedy lowest-rank merging."""
+        if piece in self.ranks:
+            return 1
+        cached = self._piece_cache.get(piece)
+        if cached is not None:
+            return cached
+
+        parts = [piece[i:i + 1] for i in range(len(piece))]
+        while len(parts) > 1:
+            best_rank = None
+            best_index = -1
+            for i in range(len(parts) - 1):
+                rank = self.ranks.get(parts[i] + parts[i + 1])
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_rank = rank
+                    best_index = i
+            if best_rank is None:
+                break
+            parts[best_index:best_index + 2] = [parts[best_index] + parts[best_index + 1]]
+
+        if len(self._piece_cache) >= self.piece_cache_size:
+            self._piece_cache.clear()
+        self._piece_cache[piece] = len(parts)
+        return len(parts)
+
+    def count(self, text: str) -> int:
+        """Count tokens by encoding the text with the BPE vocabulary."""
+        if not text:
+            return 0
+        if self._tiktoken_encoding is not None:
+            return len(self._tiktoken_encoding.encode_ordinary(text))
+        return sum(self._count_piece(piece.encode("utf-8")) for piece in self._pattern.findall(text))
+
+    def count_batch(self, texts: Sequence[str], max_workers: Optional[int] = None) -> List[int]:
+        """
+        Count tokens for several texts.
+
+        Small batches are counted inline. Large batches use ``tiktoken``'s
+        native thread pool when available, and a process pool otherwise.
+        """
+        if sum(len(text) for text in texts) < PARALLEL_BATCH_THRESHOLD or len(texts) < 2:
+            return [self.count(text) for text in texts]
+
+        workers = max_workers or os.cpu_count() or 1
+        if self._tiktoken_encoding is not None:
+            encoded = self._tiktoken_encoding.encode_ordinary_batch(list(texts), num_threads=workers)
+            return [len(tokens) for tokens in encoded]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.encoding, self.ranks),
+        ) as executor:
+            chunksize = max(1, len(texts) // (workers * 4))
+            return list(executor.map(_count_in_worker, texts, chunksize=chunksize))
+
+
+# Per-process counter used by process-pool workers
+_worker_counter: Optional[BPETokenCounter] = None
+
+
+def _init_worker(encoding: str, ranks: Dict[bytes, int]) -> None:
+    """Initialize the BPE counter of a process-pool worker."""
+    global _worker_counter
+    _worker_counter = BPETokenCounter(encoding, ranks)
+
+
+def _count_in_worker(text: str) -> int:
+    """Count tokens in a process-pool worker."""
+    return _worker_counter.count(text)
+
+
+class CachedTokenCounter(TokenCounter):
+    """Token counter that memoises counts of another counter by content hash."""
+
+    def __init__(self, counter: TokenCounter, max_size: int = 4096):
+        """
+        Initialize the cached token counter.
+
+        Args:
+            counter: The token counter to delegate to
+            max_size: Maximum number of memoised counts
+        """
+        self.counter = counter
+        self.name = counter.name
+        self.max_size = max_size
+        self._cache: "OrderedDict[bytes, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        """Return the content hash used as cache key."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _get(self, key: bytes) -> Optional[int]:
+        """Look up a memoised count."""
+        with self._lock:
+            count = self._cache.get(key)
+            if count is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return count
+
+    def _put(self, key: bytes, count: int) -> None:
+        """Memoise a count."""
+        with self._lock:
+            self._cache[key] = count
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def count(self, text: str) -> int:
+        """Count tokens, using the memoised count when available."""
+        key = self._key(text)
+        count = self._get(key)
+        if count is None:
+            count = self.counter.count(text)
+            self._put(key, count)
+        return count
+
+    def count_batch(self, texts: Sequence[str], max_workers: Optional[int] = None) -> List[int]:
+        """Count tokens for several texts, delegating only cache misses."""
+        keys = [self._key(text) for text in texts]
+        counts: List[Optional[int]] = [self._get(key) for key in keys]
+        missing = [i for i, count in enumerate(counts) if count is None]
+        if missing:
+            computed = self.counter.count_batch([texts[i] for i in missing], max_workers=max_workers)
+            for i, count in zip(missing, computed):
+                counts[i] = count
+                self._put(keys[i], count)
+        return counts
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            A dictionary with cache size, hits, misses and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "counter": self.name,
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+_counters: Dict[Tuple[str, Optional[str], int], CachedTokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def get_token_counter(
+    encoding: str = "cl100k_base",
+    vocab_dir: Optional[str] = None,
+    cache_size: int = 4096,
+) -> CachedTokenCounter:
+    """
+    Get the shared token counter for an encoding.
+
+    The vocabulary is loaded once per process. If ``vocab_dir`` is not set or
+    the vocabulary file cannot be loaded, the heuristic counter is used.
+
+    Args:
+        encoding: The encoding name
+        vocab_dir: Optional directory containing ``<encoding>.tiktoken``
+        cache_size: Maximum number of memoised counts
+
+    Returns:
+        The token counter
+    """
+    key = (encoding, vocab_dir, cache_size)
+    with _counters_lock:
+        counter = _counters.get(key)
+        if counter is not None:
+            return counter
+
+        inner: TokenCounter = HeuristicTokenCounter()
+        if vocab_dir:
+            vocab_path = Path(vocab_dir) / f"{encoding}.tiktoken"
+            try:
+                inner = BPETokenCounter(encoding, load_vocab(vocab_path))
+                logger.info(f"Loaded {encoding} tokenizer from {vocab_path}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not load tokenizer {vocab_path}, using heuristic: {e}")
+
+        counter = CachedTokenCounter(inner, max_size=cache_size)
+        _counters[key] = counter
+        return counter
+
+
+def benchmark_token_counter(
+    texts: Sequence[str],
+    counter: TokenCounter,
+    repeat: int = 3,
+) -> Dict[str, Any]:
+    """
+    Compare a token counter against the heuristic for accuracy and throughput.
+
+    The counter under test is treated as the reference for accuracy, so it
+    should be a real tokenizer.
+
+    Args:
+        texts: The sample texts
+        counter: The token counter to benchmark
+        repeat: Number of timing repetitions (the best one is reported)
+
+    Returns:
+        A dictionary with the heuristic's mean absolute percentage error and
+        the throughput of both counters in characters per second
+    """
+    heuristic = HeuristicTokenCounter()
+    if isinstance(counter, CachedTokenCounter):
+        # Measure the tokenizer itself, not the memoisation
+        counter = counter.counter
+    total_chars = sum(len(text) for text in texts) or 1
+
+    def _throughput(candidate: TokenCounter) -> float:
+        best = float("inf")
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            candidate.count_batch(texts)
+            best = min(best, time.perf_counter() - start)
+        return total_chars / best if best > 0 else float("inf")
+
+    reference = counter.count_batch(texts)
+    estimated = heuristic.count_batch(texts)
+    errors = [abs(e - r) / r for e, r in zip(estimated, reference) if r > 0]
+
+    return {
+        "counter": counter.name,
+        "samples": len(texts),
+        "characters": total_chars,
+        "reference_tokens": sum(reference),
+        "heuristic_tokens": sum(estimated),
+        "heuristic_mean_abs_pct_error": 100.0 * sum(errors) / len(errors) if errors else 0.0,
+        "counter_chars_per_second": _throughput(counter),
+        "heuristic_chars_per_second": _throughput(heuristic),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Benchmark a BPE token counter against the heuristic")
+    parser.add_argument("files", nargs="+", help="Sample text files")
+    parser.add_argument("--encoding", default="cl100k_base", help="Encoding name")
+    parser.add_argument("--vocab-dir", required=True, help="Directory containing <encoding>.tiktoken")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions")
+    args = parser.parse_args()
+
+    samples = [Path(path).read_text(encoding="utf-8", errors="replace") for path in args.files]
+    print(json.dumps(
+        benchmark_token_counter(samples, get_token_counter(args.encoding, args.vocab_dir), args.repeat),
+        indent=2,
+    ))
@@ -7,6 +7,7 @@ als allgemeinen KI-Agenten zu verwenden, der verschiedene Aufgaben übernehmen k
 
 import os
 import sys
+import copy
 import json
 import logging
 import requests
@@ -23,6 +24,112 @@ logging.basicConfig(
 )
 logger = logging.getLogger('openhands-agent')
 
+# Standardkonfiguration des OpenHands Agents
+DEFAULT_CONFIG = {
+    "openhands": {
+        "api_url": "http://localhost:8000",
+        "api_key": "",
+        "model": "gpt-4o",
+        "temperature": 0.7,
+        "max_tokens": 4000,
+        "timeout": 60,
+        "mcp_servers": [
+            {
+                "name": "filesystem",
+                "url": "http://localhost:3001",
+                "description": "File system operations"
+            },
+            {
+                "name": "desktop-commander",
+                "url": "http://localhost:3002",
+                "description": "Terminal command execution"
+            },
+            {
+                "name": "sequential-thinking",
+                "url": "http://localhost:3003",
+                "description": "Sequential thinking for complex tasks"
+            },
+            {
+                "name": "github-chat",
+                "url": "http://localhost:3004",
+                "description": "GitHub discussions and comments"
+            },
+            {
+                "name": "github",
+                "url": "http://localhost:3005",
+                "description": "GitHub repository operations"
+            },
+            {
+                "name": "n8n",
+                "url": "http://localhost:3000",
+                "description": "n8n workflow operations"
+            }
+        ],
+        "default_system_prompt": "You are OpenHands, a helpful AI assistant that can interact with various systems through MCP servers. You can help with file operations, terminal commands, GitHub operations, and more."
+    }
+}
+
+
+def load_agent_config(config_manager, config_file: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Lade die Konfiguration des OpenHands Agents.
+    
+    Args:
+        config_manager: Der Konfigurationsmanager
+        config_file: Pfad zur Konfigurationsdatei
+        
+    Returns:
+        Die Konfiguration, bei Fehlern die Standardkonfiguration
+    """
+    if config_file:
+        try:
+            return config_manager.load_json_config(config_file, copy.deepcopy(DEFAULT_CONFIG))
+        except Exception as e:
+            logger.error(f"Fehler beim Laden der Konfigurationsdatei {config_file}: {e}")
+            return copy.deepcopy(DEFAULT_CONFIG)
+    
+    # Versuche, die Konfiguration aus der Standarddatei zu laden
+    try:
+        return config_manager.load_json_config("openhands", copy.deepcopy(DEFAULT_CONFIG))
+    except Exception as e:
+        logger.error(f"Fehler beim Laden der Standardkonfigurationsdatei: {e}")
+        return copy.deepcopy(DEFAULT_CONFIG)
+
+
+def build_chat_request(config: Dict[str, Any], task: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Erstelle die Anfrage an die Chat-Completions-API von OpenHands.
+    
+    Args:
+        config: Die Konfiguration des Agents
+        task: Beschreibung der Aufgabe
+        context: Kontext für die Aufgabe
+        
+    Returns:
+        Die Anfragedaten
+    """
+    request_data = {
+        "model": config["openhands"]["model"],
+        "temperature": config["openhands"]["temperature"],
+        "max_tokens": config["openhands"]["max_tokens"],
+        "messages": [
+            {
+                "role": "system",
+                "content": config["openhands"]["default_system_prompt"]
+            },
+            {
+                "role": "user",
+                "content": task
+            }
+        ]
+    }
+    
+    # Füge Kontext hinzu, falls vorhanden
+    if context:
+        request_data["context"] = context
+    
+    return request_data
+
 
 class OpenHandsAgent:
     """
@@ -41,65 +148,8 @@ class OpenHandsAgent:
         """
         self.config_manager = get_config_manager()
         
-        # Standardkonfiguration
-        default_config = {
-            "openhands": {
-                "api_url": "http://localhost:8000",
-                "api_key": "",
-                "model": "gpt-4o",
-                "temperature": 0.7,
-                "max_tokens": 4000,
-                "timeout": 60,
-                "mcp_servers": [
-                    {
-                        "name": "filesystem",
-                        "url": "http://localhost:3001",
-                        "description": "File system operations"
-                    },
-                    {
-                        "name": "desktop-commander",
-                        "url": "http://localhost:3002",
-                        "description": "Terminal command execution"
-                    },
-                    {
-                        "name": "sequential-thinking",
-                        "url": "http://localhost:3003",
-                        "description": "Sequential thinking for complex tasks"
-                    },
-                    {
-                        "name": "github-chat",
-                        "url": "http://localhost:3004",
-                        "description": "GitHub discussions and comments"
-                    },
-                    {
-                        "name": "github",
-                        "url": "http://localhost:3005",
-                        "description": "GitHub repository operations"
-                    },
-                    {
-                        "name": "n8n",
-                        "url": "http://localhost:3000",
-                        "description": "n8n workflow operations"
-                    }
-                ],
-                "default_system_prompt": "You are OpenHands, a helpful AI assistant that can interact with various systems through MCP servers. You can help with file operations, terminal commands, GitHub operations, and more."
-            }
-        }
-        
         # Lade Konfiguration
-        if config_file:
-            try:
-                self.config = self.config_manager.load_json_config(config_file, default_config)
-            except Exception as e:
-                logger.error(f"Fehler beim Laden der Konfigurationsdatei {config_file}: {e}")
-                self.config = default_config
-        else:
-            # Versuche, die Konfiguration aus der Standarddatei zu laden
-            try:
-                self.config = self.config_manager.load_json_config("openhands", default_config)
-            except Exception as e:
-                logger.error(f"Fehler beim Laden der Standardkonfigurationsdatei: {e}")
-                self.config = default_config
+        self.config = load_agent_config(self.config_manager, config_file)
         
         # Initialisiere MCP-Client-Manager
         self.mcp_client_manager = MCPClientManager(self.config["openhands"]["mcp_servers"])
@@ -142,25 +192,7 @@ class OpenHandsAgent:
             raise Exception("OpenHands API nicht erreichbar")
         
         # Bereite die Anfrage vor
-        request_data = {
-            "model": self.config["openhands"]["model"],
-            "temperature": self.config["openhands"]["temperature"],
-            "max_tokens": self.config["openhands"]["max_tokens"],
-            "messages": [
-                {
-                    "role": "system",
-                    "content": self.config["openhands"]["default_system_prompt"]
-                },
-                {
-                    "role": "user",
-                    "content": task
-                }
-            ]
-        }
-        
-        # Füge Kontext hinzu, falls vorhanden
-        if context:
-            request_data["context"] = context
+        request_data = build_chat_request(self.config, task, context)
         
         # Sende die Anfrage an die OpenHands API
         try:
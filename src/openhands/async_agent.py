@@ -0,0 +1,605 @@
+"""
+Asynchrone OpenHands Agent Integration für das Dev-Server-Workflow-Projekt.
+
+Dieses Modul bietet eine asyncio-Variante des OpenHands Agents. Alle HTTP-Anfragen
+laufen über eine gemeinsame, gepoolte aiohttp-Session, und die Schritte von
+komplexen Aufgaben werden entsprechend ihrer deklarierten Abhängigkeiten parallel
+ausgeführt.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Any, Optional, Set
+
+import aiohttp
+
+from ..common.config_manager import get_config_manager
+from ..core.performance import Profiler
+from ..mcp.client import MCPClientManager
+from .agent import build_chat_request, load_agent_config
+
+logger = logging.getLogger('openhands-agent')
+
+
+class StepStatus(str, Enum):
+    """Status eines Schritts einer komplexen Aufgabe."""
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    TIMEOUT = "timeout"
+    CANCELLED = "cancelled"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class StepResult:
+    """Ergebnis eines Schritts einer komplexen Aufgabe."""
+    step_id: str
+    status: StepStatus = StepStatus.PENDING
+    result: Any = None
+    error: Optional[str] = None
+    started_at: Optional[float] = None
+    duration: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Konvertiere das Ergebnis in ein Dictionary.
+
+        Returns:
+            Dictionary-Darstellung des Ergebnisses
+        """
+        return {
+            "step_id": self.step_id,
+            "status": self.status.value,
+            "result": self.result,
+            "error": self.error,
+            "started_at": self.started_at,
+            "duration": self.duration,
+        }
+
+
+@dataclass
+class TaskStep:
+    """
+    Schritt einer komplexen Aufgabe.
+
+    Ein Schritt mit ``server`` und ``function`` ruft zuerst die MCP-Funktion auf,
+    andernfalls wird nur ``task`` an OpenHands gesendet. Die Ergebnisse der
+    Abhängigkeiten werden dem Kontext des Schritts hinzugefügt.
+    """
+    id: str
+    task: str
+    depends_on: List[str] = field(default_factory=list)
+    timeout: Optional[float] = None
+    server: Optional[str] = None
+    function: Optional[str] = None
+    parameters: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], index: int) -> 'TaskStep':
+        """
+        Erstelle einen Schritt aus seiner Dictionary-Darstellung.
+
+        Args:
+            data: Die Schrittdefinition
+            index: Position des Schritts, für Schritte ohne ID
+
+        Returns:
+            Der Schritt
+        """
+        return cls(
+            id=str(data.get("id", f"step-{index}")),
+            task=data.get("task") or data.get("description", ""),
+            depends_on=list(data.get("depends_on", [])),
+            timeout=data.get("timeout"),
+            server=data.get("server"),
+            function=data.get("function"),
+            parameters=data.get("parameters") or {},
+        )
+
+
+class AsyncOpenHandsAgent:
+    """
+    Asynchroner OpenHands Agent mit gepooltem HTTP-Client.
+
+    Die Session wird mit ``start()`` (oder ``async with``) geöffnet und von allen
+    Anfragen geteilt. MCP-Clients sind synchron und werden daher in einem
+    Thread-Pool ausgeführt, damit sie die Event-Loop nicht blockieren.
+    """
+
+    def __init__(
+        self,
+        config_file: Optional[str] = None,
+        max_connections: int = 20,
+        max_concurrent_steps: int = 8,
+    ):
+        """
+        Initialisiere den asynchronen OpenHands Agent.
+
+        Args:
+            config_file: Pfad zur Konfigurationsdatei
+            max_connections: Maximale Anzahl gleichzeitiger HTTP-Verbindungen im Pool
+            max_concurrent_steps: Maximale Anzahl parallel ausgeführter Schritte
+        """
+        self.config_manager = get_config_manager()
+        self.config = load_agent_config(self.config_manager, config_file)
+        self.mcp_client_manager = MCPClientManager(self.config["openhands"]["mcp_servers"])
+        self.max_connections = max_connections
+        self.max_concurrent_steps = max_concurrent_steps
+        self.profiler = Profiler()
+        self.api_available = False
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def start(self) -> None:
+        """
+        Öffne die gemeinsame HTTP-Session und prüfe die Erreichbarkeit der API.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=30),
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {self.config['openhands']['api_key']}"
+                },
+                timeout=aiohttp.ClientTimeout(total=self.config["openhands"]["timeout"]),
+            )
+        self.api_available = await self._check_api_availability()
+
+    async def close(self) -> None:
+        """
+        Schließe die gemeinsame HTTP-Session.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> 'AsyncOpenHandsAgent':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Die gemeinsame HTTP-Session."""
+        if self._session is None or self._session.closed:
+            raise RuntimeError("AsyncOpenHandsAgent wurde nicht gestartet")
+        return self._session
+
+    async def _check_api_availability(self) -> bool:
+        """
+        Überprüfe, ob die OpenHands API erreichbar ist.
+
+        Returns:
+            True, wenn die API erreichbar ist, sonst False
+        """
+        try:
+            async with self.session.get(
+                f"{self.config['openhands']['api_url']}/health",
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                return response.status == 200
+        except Exception as e:
+            logger.error(f"OpenHands API nicht erreichbar: {e}")
+            return False
+
+    async def execute_task(
+        self,
+        task: str,
+        context: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Führe eine Aufgabe mit OpenHands aus.
+
+        Args:
+            task: Beschreibung der Aufgabe
+            context: Kontext für die Aufgabe
+            timeout: Optionales Timeout in Sekunden (Standard: Konfiguration)
+
+        Returns:
+            Dict mit dem Ergebnis der Aufgabe
+
+        Raises:
+            Exception: Wenn die Aufgabe nicht ausgeführt werden konnte
+        """
+        if not self.api_available:
+            raise Exception("OpenHands API nicht erreichbar")
+
+        request_data = build_chat_request(self.config, task, context)
+        request_timeout = aiohttp.ClientTimeout(total=timeout or self.config["openhands"]["timeout"])
+
+        start_time = time.monotonic()
+        try:
+            async with self.session.post(
+                f"{self.config['openhands']['api_url']}/v1/chat/completions",
+                json=request_data,
+                timeout=request_timeout
+            ) as response:
+                if response.status != 200:
+                    raise Exception(f"Fehler bei der Anfrage an die OpenHands API: {await response.text()}")
+
+                return await response.json()
+        except Exception as e:
+            logger.error(f"Fehler bei der Ausführung der Aufgabe: {e}")
+            raise
+        finally:
+            self.profiler.record_call("execute_task", time.monotonic() - start_time)
+
+    async def _call_mcp_function(self, server_name: str, function_name: str, parameters: Dict[str, Any]) -> Any:
+        """
+        Rufe eine MCP-Funktion auf, ohne die Event-Loop zu blockieren.
+
+        Args:
+            server_name: Name des MCP-Servers
+            function_name: Name der Funktion
+            parameters: Parameter für die Funktion
+
+        Returns:
+            Das Ergebnis der Funktion
+
+        Raises:
+            Exception: Wenn der MCP-Server nicht gefunden wurde
+        """
+        client = self.mcp_client_manager.get_client(server_name)
+        if not client:
+            raise Exception(f"MCP-Server {server_name} nicht gefunden")
+
+        start_time = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, client.call_function, function_name, parameters)
+        finally:
+            self.profiler.record_call(f"mcp:{server_name}.{function_name}", time.monotonic() - start_time)
+
+    async def execute_mcp_task(
+        self,
+        task: str,
+        server_name: str,
+        function_name: str,
+        parameters: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Führe eine MCP-Aufgabe mit OpenHands aus.
+
+        Args:
+            task: Beschreibung der Aufgabe
+            server_name: Name des MCP-Servers
+            function_name: Name der Funktion
+            parameters: Parameter für die Funktion
+            timeout: Optionales Timeout in Sekunden für die OpenHands-Anfrage
+
+        Returns:
+            Dict mit dem Ergebnis der Aufgabe
+
+        Raises:
+            Exception: Wenn die Aufgabe nicht ausgeführt werden konnte
+        """
+        try:
+            result = await self._call_mcp_function(server_name, function_name, parameters)
+
+            # Bereite den Kontext für OpenHands vor
+            context = {
+                "mcp_result": result,
+                "mcp_server": server_name,
+                "mcp_function": function_name,
+                "mcp_parameters": parameters
+            }
+
+            return await self.execute_task(task, context, timeout=timeout)
+        except Exception as e:
+            logger.error(f"Fehler bei der Ausführung der MCP-Aufgabe: {e}")
+            raise
+
+    async def manage_workflow(self, workflow_name: str, action: str, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Verwalte einen n8n-Workflow mit OpenHands.
+
+        Args:
+            workflow_name: Name des Workflows
+            action: Aktion, die ausgeführt werden soll (start, stop, update, etc.)
+            parameters: Parameter für die Aktion
+
+        Returns:
+            Dict mit dem Ergebnis der Aktion
+
+        Raises:
+            Exception: Wenn die Aktion nicht ausgeführt werden konnte
+        """
+        mcp_parameters = {
+            "workflow_name": workflow_name,
+            "action": action
+        }
+
+        if parameters:
+            mcp_parameters["parameters"] = parameters
+
+        try:
+            result = await self._call_mcp_function("n8n", "manage_workflow", mcp_parameters)
+
+            # Bereite den Kontext für OpenHands vor
+            context = {
+                "workflow_name": workflow_name,
+                "action": action,
+                "parameters": parameters,
+                "result": result
+            }
+
+            task = f"Verwalte den n8n-Workflow '{workflow_name}' mit der Aktion '{action}'."
+            return await self.execute_task(task, context)
+        except Exception as e:
+            logger.error(f"Fehler bei der Verwaltung des Workflows: {e}")
+            raise
+
+    async def _run_step(
+        self,
+        step: TaskStep,
+        dependency_results: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+    ) -> StepResult:
+        """
+        Führe einen einzelnen Schritt mit Timeout und Latenzmessung aus.
+
+        Args:
+            step: Der Schritt
+            dependency_results: Ergebnisse der Schritte, von denen dieser abhängt
+            semaphore: Begrenzung der parallel laufenden Schritte
+
+        Returns:
+            Das Ergebnis des Schritts
+        """
+        step_result = StepResult(step_id=step.id)
+
+        async with semaphore:
+            step_result.started_at = time.time()
+            start_time = time.monotonic()
+            try:
+                if step.server and step.function:
+                    parameters = dict(step.parameters)
+                    if dependency_results:
+                        parameters.setdefault("dependencies", dependency_results)
+                    coro = self.execute_mcp_task(step.task, step.server, step.function, parameters)
+                else:
+                    coro = self.execute_task(step.task, {"step": step.id, "dependencies": dependency_results})
+
+                step_result.result = await asyncio.wait_for(coro, timeout=step.timeout)
+                step_result.status = StepStatus.COMPLETED
+            except asyncio.TimeoutError:
+                step_result.status = StepStatus.TIMEOUT
+                step_result.error = f"Schritt {step.id} hat das Timeout von {step.timeout}s überschritten"
+            except asyncio.CancelledError:
+                step_result.status = StepStatus.CANCELLED
+                raise
+            except Exception as e:
+                step_result.status = StepStatus.FAILED
+                step_result.error = str(e)
+            finally:
+                step_result.duration = time.monotonic() - start_time
+                self.profiler.record_call(f"step:{step.id}", step_result.duration)
+                logger.info(f"Schritt {step.id}: {step_result.status.value} nach {step_result.duration:.3f}s")
+
+        return step_result
+
+    @staticmethod
+    def _validate_steps(steps: List[TaskStep]) -> None:
+        """
+        Prüfe, dass Schritt-IDs eindeutig sind und die Abhängigkeiten einen DAG bilden.
+
+        Args:
+            steps: Die Schritte
+
+        Raises:
+            ValueError: Wenn die Schritte ungültig sind
+        """
+        ids = [step.id for step in steps]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Schritt-IDs müssen eindeutig sein")
+
+        known = set(ids)
+        for step in steps:
+            missing = [dep for dep in step.depends_on if dep not in known]
+            if missing:
+                raise ValueError(f"Schritt {step.id} hängt von unbekannten Schritten ab: {missing}")
+
+        # Kahn-Algorithmus zur Zykluserkennung
+        in_degree = {step.id: len(step.depends_on) for step in steps}
+        dependents: Dict[str, List[str]] = {step.id: [] for step in steps}
+        for step in steps:
+            for dep in step.depends_on:
+                dependents[dep].append(step.id)
+
+        queue = [step_id for step_id, degree in in_degree.items() if degree == 0]
+        visited = 0
+        while queue:
+            step_id = queue.pop()
+            visited += 1
+            for dependent in dependents[step_id]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+
+        if visited != len(steps):
+            raise ValueError("Die Schritte enthalten zyklische Abhängigkeiten")
+
+    async def run_steps(self, steps: List[Dict[str, Any]], fail_fast: bool = False) -> Dict[str, StepResult]:
+        """
+        Führe Schritte entsprechend ihrer Abhängigkeiten parallel aus.
+
+        Ein Schritt startet, sobald alle Schritte in ``depends_on`` abgeschlossen
+        sind. Schlägt eine Abhängigkeit fehl, wird der Schritt übersprungen. Mit
+        ``fail_fast`` werden beim ersten Fehler alle laufenden Schritte abgebrochen.
+        Wird der Aufrufer selbst abgebrochen, werden alle laufenden Schritte
+        ebenfalls abgebrochen.
+
+        Args:
+            steps: Die Schrittdefinitionen
+            fail_fast: Ob beim ersten Fehler abgebrochen werden soll
+
+        Returns:
+            Die Ergebnisse je Schritt-ID
+
+        Raises:
+            ValueError: Wenn die Schritte ungültig sind
+        """
+        task_steps = [TaskStep.from_dict(step, index) for index, step in enumerate(steps)]
+        self._validate_steps(task_steps)
+
+        steps_by_id = {step.id: step for step in task_steps}
+        waiting: Dict[str, Set[str]] = {step.id: set(step.depends_on) for step in task_steps}
+        dependents: Dict[str, List[str]] = {step.id: [] for step in task_steps}
+        for step in task_steps:
+            for dep in step.depends_on:
+                dependents[dep].append(step.id)
+
+        results: Dict[str, StepResult] = {}
+        running: Dict[asyncio.Future, str] = {}
+        semaphore = asyncio.Semaphore(self.max_concurrent_steps)
+
+        def finish(step_id: str) -> None:
+            for dependent in dependents[step_id]:
+                waiting[dependent].discard(step_id)
+
+        try:
+            while waiting or running:
+                progressed = False
+                for step_id in [sid for sid, deps in waiting.items() if not deps]:
+                    del waiting[step_id]
+                    step = steps_by_id[step_id]
+                    failed = [dep for dep in step.depends_on if results[dep].status != StepStatus.COMPLETED]
+                    if failed:
+                        results[step_id] = StepResult(
+                            step_id=step_id,
+                            status=StepStatus.SKIPPED,
+                            error=f"Abhängigkeiten nicht erfolgreich: {failed}",
+                        )
+                        finish(step_id)
+                        progressed = True
+                        continue
+
+                    dependency_results = {dep: results[dep].result for dep in step.depends_on}
+                    future = asyncio.ensure_future(self._run_step(step, dependency_results, semaphore))
+                    running[future] = step_id
+
+                if progressed:
+                    continue
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    step_id = running.pop(future)
+                    results[step_id] = future.result()
+                    finish(step_id)
+
+                if fail_fast and any(result.status not in (StepStatus.COMPLETED, StepStatus.SKIPPED)
+                                     for result in results.values()):
+                    break
+        finally:
+            # Breche verbleibende Schritte ab (fail_fast oder Abbruch des Aufrufers)
+            for future in running:
+                future.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            for future, step_id in running.items():
+                if future.cancelled() or future.exception() is not None:
+                    results[step_id] = StepResult(step_id=step_id, status=StepStatus.CANCELLED)
+                else:
+                    results[step_id] = future.result()
+            for step_id in waiting:
+                results.setdefault(step_id, StepResult(step_id=step_id, status=StepStatus.SKIPPED))
+
+        return results
+
+    async def solve_complex_task(
+        self,
+        task: str,
+        steps: Optional[List[Dict[str, Any]]] = None,
+        fail_fast: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Löse eine komplexe Aufgabe mit OpenHands.
+
+        Deklarierte Schritte werden zuerst über ``run_steps`` parallel ausgeführt;
+        anschließend erhält der Sequential-Thinking-Server die Schritte samt
+        Ergebnissen, und OpenHands fasst das Gesamtergebnis zusammen.
+
+        Args:
+            task: Beschreibung der Aufgabe
+            steps: Schritte für die Lösung der Aufgabe (mit ``id``, ``task``,
+                optional ``depends_on``, ``timeout``, ``server``, ``function``
+                und ``parameters``)
+            fail_fast: Ob beim ersten fehlgeschlagenen Schritt abgebrochen werden soll
+
+        Returns:
+            Dict mit der Antwort von OpenHands (``response``) und den
+            Schrittergebnissen (``steps``)
+
+        Raises:
+            Exception: Wenn die Aufgabe nicht gelöst werden konnte
+        """
+        try:
+            step_results = await self.run_steps(steps, fail_fast=fail_fast) if steps else {}
+            serialized_results = {step_id: result.to_dict() for step_id, result in step_results.items()}
+
+            mcp_parameters: Dict[str, Any] = {
+                "task": task
+            }
+            if steps:
+                mcp_parameters["steps"] = steps
+                mcp_parameters["step_results"] = serialized_results
+
+            result = await self._call_mcp_function("sequential-thinking", "solve_task", mcp_parameters)
+
+            # Bereite den Kontext für OpenHands vor
+            context = {
+                "task": task,
+                "steps": steps,
+                "step_results": serialized_results,
+                "result": result
+            }
+
+            response = await self.execute_task(task, context)
+            return {
+                "response": response,
+                "steps": serialized_results,
+            }
+        except Exception as e:
+            logger.error(f"Fehler bei der Lösung der komplexen Aufgabe: {e}")
+            raise
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Hole die Latenzstatistiken der Anfragen und Schritte.
+
+        Returns:
+            Statistiken je Operation (Anzahl, Summe, Minimum, Maximum, Mittelwert in Sekunden)
+        """
+        return self.profiler.get_stats()
+
+
+# Singleton-Instanz des asynchronen OpenHands Agents
+_async_openhands_agent = None
+
+
+async def get_async_openhands_agent(config_file: Optional[str] = None) -> AsyncOpenHandsAgent:
+    """
+    Hole die gestartete Singleton-Instanz des asynchronen OpenHands Agents.
+
+    Args:
+        config_file: Pfad zur Konfigurationsdatei
+
+    Returns:
+        Singleton-Instanz des asynchronen OpenHands Agents
+    """
+    global _async_openhands_agent
+
+    if _async_openhands_agent is None:
+        _async_openhands_agent = AsyncOpenHandsAgent(config_file)
+        await _async_openhands_agent.start()
+
+    return _async_openhands_agent
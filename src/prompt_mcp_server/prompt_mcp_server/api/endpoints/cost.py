@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field
 from ...core.llm_selector import LLMSelector
 from ...core.task_cost_estimator import TaskCostEstimator
 from ...core.template_manager import TemplateManager
+from .templates import get_template_manager
 
 # Create router
 router = APIRouter()
@@ -28,13 +29,30 @@ class CostEstimationRequest(BaseModel):
     expected_output_length: Optional[int] = Field(None, description="Optional expected output length in characters")
 
 
+class BatchCostEstimationRequest(BaseModel):
+    """Batch cost estimation request model."""
+
+    prompts: List[str] = Field(..., description="The prompts to estimate cost for")
+    model_ids: Optional[List[str]] = Field(None, description="Optional list of model IDs to estimate cost for")
+    expected_output_lengths: Optional[List[Optional[int]]] = Field(
+        None, description="Optional expected output length in characters per prompt"
+    )
+    top_k: int = Field(5, ge=1, description="Number of cheapest models to return per prompt")
+
+
+# Shared estimator, so the price matrix and token counts are reused across requests
+_task_cost_estimator: Optional[TaskCostEstimator] = None
+
+
 # Create dependencies
 def get_task_cost_estimator(
-    llm_selector: LLMSelector = Depends(LLMSelector),
-    template_manager: TemplateManager = Depends(TemplateManager),
+    template_manager: TemplateManager = Depends(get_template_manager),
 ):
     """Get task cost estimator dependency."""
-    return TaskCostEstimator(llm_selector, template_manager)
+    global _task_cost_estimator
+    if _task_cost_estimator is None:
+        _task_cost_estimator = TaskCostEstimator(LLMSelector(), template_manager)
+    return _task_cost_estimator
 
 
 @router.post("/estimate", response_model=Dict[str, Any])
@@ -62,6 +80,34 @@ async def estimate_cost(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/estimate/batch", response_model=List[Dict[str, Any]])
+async def estimate_costs_batch(
+    request: BatchCostEstimationRequest,
+    task_cost_estimator: TaskCostEstimator = Depends(get_task_cost_estimator),
+) -> List[Dict[str, Any]]:
+    """
+    Estimate the cost of processing many prompts with many models in one pass.
+
+    Args:
+        request: The batch cost estimation request
+
+    Returns:
+        One cost estimate per prompt, each with the top-k cheapest models
+    """
+    try:
+        return await task_cost_estimator.estimate_costs_batch(
+            prompts=request.prompts,
+            model_ids=request.model_ids,
+            expected_output_lengths=request.expected_output_lengths,
+            top_k=request.top_k,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception(f"Error estimating costs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/report", response_model=Dict[str, str])
 async def generate_cost_report(
     request: CostEstimationRequest,
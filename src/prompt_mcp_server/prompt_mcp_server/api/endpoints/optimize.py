@@ -10,6 +10,7 @@ from pydantic import BaseModel, Field
 
 from ...core.prompt_optimizer import PromptOptimizer
 from ...core.template_manager import TemplateManager
+from .templates import get_template_manager
 
 # Erstelle Router
 router = APIRouter()
@@ -27,6 +28,14 @@ class OptimizePromptRequest(BaseModel):
     context: Optional[Dict[str, Any]] = Field(None, description="Zusätzlicher Kontext für das Template")
 
 
+class OptimizePromptsRequest(BaseModel):
+    """Batch-Prompt-Optimierungs-Anfrage-Modell."""
+
+    prompts: List[str] = Field(..., description="Die zu optimierenden Prompts")
+    template_id: Optional[str] = Field(None, description="Die zu verwendende Template-ID")
+    context: Optional[Dict[str, Any]] = Field(None, description="Gemeinsamer Kontext für das Template")
+
+
 class SystemPromptRequest(BaseModel):
     """System-Prompt-Anfrage-Modell."""
 
@@ -36,12 +45,19 @@ class SystemPromptRequest(BaseModel):
     constraints: Optional[List[str]] = Field(None, description="Optionale Einschränkungen für die Antwort")
 
 
+# Gemeinsamer Prompt-Optimierer, damit der Render-Cache über Anfragen hinweg erhalten bleibt
+_prompt_optimizer: Optional[PromptOptimizer] = None
+
+
 # Erstelle Abhängigkeiten
 def get_prompt_optimizer(
-    template_manager: TemplateManager = Depends(TemplateManager),
+    template_manager: TemplateManager = Depends(get_template_manager),
 ):
     """Hole Prompt-Optimierer-Abhängigkeit."""
-    return PromptOptimizer(template_manager)
+    global _prompt_optimizer
+    if _prompt_optimizer is None or _prompt_optimizer.template_manager is not template_manager:
+        _prompt_optimizer = PromptOptimizer(template_manager)
+    return _prompt_optimizer
 
 
 @router.post("/prompt", response_model=Dict[str, str])
@@ -70,6 +86,45 @@ async def optimize_prompt(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/prompts", response_model=Dict[str, List[str]])
+async def optimize_prompts(
+    request: OptimizePromptsRequest,
+    prompt_optimizer: PromptOptimizer = Depends(get_prompt_optimizer),
+) -> Dict[str, List[str]]:
+    """
+    Optimiere mehrere Benutzer-Prompts mit demselben Template in einem Aufruf.
+
+    Args:
+        request: Die Batch-Prompt-Optimierungs-Anfrage
+
+    Returns:
+        Ein Dictionary mit den optimierten Prompts
+    """
+    try:
+        optimized_prompts = await prompt_optimizer.optimize_prompts(
+            user_prompts=request.prompts,
+            template_id=request.template_id,
+            context=request.context,
+        )
+        return {"optimized_prompts": optimized_prompts}
+    except Exception as e:
+        logger.exception(f"Fehler bei der Batch-Prompt-Optimierung: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/cache/stats", response_model=Dict[str, Any])
+async def get_cache_stats(
+    prompt_optimizer: PromptOptimizer = Depends(get_prompt_optimizer),
+) -> Dict[str, Any]:
+    """
+    Liefere Kennzahlen des Render-Caches.
+
+    Returns:
+        Ein Dictionary mit Cache-Größe, Treffern und Trefferquote
+    """
+    return prompt_optimizer.get_cache_stats()
+
+
 @router.post("/system-prompt", response_model=Dict[str, str])
 async def generate_system_prompt(
     request: SystemPromptRequest,
@@ -18,10 +18,17 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+# Shared template manager, so compiled templates and the index survive across requests
+_template_manager: Optional[TemplateManager] = None
+
+
 # Create dependencies
 def get_template_manager():
     """Get template manager dependency."""
-    return TemplateManager()
+    global _template_manager
+    if _template_manager is None:
+        _template_manager = TemplateManager()
+    return _template_manager
 
 
 @router.get("", response_model=List[Template])
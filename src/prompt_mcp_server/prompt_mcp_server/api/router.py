@@ -6,7 +6,7 @@ This module defines the main API router and includes all sub-routers.
 
 from fastapi import APIRouter
 
-from .endpoints import chat, models, templates, optimize
+from .endpoints import chat, cost, models, templates, optimize
 
 # Create main API router
 api_router = APIRouter()
@@ -16,3 +16,4 @@ api_router.include_router(chat.router, prefix="/chat", tags=["Chat"])
 api_router.include_router(models.router, prefix="/models", tags=["Models"])
 api_router.include_router(templates.router, prefix="/templates", tags=["Templates"])
 api_router.include_router(optimize.router, prefix="/optimize", tags=["Optimize"])
+api_router.include_router(cost.router, prefix="/cost", tags=["Cost"])
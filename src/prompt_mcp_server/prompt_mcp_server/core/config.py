@@ -46,6 +46,16 @@ class Settings(BaseSettings):
 
     # Template settings
     TEMPLATES_DIRECTORY: str = "templates"
+    TEMPLATE_CACHE_SIZE: int = 128
+    TEMPLATE_JOURNAL_COMPACT_THRESHOLD: int = 100
+
+    # Token counting settings
+    TOKENIZER_ENCODING: str = "cl100k_base"
+    TOKENIZER_VOCAB_DIRECTORY: Optional[str] = None
+    TOKEN_COUNT_CACHE_SIZE: int = 4096
+
+    # Prompt optimization settings
+    PROMPT_CACHE_SIZE: int = 1024
 
     # Logging settings
     LOG_LEVEL: str = "INFO"
@@ -8,9 +8,9 @@ import logging
 import re
 from typing import Dict, List, Optional, Any, Union
 
-from src.models.llm import LLMModel, ModelType, ComplexityLevel
-from src.models.template import Template
-from src.config import settings
+from ..models.llm import LLMModel, ModelType, ComplexityLevel
+from ..models.template import Template
+from .config import settings
 
 # Create logger
 logger = logging.getLogger(__name__)
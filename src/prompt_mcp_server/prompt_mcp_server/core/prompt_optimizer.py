@@ -4,11 +4,15 @@ Prompt-Optimierer für den Prompt MCP Server.
 Dieses Modul bietet Funktionalität zur Optimierung von Benutzer-Prompts zu strukturierten Best-Practice-Prompts.
 """
 
+import hashlib
+import json
 import logging
 import re
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 
 from ..models.template import Template
+from .config import settings
 from .template_manager import TemplateManager
 
 # Erstelle Logger
@@ -18,14 +22,123 @@ logger = logging.getLogger(__name__)
 class PromptOptimizer:
     """Prompt-Optimierer-Klasse."""
 
-    def __init__(self, template_manager: TemplateManager):
+    def __init__(self, template_manager: TemplateManager, cache_size: Optional[int] = None):
         """
         Initialisiere den Prompt-Optimierer.
 
         Args:
             template_manager: Der Template-Manager
+            cache_size: Maximale Anzahl gecachter Render-Ergebnisse (Standard: PROMPT_CACHE_SIZE)
         """
         self.template_manager = template_manager
+        self.cache_size = settings.PROMPT_CACHE_SIZE if cache_size is None else cache_size
+        self._render_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+
+    @staticmethod
+    def _template_version(template: Template) -> str:
+        """
+        Bestimme die Version eines Templates.
+
+        Jede Änderung am Template setzt ``updated_at`` neu, daher genügt der
+        Zeitstempel, um veraltete Cache-Einträge zu erkennen.
+
+        Args:
+            template: Das Template
+
+        Returns:
+            Die Template-Version
+        """
+        return f"{template.id}@{template.updated_at.isoformat()}"
+
+    @staticmethod
+    def _fingerprint_context(user_prompt: str, context: Optional[Dict[str, Any]]) -> str:
+        """
+        Berechne einen stabilen Hash für Prompt und Kontext.
+
+        Args:
+            user_prompt: Der Benutzer-Prompt
+            context: Der optionale Kontext
+
+        Returns:
+            Der Hex-Digest des Fingerprints
+        """
+        payload = json.dumps(
+            [user_prompt, context or {}], sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: Tuple[str, str, str]) -> Optional[str]:
+        """Hole ein Render-Ergebnis aus dem Cache."""
+        rendered = self._render_cache.get(key)
+        if rendered is None:
+            self._cache_misses += 1
+            return None
+        self._cache_hits += 1
+        self._render_cache.move_to_end(key)
+        return rendered
+
+    def _cache_put(self, key: Tuple[str, str, str], rendered: str) -> None:
+        """Lege ein Render-Ergebnis im Cache ab."""
+        if self.cache_size <= 0:
+            return
+        self._render_cache[key] = rendered
+        self._render_cache.move_to_end(key)
+        while len(self._render_cache) > self.cache_size:
+            self._render_cache.popitem(last=False)
+            self._cache_evictions += 1
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Liefere Kennzahlen des Render-Caches.
+
+        Returns:
+            Ein Dictionary mit Größe, Treffern, Fehlschlägen und Trefferquote
+        """
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "size": len(self._render_cache),
+            "max_size": self.cache_size,
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "evictions": self._cache_evictions,
+            "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+        }
+
+    def clear_cache(self) -> None:
+        """Leere den Render-Cache."""
+        self._render_cache.clear()
+
+    def _render(self, template: Template, user_prompt: str, context: Optional[Dict[str, Any]]) -> str:
+        """
+        Rendere einen Prompt über den Cache.
+
+        Args:
+            template: Das zu verwendende Template
+            user_prompt: Der Benutzer-Prompt
+            context: Optionaler Kontext für das Template
+
+        Returns:
+            Der optimierte Prompt
+        """
+        key = (template.id, self._template_version(template), self._fingerprint_context(user_prompt, context))
+        rendered = self._cache_get(key)
+        if rendered is not None:
+            return rendered
+
+        # Bereite Kontext vor, ohne den Kontext des Aufrufers zu verändern
+        ctx = dict(context or {})
+        ctx["user_prompt"] = user_prompt
+
+        # Analysiere Prompt-Struktur
+        ctx.update(self._analyze_prompt(user_prompt))
+
+        # Rendere Template
+        rendered = self.template_manager.render_template(template.id, ctx)
+        self._cache_put(key, rendered)
+        return rendered
 
     async def optimize_prompt(
         self,
@@ -55,24 +168,54 @@ class PromptOptimizer:
                 logger.warning(f"Template {template_id} nicht gefunden, verwende Rohprompt")
                 return user_prompt
             
-            # Bereite Kontext vor
-            ctx = context or {}
-            ctx["user_prompt"] = user_prompt
-            
-            # Analysiere Prompt-Struktur
-            prompt_analysis = self._analyze_prompt(user_prompt)
-            ctx.update(prompt_analysis)
-            
-            # Rendere Template
-            optimized_prompt = self.template_manager.render_template(template_id, ctx)
-            
-            return optimized_prompt
+            return self._render(template, user_prompt, context)
         
         except Exception as e:
             logger.exception(f"Fehler bei der Prompt-Optimierung: {e}")
             # Fallback auf Rohprompt
             return user_prompt
 
+    async def optimize_prompts(
+        self,
+        user_prompts: List[str],
+        template_id: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> List[str]:
+        """
+        Optimiere mehrere Benutzer-Prompts mit demselben Template.
+
+        Das Template wird nur einmal aufgelöst und kompiliert; jeder Prompt
+        nutzt den Render-Cache. Schlägt ein einzelner Prompt fehl, wird für
+        diesen der Rohprompt zurückgegeben.
+
+        Args:
+            user_prompts: Die zu optimierenden Benutzer-Prompts
+            template_id: Optionale Template-ID zur Verwendung
+            context: Optionaler gemeinsamer Kontext für das Template
+
+        Returns:
+            Die optimierten Prompts in der Reihenfolge der Eingabe
+        """
+        if not template_id:
+            template_id = "default"
+
+        template = self.template_manager.get_template(template_id)
+        if not template:
+            logger.warning(f"Template {template_id} nicht gefunden, verwende Rohprompts")
+            return list(user_prompts)
+
+        # Kompiliere das Template vorab, damit der erste Prompt nicht die Kosten trägt
+        self.template_manager.get_promplate_template(template_id)
+
+        results = []
+        for user_prompt in user_prompts:
+            try:
+                results.append(self._render(template, user_prompt, context))
+            except Exception as e:
+                logger.exception(f"Fehler bei der Prompt-Optimierung: {e}")
+                results.append(user_prompt)
+        return results
+
     def _analyze_prompt(self, prompt: str) -> Dict[str, Any]:
         """
         Analysiere die Struktur eines Prompts.
@@ -4,18 +4,129 @@ Task cost estimator for the Prompt MCP Server.
 This module provides functionality to estimate the cost of processing a task with different models.
 """
 
+import hashlib
+import heapq
 import json
 import logging
 import re
-from typing import Dict, List, Optional, Any, Union
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Union
 
 from ..models.llm import LLMModel, ModelType, ComplexityLevel
+from .config import settings
 from .llm_selector import LLMSelector
 from .template_manager import TemplateManager
+from .token_counter import CHARS_PER_TOKEN, get_token_counter
 
 # Create logger
 logger = logging.getLogger(__name__)
 
+# Maximum number of memoised complexity analyses
+COMPLEXITY_CACHE_SIZE = 1024
+
+
+class PriceMatrix:
+    """
+    Column-oriented price table for a model catalogue.
+
+    Input and output prices (per 1M tokens) are held in parallel ``array``
+    columns, so the cost of a prompt for every model is two multiply-adds per
+    column instead of one dict per model.
+    """
+
+    def __init__(self, models: Dict[str, LLMModel]):
+        """
+        Initialize the price matrix.
+
+        Args:
+            models: The model catalogue, keyed by model ID
+        """
+        self.model_ids: Tuple[str, ...] = tuple(models)
+        self.models: List[LLMModel] = list(models.values())
+        self.index: Dict[str, int] = {model_id: j for j, model_id in enumerate(self.model_ids)}
+        self.input_prices = array("d", (model.input_cost / 1_000_000 for model in self.models))
+        self.output_prices = array("d", (model.output_cost / 1_000_000 for model in self.models))
+
+    def matches(self, models: Dict[str, LLMModel]) -> bool:
+        """Check whether the matrix was built from the given catalogue."""
+        return len(models) == len(self.model_ids) and all(
+            models.get(model_id) is model for model_id, model in zip(self.model_ids, self.models)
+        )
+
+    def select(self, model_ids: Optional[Sequence[str]] = None) -> List[int]:
+        """
+        Resolve model IDs to column indices, skipping unknown models.
+
+        Args:
+            model_ids: Optional model IDs; all models when not given
+
+        Returns:
+            The column indices
+        """
+        if not model_ids:
+            return list(range(len(self.model_ids)))
+        return [self.index[model_id] for model_id in model_ids if model_id in self.index]
+
+    def costs(self, input_tokens: int, output_tokens: int, columns: Sequence[int]) -> List[float]:
+        """Compute the total cost of one prompt for the selected columns."""
+        input_prices = self.input_prices
+        output_prices = self.output_prices
+        return [input_tokens * input_prices[j] + output_tokens * output_prices[j] for j in columns]
+
+    def cost_matrix(
+        self,
+        input_tokens: Sequence[int],
+        output_tokens: Sequence[int],
+        columns: Sequence[int],
+    ) -> List[List[float]]:
+        """Compute the total cost of every prompt for the selected columns."""
+        input_prices = [self.input_prices[j] for j in columns]
+        output_prices = [self.output_prices[j] for j in columns]
+        return [
+            [tokens_in * p_in + tokens_out * p_out for p_in, p_out in zip(input_prices, output_prices)]
+            for tokens_in, tokens_out in zip(input_tokens, output_tokens)
+        ]
+
+    @staticmethod
+    def cheapest(
+        costs: Sequence[float],
+        columns: Sequence[int],
+        top_k: Optional[int] = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        Order the selected columns by cost.
+
+        Args:
+            costs: The cost per selected column
+            columns: The selected column indices
+            top_k: Optional number of cheapest columns to keep; uses a heap
+                instead of sorting the full list
+
+        Returns:
+            ``(position, column)`` pairs, cheapest first
+        """
+        positions = range(len(columns))
+        if top_k is not None and top_k < len(columns):
+            ordered = heapq.nsmallest(top_k, positions, key=costs.__getitem__)
+        else:
+            ordered = sorted(positions, key=costs.__getitem__)
+        return [(n, columns[n]) for n in ordered]
+
+    def estimate(self, column: int, input_tokens: int, output_tokens: int, total_cost: float) -> Dict[str, Any]:
+        """Build the cost estimate entry for one model."""
+        model = self.models[column]
+        return {
+            "model": model.id,
+            "name": model.name,
+            "provider": model.provider,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "input_cost": input_tokens * self.input_prices[column],
+            "output_cost": output_tokens * self.output_prices[column],
+            "total_cost": total_cost,
+        }
+
 
 class TaskCostEstimator:
     """Task cost estimator class."""
@@ -30,25 +141,100 @@ class TaskCostEstimator:
         """
         self.llm_selector = llm_selector
         self.template_manager = template_manager
+        self.token_counter = get_token_counter(
+            encoding=settings.TOKENIZER_ENCODING,
+            vocab_dir=settings.TOKENIZER_VOCAB_DIRECTORY,
+            cache_size=settings.TOKEN_COUNT_CACHE_SIZE,
+        )
+        self._price_matrix: Optional[PriceMatrix] = None
+        self._complexity_cache: "OrderedDict[bytes, ComplexityLevel]" = OrderedDict()
 
     def estimate_tokens(self, text: str) -> int:
         """
         Estimate the number of tokens in a text.
 
+        Uses the configured BPE tokenizer, or the 4-characters-per-token
+        heuristic when no vocabulary is available.
+
         Args:
             text: The text to estimate tokens for
 
         Returns:
             The estimated number of tokens
         """
-        # Simple estimation: 1 token ≈ 4 characters for English text
-        return len(text) // 4
+        return self.token_counter.count(text)
+
+    def estimate_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Estimate the number of tokens in several texts.
+
+        Args:
+            texts: The texts to estimate tokens for
+
+        Returns:
+            The estimated number of tokens for each text
+        """
+        return self.token_counter.count_batch(texts)
+
+    def _get_price_matrix(self) -> PriceMatrix:
+        """
+        Get the price matrix for the current model catalogue.
+
+        The matrix is rebuilt only when the set of models changes.
+
+        Returns:
+            The price matrix
+        """
+        models = self.llm_selector.models
+        if self._price_matrix is None or not self._price_matrix.matches(models):
+            self._price_matrix = PriceMatrix(models)
+        return self._price_matrix
+
+    def _analyze_complexity(self, prompt: str) -> ComplexityLevel:
+        """
+        Analyze the complexity of a prompt, memoised by prompt hash.
+
+        Args:
+            prompt: The prompt to analyze
+
+        Returns:
+            The complexity level
+        """
+        key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+        complexity = self._complexity_cache.get(key)
+        if complexity is not None:
+            self._complexity_cache.move_to_end(key)
+            return complexity
+
+        complexity = self.llm_selector.analyze_complexity(prompt)
+        self._complexity_cache[key] = complexity
+        if len(self._complexity_cache) > COMPLEXITY_CACHE_SIZE:
+            self._complexity_cache.popitem(last=False)
+        return complexity
+
+    def _output_tokens(self, input_tokens: int, expected_output_length: Optional[int]) -> int:
+        """Estimate the number of output tokens."""
+        if expected_output_length:
+            # The output has not been generated yet, so only its length is known
+            return expected_output_length // CHARS_PER_TOKEN
+        # Default: output is roughly 1.5x the input for most tasks
+        return int(input_tokens * 1.5)
+
+    def _recommended_model(self, complexity: ComplexityLevel) -> Dict[str, str]:
+        """Return the summary of the model recommended for a complexity level."""
+        model = self.llm_selector.get_model(self.llm_selector.select_model(complexity))
+        return {
+            "id": model.id,
+            "name": model.name,
+            "provider": model.provider,
+        }
 
     async def estimate_cost(
         self,
         prompt: str,
         model_ids: Optional[List[str]] = None,
         expected_output_length: Optional[int] = None,
+        top_k: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Estimate the cost of processing a prompt with different models.
@@ -57,67 +243,37 @@ class TaskCostEstimator:
             prompt: The prompt to estimate cost for
             model_ids: Optional list of model IDs to estimate cost for
             expected_output_length: Optional expected output length in characters
+            top_k: Optional number of cheapest models to return
 
         Returns:
             A dictionary with cost estimates
         """
         try:
-            # Estimate input tokens
+            # Estimate tokens
             input_tokens = self.estimate_tokens(prompt)
-            
-            # Estimate output tokens
-            if expected_output_length:
-                output_tokens = self.estimate_tokens(expected_output_length)
-            else:
-                # Default: output is roughly 1.5x the input for most tasks
-                output_tokens = int(input_tokens * 1.5)
-            
-            # Get models to estimate cost for
-            if model_ids:
-                models = [self.llm_selector.get_model(model_id) for model_id in model_ids if self.llm_selector.get_model(model_id)]
-            else:
-                # Use all available models
-                models = self.llm_selector.list_models()
-            
-            # Calculate cost for each model
-            cost_estimates = []
-            for model in models:
-                input_cost = (input_tokens / 1_000_000) * model.input_cost
-                output_cost = (output_tokens / 1_000_000) * model.output_cost
-                total_cost = input_cost + output_cost
-                
-                cost_estimates.append({
-                    "model": model.id,
-                    "name": model.name,
-                    "provider": model.provider,
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "input_cost": input_cost,
-                    "output_cost": output_cost,
-                    "total_cost": total_cost,
-                })
-            
-            # Sort by total cost
-            cost_estimates.sort(key=lambda x: x["total_cost"])
-            
+            output_tokens = self._output_tokens(input_tokens, expected_output_length)
+
+            # Calculate cost for the requested models in one pass
+            matrix = self._get_price_matrix()
+            columns = matrix.select(model_ids)
+            costs = matrix.costs(input_tokens, output_tokens, columns)
+            cost_estimates = [
+                matrix.estimate(j, input_tokens, output_tokens, costs[n])
+                for n, j in matrix.cheapest(costs, columns, top_k)
+            ]
+
             # Analyze complexity
-            complexity = self.llm_selector.analyze_complexity(prompt)
-            recommended_model_id = self.llm_selector.select_model(complexity)
-            recommended_model = self.llm_selector.get_model(recommended_model_id)
-            
+            complexity = self._analyze_complexity(prompt)
+
             # Return results
             return {
                 "estimated_input_tokens": input_tokens,
                 "estimated_output_tokens": output_tokens,
                 "complexity": complexity,
-                "recommended_model": {
-                    "id": recommended_model.id,
-                    "name": recommended_model.name,
-                    "provider": recommended_model.provider,
-                },
+                "recommended_model": self._recommended_model(complexity),
                 "cost_estimates": cost_estimates,
             }
-        
+
         except Exception as e:
             logger.exception(f"Error estimating cost: {e}")
             return {
@@ -127,11 +283,64 @@ class TaskCostEstimator:
                 "cost_estimates": [],
             }
 
+    async def estimate_costs_batch(
+        self,
+        prompts: List[str],
+        model_ids: Optional[List[str]] = None,
+        expected_output_lengths: Optional[List[Optional[int]]] = None,
+        top_k: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """
+        Estimate the cost of processing many prompts with many models.
+
+        Token counts for all prompts are computed in one batch, and the cost of
+        every prompt x model pair is derived from the price matrix in a single
+        pass. Only the ``top_k`` cheapest models are returned per prompt.
+
+        Args:
+            prompts: The prompts to estimate cost for
+            model_ids: Optional list of model IDs to estimate cost for
+            expected_output_lengths: Optional expected output length in characters per prompt
+            top_k: Number of cheapest models to return per prompt
+
+        Returns:
+            A list of cost estimate dictionaries, in prompt order
+        """
+        if expected_output_lengths is not None and len(expected_output_lengths) != len(prompts):
+            raise ValueError("expected_output_lengths must have one entry per prompt")
+
+        input_tokens = self.estimate_tokens_batch(prompts)
+        output_tokens = [
+            self._output_tokens(tokens, expected_output_lengths[i] if expected_output_lengths else None)
+            for i, tokens in enumerate(input_tokens)
+        ]
+
+        matrix = self._get_price_matrix()
+        columns = matrix.select(model_ids)
+        cost_rows = matrix.cost_matrix(input_tokens, output_tokens, columns)
+
+        results = []
+        for i, prompt in enumerate(prompts):
+            costs = cost_rows[i]
+            complexity = self._analyze_complexity(prompt)
+            results.append({
+                "estimated_input_tokens": input_tokens[i],
+                "estimated_output_tokens": output_tokens[i],
+                "complexity": complexity,
+                "recommended_model": self._recommended_model(complexity),
+                "cost_estimates": [
+                    matrix.estimate(j, input_tokens[i], output_tokens[i], costs[n])
+                    for n, j in matrix.cheapest(costs, columns, top_k)
+                ],
+            })
+        return results
+
     async def generate_cost_report(
         self,
         prompt: str,
         model_ids: Optional[List[str]] = None,
         expected_output_length: Optional[int] = None,
+        estimates: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
         Generate a human-readable cost report.
@@ -140,13 +349,15 @@ class TaskCostEstimator:
             prompt: The prompt to estimate cost for
             model_ids: Optional list of model IDs to estimate cost for
             expected_output_length: Optional expected output length in characters
+            estimates: Optional result of ``estimate_cost`` to render instead of recomputing it
 
         Returns:
             A human-readable cost report
         """
         try:
             # Get cost estimates
-            estimates = await self.estimate_cost(prompt, model_ids, expected_output_length)
+            if estimates is None:
+                estimates = await self.estimate_cost(prompt, model_ids, expected_output_length)
             
             # Generate report
             report = "# Task Cost Estimation Report\n\n"
@@ -1,13 +1,22 @@
 """
 Template manager for the Prompt MCP Server.
+
+Templates are persisted incrementally: each template's content lives in its own
+``<id>.j2`` file, and template metadata lives in a compact ``templates.json``
+index.  Changes to the index are appended to ``templates.journal`` and folded
+back into the index once the journal grows past a threshold, so a single edit
+costs O(1) disk I/O instead of rewriting the whole library.
 """
 
+import bisect
 import json
 import logging
 import os
+import tempfile
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from promplate import Template as PromplateTemplate
 
@@ -17,6 +26,35 @@ from .config import settings
 # Create logger
 logger = logging.getLogger(__name__)
 
+INDEX_FILE = "templates.json"
+JOURNAL_FILE = "templates.journal"
+
+
+def _atomic_write(path: Path, data: str) -> None:
+    """
+    Write data to a file atomically.
+
+    The data is written to a temporary file in the same directory, flushed to
+    disk and then renamed over the target, so readers never see a partial file.
+
+    Args:
+        path: The target file path
+        data: The data to write
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class TemplateManager:
     """Template manager class."""
@@ -24,24 +62,74 @@ class TemplateManager:
     def __init__(self):
         """Initialize the template manager."""
         self.templates: Dict[str, Template] = {}
-        self.promplate_templates: Dict[str, PromplateTemplate] = {}
+        self.promplate_templates: "OrderedDict[str, PromplateTemplate]" = OrderedDict()
+        self.cache_size = settings.TEMPLATE_CACHE_SIZE
+        self.journal_compact_threshold = settings.TEMPLATE_JOURNAL_COMPACT_THRESHOLD
         self.templates_dir = Path(settings.TEMPLATES_DIRECTORY)
         self.templates_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.templates_dir / INDEX_FILE
+        self.journal_file = self.templates_dir / JOURNAL_FILE
+        self._journal_entries = 0
+        self._sorted_index: List[Tuple[str, str]] = []
         self._load_templates()
 
+    @staticmethod
+    def _sort_key(template: Template) -> Tuple[str, str]:
+        """Return the key used to order templates in the index."""
+        return (template.name.lower(), template.id)
+
+    @staticmethod
+    def _index_entry(template: Template) -> Dict[str, Any]:
+        """Return the index entry for a template (metadata without content)."""
+        return template.model_dump(mode="json", exclude={"content"})
+
+    def _read_content(self, template_id: str) -> Optional[str]:
+        """Read the content of a template from its ``.j2`` file."""
+        file_path = self.templates_dir / f"{template_id}.j2"
+        if not file_path.exists():
+            return None
+        with open(file_path, "r") as f:
+            return f.read()
+
     def _load_templates(self) -> None:
         """Load templates from the templates directory."""
         try:
-            # Load templates from JSON file if it exists
-            templates_file = self.templates_dir / "templates.json"
-            if templates_file.exists():
-                with open(templates_file, "r") as f:
-                    templates_data = json.load(f)
-                    for template_data in templates_data:
-                        template = Template(**template_data)
-                        self.templates[template.id] = template
-                        self.promplate_templates[template.id] = PromplateTemplate(template.content)
-            
+            entries: Dict[str, Dict[str, Any]] = {}
+
+            # Load the index; older indexes also embed the template content
+            if self.index_file.exists():
+                with open(self.index_file, "r") as f:
+                    for entry in json.load(f):
+                        entries[entry["id"]] = entry
+
+            # Replay the journal on top of the index
+            if self.journal_file.exists():
+                with open(self.journal_file, "r") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            # A torn trailing write from a crash; everything before it is intact
+                            logger.warning(f"Ignoring corrupt journal entry in {self.journal_file}")
+                            continue
+                        self._journal_entries += 1
+                        if record.get("op") == "put":
+                            entries[record["template"]["id"]] = record["template"]
+                        elif record.get("op") == "delete":
+                            entries.pop(record["id"], None)
+
+            for template_id, entry in entries.items():
+                if "content" not in entry:
+                    content = self._read_content(template_id)
+                    if content is None:
+                        logger.warning(f"Content file for template {template_id} is missing, skipping")
+                        continue
+                    entry = {**entry, "content": content}
+                self.templates[template_id] = Template(**entry)
+
             # Load templates from individual files
             for file_path in self.templates_dir.glob("*.j2"):
                 template_id = file_path.stem
@@ -54,33 +142,80 @@ class TemplateManager:
                             content=content,
                         )
                         self.templates[template.id] = template
-                        self.promplate_templates[template.id] = PromplateTemplate(content)
-            
+
+            self._sorted_index = sorted(self._sort_key(t) for t in self.templates.values())
+
             logger.info(f"Loaded {len(self.templates)} templates")
         except Exception as e:
             logger.exception(f"Error loading templates: {e}")
 
-    def _save_templates(self) -> None:
-        """Save templates to the templates directory."""
+    def _append_journal(self, record: Dict[str, Any]) -> None:
+        """
+        Append a record to the index journal and compact it if it grew too large.
+
+        Args:
+            record: The journal record
+        """
+        with open(self.journal_file, "a") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_entries += 1
+
+        if self._journal_entries >= self.journal_compact_threshold:
+            self._compact_index()
+
+    def _compact_index(self) -> None:
+        """Fold the journal into a fresh index file and truncate the journal."""
+        entries = [self._index_entry(self.templates[template_id]) for _, template_id in self._sorted_index]
+        _atomic_write(self.index_file, json.dumps(entries, separators=(",", ":")))
+        # The new index already contains every journaled change, so the journal can go
+        self.journal_file.unlink(missing_ok=True)
+        self._journal_entries = 0
+        logger.info(f"Compacted template index with {len(entries)} templates")
+
+    def _save_template(self, template: Template, content_changed: bool = True) -> None:
+        """
+        Persist a single template.
+
+        Args:
+            template: The template to persist
+            content_changed: Whether the ``.j2`` content file has to be rewritten
+        """
+        try:
+            if content_changed:
+                _atomic_write(self.templates_dir / f"{template.id}.j2", template.content)
+            self._append_journal({"op": "put", "template": self._index_entry(template)})
+        except Exception as e:
+            logger.exception(f"Error saving template {template.id}: {e}")
+
+    def _remove_template_files(self, template_id: str) -> None:
+        """
+        Remove a template from persistent storage.
+
+        Args:
+            template_id: The template ID
+        """
         try:
-            # Save templates to JSON file
-            templates_file = self.templates_dir / "templates.json"
-            with open(templates_file, "w") as f:
-                json.dump([template.model_dump() for template in self.templates.values()], f, indent=2)
-            
-            # Save templates to individual files
-            for template_id, template in self.templates.items():
-                file_path = self.templates_dir / f"{template_id}.j2"
-                with open(file_path, "w") as f:
-                    f.write(template.content)
-            
-            logger.info(f"Saved {len(self.templates)} templates")
+            # Remove the content first so a crash cannot resurrect the template from a stray file
+            (self.templates_dir / f"{template_id}.j2").unlink(missing_ok=True)
+            self._append_journal({"op": "delete", "id": template_id})
         except Exception as e:
-            logger.exception(f"Error saving templates: {e}")
+            logger.exception(f"Error deleting template {template_id}: {e}")
+
+    def _index_insert(self, template: Template) -> None:
+        """Insert a template into the sorted index."""
+        bisect.insort(self._sorted_index, self._sort_key(template))
+
+    def _index_remove(self, key: Tuple[str, str]) -> None:
+        """Remove a key from the sorted index."""
+        position = bisect.bisect_left(self._sorted_index, key)
+        if position < len(self._sorted_index) and self._sorted_index[position] == key:
+            del self._sorted_index[position]
 
     def list_templates(self, skip: int = 0, limit: int = 100) -> List[Template]:
         """
-        List all templates.
+        List templates ordered by name.
 
         Args:
             skip: Number of templates to skip
@@ -89,7 +224,7 @@ class TemplateManager:
         Returns:
             List of templates
         """
-        return list(self.templates.values())[skip:skip + limit]
+        return [self.templates[template_id] for _, template_id in self._sorted_index[skip:skip + limit]]
 
     def get_template(self, template_id: str) -> Optional[Template]:
         """
@@ -107,13 +242,29 @@ class TemplateManager:
         """
         Get a Promplate template by ID.
 
+        Templates are compiled on first use and kept in an LRU cache bounded by
+        ``TEMPLATE_CACHE_SIZE``.
+
         Args:
             template_id: The template ID
 
         Returns:
             The Promplate template if found, None otherwise
         """
-        return self.promplate_templates.get(template_id)
+        compiled = self.promplate_templates.get(template_id)
+        if compiled is not None:
+            self.promplate_templates.move_to_end(template_id)
+            return compiled
+
+        template = self.templates.get(template_id)
+        if not template:
+            return None
+
+        compiled = PromplateTemplate(template.content)
+        self.promplate_templates[template_id] = compiled
+        if len(self.promplate_templates) > self.cache_size:
+            self.promplate_templates.popitem(last=False)
+        return compiled
 
     def create_template(self, template_create: TemplateCreate) -> Template:
         """
@@ -137,10 +288,10 @@ class TemplateManager:
 
         # Add template
         self.templates[template.id] = template
-        self.promplate_templates[template.id] = PromplateTemplate(template.content)
+        self._index_insert(template)
 
-        # Save templates
-        self._save_templates()
+        # Save template
+        self._save_template(template)
 
         return template
 
@@ -160,25 +311,34 @@ class TemplateManager:
         if not template:
             return None
 
+        old_key = self._sort_key(template)
+        content_changed = False
+
         # Update template
         if template_update.name is not None:
             template.name = template_update.name
         if template_update.description is not None:
             template.description = template_update.description
         if template_update.content is not None:
+            content_changed = template_update.content != template.content
             template.content = template_update.content
-            self.promplate_templates[template.id] = PromplateTemplate(template.content)
+            self.promplate_templates.pop(template.id, None)
         if template_update.type is not None:
             template.type = template_update.type
         if template_update.metadata is not None:
             template.metadata = template_update.metadata
         if template_update.tags is not None:
             template.tags = template_update.tags
-        
+
         template.updated_at = datetime.utcnow()
 
-        # Save templates
-        self._save_templates()
+        new_key = self._sort_key(template)
+        if new_key != old_key:
+            self._index_remove(old_key)
+            self._index_insert(template)
+
+        # Save template
+        self._save_template(template, content_changed=content_changed)
 
         return template
 
@@ -193,15 +353,17 @@ class TemplateManager:
             True if the template was deleted, False otherwise
         """
         # Check if template exists
-        if template_id not in self.templates:
+        template = self.templates.get(template_id)
+        if not template:
             return False
 
         # Delete template
+        self._index_remove(self._sort_key(template))
         del self.templates[template_id]
-        del self.promplate_templates[template_id]
+        self.promplate_templates.pop(template_id, None)
 
-        # Save templates
-        self._save_templates()
+        # Remove template from storage
+        self._remove_template_files(template_id)
 
         return True
 
@@ -217,9 +379,9 @@ class TemplateManager:
             The rendered template
         """
         # Get template
-        template = self.promplate_templates.get(template_id)
+        template = self.get_promplate_template(template_id)
         if not template:
             raise ValueError(f"Template {template_id} not found")
 
         # Render template
-        return template.render(**context)
\ No newline at end of file
+        return template.render(context)
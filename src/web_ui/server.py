@@ -50,13 +50,15 @@ logger = logging.getLogger("dev-server-web-ui")
 class DevServerWebUI:
     """Web-UI für den Dev-Server."""
 
-    def __init__(self, config_path=None):
+    def __init__(self, config_path=None, orchestrator=None):
         """Initialisiert die Web-UI mit Konfiguration.
 
         Args:
             config_path: Pfad zur Konfigurationsdatei
+            orchestrator: Optionaler WorkflowOrchestrator, dessen Ausführungsereignisse gestreamt werden
         """
         self.config_path = config_path or Path.home() / ".dev-server-web-ui.json"
+        self.orchestrator = orchestrator
         self.services = {
             "n8n": {
                 "name": "n8n",
@@ -203,6 +205,77 @@ class DevServerWebUI:
                 logger.error(f"Fehler beim Löschen des Dienstes: {e}")
                 return web.json_response({"error": str(e)}, status=500)
         
+        # Ereignisse von Workflow-Ausführungen
+        def subscribe_events(request):
+            execution_id = request.match_info.get('id')
+            workflow_id = request.query.get('workflow_id')
+            return self.orchestrator.subscribe(execution_id=execution_id, workflow_id=workflow_id)
+
+        async def handle_execution_events(request):
+            """Streamt Ereignisse als Server-Sent Events.
+
+            Mit ?include_outputs=true werden auch die Ausgaben der Knoten gesendet.
+            """
+            try:
+                subscription = subscribe_events(request)
+            except Exception as e:
+                return web.json_response({"error": str(e)}, status=404)
+            include_outputs = request.query.get('include_outputs', '').lower() in ('1', 'true', 'yes')
+
+            response = web.StreamResponse(headers={
+                "Content-Type": "text/event-stream",
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no"
+            })
+            await response.prepare(request)
+
+            try:
+                async with subscription:
+                    while True:
+                        try:
+                            event = await subscription.next(timeout=15)
+                        except StopAsyncIteration:
+                            break
+                        if event is None:
+                            # Hält die Verbindung über Proxys hinweg offen
+                            await response.write(b": keepalive\n\n")
+                            continue
+                        data = json.dumps(event.to_dict(include_outputs), default=str)
+                        await response.write(
+                            f"id: {event.sequence}\nevent: {event.type}\ndata: {data}\n\n".encode("utf-8")
+                        )
+            except (ConnectionResetError, asyncio.CancelledError):
+                logger.info("Client hat den Ereignis-Stream geschlossen")
+                raise
+            return response
+
+        async def handle_execution_events_ws(request):
+            """Streamt Ereignisse über eine WebSocket-Verbindung."""
+            try:
+                subscription = subscribe_events(request)
+            except Exception as e:
+                return web.json_response({"error": str(e)}, status=404)
+            include_outputs = request.query.get('include_outputs', '').lower() in ('1', 'true', 'yes')
+
+            ws = web.WebSocketResponse(heartbeat=15)
+            await ws.prepare(request)
+
+            # Beendet das Abonnement, sobald der Client die Verbindung schließt
+            async def read_until_closed():
+                async for _ in ws:
+                    pass
+                subscription.close()
+
+            reader = asyncio.create_task(read_until_closed())
+            try:
+                async with subscription:
+                    async for event in subscription:
+                        await ws.send_json(event.to_dict(include_outputs), dumps=lambda d: json.dumps(d, default=str))
+            finally:
+                reader.cancel()
+                await ws.close()
+            return ws
+
         # Hauptseite
         async def handle_index(request):
             with open(Path(__file__).parent / 'static' / 'index.html', 'r') as f:
@@ -214,14 +287,22 @@ class DevServerWebUI:
             web.get('/api/services', handle_get_services),
             web.post('/api/services', handle_add_service),
             web.put('/api/services/{id}', handle_update_service),
-            web.delete('/api/services/{id}', handle_delete_service),
+            web.delete('/api/services/{id}', handle_delete_service)
+        ]
+        if self.orchestrator is not None:
+            api_routes += [
+                web.get('/api/workflows/events', handle_execution_events),
+                web.get('/api/workflows/events/ws', handle_execution_events_ws),
+                web.get('/api/workflows/executions/{id}/events', handle_execution_events),
+                web.get('/api/workflows/executions/{id}/events/ws', handle_execution_events_ws)
+            ]
+        api_routes += [
             web.get('/', handle_index),
             web.get('/{path:.*}', handle_index)  # Alle anderen Pfade zur Index-Seite umleiten
         ]
         
         for route in api_routes:
-            cors.add(route)
-            app.router.add_route(route.method, route.path, route.handler)
+            cors.add(app.router.add_route(route.method, route.path, route.handler))
         
         runner = web.AppRunner(app)
         await runner.setup()
@@ -232,6 +313,22 @@ class DevServerWebUI:
         
         return runner
 
+def load_orchestrator():
+    """Lädt den WorkflowOrchestrator, dessen Ausführungsereignisse die Web-UI streamt.
+
+    Returns:
+        Der globale Orchestrator oder None, wenn das Workflow-Paket nicht verfügbar ist
+    """
+    root = str(BASE_DIR.parent)
+    if root not in sys.path:
+        sys.path.append(root)
+    try:
+        from src.workflow.orchestrator import orchestrator
+    except ImportError as e:
+        logger.warning(f"Workflow-Orchestrator nicht verfügbar, Ausführungsereignisse sind deaktiviert: {e}")
+        return None
+    return orchestrator
+
 async def main():
     """Hauptfunktion zum Starten des Web-UI-Servers."""
     parser = argparse.ArgumentParser(description='Dev-Server Web UI')
@@ -241,11 +338,14 @@ async def main():
                         help='Host für den Web-Server')
     parser.add_argument('--port', type=int, default=int(os.environ.get('DEV_SERVER_WEB_UI_PORT', '8080')),
                         help='Port für den Web-Server')
+    parser.add_argument('--no-workflow-events', action='store_true',
+                        help='Ereignisse von Workflow-Ausführungen nicht streamen')
     
     args = parser.parse_args()
     
     # Erstelle und initialisiere den Server
-    server = DevServerWebUI(args.config)
+    orchestrator = None if args.no_workflow_events else load_orchestrator()
+    server = DevServerWebUI(args.config, orchestrator=orchestrator)
     runner = await server.start_server(args.host, args.port)
     
     # Halte den Server am Laufen
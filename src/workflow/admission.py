@@ -0,0 +1,386 @@
+"""
+Workflow Admission Control.
+
+This module limits how many workflow executions run at the same time. Executions
+beyond the global or per-workflow concurrency caps wait in a bounded priority
+queue; what happens when the queue is full depends on the admission policy.
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from src.core.error_handling import BaseError, ErrorCategory, ErrorSeverity
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Priority classes, lower values are admitted first
+PRIORITIES = {
+    "critical": 0,
+    "high": 1,
+    "normal": 2,
+    "low": 3,
+}
+DEFAULT_PRIORITY = "normal"
+
+# Admission policies
+POLICY_REJECT = "reject"  # Reject executions that cannot start immediately
+POLICY_QUEUE = "queue"    # Queue executions, reject new ones when the queue is full
+POLICY_SHED = "shed"      # Queue executions, drop the lowest-priority queued one when the queue is full
+POLICIES = (POLICY_REJECT, POLICY_QUEUE, POLICY_SHED)
+
+# Number of recent queue wait times kept per priority class for percentiles
+WAIT_SAMPLES = 1024
+
+
+class AdmissionRejectedError(BaseError):
+    """Error raised when a workflow execution is not admitted."""
+
+    def __init__(
+        self,
+        message: str,
+        workflow_id: Optional[str] = None,
+        reason: str = "rejected",
+        details: Optional[Dict[str, Any]] = None,
+        cause: Optional[Exception] = None
+    ):
+        super().__init__(
+            message=message,
+            category=ErrorCategory.RESOURCE,
+            severity=ErrorSeverity.WARNING,
+            code="ERR_ADMISSION_REJECTED",
+            details={"workflow_id": workflow_id, "reason": reason, **(details or {})},
+            cause=cause
+        )
+        self.workflow_id = workflow_id
+        self.reason = reason
+
+
+@dataclass(order=True)
+class _Ticket:
+    """A queued execution."""
+    priority: int
+    sequence: int
+    key: str = field(compare=False)
+    workflow_id: str = field(compare=False)
+    priority_class: str = field(compare=False)
+    limit: Optional[int] = field(compare=False)
+    start: Callable[[], None] = field(compare=False)
+    on_shed: Optional[Callable[[AdmissionRejectedError], None]] = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    active: bool = field(default=True, compare=False)
+
+
+class AdmissionController:
+    """Admits workflow executions within global and per-workflow concurrency caps."""
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        max_per_workflow: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        policy: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the admission controller.
+
+        Args:
+            max_concurrent: Maximum number of running executions. Defaults to the
+                WORKFLOW_MAX_CONCURRENT environment variable or 100.
+            max_per_workflow: Default maximum number of running executions per workflow.
+                Defaults to the WORKFLOW_MAX_PER_WORKFLOW environment variable, 0 means no limit.
+            max_queue_size: Maximum number of queued executions. Defaults to the
+                WORKFLOW_MAX_QUEUE_SIZE environment variable or 1000.
+            policy: Default admission policy. Defaults to the WORKFLOW_ADMISSION_POLICY
+                environment variable or "queue".
+            clock: Function returning the current time in seconds.
+        """
+        self.max_concurrent = max_concurrent or int(os.environ.get("WORKFLOW_MAX_CONCURRENT", 100))
+        if max_per_workflow is None:
+            max_per_workflow = int(os.environ.get("WORKFLOW_MAX_PER_WORKFLOW", 0))
+        self.max_per_workflow = max_per_workflow or None
+        self.max_queue_size = max_queue_size or int(os.environ.get("WORKFLOW_MAX_QUEUE_SIZE", 1000))
+        self.policy = self._check_policy(policy or os.environ.get("WORKFLOW_ADMISSION_POLICY", POLICY_QUEUE))
+        self._clock = clock
+
+        self._running = 0
+        self._running_by_workflow: Dict[str, int] = {}
+        self._queue: List[_Ticket] = []
+        self._tickets: Dict[str, _Ticket] = {}
+        self._sequence = itertools.count()
+
+        self._counters = {"admitted": 0, "queued": 0, "dispatched": 0, "rejected": 0, "shed": 0}
+        self._waits: Dict[str, Deque[float]] = {}
+        self._wait_totals: Dict[str, List[float]] = {}
+
+    @staticmethod
+    def _check_policy(policy: str) -> str:
+        """Check that an admission policy is known.
+
+        Args:
+            policy: The policy.
+
+        Returns:
+            The policy.
+
+        Raises:
+            ValueError: If the policy is unknown.
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown admission policy: {policy}")
+        return policy
+
+    @staticmethod
+    def get_priority_class(metadata: Optional[Dict[str, Any]]) -> str:
+        """Get the priority class from execution metadata.
+
+        Args:
+            metadata: Execution metadata, may contain a "priority" entry.
+
+        Returns:
+            The priority class, "normal" if missing or unknown.
+        """
+        priority = (metadata or {}).get("priority", DEFAULT_PRIORITY)
+        if priority not in PRIORITIES:
+            logger.warning(f"Unknown priority class: {priority}, using {DEFAULT_PRIORITY}")
+            return DEFAULT_PRIORITY
+        return priority
+
+    def _can_run(self, workflow_id: str, limit: Optional[int]) -> bool:
+        """Check if an execution of a workflow can start now.
+
+        Args:
+            workflow_id: ID of the workflow.
+            limit: Per-workflow concurrency cap.
+
+        Returns:
+            True if both the global and the per-workflow cap allow it.
+        """
+        if self._running >= self.max_concurrent:
+            return False
+        limit = limit or self.max_per_workflow
+        return not limit or self._running_by_workflow.get(workflow_id, 0) < limit
+
+    def _start(self, ticket: _Ticket) -> None:
+        """Mark an execution as running and start it.
+
+        Args:
+            ticket: The execution's ticket.
+        """
+        self._running += 1
+        self._running_by_workflow[ticket.workflow_id] = self._running_by_workflow.get(ticket.workflow_id, 0) + 1
+        ticket.start()
+
+    def _record_wait(self, priority_class: str, wait: float) -> None:
+        """Record the time an execution waited in the queue.
+
+        Args:
+            priority_class: Priority class of the execution.
+            wait: Wait time in seconds.
+        """
+        samples = self._waits.get(priority_class)
+        if samples is None:
+            samples = self._waits[priority_class] = deque(maxlen=WAIT_SAMPLES)
+            self._wait_totals[priority_class] = [0, 0.0, 0.0]
+        samples.append(wait)
+        totals = self._wait_totals[priority_class]
+        totals[0] += 1
+        totals[1] += wait
+        totals[2] = max(totals[2], wait)
+
+    def _find_shed_victim(self, priority: int) -> Optional[_Ticket]:
+        """Find the queued execution to drop for a new one.
+
+        Args:
+            priority: Priority of the new execution.
+
+        Returns:
+            The oldest queued execution of the lowest priority class, if it is not
+            more important than the new execution.
+        """
+        victim = None
+        for ticket in self._queue:
+            if not ticket.active:
+                continue
+            if victim is None or (ticket.priority, -ticket.sequence) > (victim.priority, -victim.sequence):
+                victim = ticket
+        if victim is None or victim.priority < priority:
+            return None
+        return victim
+
+    def submit(
+        self,
+        key: str,
+        workflow_id: str,
+        start: Callable[[], None],
+        priority_class: str = DEFAULT_PRIORITY,
+        limit: Optional[int] = None,
+        policy: Optional[str] = None,
+        on_shed: Optional[Callable[[AdmissionRejectedError], None]] = None,
+    ) -> bool:
+        """Submit an execution for admission.
+
+        Args:
+            key: ID of the execution.
+            workflow_id: ID of the workflow.
+            start: Function starting the execution once it is admitted.
+            priority_class: Priority class of the execution.
+            limit: Per-workflow concurrency cap, overriding the default.
+            policy: Admission policy, overriding the default.
+            on_shed: Function called if the execution is dropped from the queue.
+
+        Returns:
+            True if the execution started immediately, False if it was queued.
+
+        Raises:
+            AdmissionRejectedError: If the execution is not admitted.
+        """
+        policy = self._check_policy(policy or self.policy)
+        ticket = _Ticket(
+            priority=PRIORITIES[priority_class],
+            sequence=next(self._sequence),
+            key=key,
+            workflow_id=workflow_id,
+            priority_class=priority_class,
+            limit=limit,
+            start=start,
+            on_shed=on_shed,
+            enqueued_at=self._clock(),
+        )
+
+        # Queued executions are dispatched as soon as the caps allow, so if there is
+        # room now, everything still queued is blocked by its own workflow's cap
+        if self._can_run(workflow_id, limit):
+            self._counters["admitted"] += 1
+            self._record_wait(priority_class, 0.0)
+            self._start(ticket)
+            return True
+
+        if policy == POLICY_REJECT:
+            self._counters["rejected"] += 1
+            raise AdmissionRejectedError(
+                f"Workflow {workflow_id} is at its concurrency limit", workflow_id=workflow_id, reason="concurrency"
+            )
+
+        if len(self._tickets) >= self.max_queue_size:
+            victim = self._find_shed_victim(ticket.priority) if policy == POLICY_SHED else None
+            if victim is None:
+                self._counters["rejected"] += 1
+                raise AdmissionRejectedError(
+                    f"Admission queue is full ({self.max_queue_size} executions)",
+                    workflow_id=workflow_id,
+                    reason="queue_full",
+                )
+            self._shed(victim)
+
+        heapq.heappush(self._queue, ticket)
+        self._tickets[key] = ticket
+        self._counters["queued"] += 1
+        return False
+
+    def _shed(self, ticket: _Ticket) -> None:
+        """Drop a queued execution.
+
+        Args:
+            ticket: The execution's ticket.
+        """
+        ticket.active = False
+        del self._tickets[ticket.key]
+        self._counters["shed"] += 1
+        logger.warning(f"Shed queued workflow execution: {ticket.key} ({ticket.workflow_id})")
+
+        if ticket.on_shed:
+            ticket.on_shed(AdmissionRejectedError(
+                f"Execution {ticket.key} was shed from the admission queue",
+                workflow_id=ticket.workflow_id,
+                reason="shed",
+            ))
+
+    def discard(self, key: str) -> bool:
+        """Remove a queued execution, e.g. when it is canceled.
+
+        Args:
+            key: ID of the execution.
+
+        Returns:
+            True if the execution was queued.
+        """
+        ticket = self._tickets.pop(key, None)
+        if ticket is None:
+            return False
+        ticket.active = False
+        return True
+
+    def release(self, workflow_id: str) -> None:
+        """Mark a running execution as finished and start queued ones.
+
+        Args:
+            workflow_id: ID of the execution's workflow.
+        """
+        self._running -= 1
+        count = self._running_by_workflow.get(workflow_id, 0) - 1
+        if count > 0:
+            self._running_by_workflow[workflow_id] = count
+        else:
+            self._running_by_workflow.pop(workflow_id, None)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Start queued executions in priority order while the caps allow it."""
+        blocked = []
+        while self._queue and self._running < self.max_concurrent:
+            ticket = heapq.heappop(self._queue)
+            if not ticket.active:
+                continue
+            if not self._can_run(ticket.workflow_id, ticket.limit):
+                # The workflow is at its own cap, let other workflows go first
+                blocked.append(ticket)
+                continue
+
+            del self._tickets[ticket.key]
+            ticket.active = False
+            self._counters["dispatched"] += 1
+            self._record_wait(ticket.priority_class, self._clock() - ticket.enqueued_at)
+            try:
+                self._start(ticket)
+            except Exception as e:
+                logger.error(f"Failed to start queued workflow execution {ticket.key}: {e}")
+                self.release(ticket.workflow_id)
+
+        for ticket in blocked:
+            heapq.heappush(self._queue, ticket)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get admission metrics.
+
+        Returns:
+            Dictionary with running and queued executions, admission counters and
+            queue wait times per priority class.
+        """
+        wait_times = {}
+        for priority_class, samples in self._waits.items():
+            count, total, maximum = self._wait_totals[priority_class]
+            ordered = sorted(samples)
+            wait_times[priority_class] = {
+                "count": count,
+                "mean": total / count if count else 0.0,
+                "max": maximum,
+                "p50": ordered[len(ordered) // 2] if ordered else 0.0,
+                "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0,
+            }
+
+        return {
+            "running": self._running,
+            "running_by_workflow": dict(self._running_by_workflow),
+            "queue_depth": len(self._tickets),
+            "max_concurrent": self.max_concurrent,
+            "max_queue_size": self.max_queue_size,
+            **self._counters,
+            "queue_wait_seconds": wait_times,
+        }
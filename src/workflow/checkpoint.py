@@ -0,0 +1,486 @@
+"""
+Workflow Execution Checkpoints.
+
+This module stores workflow executions in a local SQLite database, so that they
+can be resumed after a restart. Every settled node is checkpointed with its
+outputs, unless they would not be restored unchanged from JSON; node inputs are
+not stored, since they are resolved again from the outputs of earlier nodes.
+
+The store also memoises the outputs of deterministic nodes by a hash of their
+inputs, so that they can be reused by later executions.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Version of the database schema
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS executions (
+    id TEXT PRIMARY KEY,
+    workflow_id TEXT NOT NULL,
+    workflow_version TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    completed_at REAL,
+    inputs BLOB,
+    outputs BLOB,
+    error BLOB,
+    metadata BLOB
+);
+CREATE INDEX IF NOT EXISTS executions_status ON executions (status);
+CREATE TABLE IF NOT EXISTS nodes (
+    execution_id TEXT NOT NULL,
+    node_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at REAL,
+    completed_at REAL,
+    retry_count INTEGER NOT NULL,
+    outputs BLOB,
+    error BLOB,
+    metadata BLOB,
+    PRIMARY KEY (execution_id, node_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS memo (
+    key TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    outputs BLOB
+) WITHOUT ROWID;
+"""
+
+# Statuses of executions that have not finished yet
+UNFINISHED_STATUSES = ("pending", "running", "paused")
+
+# Encoded values start with a marker telling how they are encoded
+_JSON = b"j"
+_ZLIB = b"z"
+
+# Values larger than this are compressed
+COMPRESS_THRESHOLD = 1024
+
+
+def encode(value: Any) -> Optional[bytes]:
+    """Encode a value compactly.
+
+    Values are encoded as JSON without whitespace, and compressed if they are
+    large. Values that JSON does not support are stored as strings.
+
+    Args:
+        value: The value to encode.
+
+    Returns:
+        The encoded value, or None if the value is None.
+    """
+    return _pack(_dumps(value))
+
+
+def _dumps(value: Any) -> Optional[bytes]:
+    """Serialise a value as compact JSON.
+
+    Args:
+        value: The value.
+
+    Returns:
+        The JSON, or None if the value is None.
+    """
+    if value is None:
+        return None
+    return json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _dumps_exact(value: Any) -> Optional[bytes]:
+    """Serialise a value as compact JSON that decodes to an equal value.
+
+    Node outputs are restored from checkpoints and memos in place of running the
+    node, so they must come back with the same types, e.g. not datetimes as
+    strings, tuples as lists or integer keys as strings.
+
+    Args:
+        value: The value.
+
+    Returns:
+        The JSON, or None if the value is None.
+
+    Raises:
+        ValueError: If the value does not survive a round trip through JSON.
+    """
+    if value is None:
+        return None
+    try:
+        data = json.dumps(value, separators=(",", ":")).encode("utf-8")
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Value is not JSON serialisable: {e}") from e
+    if json.loads(data) != value:
+        raise ValueError("Value changes in a round trip through JSON")
+    return data
+
+
+def _pack(data: Optional[bytes]) -> Optional[bytes]:
+    """Add the encoding marker to serialised JSON, compressing it if it is large.
+
+    Args:
+        data: The JSON.
+
+    Returns:
+        The encoded value.
+    """
+    if data is None:
+        return None
+    if len(data) >= COMPRESS_THRESHOLD:
+        # The fastest level already shrinks typical JSON several times
+        compressed = zlib.compress(data, 1)
+        if len(compressed) < len(data):
+            return _ZLIB + compressed
+    return _JSON + data
+
+
+def decode(data: Optional[bytes]) -> Any:
+    """Decode a value encoded with encode().
+
+    Args:
+        data: The encoded value.
+
+    Returns:
+        The value.
+    """
+    if data is None:
+        return None
+    data = bytes(data)
+    if data[:1] == _ZLIB:
+        return json.loads(zlib.decompress(data[1:]))
+    return json.loads(data[1:])
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    """Convert a datetime to a POSIX timestamp."""
+    return value.timestamp() if value is not None else None
+
+
+def _datetime(value: Optional[float]) -> Optional[datetime]:
+    """Convert a POSIX timestamp to a datetime."""
+    return datetime.fromtimestamp(value) if value is not None else None
+
+
+class CheckpointStore:
+    """SQLite store for workflow execution checkpoints.
+
+    Writes are queued to a background thread in the order they are made, so
+    they neither block the event loop nor reach the database out of order. A
+    node checkpoint is therefore never stored before the checkpoints of the
+    nodes it depends on.
+
+    The rows are serialised when a write is queued, so changes made to an
+    execution afterwards do not leak into the checkpoint, and the background
+    thread never reads objects owned by the event loop.
+    """
+
+    def __init__(self, db_file: Path):
+        """Initialize the checkpoint store.
+
+        Args:
+            db_file: Path to the database file.
+        """
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(str(self.db_file), check_same_thread=False, isolation_level=None)
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="workflow-checkpoint")
+
+        # WAL makes writes crash-safe without syncing the whole file on every commit
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._connection.execute(
+            "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),)
+        )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run writes in a transaction.
+
+        Yields:
+            The database connection.
+        """
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def defer(self, function: Callable[..., Any], *args: Any) -> Future:
+        """Queue a write to run in the background.
+
+        Failed writes are logged, they do not fail the execution.
+
+        Args:
+            function: The write, e.g. prune.
+            *args: Arguments of the write.
+
+        Returns:
+            Future of the write.
+        """
+        future = self._writer.submit(function, *args)
+        future.add_done_callback(self._log_failure)
+        return future
+
+    async def call(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Run a read or write without blocking the event loop.
+
+        The call runs after all queued writes.
+
+        Args:
+            function: The function, e.g. get_memo.
+            *args: Arguments of the function.
+
+        Returns:
+            Result of the function.
+        """
+        return await asyncio.wrap_future(self._writer.submit(function, *args))
+
+    @staticmethod
+    def _log_failure(future: Future) -> None:
+        """Log a failed background write.
+
+        Args:
+            future: Future of the write.
+        """
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Failed to write workflow checkpoint: {future.exception()}")
+
+    def save_execution(self, execution: Any, workflow_version: str) -> Future:
+        """Queue a checkpoint of the state of an execution, without its nodes.
+
+        Args:
+            execution: The workflow execution.
+            workflow_version: Version of the executed workflow.
+
+        Returns:
+            Future of the write.
+        """
+        row = (
+            execution.id,
+            execution.workflow_id,
+            workflow_version,
+            execution.status.value,
+            _timestamp(execution.created_at),
+            _timestamp(execution.started_at),
+            _timestamp(execution.completed_at),
+            _dumps(execution.inputs),
+            _dumps(execution.outputs or None),
+            _dumps(execution.error),
+            _dumps(execution.metadata or None),
+        )
+        return self.defer(self._write_execution, row)
+
+    def _write_execution(self, row: tuple) -> None:
+        """Store the row of an execution.
+
+        Args:
+            row: Row built by save_execution.
+        """
+        execution_id, status = row[0], row[3]
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO executions (id, workflow_id, workflow_version, status, created_at, "
+                "started_at, completed_at, inputs, outputs, error, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row[:7] + tuple(_pack(data) for data in row[7:]),
+            )
+            # Finished executions are not resumed, so their nodes are not needed anymore
+            if status not in UNFINISHED_STATUSES:
+                connection.execute("DELETE FROM nodes WHERE execution_id = ?", (execution_id,))
+
+    def save_node(self, execution_id: str, node_execution: Any) -> Optional[Future]:
+        """Queue a checkpoint of a settled node.
+
+        Nodes whose outputs do not round-trip through JSON are not checkpointed,
+        so they run again when the execution is resumed.
+
+        Args:
+            execution_id: ID of the execution.
+            node_execution: The node execution.
+
+        Returns:
+            Future of the write, or None if the node is not checkpointed.
+        """
+        try:
+            outputs = _dumps_exact(node_execution.outputs or None)
+        except ValueError as e:
+            logger.debug(f"Not checkpointing node {node_execution.node_id} of execution {execution_id}: {e}")
+            return None
+        row = (
+            execution_id,
+            node_execution.node_id,
+            node_execution.status.value,
+            _timestamp(node_execution.started_at),
+            _timestamp(node_execution.completed_at),
+            node_execution.retry_count,
+            outputs,
+            _dumps(node_execution.error),
+            _dumps(node_execution.metadata or None),
+        )
+        return self.defer(self._write_node, row)
+
+    def _write_node(self, row: tuple) -> None:
+        """Store the row of a node.
+
+        Args:
+            row: Row built by save_node.
+        """
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO nodes (execution_id, node_id, status, started_at, completed_at, "
+                "retry_count, outputs, error, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row[:6] + tuple(_pack(data) for data in row[6:]),
+            )
+
+    def load_unfinished(self) -> List[Tuple[str, dict]]:
+        """Load the executions that have not finished.
+
+        Returns:
+            Pairs of the workflow version and the execution as a dictionary
+            in the format of WorkflowExecution.to_dict().
+        """
+        placeholders = ", ".join("?" for _ in UNFINISHED_STATUSES)
+        with self._lock:
+            executions = self._connection.execute(
+                f"SELECT id, workflow_id, workflow_version, status, created_at, started_at, completed_at, "
+                f"inputs, outputs, error, metadata FROM executions WHERE status IN ({placeholders}) "
+                f"ORDER BY created_at",
+                UNFINISHED_STATUSES,
+            ).fetchall()
+            nodes = self._connection.execute(
+                f"SELECT execution_id, node_id, status, started_at, completed_at, retry_count, outputs, error, "
+                f"metadata FROM nodes WHERE execution_id IN "
+                f"(SELECT id FROM executions WHERE status IN ({placeholders}))",
+                UNFINISHED_STATUSES,
+            ).fetchall()
+
+        node_executions = {}
+        for execution_id, node_id, status, started_at, completed_at, retry_count, outputs, error, metadata in nodes:
+            node_executions.setdefault(execution_id, {})[node_id] = {
+                "node_id": node_id,
+                "status": status,
+                "started_at": _datetime(started_at),
+                "completed_at": _datetime(completed_at),
+                "outputs": decode(outputs) or {},
+                "error": decode(error),
+                "retry_count": retry_count,
+                "metadata": decode(metadata) or {},
+            }
+
+        result = []
+        for (execution_id, workflow_id, workflow_version, status, created_at, started_at, completed_at,
+             inputs, outputs, error, metadata) in executions:
+            result.append((workflow_version, {
+                "id": execution_id,
+                "workflow_id": workflow_id,
+                "status": status,
+                "created_at": _datetime(created_at),
+                "started_at": _datetime(started_at),
+                "completed_at": _datetime(completed_at),
+                "inputs": decode(inputs) or {},
+                "outputs": decode(outputs) or {},
+                "node_executions": node_executions.get(execution_id, {}),
+                "error": decode(error),
+                "metadata": decode(metadata) or {},
+            }))
+        return result
+
+    def get_memo(self, key: str, max_age: Optional[float] = None) -> Optional[dict]:
+        """Get memoised node outputs.
+
+        Args:
+            key: Hash of the node and its inputs.
+            max_age: Maximum age of the outputs in seconds.
+
+        Returns:
+            The outputs, or None if none are stored.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT created_at, outputs FROM memo WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or (max_age is not None and time.time() - row[0] > max_age):
+            return None
+        return decode(row[1]) or {}
+
+    def put_memo(self, key: str, outputs: dict) -> Optional[Future]:
+        """Queue memoising node outputs.
+
+        Outputs that do not round-trip through JSON are not memoised.
+
+        Args:
+            key: Hash of the node and its inputs.
+            outputs: The outputs.
+
+        Returns:
+            Future of the write, or None if the outputs are not memoised.
+        """
+        try:
+            data = _dumps_exact(outputs or None)
+        except ValueError as e:
+            logger.debug(f"Not memoising node outputs: {e}")
+            return None
+        return self.defer(self._write_memo, key, time.time(), data)
+
+    def _write_memo(self, key: str, created_at: float, outputs: Optional[bytes]) -> None:
+        """Store memoised node outputs.
+
+        Args:
+            key: Hash of the node and its inputs.
+            created_at: Time the outputs were memoised.
+            outputs: The serialised outputs.
+        """
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO memo (key, created_at, outputs) VALUES (?, ?, ?)",
+                (key, created_at, _pack(outputs)),
+            )
+
+    def prune(self, before: datetime) -> int:
+        """Delete finished executions and memoised outputs older than a point in time.
+
+        Args:
+            before: Delete what was completed or memoised before this time.
+
+        Returns:
+            Number of deleted executions.
+        """
+        placeholders = ", ".join("?" for _ in UNFINISHED_STATUSES)
+        with self._transaction() as connection:
+            deleted = connection.execute(
+                f"DELETE FROM executions WHERE status NOT IN ({placeholders}) AND completed_at < ?",
+                (*UNFINISHED_STATUSES, before.timestamp()),
+            ).rowcount
+            connection.execute("DELETE FROM memo WHERE created_at < ?", (before.timestamp(),))
+        return deleted
+
+    def close(self) -> None:
+        """Wait for queued writes and close the database connection."""
+        self._writer.shutdown(wait=True)
+        with self._lock:
+            self._connection.close()
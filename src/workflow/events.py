@@ -0,0 +1,308 @@
+"""
+Workflow Execution Events.
+
+This module streams what happens during workflow executions to subscribers.
+Events are small deltas describing a single change, e.g. a node that started or
+completed, instead of full execution snapshots.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Event types
+WORKFLOW_QUEUED = "workflow_queued"
+WORKFLOW_STARTED = "workflow_started"
+WORKFLOW_COMPLETED = "workflow_completed"
+WORKFLOW_FAILED = "workflow_failed"
+WORKFLOW_CANCELED = "workflow_canceled"
+NODE_STARTED = "node_started"
+NODE_COMPLETED = "node_completed"
+NODE_FAILED = "node_failed"
+NODE_SKIPPED = "node_skipped"
+NODE_RETRY = "node_retry"
+
+# Sent first to subscribers of a single execution
+SNAPSHOT = "snapshot"
+# Sent when a subscriber fell behind and events were dropped
+RESYNC = "resync"
+
+# Events after which an execution does not change anymore
+TERMINAL_EVENTS = frozenset({WORKFLOW_COMPLETED, WORKFLOW_FAILED, WORKFLOW_CANCELED})
+
+# Wakes up a subscriber waiting for events when its subscription is closed
+_CLOSED = object()
+
+
+@dataclass
+class ExecutionEvent:
+    """A change in a workflow execution."""
+    sequence: int
+    type: str
+    execution_id: str
+    workflow_id: str
+    node_id: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+    data: Dict[str, Any] = field(default_factory=dict)
+    outputs: Optional[Dict[str, Any]] = None
+
+    def to_dict(self, include_outputs: bool = False) -> Dict[str, Any]:
+        """Convert the event to a dictionary.
+
+        Args:
+            include_outputs: Whether to include node or workflow outputs.
+
+        Returns:
+            Dictionary representation of the event.
+        """
+        result = {
+            "sequence": self.sequence,
+            "type": self.type,
+            "execution_id": self.execution_id,
+            "workflow_id": self.workflow_id,
+            "timestamp": self.timestamp,
+            **self.data,
+        }
+        if self.node_id is not None:
+            result["node_id"] = self.node_id
+        if include_outputs and self.outputs is not None:
+            result["outputs"] = self.outputs
+        return result
+
+
+class EventSubscription:
+    """A subscriber's stream of execution events.
+
+    Use it as an async iterator, ideally within ``async with``::
+
+        async with orchestrator.events.subscribe(execution_id=execution_id) as events:
+            async for event in events:
+                ...
+    """
+
+    def __init__(
+        self,
+        bus: "ExecutionEventBus",
+        execution_id: Optional[str],
+        workflow_id: Optional[str],
+        max_queue_size: int,
+    ):
+        """Initialize the subscription.
+
+        Args:
+            bus: The event bus.
+            execution_id: Only receive events of this execution.
+            workflow_id: Only receive events of executions of this workflow.
+            max_queue_size: Maximum number of undelivered events.
+        """
+        self.bus = bus
+        self.execution_id = execution_id
+        self.workflow_id = workflow_id
+        self.dropped = 0
+        self._queue: asyncio.Queue = asyncio.Queue(max_queue_size)
+        self._closed = False
+
+    def matches(self, event: ExecutionEvent) -> bool:
+        """Check if an event is relevant to this subscriber.
+
+        Args:
+            event: The event.
+
+        Returns:
+            True if the subscriber should receive the event.
+        """
+        if self.execution_id is not None and event.execution_id != self.execution_id:
+            return False
+        if self.workflow_id is not None and event.workflow_id != self.workflow_id:
+            return False
+        return True
+
+    def put(self, event: ExecutionEvent) -> None:
+        """Deliver an event without blocking.
+
+        If the subscriber fell behind, the undelivered events are dropped and
+        replaced by a resync event, after which the subscriber should fetch the
+        execution state again.
+
+        Args:
+            event: The event.
+        """
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Count the new event and the queued ones, including earlier resyncs
+            dropped = 1
+            while not self._queue.empty():
+                queued = self._queue.get_nowait()
+                if queued.type == RESYNC:
+                    dropped += queued.data["dropped"]
+                    self.dropped -= queued.data["dropped"]
+                else:
+                    dropped += 1
+            self.dropped += dropped
+            self._queue.put_nowait(ExecutionEvent(
+                sequence=event.sequence,
+                type=RESYNC,
+                execution_id=event.execution_id if self.execution_id else "",
+                workflow_id=event.workflow_id if self.workflow_id else "",
+                data={"dropped": dropped},
+            ))
+            if self.execution_id is not None and event.type in TERMINAL_EVENTS:
+                # The resync is the last event of this execution
+                self.close()
+
+    async def next(self, timeout: Optional[float] = None) -> Optional[ExecutionEvent]:
+        """Wait for the next event.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            The next event, or None if the timeout expired.
+
+        Raises:
+            StopAsyncIteration: If the subscription ended.
+        """
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        try:
+            event = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if event is _CLOSED:
+            raise StopAsyncIteration
+
+        # A subscription to one execution ends with its last event
+        if self.execution_id is not None and event.type in TERMINAL_EVENTS:
+            self.close()
+        return event
+
+    def __aiter__(self) -> "EventSubscription":
+        return self
+
+    async def __anext__(self) -> ExecutionEvent:
+        return await self.next()
+
+    async def __aenter__(self) -> "EventSubscription":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        if not self._closed:
+            self._closed = True
+            self.bus._unsubscribe(self)
+            try:
+                self._queue.put_nowait(_CLOSED)
+            except asyncio.QueueFull:
+                pass
+
+
+class ExecutionEventBus:
+    """Publishes execution events to subscribers."""
+
+    def __init__(self, max_queue_size: int = 1000):
+        """Initialize the event bus.
+
+        Args:
+            max_queue_size: Default maximum number of undelivered events per subscriber.
+        """
+        self.max_queue_size = max_queue_size
+        self._subscribers: List[EventSubscription] = []
+        self._sequence = itertools.count(1)
+
+    @property
+    def active(self) -> bool:
+        """Whether anyone is subscribed."""
+        return bool(self._subscribers)
+
+    def subscribe(
+        self,
+        execution_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        snapshot: Optional[Dict[str, Any]] = None,
+        max_queue_size: Optional[int] = None,
+    ) -> EventSubscription:
+        """Subscribe to execution events.
+
+        Args:
+            execution_id: Only receive events of this execution.
+            workflow_id: Only receive events of executions of this workflow.
+            snapshot: Current state of the execution, delivered as the first event.
+            max_queue_size: Maximum number of undelivered events.
+
+        Returns:
+            The subscription.
+        """
+        subscription = EventSubscription(
+            self, execution_id, workflow_id, max_queue_size or self.max_queue_size
+        )
+        if snapshot is not None:
+            subscription.put(ExecutionEvent(
+                sequence=next(self._sequence),
+                type=SNAPSHOT,
+                execution_id=execution_id or "",
+                workflow_id=snapshot.get("workflow_id", workflow_id or ""),
+                data=snapshot,
+            ))
+            if snapshot.get("status") in ("completed", "failed", "canceled"):
+                # Nothing will happen anymore
+                subscription.close()
+                return subscription
+
+        self._subscribers.append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: EventSubscription) -> None:
+        """Remove a subscription.
+
+        Args:
+            subscription: The subscription.
+        """
+        try:
+            self._subscribers.remove(subscription)
+        except ValueError:
+            pass
+
+    def publish(
+        self,
+        type: str,
+        execution_id: str,
+        workflow_id: str,
+        node_id: Optional[str] = None,
+        outputs: Optional[Dict[str, Any]] = None,
+        **data: Any,
+    ) -> None:
+        """Publish an event.
+
+        Args:
+            type: Type of the event.
+            execution_id: ID of the execution.
+            workflow_id: ID of the workflow.
+            node_id: ID of the node, for node events.
+            outputs: Node or workflow outputs, only sent to subscribers asking for them.
+            **data: Changed fields.
+        """
+        if not self._subscribers:
+            return
+
+        event = ExecutionEvent(
+            sequence=next(self._sequence),
+            type=type,
+            execution_id=execution_id,
+            workflow_id=workflow_id,
+            node_id=node_id,
+            data=data,
+            outputs=outputs,
+        )
+        for subscription in list(self._subscribers):
+            if subscription.matches(event):
+                subscription.put(event)
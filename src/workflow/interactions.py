@@ -36,6 +36,7 @@ class InteractionError(WorkflowError):
         workflow_id: Optional[str] = None,
         node_id: Optional[str] = None,
         interaction_id: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
         **kwargs
     ):
         super().__init__(
@@ -45,7 +46,7 @@ class InteractionError(WorkflowError):
             code="ERR_WORKFLOW_INTERACTION",
             details={
                 "interaction_id": interaction_id,
-                **kwargs.get("details", {})
+                **(details or {})
             },
             **kwargs
         )
@@ -6,10 +6,16 @@ complex workflows across multiple MCP servers.
 """
 
 import asyncio
+import functools
+import hashlib
+import heapq
 import json
 import logging
+import os
+import random
 import time
 import uuid
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -17,7 +23,13 @@ from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, cast
 
 from src.core.error_handling import BaseError, ErrorCategory, ErrorHandler
 from src.core.logging import get_logger
-from src.core.performance import async_cached, async_profiled, async_timed
+from src.core.performance import RetryBudget, TimerWheel, async_cached, async_profiled, async_timed
+from src.workflow import events
+from src.workflow.admission import AdmissionController, AdmissionRejectedError
+from src.workflow.checkpoint import CheckpointStore
+from src.workflow.events import EventSubscription, ExecutionEventBus
+from src.workflow.python_worker import PythonWorkerPool
+from src.workflow.result_cache import NodeResultCache
 
 # Set up logging
 logger = get_logger(__name__)
@@ -49,16 +61,18 @@ class WorkflowError(BaseError):
         message: str,
         workflow_id: Optional[str] = None,
         node_id: Optional[str] = None,
+        code: str = "ERR_WORKFLOW",
+        details: Optional[Dict[str, Any]] = None,
         **kwargs
     ):
         super().__init__(
             message,
             category=ErrorCategory.WORKFLOW,
-            code="ERR_WORKFLOW",
+            code=code,
             details={
                 "workflow_id": workflow_id,
                 "node_id": node_id,
-                **kwargs.get("details", {})
+                **(details or {})
             },
             **kwargs
         )
@@ -79,11 +93,11 @@ class WorkflowNotFoundError(WorkflowError):
 
 class WorkflowExecutionNotFoundError(WorkflowError):
     """Error raised when a workflow execution is not found."""
-    def __init__(self, execution_id: str, **kwargs):
+    def __init__(self, execution_id: str, details: Optional[Dict[str, Any]] = None, **kwargs):
         super().__init__(
             f"Workflow execution with ID '{execution_id}' not found",
             code="ERR_WORKFLOW_EXECUTION_NOT_FOUND",
-            details={"execution_id": execution_id, **kwargs.get("details", {})},
+            details={"execution_id": execution_id, **(details or {})},
             **kwargs
         )
 
@@ -119,6 +133,7 @@ class WorkflowExecutionError(WorkflowError):
         workflow_id: Optional[str] = None,
         node_id: Optional[str] = None,
         execution_id: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
         **kwargs
     ):
         super().__init__(
@@ -128,7 +143,7 @@ class WorkflowExecutionError(WorkflowError):
             code="ERR_WORKFLOW_EXECUTION",
             details={
                 "execution_id": execution_id,
-                **kwargs.get("details", {})
+                **(details or {})
             },
             **kwargs
         )
@@ -294,15 +309,24 @@ class WorkflowDefinition:
 
         return errors
 
-    def _has_cycle(self) -> bool:
-        """Check if the workflow contains cycles."""
-        # Build adjacency list
+    def _get_adjacency_list(self) -> Dict[str, List[str]]:
+        """Get the nodes depending on each node, from edges and explicit dependencies."""
         adjacency_list = {node_id: [] for node_id in self.nodes}
         for edge in self.edges:
             source = edge.get("source")
             target = edge.get("target")
-            if source and target:
+            if source in adjacency_list and target in adjacency_list and target not in adjacency_list[source]:
                 adjacency_list[source].append(target)
+        for node_id, node in self.nodes.items():
+            for dep_id in node.dependencies:
+                if dep_id in adjacency_list and node_id not in adjacency_list[dep_id]:
+                    adjacency_list[dep_id].append(node_id)
+        return adjacency_list
+
+    def _has_cycle(self) -> bool:
+        """Check if the workflow contains cycles."""
+        # Build adjacency list
+        adjacency_list = self._get_adjacency_list()
 
         # DFS to detect cycles
         visited = set()
@@ -361,12 +385,7 @@ class WorkflowDefinition:
             List of node IDs in topological order.
         """
         # Build adjacency list
-        adjacency_list = {node_id: [] for node_id in self.nodes}
-        for edge in self.edges:
-            source = edge.get("source")
-            target = edge.get("target")
-            if source and target:
-                adjacency_list[source].append(target)
+        adjacency_list = self._get_adjacency_list()
 
         # Calculate in-degree of each node
         in_degree = {node_id: 0 for node_id in self.nodes}
@@ -509,6 +528,180 @@ class WorkflowExecution:
         )
 
 
+# Kinds of compiled input and output references
+_LITERAL = 0
+_WORKFLOW_INPUT = 1
+_NODE_OUTPUT = 2
+_CONTEXT = 3
+
+# A compiled reference: (name, kind, key, slot)
+Binding = Tuple[str, int, Any, int]
+
+# Statuses of nodes whose dependents may run
+_SETTLED_NODE_STATUSES = (NodeStatus.COMPLETED, NodeStatus.SKIPPED, NodeStatus.FAILED)
+
+
+def _compile_bindings(
+    specs: Dict[str, Any],
+    index: Dict[str, int],
+    workflow_inputs: bool = True,
+) -> Tuple[Binding, ...]:
+    """Compile input or output specs into bindings.
+
+    Args:
+        specs: Specs by name, e.g. "node.x.y", "workflow.inputs.z", "context.k" or literals.
+        index: Slot index of each node.
+        workflow_inputs: Whether "workflow.inputs." references are resolved.
+
+    Returns:
+        The compiled bindings. Specs that can never resolve are left out.
+    """
+    bindings = []
+    for name, spec in specs.items():
+        if not isinstance(spec, str):
+            bindings.append((name, _LITERAL, spec, -1))
+        elif workflow_inputs and spec.startswith("workflow.inputs."):
+            bindings.append((name, _WORKFLOW_INPUT, spec[len("workflow.inputs."):], -1))
+        elif spec.startswith("node."):
+            parts = spec.split(".")
+            if len(parts) >= 3 and parts[1] in index:
+                bindings.append((name, _NODE_OUTPUT, parts[2], index[parts[1]]))
+        elif spec.startswith("context."):
+            bindings.append((name, _CONTEXT, spec[len("context."):], -1))
+        else:
+            bindings.append((name, _LITERAL, spec, -1))
+    return tuple(bindings)
+
+
+@dataclass
+class ExecutionPlan:
+    """A workflow definition compiled for execution.
+
+    Node IDs are mapped to slot indices in topological order, input and output
+    references are parsed once, and conditions are compiled once.
+    """
+    workflow: WorkflowDefinition
+    version: str
+    order: Tuple[str, ...]
+    index: Dict[str, int]
+    dependencies: Tuple[Tuple[str, ...], ...]
+    dependency_slots: Tuple[Tuple[int, ...], ...]
+    dependents: Tuple[Tuple[int, ...], ...]
+    conditions: Tuple[Any, ...]
+    inputs: Tuple[Tuple[Binding, ...], ...]
+    outputs: Tuple[Binding, ...]
+
+    @classmethod
+    def compile(cls, workflow: WorkflowDefinition) -> "ExecutionPlan":
+        """Compile a workflow definition.
+
+        Args:
+            workflow: The workflow to compile.
+
+        Returns:
+            The execution plan.
+
+        Raises:
+            WorkflowValidationError: If the workflow contains cycles.
+        """
+        order = tuple(workflow.get_topological_order())
+        index = {node_id: slot for slot, node_id in enumerate(order)}
+
+        # Collect explicit and implicit dependencies in one pass over the edges
+        dependencies = {node_id: list(workflow.nodes[node_id].dependencies) for node_id in order}
+        for edge in workflow.edges:
+            source = edge.get("source")
+            target = edge.get("target")
+            if source and target in dependencies and source not in dependencies[target]:
+                dependencies[target].append(source)
+
+        # Link slots to the slots depending on them for scheduling
+        dependency_slots = tuple(
+            tuple(index[dep_id] for dep_id in dependencies[node_id] if dep_id in index)
+            for node_id in order
+        )
+        dependents: List[List[int]] = [[] for _ in order]
+        for slot, dep_slots in enumerate(dependency_slots):
+            for dep_slot in dep_slots:
+                dependents[dep_slot].append(slot)
+
+        conditions = []
+        for node_id in order:
+            condition = workflow.nodes[node_id].condition
+            if condition:
+                try:
+                    condition = compile(condition, f"<condition {node_id}>", "eval")
+                except SyntaxError:
+                    # Keep the source, evaluating it reports the error
+                    pass
+            conditions.append(condition)
+
+        return cls(
+            workflow=workflow,
+            version=workflow.version,
+            order=order,
+            index=index,
+            dependencies=tuple(tuple(dependencies[node_id]) for node_id in order),
+            dependency_slots=dependency_slots,
+            dependents=tuple(tuple(slots) for slots in dependents),
+            conditions=tuple(conditions),
+            inputs=tuple(_compile_bindings(workflow.nodes[node_id].inputs, index) for node_id in order),
+            outputs=_compile_bindings(workflow.outputs, index, workflow_inputs=False),
+        )
+
+
+class ExecutionContext(Mapping):
+    """Execution context of a workflow execution.
+
+    Node outputs are not copied into the context; "node_<id>_outputs" keys are
+    read from the execution's output slots.
+    """
+
+    __slots__ = ("values", "plan", "slots")
+
+    def __init__(
+        self,
+        values: Dict[str, Any],
+        plan: ExecutionPlan,
+        slots: List[Optional[Dict[str, Any]]],
+    ):
+        """Initialize the execution context.
+
+        Args:
+            values: Context values.
+            plan: The execution plan.
+            slots: Outputs of completed nodes by slot index.
+        """
+        self.values = values
+        self.plan = plan
+        self.slots = slots
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self.values[key]
+        except KeyError:
+            pass
+        if isinstance(key, str) and key.startswith("node_") and key.endswith("_outputs"):
+            slot = self.plan.index.get(key[len("node_"):-len("_outputs")])
+            if slot is not None and self.slots[slot] is not None:
+                return self.slots[slot]
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from self.values
+        for node_id, slot in self.plan.index.items():
+            if self.slots[slot] is not None:
+                yield f"node_{node_id}_outputs"
+
+    def __len__(self) -> int:
+        return len(self.values) + sum(1 for outputs in self.slots if outputs is not None)
+
+    def __reduce__(self):
+        # Pickle as a plain dictionary, e.g. for Python node workers
+        return dict, (dict(self),)
+
+
+
 class NodeExecutor:
     """Base class for node executors."""
 
@@ -549,16 +742,60 @@ class NodeExecutor:
         """
         return node.type == self.node_type
 
+    def is_cacheable(self, node: WorkflowNode, inputs: Dict[str, Any]) -> bool:
+        """Check if the outputs of a node opted into caching may be cached.
+
+        Args:
+            node: The node.
+            inputs: Resolved input values for the node.
+
+        Returns:
+            True if executing the node has no side effects that must happen
+            on every execution.
+        """
+        return True
+
+    def is_cacheable_result(self, node: WorkflowNode, outputs: Dict[str, Any]) -> bool:
+        """Check if the outputs of a node may be cached.
+
+        Args:
+            node: The node.
+            outputs: Output values from the node.
+
+        Returns:
+            True if the outputs may be reused by later executions.
+        """
+        return True
+
 
 class WorkflowOrchestrator:
     """Orchestrates workflow executions."""
 
-    def __init__(self):
-        """Initialize the workflow orchestrator."""
+    # Default jitter applied to retry delays, as a fraction of the delay
+    DEFAULT_RETRY_JITTER = 0.1
+
+    def __init__(self, checkpoints: Optional[CheckpointStore] = None):
+        """Initialize the workflow orchestrator.
+
+        Args:
+            checkpoints: Store to checkpoint executions to. Defaults to the
+                database named by the WORKFLOW_CHECKPOINT_DB environment
+                variable; executions are not checkpointed if it is not set.
+        """
+        if checkpoints is None and os.environ.get("WORKFLOW_CHECKPOINT_DB"):
+            checkpoints = CheckpointStore(os.environ["WORKFLOW_CHECKPOINT_DB"])
+        self.checkpoints = checkpoints
         self.workflows: Dict[str, WorkflowDefinition] = {}
         self.executions: Dict[str, WorkflowExecution] = {}
         self.node_executors: Dict[str, NodeExecutor] = {}
         self._execution_tasks: Dict[str, asyncio.Task] = {}
+        self._plans: Dict[str, ExecutionPlan] = {}
+        self.retry_wheel = TimerWheel()
+        self.admission = AdmissionController()
+        self.events = ExecutionEventBus()
+        self.result_cache = NodeResultCache()
+        self._retry_budgets: Dict[str, RetryBudget] = {}
+        self._retry_metrics: Dict[str, Dict[str, float]] = {}
 
     def register_workflow(self, workflow: WorkflowDefinition) -> None:
         """Register a workflow.
@@ -579,8 +816,96 @@ class WorkflowOrchestrator:
 
         # Register the workflow
         self.workflows[workflow.id] = workflow
+        self._plans[workflow.id] = ExecutionPlan.compile(workflow)
         logger.info(f"Registered workflow: {workflow.id} ({workflow.name})")
 
+    def _get_plan(self, workflow: WorkflowDefinition) -> ExecutionPlan:
+        """Get the execution plan of a workflow, compiling it if needed.
+
+        Args:
+            workflow: The workflow.
+
+        Returns:
+            The execution plan for the current version of the workflow.
+        """
+        plan = self._plans.get(workflow.id)
+        if plan is None or plan.workflow is not workflow or plan.version != workflow.version:
+            plan = self._plans[workflow.id] = ExecutionPlan.compile(workflow)
+        return plan
+
+    def _get_retry_budget(self, workflow: WorkflowDefinition) -> RetryBudget:
+        """Get the retry budget shared by all executions of a workflow.
+
+        The budget is configured by the "retry_budget" entry of the workflow
+        metadata with the keys "ratio", "min_per_second" and "capacity".
+
+        Args:
+            workflow: The workflow.
+
+        Returns:
+            The retry budget.
+        """
+        budget = self._retry_budgets.get(workflow.id)
+        if budget is None:
+            config = workflow.metadata.get("retry_budget", {})
+            budget = self._retry_budgets[workflow.id] = RetryBudget(
+                ratio=config.get("ratio", 0.2),
+                min_per_second=config.get("min_per_second", 1.0),
+                capacity=config.get("capacity", 20.0),
+            )
+        return budget
+
+    def _count_retry_metric(self, workflow_id: str, name: str, value: float = 1) -> None:
+        """Add to a retry metric of a workflow.
+
+        Args:
+            workflow_id: ID of the workflow.
+            name: Name of the metric.
+            value: Value to add.
+        """
+        metrics = self._retry_metrics.get(workflow_id)
+        if metrics is None:
+            metrics = self._retry_metrics[workflow_id] = {
+                "scheduled": 0,
+                "succeeded": 0,
+                "exhausted": 0,
+                "budget_exhausted": 0,
+                "delay_seconds": 0.0,
+            }
+        metrics[name] += value
+
+    def get_retry_metrics(self, workflow_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get retry metrics.
+
+        Args:
+            workflow_id: Optional workflow ID to filter by.
+
+        Returns:
+            Retry metrics and remaining retry budget by workflow ID, and the
+            number of retries currently waiting.
+        """
+        workflows = {}
+        for metrics_workflow_id, metrics in self._retry_metrics.items():
+            if workflow_id and metrics_workflow_id != workflow_id:
+                continue
+            budget = self._retry_budgets.get(metrics_workflow_id)
+            workflows[metrics_workflow_id] = {
+                **metrics,
+                "budget_tokens": budget.tokens if budget else None,
+            }
+        return {"workflows": workflows, "pending": len(self.retry_wheel)}
+
+    def get_result_cache_stats(self, workflow_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get node result cache statistics.
+
+        Args:
+            workflow_id: Optional workflow ID to filter by.
+
+        Returns:
+            Size of the cache, and hits, misses and hit rate by workflow and node ID.
+        """
+        return self.result_cache.get_stats(workflow_id)
+
     def register_node_executor(self, executor: NodeExecutor) -> None:
         """Register a node executor.
 
@@ -645,6 +970,7 @@ class WorkflowOrchestrator:
 
         Raises:
             WorkflowNotFoundError: If the workflow is not found.
+            AdmissionRejectedError: If the execution is not admitted.
         """
         # Get the workflow
         workflow = self.get_workflow(workflow_id)
@@ -662,12 +988,207 @@ class WorkflowOrchestrator:
         )
         self.executions[execution_id] = execution
 
-        # Start execution in background
+        # Start execution in background once it is admitted
+        try:
+            started = self._admit(workflow, execution)
+        except AdmissionRejectedError:
+            del self.executions[execution_id]
+            raise
+
+        self._checkpoint_execution(execution)
+        if started:
+            logger.info(f"Started workflow execution: {execution_id} ({workflow.name})")
+        else:
+            self._emit(events.WORKFLOW_QUEUED, execution, priority=self.admission.get_priority_class(execution.metadata))
+            logger.info(f"Queued workflow execution: {execution_id} ({workflow.name})")
+        return execution_id
+
+    def _admit(self, workflow: WorkflowDefinition, execution: WorkflowExecution) -> bool:
+        """Submit an execution to the admission controller.
+
+        The priority class is taken from the "priority" entry of the execution
+        metadata. The workflow metadata may set "max_concurrency" and
+        "admission_policy" to override the controller's defaults.
+
+        Args:
+            workflow: The workflow.
+            execution: The workflow execution.
+
+        Returns:
+            True if the execution started immediately, False if it was queued.
+
+        Raises:
+            AdmissionRejectedError: If the execution is not admitted.
+        """
+        return self.admission.submit(
+            execution.id,
+            workflow.id,
+            functools.partial(self._start_execution, execution),
+            priority_class=self.admission.get_priority_class(execution.metadata),
+            limit=workflow.metadata.get("max_concurrency"),
+            policy=workflow.metadata.get("admission_policy"),
+            on_shed=functools.partial(self._shed_execution, execution),
+        )
+
+    def _start_execution(self, execution: WorkflowExecution) -> None:
+        """Start an admitted execution in the background.
+
+        Args:
+            execution: The workflow execution.
+        """
         task = asyncio.create_task(self._execute_workflow(execution))
-        self._execution_tasks[execution_id] = task
+        # Release the admission slot when the task is done, also if it is canceled before it started
+        task.add_done_callback(lambda _: self.admission.release(execution.workflow_id))
+        self._execution_tasks[execution.id] = task
 
-        logger.info(f"Started workflow execution: {execution_id} ({workflow.name})")
-        return execution_id
+    def _shed_execution(self, execution: WorkflowExecution, error: AdmissionRejectedError) -> None:
+        """Mark a queued execution that was dropped by the admission controller.
+
+        Args:
+            execution: The workflow execution.
+            error: The reason the execution was dropped.
+        """
+        execution.status = WorkflowStatus.CANCELED
+        execution.completed_at = datetime.now()
+        execution.error = error.to_dict()
+        self._emit(events.WORKFLOW_CANCELED, execution, status=execution.status.value, error=execution.error)
+        self._checkpoint_execution(execution)
+
+    def _emit(
+        self,
+        type: str,
+        execution: WorkflowExecution,
+        node_id: Optional[str] = None,
+        outputs: Optional[Dict[str, Any]] = None,
+        **data: Any,
+    ) -> None:
+        """Publish an execution event.
+
+        Args:
+            type: Type of the event.
+            execution: The workflow execution.
+            node_id: ID of the node, for node events.
+            outputs: Node or workflow outputs.
+            **data: Changed fields.
+        """
+        self.events.publish(type, execution.id, execution.workflow_id, node_id, outputs, **data)
+
+    def subscribe(
+        self,
+        execution_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        max_queue_size: Optional[int] = None,
+    ) -> EventSubscription:
+        """Subscribe to execution events.
+
+        Subscribers to a single execution first receive a snapshot with the
+        execution's status and the status of each node, followed by deltas.
+        Their subscription ends with the execution.
+
+        Args:
+            execution_id: Only receive events of this execution.
+            workflow_id: Only receive events of executions of this workflow.
+            max_queue_size: Maximum number of undelivered events.
+
+        Returns:
+            The subscription, an async iterator of ExecutionEvent.
+
+        Raises:
+            WorkflowExecutionNotFoundError: If the execution is not found.
+        """
+        snapshot = None
+        if execution_id is not None:
+            execution = self.get_execution(execution_id)
+            snapshot = {
+                "workflow_id": execution.workflow_id,
+                "status": execution.status.value,
+                "nodes": {
+                    node_id: {"status": node_execution.status.value, "retry_count": node_execution.retry_count}
+                    for node_id, node_execution in execution.node_executions.items()
+                },
+            }
+        return self.events.subscribe(execution_id, workflow_id, snapshot, max_queue_size)
+
+    def _checkpoint_execution(self, execution: WorkflowExecution) -> None:
+        """Checkpoint the state of an execution in the background.
+
+        Args:
+            execution: The workflow execution.
+        """
+        if self.checkpoints is not None:
+            workflow = self.workflows.get(execution.workflow_id)
+            self.checkpoints.save_execution(execution, workflow.version if workflow else "")
+
+    def _checkpoint_node(self, execution: WorkflowExecution, node_execution: NodeExecution) -> None:
+        """Checkpoint a settled node in the background.
+
+        Args:
+            execution: The workflow execution.
+            node_execution: The node execution.
+        """
+        if self.checkpoints is not None:
+            self.checkpoints.save_node(execution.id, node_execution)
+
+    @staticmethod
+    def _get_result_key(node: WorkflowNode, inputs: Dict[str, Any]) -> str:
+        """Get the key of a node's cached or memoised outputs.
+
+        Args:
+            node: The node.
+            inputs: Resolved input values for the node.
+
+        Returns:
+            Hash of the node type, its configuration and its inputs.
+        """
+        data = json.dumps([node.type, node.config, inputs], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    async def recover_executions(self) -> List[str]:
+        """Resume the executions that were checkpointed but did not finish.
+
+        Call this on startup, after the workflows have been registered.
+        Executions continue from their last settled nodes; paused executions
+        stay paused until they are resumed.
+
+        Returns:
+            IDs of the recovered executions.
+        """
+        if self.checkpoints is None:
+            return []
+
+        recovered = []
+        for workflow_version, data in await self.checkpoints.call(self.checkpoints.load_unfinished):
+            if data["id"] in self.executions:
+                continue
+            workflow = self.workflows.get(data["workflow_id"])
+            if workflow is None:
+                logger.warning(f"Cannot recover execution {data['id']}: workflow {data['workflow_id']} is not registered")
+                continue
+
+            execution = WorkflowExecution.from_dict(data)
+            if workflow_version != workflow.version:
+                # The nodes may have changed, start over
+                logger.warning(
+                    f"Workflow {workflow.id} changed since execution {execution.id} was checkpointed, restarting it"
+                )
+                execution.node_executions = {}
+            self.executions[execution.id] = execution
+            recovered.append(execution.id)
+
+            if execution.status == WorkflowStatus.PAUSED:
+                continue
+            execution.status = WorkflowStatus.PENDING
+            try:
+                self._admit(workflow, execution)
+            except AdmissionRejectedError as e:
+                self._shed_execution(execution, e)
+                continue
+
+            logger.info(
+                f"Recovered workflow execution: {execution.id} ({workflow.name}), "
+                f"{len(execution.node_executions)} nodes already settled"
+            )
+        return recovered
 
     @async_timed
     async def _execute_workflow(self, execution: WorkflowExecution) -> None:
@@ -676,49 +1197,132 @@ class WorkflowOrchestrator:
         Args:
             execution: The workflow execution.
         """
+        retry_timers: Dict[int, List[Any]] = {}
         try:
-            # Get the workflow
+            # Get the workflow and its execution plan
             workflow = self.get_workflow(execution.workflow_id)
+            plan = self._get_plan(workflow)
 
             # Update execution status
             execution.status = WorkflowStatus.RUNNING
-            execution.started_at = datetime.now()
+            execution.started_at = execution.started_at or datetime.now()
+            self._emit(events.WORKFLOW_STARTED, execution, status=execution.status.value)
+            self._checkpoint_execution(execution)
 
-            # Initialize node executions
-            for node_id, node in workflow.nodes.items():
-                execution.node_executions[node_id] = NodeExecution(node_id=node_id)
-
-            # Get nodes in topological order
-            node_order = workflow.get_topological_order()
+            # Initialize node executions, keeping the nodes settled before a restart
+            for node_id in workflow.nodes:
+                node_execution = execution.node_executions.get(node_id)
+                if node_execution is None or node_execution.status not in _SETTLED_NODE_STATUSES:
+                    execution.node_executions[node_id] = NodeExecution(node_id=node_id)
 
             # Execute nodes in order
-            context = {
-                "workflow_id": workflow.id,
-                "execution_id": execution.id,
-                "inputs": execution.inputs,
-                "metadata": execution.metadata,
-            }
+            slots: List[Optional[Dict[str, Any]]] = [None] * len(plan.order)
+            context = ExecutionContext(
+                {
+                    "workflow_id": workflow.id,
+                    "execution_id": execution.id,
+                    "inputs": execution.inputs,
+                    "metadata": execution.metadata,
+                },
+                plan,
+                slots,
+            )
+
+            # Nodes become ready once all their dependencies are settled, ready
+            # nodes run in topological order
+            waiting = [len(dep_slots) for dep_slots in plan.dependency_slots]
+            ready = [slot for slot, count in enumerate(waiting) if count == 0]
+            heapq.heapify(ready)
+            retry_queue: asyncio.Queue = asyncio.Queue()
+            budget = self._get_retry_budget(workflow)
+
+            def settle(slot: int) -> None:
+                for dependent in plan.dependents[slot]:
+                    waiting[dependent] -= 1
+                    if waiting[dependent] == 0:
+                        heapq.heappush(ready, dependent)
+
+            def requeue(slot: int) -> None:
+                retry_timers.pop(slot, None)
+                retry_queue.put_nowait(slot)
+
+            while ready or retry_timers:
+                # Pick up nodes whose retry delay has passed
+                while not retry_queue.empty():
+                    heapq.heappush(ready, retry_queue.get_nowait())
+                if not ready:
+                    heapq.heappush(ready, await retry_queue.get())
+                    continue
 
-            for node_id in node_order:
+                slot = heapq.heappop(ready)
+                node_id = plan.order[slot]
                 node = workflow.nodes[node_id]
                 node_execution = execution.node_executions[node_id]
 
+                # Nodes settled before a restart are not executed again
+                if node_execution.status in _SETTLED_NODE_STATUSES:
+                    if node_execution.status == NodeStatus.COMPLETED:
+                        slots[slot] = node_execution.outputs
+                    settle(slot)
+                    continue
+
                 # Check if we should execute this node
                 if not await self._should_execute_node(node, execution, context):
                     node_execution.status = NodeStatus.SKIPPED
+                    self._emit(events.NODE_SKIPPED, execution, node_id, status=node_execution.status.value)
+                    self._checkpoint_node(execution, node_execution)
+                    settle(slot)
                     continue
 
                 # Get node inputs
                 node_inputs = await self._resolve_node_inputs(node, execution, context)
                 node_execution.inputs = node_inputs
 
+                # Reuse the outputs of deterministic nodes executed before with the same inputs,
+                # from the result cache or else from the memoised outputs in the checkpoint store
+                executor = self.node_executors.get(node.type)
+                use_cache = bool(node.metadata.get("cache")) and executor is not None and executor.is_cacheable(
+                    node, node_inputs
+                )
+                memoize = bool(node.metadata.get("memoize")) and self.checkpoints is not None
+                result_key = node_outputs = None
+                if use_cache or memoize:
+                    result_key = self._get_result_key(node, node_inputs)
+                if use_cache:
+                    node_outputs = self.result_cache.get(workflow.id, node_id, result_key)
+                    reused = "cache_hit"
+                if node_outputs is None and memoize:
+                    node_outputs = await self.checkpoints.call(
+                        self.checkpoints.get_memo, result_key, node.metadata.get("memoize_ttl")
+                    )
+                    reused = "memoized"
+                    if node_outputs is not None and use_cache:
+                        self.result_cache.put(result_key, node_outputs, node.metadata.get("cache_ttl"))
+                if node_outputs is not None:
+                    node_execution.outputs = node_outputs
+                    node_execution.status = NodeStatus.COMPLETED
+                    node_execution.started_at = node_execution.completed_at = datetime.now()
+                    node_execution.metadata[reused] = True
+                    self._emit(
+                        events.NODE_COMPLETED, execution, node_id, node_outputs,
+                        status=node_execution.status.value, duration=0.0, **{reused: True},
+                    )
+                    self._checkpoint_node(execution, node_execution)
+                    slots[slot] = node_outputs
+                    settle(slot)
+                    continue
+
                 # Execute the node
                 try:
                     node_execution.status = NodeStatus.RUNNING
                     node_execution.started_at = datetime.now()
+                    budget.deposit()
+                    self._emit(
+                        events.NODE_STARTED, execution, node_id,
+                        status=node_execution.status.value, retry_count=node_execution.retry_count,
+                    )
 
-                    # Get the node executor
-                    executor = self.node_executors.get(node.type)
+                    # Check the node executor
                     if not executor:
                         raise WorkflowExecutionError(
                             f"No executor found for node type: {node.type}",
@@ -732,9 +1336,22 @@ class WorkflowOrchestrator:
                     node_execution.outputs = node_outputs
                     node_execution.status = NodeStatus.COMPLETED
                     node_execution.completed_at = datetime.now()
-
-                    # Update context with node outputs
-                    context[f"node_{node_id}_outputs"] = node_outputs
+                    self._emit(
+                        events.NODE_COMPLETED, execution, node_id, node_outputs,
+                        status=node_execution.status.value,
+                        duration=(node_execution.completed_at - node_execution.started_at).total_seconds(),
+                    )
+                    self._checkpoint_node(execution, node_execution)
+                    if use_cache and executor.is_cacheable_result(node, node_outputs):
+                        self.result_cache.put(result_key, node_outputs, node.metadata.get("cache_ttl"))
+                    if memoize:
+                        self.checkpoints.put_memo(result_key, node_outputs)
+
+                    # Make the node outputs available to later nodes
+                    slots[slot] = node_outputs
+                    if node_execution.retry_count:
+                        self._count_retry_metric(workflow.id, "succeeded")
+                    settle(slot)
 
                 except Exception as e:
                     # Handle node execution error
@@ -744,7 +1361,14 @@ class WorkflowOrchestrator:
                     node_execution.error = error_dict
 
                     # Check if we should retry
-                    if await self._should_retry_node(node, node_execution):
+                    should_retry = await self._should_retry_node(node, node_execution)
+                    if should_retry and not budget.try_withdraw():
+                        should_retry = False
+                        node_execution.metadata["retry_budget_exhausted"] = True
+                        self._count_retry_metric(workflow.id, "budget_exhausted")
+                        logger.warning(f"Retry budget exhausted for workflow {workflow.id}, not retrying node {node_id}")
+
+                    if should_retry:
                         # Increment retry count
                         node_execution.retry_count += 1
                         node_execution.status = NodeStatus.PENDING
@@ -752,16 +1376,32 @@ class WorkflowOrchestrator:
                         node_execution.completed_at = None
                         node_execution.error = None
 
-                        # Wait for retry delay
+                        # Re-enqueue the node after the retry delay, other nodes continue meanwhile
                         retry_delay = self._get_retry_delay(node, node_execution)
+                        node_execution.metadata["retry_delay"] = retry_delay
+                        self._count_retry_metric(workflow.id, "scheduled")
+                        self._count_retry_metric(workflow.id, "delay_seconds", retry_delay)
+                        self._emit(
+                            events.NODE_RETRY, execution, node_id,
+                            status=node_execution.status.value, retry_count=node_execution.retry_count,
+                            delay=retry_delay, error=error_dict,
+                        )
                         if retry_delay > 0:
-                            await asyncio.sleep(retry_delay)
-
-                        # Retry the node
-                        node_id_index = node_order.index(node_id)
-                        node_order.insert(node_id_index + 1, node_id)
+                            retry_timers[slot] = self.retry_wheel.schedule(
+                                retry_delay, functools.partial(requeue, slot)
+                            )
+                        else:
+                            heapq.heappush(ready, slot)
                         continue
                     else:
+                        if node_execution.retry_count:
+                            self._count_retry_metric(workflow.id, "exhausted")
+                        self._emit(
+                            events.NODE_FAILED, execution, node_id,
+                            status=node_execution.status.value, retry_count=node_execution.retry_count,
+                            error=error_dict,
+                        )
+
                         # Node failed, check if workflow should fail
                         if node.metadata.get("critical", False):
                             raise WorkflowExecutionError(
@@ -771,11 +1411,21 @@ class WorkflowOrchestrator:
                                 execution_id=execution.id,
                                 cause=e,
                             )
+                        self._checkpoint_node(execution, node_execution)
+                        settle(slot)
+
+            # Nodes whose dependencies never settled, e.g. because of cyclic explicit dependencies
+            for node_id, node_execution in execution.node_executions.items():
+                if node_execution.status == NodeStatus.PENDING:
+                    node_execution.status = NodeStatus.SKIPPED
+                    self._emit(events.NODE_SKIPPED, execution, node_id, status=node_execution.status.value)
 
             # Resolve workflow outputs
             execution.outputs = await self._resolve_workflow_outputs(workflow, execution, context)
             execution.status = WorkflowStatus.COMPLETED
             execution.completed_at = datetime.now()
+            self._emit(events.WORKFLOW_COMPLETED, execution, outputs=execution.outputs, status=execution.status.value)
+            self._checkpoint_execution(execution)
 
             logger.info(f"Completed workflow execution: {execution.id} ({workflow.name})")
 
@@ -785,11 +1435,15 @@ class WorkflowOrchestrator:
             execution.status = WorkflowStatus.FAILED
             execution.completed_at = datetime.now()
             execution.error = error_dict
+            self._emit(events.WORKFLOW_FAILED, execution, status=execution.status.value, error=error_dict)
+            self._checkpoint_execution(execution)
 
             logger.error(f"Failed workflow execution: {execution.id} ({execution.workflow_id})")
 
         finally:
             # Clean up
+            for timer in retry_timers.values():
+                self.retry_wheel.cancel(timer)
             if execution.id in self._execution_tasks:
                 del self._execution_tasks[execution.id]
 
@@ -797,7 +1451,7 @@ class WorkflowOrchestrator:
         self,
         node: WorkflowNode,
         execution: WorkflowExecution,
-        context: Dict[str, Any],
+        context: ExecutionContext,
     ) -> bool:
         """Check if a node should be executed.
 
@@ -809,20 +1463,22 @@ class WorkflowOrchestrator:
         Returns:
             True if the node should be executed, False otherwise.
         """
+        plan = context.plan
+        slot = plan.index[node.id]
+
         # Check if the node has a condition
-        if node.condition:
+        condition = plan.conditions[slot]
+        if condition is not None:
             try:
                 # Evaluate the condition
-                condition_result = eval(node.condition, {"__builtins__": {}}, context)
+                condition_result = eval(condition, {"__builtins__": {}}, context)
                 return bool(condition_result)
             except Exception as e:
                 logger.warning(f"Error evaluating condition for node {node.id}: {e}")
                 return False
 
         # Check if all dependencies are completed
-        workflow = self.get_workflow(execution.workflow_id)
-        dependencies = workflow.get_node_dependencies(node.id)
-        for dep_id in dependencies:
+        for dep_id in plan.dependencies[slot]:
             dep_execution = execution.node_executions.get(dep_id)
             if not dep_execution or dep_execution.status != NodeStatus.COMPLETED:
                 return False
@@ -887,10 +1543,9 @@ class WorkflowOrchestrator:
         backoff_multiplier = retry_policy.get("backoff_multiplier", 2.0)
         delay = base_delay * (backoff_multiplier ** node_execution.retry_count)
 
-        # Apply jitter
-        jitter = retry_policy.get("jitter", 0.0)
+        # Apply jitter, so retries of many executions do not fire at the same time
+        jitter = retry_policy.get("jitter", self.DEFAULT_RETRY_JITTER)
         if jitter > 0:
-            import random
             delay = delay * (1 + random.uniform(-jitter, jitter))
 
         # Apply max delay
@@ -899,11 +1554,42 @@ class WorkflowOrchestrator:
 
         return delay
 
+    @staticmethod
+    def _resolve_bindings(
+        bindings: Tuple[Binding, ...],
+        execution: WorkflowExecution,
+        context: ExecutionContext,
+    ) -> Dict[str, Any]:
+        """Resolve compiled input or output bindings.
+
+        Args:
+            bindings: The compiled bindings.
+            execution: The workflow execution.
+            context: Execution context.
+
+        Returns:
+            Resolved values by name. References to nodes that have not completed are left out.
+        """
+        slots = context.slots
+        values = {}
+        for name, kind, key, slot in bindings:
+            if kind == _LITERAL:
+                values[name] = key
+            elif kind == _NODE_OUTPUT:
+                outputs = slots[slot]
+                if outputs is not None:
+                    values[name] = outputs.get(key)
+            elif kind == _WORKFLOW_INPUT:
+                values[name] = execution.inputs.get(key)
+            else:
+                values[name] = context.get(key)
+        return values
+
     async def _resolve_node_inputs(
         self,
         node: WorkflowNode,
         execution: WorkflowExecution,
-        context: Dict[str, Any],
+        context: ExecutionContext,
     ) -> Dict[str, Any]:
         """Resolve inputs for a node.
 
@@ -915,46 +1601,14 @@ class WorkflowOrchestrator:
         Returns:
             Resolved input values.
         """
-        inputs = {}
-
-        # Process each input
-        for input_name, input_spec in node.inputs.items():
-            # If the input is a string, it's a reference to another node's output
-            if isinstance(input_spec, str):
-                # Check if it's a workflow input
-                if input_spec.startswith("workflow.inputs."):
-                    input_path = input_spec[len("workflow.inputs."):]
-                    input_value = execution.inputs.get(input_path)
-                    inputs[input_name] = input_value
-                # Check if it's a node output
-                elif input_spec.startswith("node."):
-                    parts = input_spec.split(".")
-                    if len(parts) >= 3:
-                        ref_node_id = parts[1]
-                        output_name = parts[2]
-                        ref_node_execution = execution.node_executions.get(ref_node_id)
-                        if ref_node_execution and ref_node_execution.status == NodeStatus.COMPLETED:
-                            input_value = ref_node_execution.outputs.get(output_name)
-                            inputs[input_name] = input_value
-                # Check if it's a context value
-                elif input_spec.startswith("context."):
-                    context_path = input_spec[len("context."):]
-                    input_value = context.get(context_path)
-                    inputs[input_name] = input_value
-                else:
-                    # Treat as a literal value
-                    inputs[input_name] = input_spec
-            else:
-                # Use the input spec as a literal value
-                inputs[input_name] = input_spec
-
-        return inputs
+        plan = context.plan
+        return self._resolve_bindings(plan.inputs[plan.index[node.id]], execution, context)
 
     async def _resolve_workflow_outputs(
         self,
         workflow: WorkflowDefinition,
         execution: WorkflowExecution,
-        context: Dict[str, Any],
+        context: ExecutionContext,
     ) -> Dict[str, Any]:
         """Resolve outputs for a workflow.
 
@@ -966,35 +1620,7 @@ class WorkflowOrchestrator:
         Returns:
             Resolved output values.
         """
-        outputs = {}
-
-        # Process each output
-        for output_name, output_spec in workflow.outputs.items():
-            # If the output is a string, it's a reference to a node's output
-            if isinstance(output_spec, str):
-                # Check if it's a node output
-                if output_spec.startswith("node."):
-                    parts = output_spec.split(".")
-                    if len(parts) >= 3:
-                        node_id = parts[1]
-                        output_key = parts[2]
-                        node_execution = execution.node_executions.get(node_id)
-                        if node_execution and node_execution.status == NodeStatus.COMPLETED:
-                            output_value = node_execution.outputs.get(output_key)
-                            outputs[output_name] = output_value
-                # Check if it's a context value
-                elif output_spec.startswith("context."):
-                    context_path = output_spec[len("context."):]
-                    output_value = context.get(context_path)
-                    outputs[output_name] = output_value
-                else:
-                    # Treat as a literal value
-                    outputs[output_name] = output_spec
-            else:
-                # Use the output spec as a literal value
-                outputs[output_name] = output_spec
-
-        return outputs
+        return self._resolve_bindings(context.plan.outputs, execution, context)
 
     async def cancel_execution(self, execution_id: str) -> None:
         """Cancel a workflow execution.
@@ -1020,6 +1646,11 @@ class WorkflowOrchestrator:
         execution.status = WorkflowStatus.CANCELED
         execution.completed_at = datetime.now()
 
+        # Remove the execution from the admission queue if it has not started yet
+        self.admission.discard(execution_id)
+        self._emit(events.WORKFLOW_CANCELED, execution, status=execution.status.value)
+        self._checkpoint_execution(execution)
+
         # Cancel the execution task
         task = self._execution_tasks.get(execution_id)
         if task:
@@ -1054,6 +1685,7 @@ class WorkflowOrchestrator:
 
         # Pause the execution
         execution.status = WorkflowStatus.PAUSED
+        self._checkpoint_execution(execution)
 
         logger.info(f"Paused workflow execution: {execution_id}")
 
@@ -1066,6 +1698,7 @@ class WorkflowOrchestrator:
         Raises:
             WorkflowExecutionNotFoundError: If the execution is not found.
             WorkflowExecutionError: If the execution cannot be resumed.
+            AdmissionRejectedError: If the execution is not admitted.
         """
         # Get the execution
         execution = self.get_execution(execution_id)
@@ -1077,14 +1710,18 @@ class WorkflowOrchestrator:
                 execution_id=execution_id,
             )
 
-        # Resume the execution
-        execution.status = WorkflowStatus.RUNNING
+        # Start execution in background once it is admitted
+        started = self._admit(self.get_workflow(execution.workflow_id), execution)
 
-        # Start execution in background
-        task = asyncio.create_task(self._execute_workflow(execution))
-        self._execution_tasks[execution_id] = task
-
-        logger.info(f"Resumed workflow execution: {execution_id}")
+        # Resume the execution
+        if started:
+            execution.status = WorkflowStatus.RUNNING
+            logger.info(f"Resumed workflow execution: {execution_id}")
+        else:
+            execution.status = WorkflowStatus.PENDING
+            self._emit(events.WORKFLOW_QUEUED, execution, priority=self.admission.get_priority_class(execution.metadata))
+            logger.info(f"Queued resumed workflow execution: {execution_id}")
+        self._checkpoint_execution(execution)
 
     def list_workflows(self) -> List[Dict[str, Any]]:
         """List all registered workflows.
@@ -1141,6 +1778,31 @@ class HttpNodeExecutor(NodeExecutor):
         """Initialize the HTTP node executor."""
         super().__init__("http")
 
+    def is_cacheable(self, node: WorkflowNode, inputs: Dict[str, Any]) -> bool:
+        """Only cache requests without side effects.
+
+        Args:
+            node: The node.
+            inputs: Resolved input values for the node.
+
+        Returns:
+            True for GET and HEAD requests.
+        """
+        method = (inputs.get("method") or node.config.get("method", "GET")).upper()
+        return method in ("GET", "HEAD")
+
+    def is_cacheable_result(self, node: WorkflowNode, outputs: Dict[str, Any]) -> bool:
+        """Do not cache server errors, which are usually transient.
+
+        Args:
+            node: The node.
+            outputs: Output values from the node.
+
+        Returns:
+            True if the response is not a server error.
+        """
+        return outputs.get("status", 0) < 500
+
     @async_timed
     async def execute(
         self,
@@ -1197,11 +1859,56 @@ class HttpNodeExecutor(NodeExecutor):
 
 
 class PythonNodeExecutor(NodeExecutor):
-    """Executor for Python code nodes."""
+    """Executor for Python code nodes.
 
-    def __init__(self):
-        """Initialize the Python node executor."""
+    The code runs in a pool of warm worker processes. Each worker compiles a
+    node's code once and keeps the code object for later executions. The code
+    gets its resolved inputs and the context values; outputs of earlier nodes
+    are passed through the node's inputs. See python_worker for the main module
+    guard the default start method requires.
+    """
+
+    def __init__(
+        self,
+        pool: Optional[PythonWorkerPool] = None,
+        timeout: Optional[float] = 60.0,
+        cpu_time_limit: Optional[float] = 30.0,
+        memory_limit: Optional[int] = 512,
+    ):
+        """Initialize the Python node executor.
+
+        Args:
+            pool: Worker pool to run the code in. A new pool is created if not provided.
+            timeout: Default wall-clock timeout in seconds, overridden by the node's timeout.
+            cpu_time_limit: Default CPU time limit in seconds, overridden by the
+                node's "cpu_time_limit" config.
+            memory_limit: Default memory limit in megabytes, overridden by the
+                node's "memory_limit" config.
+        """
         super().__init__("python")
+        self.pool = pool or PythonWorkerPool()
+        self.timeout = timeout
+        self.cpu_time_limit = cpu_time_limit
+        self.memory_limit = memory_limit
+        self._code_keys: Dict[str, str] = {}
+
+    def _get_code_key(self, node: WorkflowNode, code: str) -> str:
+        """Get the key identifying a version of a node's code.
+
+        Args:
+            node: The node.
+            code: The node's code.
+
+        Returns:
+            Key made of the node ID and a hash of the code.
+        """
+        key = self._code_keys.get(code)
+        if key is None:
+            key = f"{node.id}:{hashlib.sha1(code.encode()).hexdigest()}"
+            if len(self._code_keys) >= 1024:
+                self._code_keys.clear()
+            self._code_keys[code] = key
+        return key
 
     @async_timed
     async def execute(
@@ -1223,33 +1930,30 @@ class PythonNodeExecutor(NodeExecutor):
         # Get the code to execute
         code = inputs.get("code") or node.config.get("code", "")
 
-        # Create a safe globals dictionary
-        safe_globals = {
-            "inputs": inputs,
-            "context": context,
-            "print": print,
-            "logger": logger,
-        }
-
-        # Add allowed modules
-        allowed_modules = node.config.get("allowed_modules", [])
-        for module_name in allowed_modules:
-            try:
-                module = __import__(module_name)
-                safe_globals[module_name] = module
-            except ImportError:
-                logger.warning(f"Failed to import module: {module_name}")
-
-        # Execute the code
-        local_vars = {}
-        exec(code, safe_globals, local_vars)
-
-        # Get the outputs
-        outputs = local_vars.get("outputs", {})
-        if not isinstance(outputs, dict):
-            outputs = {"result": outputs}
+        # Only send the context values, not the plan and the outputs of every other node
+        if isinstance(context, ExecutionContext):
+            context = context.values
+
+        # Get the limits
+        timeout = node.timeout or self.timeout
+        cpu_time_limit = node.config.get("cpu_time_limit", self.cpu_time_limit)
+        memory_limit = node.config.get("memory_limit", self.memory_limit)
+
+        return await self.pool.run(
+            key=self._get_code_key(node, code),
+            code=code,
+            node_id=node.id,
+            inputs=inputs,
+            context=context,
+            allowed_modules=list(node.config.get("allowed_modules", [])),
+            timeout=timeout,
+            cpu_time_limit=cpu_time_limit,
+            memory_limit=memory_limit * 1024 * 1024 if memory_limit else None,
+        )
 
-        return outputs
+    async def close(self) -> None:
+        """Terminate the worker processes."""
+        await self.pool.close()
 
 
 class DelayNodeExecutor(NodeExecutor):
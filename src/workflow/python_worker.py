@@ -0,0 +1,513 @@
+"""
+Python Node Worker Pool.
+
+This module runs the code of Python workflow nodes in a pool of warm worker
+processes, so CPU-heavy nodes do not block the orchestrator's event loop and
+many nodes can run in parallel across cores.
+
+The module only depends on the standard library, so worker processes start quickly.
+
+Workers are started with the forkserver start method by default, which imports
+the main module again in every worker. Scripts embedding the orchestrator must
+therefore guard their entry point with ``if __name__ == "__main__":``, or set
+WORKFLOW_PYTHON_START_METHOD to "fork".
+"""
+
+import asyncio
+import builtins
+import logging
+import multiprocessing
+import os
+import pickle
+import signal
+import traceback
+from collections import OrderedDict
+from types import CodeType
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Logger available to node code as `logger`
+NODE_LOGGER_NAME = "src.workflow.orchestrator.python"
+
+# Default number of compiled code objects kept per worker
+DEFAULT_CODE_CACHE_SIZE = 256
+
+
+class CPUTimeLimitExceeded(Exception):
+    """Error raised when a Python node exceeds its CPU time limit."""
+
+
+class WorkerCrashedError(Exception):
+    """Error raised when a worker process dies while executing a node."""
+
+
+class RemoteTraceback(Exception):
+    """Carries the formatted traceback of an exception raised in a worker."""
+
+    def __init__(self, tb: str):
+        super().__init__(tb)
+        self.tb = tb
+
+    def __str__(self) -> str:
+        return self.tb
+
+
+def _address_space() -> Optional[int]:
+    """Get the current address space size of this process in bytes."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def _restricted_builtins(allowed_modules: List[str]) -> Dict[str, Any]:
+    """Get the builtins of node code, which may only import allowed modules.
+
+    Args:
+        allowed_modules: Modules the code may import, including their submodules.
+
+    Returns:
+        Copy of the builtins with a restricted __import__.
+    """
+    allowed = set(allowed_modules)
+
+    def restricted_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name.partition(".")[0] not in allowed:
+            raise ImportError(f"Import of module {name!r} is not allowed")
+        return builtins.__import__(name, globals, locals, fromlist, level)
+
+    return dict(vars(builtins), __import__=restricted_import)
+
+
+def _raise_cpu_time_exceeded(signum, frame):
+    """Signal handler turning SIGXCPU into an exception."""
+    raise CPUTimeLimitExceeded("CPU time limit exceeded")
+
+
+class _Limits:
+    """Applies per-execution resource limits inside a worker process."""
+
+    def __init__(self, cpu_time: Optional[float], memory: Optional[int]):
+        """Initialize the limits.
+
+        Args:
+            cpu_time: CPU time limit in seconds.
+            memory: Memory limit in bytes on top of the worker's current usage.
+        """
+        self.cpu_time = cpu_time
+        self.memory = memory
+        self._saved: List[Tuple[int, Tuple[int, int]]] = []
+
+    def __enter__(self) -> "_Limits":
+        if resource is None:
+            return self
+
+        if self.cpu_time:
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            used = usage.ru_utime + usage.ru_stime
+            self._set(resource.RLIMIT_CPU, int(used + self.cpu_time) + 1)
+
+        if self.memory:
+            current = _address_space()
+            if current is not None:
+                self._set(resource.RLIMIT_AS, current + self.memory)
+
+        return self
+
+    def _set(self, limit: int, soft: int) -> None:
+        """Lower the soft value of a resource limit and remember the old one."""
+        previous = resource.getrlimit(limit)
+        hard = previous[1]
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(limit, (soft, hard))
+        self._saved.append((limit, previous))
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        while self._saved:
+            limit, previous = self._saved.pop()
+            resource.setrlimit(limit, previous)
+
+
+def _run_node(
+    request: Dict[str, Any],
+    code_cache: "OrderedDict[str, CodeType]",
+    cache_size: int,
+    modules: Dict[str, Any],
+    node_logger: logging.Logger,
+) -> Tuple[str, Any]:
+    """Execute one node request inside a worker.
+
+    Args:
+        request: The request sent by the pool.
+        code_cache: Compiled code objects by code key.
+        cache_size: Maximum number of cached code objects.
+        modules: Already imported allowed modules.
+        node_logger: Logger available to the node code.
+
+    Returns:
+        Tuple of status and payload.
+    """
+    key = request["key"]
+    code = code_cache.get(key)
+    if code is None:
+        source = request.get("code")
+        if source is None:
+            return "missing", None
+        code = compile(source, f"<node {request['node_id']}>", "exec")
+        code_cache[key] = code
+        if len(code_cache) > cache_size:
+            code_cache.popitem(last=False)
+    else:
+        code_cache.move_to_end(key)
+
+    # Create a safe globals dictionary
+    safe_globals = {
+        "__builtins__": _restricted_builtins(request["allowed_modules"]),
+        "inputs": request["inputs"],
+        "context": request["context"],
+        "print": print,
+        "logger": node_logger,
+    }
+
+    # Add allowed modules
+    for module_name in request["allowed_modules"]:
+        module = modules.get(module_name)
+        if module is None:
+            try:
+                module = modules[module_name] = __import__(module_name)
+            except ImportError:
+                node_logger.warning(f"Failed to import module: {module_name}")
+                continue
+        safe_globals[module_name] = module
+
+    # Execute the code
+    local_vars = {}
+    with _Limits(request["cpu_time_limit"], request["memory_limit"]):
+        exec(code, safe_globals, local_vars)
+
+    # Get the outputs
+    outputs = local_vars.get("outputs", {})
+    if not isinstance(outputs, dict):
+        outputs = {"result": outputs}
+
+    return "ok", outputs
+
+
+def worker_main(conn, cache_size: int = DEFAULT_CODE_CACHE_SIZE) -> None:
+    """Main loop of a worker process.
+
+    Args:
+        conn: Connection to the pool.
+        cache_size: Maximum number of cached code objects.
+    """
+    # The parent handles interrupts and terminates workers itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if hasattr(signal, "SIGXCPU"):
+        signal.signal(signal.SIGXCPU, _raise_cpu_time_exceeded)
+
+    code_cache: "OrderedDict[str, CodeType]" = OrderedDict()
+    modules: Dict[str, Any] = {}
+    node_logger = logging.getLogger(NODE_LOGGER_NAME)
+
+    while True:
+        try:
+            request = pickle.loads(conn.recv_bytes())
+        except EOFError:
+            break
+
+        try:
+            response = _run_node(request, code_cache, cache_size, modules, node_logger)
+        except BaseException as e:
+            response = ("error", (e, traceback.format_exc()))
+
+        try:
+            data = pickle.dumps(response, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            if response[0] == "error":
+                error = RuntimeError(f"{type(response[1][0]).__name__}: {response[1][0]}")
+                tb = response[1][1]
+            else:
+                error = TypeError(f"Node outputs could not be serialised: {e}")
+                tb = traceback.format_exc()
+            data = pickle.dumps(("error", (error, tb)), protocol=pickle.HIGHEST_PROTOCOL)
+
+        conn.send_bytes(data)
+
+
+class _Worker:
+    """Handle of a worker process in the pool."""
+
+    def __init__(self, process: multiprocessing.Process, conn):
+        self.process = process
+        self.conn = conn
+        self.known_keys: "OrderedDict[str, None]" = OrderedDict()
+        self.tasks = 0
+
+    def kill(self) -> None:
+        """Terminate the worker process."""
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=1)
+
+
+class PythonWorkerPool:
+    """Pool of warm worker processes executing Python node code."""
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        start_method: Optional[str] = None,
+        code_cache_size: int = DEFAULT_CODE_CACHE_SIZE,
+    ):
+        """Initialize the worker pool.
+
+        Args:
+            size: Number of worker processes. Defaults to the number of CPUs.
+            start_method: Multiprocessing start method. Defaults to the
+                WORKFLOW_PYTHON_START_METHOD environment variable, then forkserver
+                where available and spawn elsewhere.
+            code_cache_size: Maximum number of compiled code objects per worker.
+        """
+        self.size = size or int(os.environ.get("WORKFLOW_PYTHON_WORKERS", 0)) or os.cpu_count() or 1
+        if start_method is None:
+            start_method = os.environ.get("WORKFLOW_PYTHON_START_METHOD")
+        if start_method is None:
+            available = multiprocessing.get_all_start_methods()
+            start_method = "forkserver" if "forkserver" in available else "spawn"
+        self.code_cache_size = code_cache_size
+
+        self._context = multiprocessing.get_context(start_method)
+        self._workers: List[_Worker] = []
+        self._idle: Optional[asyncio.Queue] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._closed = False
+        self._stats = {"executions": 0, "timeouts": 0, "crashes": 0, "code_transfers": 0}
+
+    def _spawn(self) -> _Worker:
+        """Start a new worker process.
+
+        Returns:
+            The new worker.
+        """
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=worker_main,
+            args=(child_conn, self.code_cache_size),
+            name="workflow-python-worker",
+            daemon=True,
+        )
+        try:
+            process.start()
+        except RuntimeError as e:
+            if "bootstrapping phase" not in str(e):
+                raise
+            raise RuntimeError(
+                f"Python node workers cannot be started while the main module is imported by a worker. "
+                f"The '{self._context.get_start_method()}' start method imports the main module in every "
+                f"worker, so guard the script's entry point with 'if __name__ == \"__main__\":', or set "
+                f"WORKFLOW_PYTHON_START_METHOD=fork."
+            ) from None
+        child_conn.close()
+        return _Worker(process, parent_conn)
+
+    async def start(self) -> None:
+        """Start the worker processes if they are not running yet."""
+        if self._idle is not None:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+
+        async with self._start_lock:
+            if self._idle is not None:
+                return
+
+            loop = asyncio.get_running_loop()
+            idle = asyncio.Queue()
+            for _ in range(self.size):
+                worker = await loop.run_in_executor(None, self._spawn)
+                self._workers.append(worker)
+                idle.put_nowait(worker)
+            self._idle = idle
+
+            logger.info(f"Started {self.size} Python node workers")
+
+    async def _replace(self, worker: _Worker) -> None:
+        """Kill a worker and put a fresh one into the pool.
+
+        Args:
+            worker: The worker to replace.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, worker.kill)
+        if worker in self._workers:
+            self._workers.remove(worker)
+        if self._closed:
+            return
+
+        replacement = await loop.run_in_executor(None, self._spawn)
+        self._workers.append(replacement)
+        self._idle.put_nowait(replacement)
+
+    async def _receive(self, worker: _Worker) -> Tuple[str, Any]:
+        """Wait for the response of a worker without blocking the event loop.
+
+        Args:
+            worker: The worker.
+
+        Returns:
+            Tuple of status and payload.
+        """
+        loop = asyncio.get_running_loop()
+        readable = loop.create_future()
+        fd = worker.conn.fileno()
+        loop.add_reader(fd, lambda: readable.done() or readable.set_result(None))
+        try:
+            await readable
+        finally:
+            loop.remove_reader(fd)
+
+        try:
+            return pickle.loads(worker.conn.recv_bytes())
+        except (EOFError, OSError) as e:
+            raise WorkerCrashedError("Python node worker exited unexpectedly") from e
+
+    async def _roundtrip(self, worker: _Worker, request: Dict[str, Any], code: str) -> Tuple[str, Any]:
+        """Send a request to a worker and wait for the response.
+
+        The code is only sent if the worker has not compiled it yet.
+
+        Args:
+            worker: The worker.
+            request: The request without code.
+            code: The node's source code.
+
+        Returns:
+            Tuple of status and payload.
+        """
+        key = request["key"]
+        if key in worker.known_keys:
+            worker.known_keys.move_to_end(key)
+        else:
+            request = dict(request, code=code)
+            self._stats["code_transfers"] += 1
+
+        worker.conn.send_bytes(pickle.dumps(request, protocol=pickle.HIGHEST_PROTOCOL))
+        status, payload = await self._receive(worker)
+
+        if status == "missing":
+            # The worker evicted the code object, send the code again
+            self._stats["code_transfers"] += 1
+            worker.conn.send_bytes(pickle.dumps(dict(request, code=code), protocol=pickle.HIGHEST_PROTOCOL))
+            status, payload = await self._receive(worker)
+
+        worker.known_keys[key] = None
+        if len(worker.known_keys) > self.code_cache_size:
+            worker.known_keys.popitem(last=False)
+        return status, payload
+
+    async def run(
+        self,
+        key: str,
+        code: str,
+        node_id: str,
+        inputs: Dict[str, Any],
+        context: Dict[str, Any],
+        allowed_modules: List[str],
+        timeout: Optional[float] = None,
+        cpu_time_limit: Optional[float] = None,
+        memory_limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Execute node code in a worker process.
+
+        Args:
+            key: Key identifying this version of the code.
+            code: The node's source code.
+            node_id: ID of the node.
+            inputs: Input values for the node.
+            context: Execution context.
+            allowed_modules: Modules made available to the code, the only ones it may import.
+            timeout: Wall-clock timeout in seconds.
+            cpu_time_limit: CPU time limit in seconds.
+            memory_limit: Memory limit in bytes.
+
+        Returns:
+            Output values from the node.
+
+        Raises:
+            TimeoutError: If the code exceeds the wall-clock timeout.
+            WorkerCrashedError: If the worker process dies.
+            Exception: Any exception raised by the node code.
+        """
+        if self._closed:
+            raise RuntimeError("Python worker pool is closed")
+        await self.start()
+
+        request = {
+            "key": key,
+            "node_id": node_id,
+            "inputs": inputs,
+            "context": context,
+            "allowed_modules": allowed_modules,
+            "cpu_time_limit": cpu_time_limit,
+            "memory_limit": memory_limit,
+        }
+
+        worker = await self._idle.get()
+        try:
+            status, payload = await asyncio.wait_for(self._roundtrip(worker, request, code), timeout)
+        except asyncio.TimeoutError:
+            self._stats["timeouts"] += 1
+            await self._replace(worker)
+            raise TimeoutError(f"Python node {node_id} exceeded timeout of {timeout} seconds") from None
+        except WorkerCrashedError:
+            self._stats["crashes"] += 1
+            await self._replace(worker)
+            raise
+        except BaseException:
+            # The worker's state is unknown, e.g. after cancellation
+            await asyncio.shield(self._replace(worker))
+            raise
+
+        worker.tasks += 1
+        self._stats["executions"] += 1
+        self._idle.put_nowait(worker)
+
+        if status == "error":
+            error, tb = payload
+            error.__cause__ = RemoteTraceback(tb)
+            raise error
+        return payload
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Dictionary with the pool size and execution counters.
+        """
+        return {
+            "size": self.size,
+            "workers": len(self._workers),
+            "idle": self._idle.qsize() if self._idle is not None else 0,
+            **self._stats,
+        }
+
+    async def close(self) -> None:
+        """Terminate all worker processes."""
+        self._closed = True
+        loop = asyncio.get_running_loop()
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            await loop.run_in_executor(None, worker.kill)
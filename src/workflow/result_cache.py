@@ -0,0 +1,133 @@
+"""
+Workflow Node Result Cache.
+
+This module caches the outputs of deterministic nodes in memory, so that
+executions running a node with the same configuration and inputs again can skip
+it. Nodes opt in with the "cache" entry of their metadata.
+"""
+
+import copy
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class NodeResultCache:
+    """LRU cache of node outputs with expiration and per-node statistics."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        default_ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the result cache.
+
+        Args:
+            max_entries: Maximum number of cached outputs. Defaults to the
+                WORKFLOW_RESULT_CACHE_SIZE environment variable or 1024.
+            default_ttl: Time-to-live of cached outputs in seconds, overridden by
+                the node's "cache_ttl" metadata. Defaults to the
+                WORKFLOW_RESULT_CACHE_TTL environment variable or 300.
+            clock: Function returning the current time in seconds.
+        """
+        self.max_entries = max_entries or int(os.environ.get("WORKFLOW_RESULT_CACHE_SIZE", 1024))
+        if default_ttl is None:
+            default_ttl = float(os.environ.get("WORKFLOW_RESULT_CACHE_TTL", 300))
+        self.default_ttl = default_ttl
+        self._clock = clock
+        # Key -> (expiry time, outputs), least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # (workflow ID, node ID) -> [hits, misses]
+        self._stats: Dict[Tuple[str, str], list] = {}
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, workflow_id: str, node_id: str, key: str) -> Optional[Dict[str, Any]]:
+        """Get the cached outputs of a node.
+
+        Args:
+            workflow_id: ID of the workflow, for statistics.
+            node_id: ID of the node, for statistics.
+            key: Hash of the node type, its configuration and its inputs.
+
+        Returns:
+            A copy of the cached outputs, or None if they are not cached.
+        """
+        stats = self._stats.get((workflow_id, node_id))
+        if stats is None:
+            stats = self._stats[(workflow_id, node_id)] = [0, 0]
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= self._clock():
+            del self._entries[key]
+            self._expirations += 1
+            entry = None
+        if entry is None:
+            stats[1] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        stats[0] += 1
+        # Later nodes must not change the cached outputs
+        return copy.deepcopy(entry[1])
+
+    def put(self, key: str, outputs: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Cache the outputs of a node.
+
+        Args:
+            key: Hash of the node type, its configuration and its inputs.
+            outputs: The outputs.
+            ttl: Time-to-live in seconds. None means use default_ttl.
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        # Nor may the node that produced them
+        self._entries[key] = (self._clock() + ttl, copy.deepcopy(outputs))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def get_stats(self, workflow_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Args:
+            workflow_id: Only include the nodes of this workflow.
+
+        Returns:
+            Number of entries, evictions and expirations, and hits, misses and
+            hit rate per workflow and node.
+        """
+        nodes: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (stats_workflow_id, node_id), (hits, misses) in self._stats.items():
+            if workflow_id is not None and stats_workflow_id != workflow_id:
+                continue
+            nodes.setdefault(stats_workflow_id, {})[node_id] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            }
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "nodes": nodes,
+        }
+
+    def clear(self) -> None:
+        """Remove all cached outputs and reset the statistics."""
+        self._entries.clear()
+        self._stats.clear()
+        self._evictions = 0
+        self._expirations = 0
@@ -0,0 +1,163 @@
+"""
+Tests für den zentralen Konfigurationsmanager.
+"""
+
+import gc
+import json
+import os
+import threading
+
+import pytest
+
+from src.common.config_manager import ConfigManager, ConfigSchema, ConfigValidationError
+
+
+class ServerModel:
+    """Modell einer Serverkonfiguration."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+
+
+class OtherModel(ServerModel):
+    """Zweites Modell für dieselbe Konfiguration."""
+
+
+SERVER_SCHEMA = {
+    "host": {"type": "string", "required": True},
+    "port": {"type": "integer", "min": 1, "max": 65535},
+}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Fixture für einen Konfigurationsmanager mit eigenem Verzeichnis."""
+    manager = ConfigManager(str(tmp_path))
+    yield manager
+    manager.stop_watching()
+
+
+def write_config(manager, name, config):
+    """Schreibe eine Konfigurationsdatei mit neuer Änderungszeit, ohne den Manager zu benachrichtigen."""
+    path = os.path.join(manager.config_dir, f"{name}.json")
+    with open(path, "w") as f:
+        json.dump(config, f)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_default_is_copied(manager):
+    """Änderungen an der geladenen Konfiguration verändern den übergebenen Standardwert nicht."""
+    default = {"server": {"host": "localhost", "ports": [80]}}
+
+    config = manager.load_json_config("server", default)
+    config["server"]["ports"].append(443)
+    manager.update_config("server", {"server": {"host": "example.org"}})
+
+    assert default == {"server": {"host": "localhost", "ports": [80]}}
+
+
+def test_snapshot_is_immutable_and_versioned(manager):
+    """Snapshots sind schreibgeschützt und erhalten bei jeder Änderung eine neue Version."""
+    manager.load_json_config("server", {"host": "localhost", "tags": ["a"]})
+    snapshot = manager.get_snapshot("server")
+
+    with pytest.raises(TypeError):
+        snapshot.data["host"] = "example.org"
+    assert snapshot["tags"] == ("a",)
+
+    manager.update_config("server", {"host": "example.org"})
+
+    assert manager.get_snapshot("server").version == snapshot.version + 1
+    assert snapshot["host"] == "localhost"
+    assert manager.get_snapshot("server")["host"] == "example.org"
+
+
+def test_watcher_reloads_changed_file(manager):
+    """Der Überwachungs-Thread lädt geänderte Dateien neu und benachrichtigt die Listener."""
+    write_config(manager, "server", {"host": "localhost", "port": 80})
+    manager.load_json_config("server")
+    changed = threading.Event()
+    changes = []
+
+    def listener(name, old, new):
+        changes.append((name, old, new))
+        changed.set()
+
+    manager.add_listener("server", listener)
+    manager.start_watching(interval=0.01)
+    write_config(manager, "server", {"host": "localhost", "port": 8080})
+
+    assert changed.wait(5)
+    assert changes == [("server", {"host": "localhost", "port": 80}, {"host": "localhost", "port": 8080})]
+    assert manager.get_config("server")["port"] == 8080
+
+
+def test_invalid_file_keeps_previous_config(manager):
+    """Eine ungültige neue Fassung wird verworfen, wenn ein Schema registriert ist."""
+    write_config(manager, "server", {"host": "localhost", "port": 80})
+    manager.load_json_config("server")
+    manager.register_schema("server", SERVER_SCHEMA)
+
+    write_config(manager, "server", {"host": "localhost", "port": 0})
+
+    assert manager.check_for_changes() == []
+    assert manager.get_config("server")["port"] == 80
+
+
+def test_typed_model_is_rebuilt_after_reload(manager):
+    """Das Modell wird pro Fassung einmal erzeugt und beim Neuladen verworfen."""
+    schema = ConfigSchema(SERVER_SCHEMA, ServerModel)
+    write_config(manager, "server", {"host": "localhost", "port": 80})
+    manager.load_json_config("server")
+
+    model = manager.get_typed("server", schema)
+    assert manager.get_typed("server", schema) is model
+
+    write_config(manager, "server", {"host": "localhost", "port": 8080})
+    assert manager.check_for_changes() == ["server"]
+
+    assert manager._typed[schema] == {}
+    assert manager.get_typed("server", schema).port == 8080
+
+
+def test_typed_model_belongs_to_its_schema(manager):
+    """Ein neues Schema erhält nie das Modell eines freigegebenen Schemas."""
+    manager.load_json_config("server", {"host": "localhost", "port": 80})
+
+    for _ in range(20):
+        assert isinstance(manager.get_typed("server", ConfigSchema(SERVER_SCHEMA, ServerModel)), ServerModel)
+        gc.collect()
+        model = manager.get_typed("server", ConfigSchema(SERVER_SCHEMA, OtherModel))
+        assert isinstance(model, OtherModel)
+        gc.collect()
+
+    assert len(manager._typed) == 0
+
+
+def test_invalid_typed_config_raises(manager):
+    """Eine ungültige Konfiguration lässt sich nicht als Modell abrufen."""
+    manager.load_json_config("server", {"port": 80})
+
+    with pytest.raises(ConfigValidationError) as excinfo:
+        manager.get_typed("server", ConfigSchema(SERVER_SCHEMA, ServerModel))
+
+    assert excinfo.value.errors == {"host": "Pflichtfeld host fehlt"}
+
+
+def test_compiled_validators_are_reused_and_bounded(manager):
+    """Validatoren werden pro Schema-Objekt kompiliert und nur begrenzt aufbewahrt."""
+    manager.load_json_config("server", {"host": "localhost", "port": 80})
+
+    validator = manager._get_validator(SERVER_SCHEMA)
+    assert manager._get_validator(SERVER_SCHEMA) is validator
+    assert manager.validate_config("server", SERVER_SCHEMA)
+
+    for index in range(200):
+        manager.validate_config("server", {"host": {"type": "string"}, f"extra{index}": {"type": "string"}})
+
+    assert len(manager._validators) == 128
+
+    with pytest.raises(ConfigValidationError):
+        manager.validate_config("server", {"port": {"type": "integer", "max": 10}})
@@ -0,0 +1,132 @@
+"""
+Tests for the OpenHands run tracker.
+"""
+
+import asyncio
+
+import pytest
+
+from src.connectors.base import ConnectorError, ConnectorNotFoundError
+from src.connectors.run_tracker import RunTracker
+
+
+class FakeConnector:
+    """Connector that answers run requests from per-run scripts."""
+
+    connector_type = "openhands"
+    service_name = "OpenHands"
+
+    def __init__(self):
+        self.delays = {}
+        self.statuses = {}
+        self.errors = {}
+        self.polls = []
+
+    async def get_run(self, thread_id, run_id):
+        self.polls.append(run_id)
+        await asyncio.sleep(self.delays.get(run_id, 0))
+        if run_id in self.errors:
+            raise self.errors[run_id]
+        return {"id": run_id, "status": self.statuses.get(run_id, "in_progress")}
+
+
+@pytest.fixture
+def connector():
+    """Fixture for a fake connector."""
+    return FakeConnector()
+
+
+@pytest.fixture
+def tracker(connector):
+    """Fixture for a polling-only tracker."""
+    return RunTracker(connector, initial_interval=0.01, use_streaming=False)
+
+
+@pytest.mark.asyncio
+async def test_completed_run_resolves_waiters(tracker, connector):
+    """Test that all waiters of a run get the final run."""
+    waiters = [asyncio.ensure_future(tracker.wait("thread", "run", timeout=2)) for _ in range(2)]
+    await asyncio.sleep(0.05)
+    connector.statuses["run"] = "completed"
+
+    results = await asyncio.gather(*waiters)
+
+    assert results == [{"id": "run", "status": "completed"}] * 2
+    assert tracker.get_stats()["tracked_runs"] == 0
+
+
+@pytest.mark.asyncio
+async def test_poll_error_fails_waiters(tracker, connector):
+    """Test that an error other than not found fails the run instead of polling forever."""
+    connector.errors["run"] = RuntimeError("connection reset")
+
+    with pytest.raises(ConnectorError, match="connection reset"):
+        await tracker.wait("thread", "run", timeout=2)
+
+    assert connector.polls == ["run"]
+    assert tracker.get_stats()["tracked_runs"] == 0
+
+
+@pytest.mark.asyncio
+async def test_missing_run_fails_waiters(tracker, connector):
+    """Test that a missing run fails its waiters with the connector error."""
+    connector.errors["run"] = ConnectorNotFoundError("Run not found")
+
+    with pytest.raises(ConnectorNotFoundError):
+        await tracker.wait("thread", "run", timeout=2)
+
+
+@pytest.mark.asyncio
+async def test_slow_poll_does_not_delay_other_runs(tracker, connector):
+    """Test that a run keeps being polled while the poll of another run hangs."""
+    connector.delays["slow"] = 5.0
+    connector.statuses["fast"] = "in_progress"
+    slow = asyncio.ensure_future(tracker.wait("thread", "slow", timeout=5, max_interval=0.02))
+    fast = asyncio.ensure_future(tracker.wait("thread", "fast", timeout=5, max_interval=0.02))
+
+    await asyncio.sleep(0.2)
+    connector.statuses["fast"] = "completed"
+    result = await asyncio.wait_for(fast, 1)
+
+    assert result["status"] == "completed"
+    assert connector.polls.count("fast") > 3
+    assert connector.polls.count("slow") == 1
+
+    slow.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await slow
+
+
+@pytest.mark.asyncio
+async def test_concurrent_polls_are_limited(connector):
+    """Test that no more than max_concurrent_polls requests run at once."""
+    tracker = RunTracker(connector, initial_interval=0.01, use_streaming=False, max_concurrent_polls=2)
+    running = 0
+    max_running = 0
+
+    async def get_run(thread_id, run_id):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return {"id": run_id, "status": "completed"}
+
+    connector.get_run = get_run
+    results = await asyncio.gather(*(tracker.wait("thread", f"run-{index}", timeout=2) for index in range(5)))
+
+    assert [result["id"] for result in results] == [f"run-{index}" for index in range(5)]
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_timeout_stops_tracking(tracker, connector):
+    """Test that a waiter that times out stops the tracking of its run."""
+    connector.delays["run"] = 5.0
+
+    with pytest.raises(ConnectorError, match="Timeout"):
+        await tracker.wait("thread", "run", timeout=0.1)
+
+    await asyncio.sleep(0)
+    assert tracker.get_stats()["tracked_runs"] == 0
+    assert tracker._poller.done()
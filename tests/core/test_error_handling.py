@@ -8,7 +8,7 @@ from src.core.error_handling import (
     BaseError, ConfigurationError, NetworkError, ValidationError,
     AuthenticationError, AuthorizationError, ResourceError,
     ResourceNotFoundError, ExternalServiceError, MCPError, MCPServerError,
-    ErrorHandler, ErrorCategory, ErrorSeverity
+    ErrorHandler, ErrorAggregator, ErrorCategory, ErrorSeverity
 )
 
 class TestBaseError(unittest.TestCase):
@@ -237,5 +237,101 @@ class TestErrorHandler(unittest.TestCase):
         with self.assertRaises(BaseError):
             ErrorHandler.handle_error(error, log_error=False, raise_error=True)
 
+class TestErrorAggregator(unittest.TestCase):
+    """Test cases for the ErrorAggregator class."""
+    
+    def setUp(self):
+        self.now = 1000.0
+        self.aggregator = ErrorAggregator(window=10.0, rate_window=10.0, clock=lambda: self.now)
+    
+    def raise_value_error(self):
+        """Raise the same ValueError from the same location."""
+        raise ValueError("Invalid value")
+    
+    def handle(self, **kwargs):
+        try:
+            self.raise_value_error()
+        except ValueError as e:
+            return ErrorHandler.handle_error(e, aggregator=self.aggregator, **kwargs)
+    
+    def test_duplicates_are_counted(self):
+        """Test that identical errors within the window are counted once."""
+        with self.assertLogs("src.core.error_handling", level="ERROR") as logs:
+            for _ in range(5):
+                result = self.handle()
+        self.assertEqual(result["message"], "Invalid value")
+        self.assertEqual(len(logs.records), 1)
+        
+        errors = self.aggregator.get_errors()
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0]["count"], 5)
+        self.assertEqual(self.aggregator.get_metrics()["suppressed"], 4)
+    
+    def test_window_expiry_logs_repeats(self):
+        """Test that an error is logged again with its repeat count after the window."""
+        for _ in range(3):
+            self.handle(log_error=False)
+        self.now += 11.0
+        with self.assertLogs("src.core.error_handling", level="ERROR") as logs:
+            self.handle()
+        self.assertIn("repeated 3 times", logs.output[0])
+
+    def test_duplicates_return_their_own_details(self):
+        """Test that aggregated errors still return the details of each occurrence."""
+        first = ErrorHandler.handle_error(
+            ValidationError("Invalid field", details={"field": "name"}), log_error=False, aggregator=self.aggregator
+        )
+        second = ErrorHandler.handle_error(
+            ValidationError("Invalid field", details={"field": "email"}), log_error=False, aggregator=self.aggregator
+        )
+        self.assertEqual(first["details"]["field"], "name")
+        self.assertEqual(second["details"]["field"], "email")
+        self.assertEqual(self.aggregator.get_errors()[0]["count"], 2)
+
+    def test_current_error_is_raised(self):
+        """Test that the current error is raised, also after the window expired."""
+        first = ValidationError("Invalid field")
+        with self.assertRaises(ValidationError) as context:
+            ErrorHandler.handle_error(first, log_error=False, raise_error=True, aggregator=self.aggregator)
+        self.assertIs(context.exception, first)
+
+        self.now += 11.0
+        second = ValidationError("Invalid field")
+        with self.assertRaises(ValidationError) as context:
+            ErrorHandler.handle_error(second, log_error=False, raise_error=True, aggregator=self.aggregator)
+        self.assertIs(context.exception, second)
+
+    def test_different_errors_are_not_merged(self):
+        """Test that errors with different messages get separate fingerprints."""
+        ErrorHandler.handle_error(ValueError("a"), log_error=False, aggregator=self.aggregator)
+        ErrorHandler.handle_error(ValueError("b"), log_error=False, aggregator=self.aggregator)
+        self.assertEqual(len(self.aggregator.get_errors()), 2)
+    
+    def test_metrics_per_category(self):
+        """Test that totals and rates are tracked per category."""
+        error_map = {KeyError: ConfigurationError}
+        for _ in range(4):
+            ErrorHandler.handle_error(KeyError("x"), log_error=False, error_map=error_map, aggregator=self.aggregator)
+        ErrorHandler.handle_error(NetworkError("down"), log_error=False, aggregator=self.aggregator)
+        
+        categories = self.aggregator.get_metrics()["categories"]
+        self.assertEqual(categories["configuration"]["total"], 4)
+        self.assertAlmostEqual(categories["configuration"]["rate_per_second"], 0.4)
+        self.assertEqual(categories["network"]["total"], 1)
+        
+        self.now += 20.0
+        categories = self.aggregator.get_metrics()["categories"]
+        self.assertEqual(categories["configuration"]["rate_per_second"], 0)
+        self.assertIn('errors_total{category="configuration"} 4', self.aggregator.render_prometheus())
+    
+    def test_stack_trace_is_formatted_lazily(self):
+        """Test that the stack trace is only formatted when accessed."""
+        try:
+            self.raise_value_error()
+        except ValueError as e:
+            error = BaseError("Wrapped", cause=e)
+        self.assertIsNone(error._stack_trace)
+        self.assertIn("raise_value_error", error.stack_trace)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""
+Unit tests for the performance module.
+"""
+
+import asyncio
+import unittest
+
+from src.core.performance import RetryBudget, TimerWheel
+
+
+class TestRetryBudget(unittest.TestCase):
+    """Test cases for the RetryBudget class."""
+
+    def setUp(self):
+        self.now = 1000.0
+        self.budget = RetryBudget(ratio=0.5, min_per_second=1.0, capacity=2.0, clock=lambda: self.now)
+
+    def test_exhausted_budget_rejects_retries(self):
+        """Test that retries are rejected once the tokens are used up."""
+        self.assertTrue(self.budget.try_withdraw())
+        self.assertTrue(self.budget.try_withdraw())
+        self.assertFalse(self.budget.try_withdraw())
+
+    def test_attempts_deposit_tokens(self):
+        """Test that every attempt deposits a fraction of a retry."""
+        self.budget.try_withdraw()
+        self.budget.try_withdraw()
+        self.budget.deposit()
+        self.assertFalse(self.budget.try_withdraw())
+        self.budget.deposit()
+        self.assertTrue(self.budget.try_withdraw())
+
+    def test_tokens_refill_over_time(self):
+        """Test that the minimum rate refills the budget up to its capacity."""
+        self.budget.try_withdraw()
+        self.budget.try_withdraw()
+        self.now += 1.5
+        self.assertAlmostEqual(self.budget.tokens, 1.5)
+        self.now += 100.0
+        self.assertEqual(self.budget.tokens, 2.0)
+
+        for _ in range(10):
+            self.budget.deposit()
+        self.assertEqual(self.budget.tokens, 2.0)
+
+
+class TestTimerWheel(unittest.TestCase):
+    """Test cases for the TimerWheel class."""
+
+    def setUp(self):
+        self.wheel = TimerWheel(tick=0.01, size=4)
+        self.fired = []
+
+    async def schedule_and_wait(self, delay, name, wait):
+        """Schedule a timer and wait for some time."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        self.wheel.schedule(delay, lambda: self.fired.append((name, loop.time() - start)))
+        await asyncio.sleep(wait)
+
+    def test_timer_fires_after_delay(self):
+        """Test that a timer fires after its delay, also beyond one rotation of the wheel."""
+        asyncio.run(self.schedule_and_wait(0.1, "timer", 0.3))
+
+        self.assertEqual([name for name, _ in self.fired], ["timer"])
+        self.assertGreaterEqual(self.fired[0][1], 0.1)
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_cancelled_timer_does_not_fire(self):
+        """Test that a cancelled timer does not fire."""
+        async def run():
+            timer = self.wheel.schedule(0.05, lambda: self.fired.append("cancelled"))
+            self.wheel.schedule(0.05, lambda: self.fired.append("kept"))
+            self.wheel.cancel(timer)
+            self.wheel.cancel(timer)
+            self.assertEqual(len(self.wheel), 1)
+            await asyncio.sleep(0.2)
+
+        asyncio.run(run())
+
+        self.assertEqual(self.fired, ["kept"])
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_wheel_moves_to_new_event_loop(self):
+        """Test that the wheel keeps working when used from another event loop."""
+        # The first loop ends before its timer is due
+        asyncio.run(self.schedule_and_wait(1.0, "first", 0.0))
+        self.assertEqual(len(self.wheel), 1)
+
+        asyncio.run(self.schedule_and_wait(0.05, "second", 0.2))
+
+        self.assertEqual([name for name, _ in self.fired], ["second"])
+        self.assertEqual(len(self.wheel), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
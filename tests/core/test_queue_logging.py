@@ -0,0 +1,141 @@
+"""
+Unit tests for the queue-based logging pipeline.
+"""
+
+import logging
+import os
+import tempfile
+import unittest
+
+import src.core.logging as core_logging
+from src.core.logging import (
+    NonBlockingQueueHandler, RateLimitFilter, configure_logging, get_logging_stats, stop_queue_logging
+)
+
+
+class TestQueueLogging(unittest.TestCase):
+    """Test cases for configure_logging(use_queue=True)."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.temp_dir.name, "app.log")
+        self.saved_handlers = logging.root.handlers[:]
+        self.saved_level = logging.root.level
+
+    def tearDown(self):
+        """Restore the logging configuration."""
+        stop_queue_logging()
+        for handler in logging.root.handlers[:]:
+            logging.root.removeHandler(handler)
+            handler.close()
+        logging.root.handlers = self.saved_handlers
+        logging.root.setLevel(self.saved_level)
+        self.temp_dir.cleanup()
+
+    def read_log(self):
+        """Read the log file."""
+        with open(self.log_file) as f:
+            return f.read()
+
+    def test_replaces_existing_root_handler(self):
+        """Test that the queue handler replaces a handler installed before."""
+        logging.root.addHandler(logging.StreamHandler())
+
+        configure_logging(log_file=self.log_file, enable_console=False, use_queue=True)
+
+        self.assertEqual(len(logging.root.handlers), 1)
+        self.assertIsInstance(logging.root.handlers[0], NonBlockingQueueHandler)
+
+        logging.getLogger("test").info("Queued message")
+        stop_queue_logging()
+        self.assertIn("Queued message", self.read_log())
+
+    def test_reconfigure_twice(self):
+        """Test that records are still written after configuring logging again."""
+        configure_logging(log_file=self.log_file, enable_console=False, use_queue=True)
+        logging.getLogger("test").info("First message")
+
+        configure_logging(log_file=self.log_file, enable_console=False, use_queue=True)
+        logging.getLogger("test").info("Second message")
+
+        queue_handlers = [h for h in logging.root.handlers if isinstance(h, NonBlockingQueueHandler)]
+        self.assertEqual(len(queue_handlers), 1)
+
+        stop_queue_logging()
+        log_content = self.read_log()
+        self.assertIn("First message", log_content)
+        self.assertIn("Second message", log_content)
+
+    def test_stop_detaches_queue_handler(self):
+        """Test that no records are queued after the pipeline is stopped."""
+        configure_logging(log_file=self.log_file, enable_console=False, use_queue=True)
+        logging.getLogger("test").info("Message")
+        self.assertEqual(get_logging_stats()["queued"], 1)
+
+        stop_queue_logging()
+
+        self.assertFalse(any(isinstance(h, NonBlockingQueueHandler) for h in logging.root.handlers))
+        logging.getLogger("test").info("After stop")
+        self.assertEqual(get_logging_stats()["pending"], 0)
+
+    def test_unqueued_reconfiguration_stops_listener(self):
+        """Test that configuring logging without a queue stops the previous queue listener."""
+        configure_logging(log_file=self.log_file, enable_console=False, use_queue=True)
+        logging.getLogger("test").info("Queued message")
+
+        configure_logging(log_file=self.log_file, enable_console=False, use_queue=False)
+
+        self.assertFalse(any(isinstance(h, NonBlockingQueueHandler) for h in logging.root.handlers))
+        self.assertIsNone(core_logging._queue_listener)
+        self.assertIn("Queued message", self.read_log())
+
+
+class TestRateLimitFilter(unittest.TestCase):
+    """Test cases for the RateLimitFilter class."""
+
+    def make_record(self, message, lineno=10):
+        """Create a record logged from a given line."""
+        return logging.LogRecord("test", logging.INFO, "/src/module.py", lineno, message, None, None)
+
+    def test_formatted_messages_from_one_call_site_are_limited(self):
+        """Test that f-string messages logged from the same line share one rate limit."""
+        rate_filter = RateLimitFilter(rate_limit=0.001, burst=2)
+
+        results = [rate_filter.filter(self.make_record(f"Item {i}")) for i in range(5)]
+
+        self.assertEqual(results, [True, True, False, False, False])
+        self.assertEqual(rate_filter.rate_limited, 3)
+        self.assertTrue(rate_filter.filter(self.make_record("Item 0", lineno=11)))
+
+    def test_sampling_per_call_site(self):
+        """Test that every n-th record of a call site is kept."""
+        rate_filter = RateLimitFilter(sample_rate=0.5)
+
+        results = [rate_filter.filter(self.make_record(f"Item {i}")) for i in range(6)]
+
+        self.assertEqual(results, [True, True, False, True, False, True])
+        self.assertEqual(rate_filter.sampled_out, 2)
+
+    def test_state_is_bounded(self):
+        """Test that only the most recently used call sites are remembered."""
+        rate_filter = RateLimitFilter(sample_rate=0.5, rate_limit=1000, max_keys=3)
+
+        for lineno in range(10):
+            rate_filter.filter(self.make_record("Message", lineno=lineno))
+
+        self.assertEqual(len(rate_filter._sample_counters), 3)
+        self.assertEqual(len(rate_filter._buckets), 3)
+        self.assertEqual([key[2] for key in rate_filter._buckets], [7, 8, 9])
+
+    def test_higher_levels_always_pass(self):
+        """Test that records above the maximum level are not limited."""
+        rate_filter = RateLimitFilter(rate_limit=0.001, burst=1)
+        record = self.make_record("Failure")
+        record.levelno = logging.ERROR
+
+        self.assertTrue(all(rate_filter.filter(record) for _ in range(5)))
+
+
+if __name__ == "__main__":
+    unittest.main()
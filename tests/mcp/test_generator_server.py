@@ -0,0 +1,225 @@
+"""
+Tests für den MCP-Server-Generator und seinen Prozess-Supervisor.
+"""
+
+import asyncio
+import importlib
+import json
+import os
+import socket
+import sys
+
+import pytest
+import pytest_asyncio
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="module")
+def generator_module():
+    """Fixture für das Modul des Generators, das die gemeinsame Bibliothek benötigt."""
+    sys.path.append(os.path.join(ROOT, "scripts", "common", "python"))
+    return importlib.import_module("src.mcp.generator_server")
+
+
+@pytest_asyncio.fixture
+async def generator(generator_module, tmp_path):
+    """Fixture für einen Generator mit eigenem Serververzeichnis."""
+    generator = generator_module.MCPServerGenerator(servers_dir=str(tmp_path))
+    try:
+        yield generator
+    finally:
+        await generator.supervisor.shutdown()
+
+
+def free_port():
+    """Ermittle einen freien TCP-Port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def call_function(port, function_name, parameters, timeout=10.0):
+    """Rufe eine Funktion eines generierten Servers auf, sobald er Verbindungen annimmt."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            break
+        except OSError:
+            if asyncio.get_running_loop().time() > deadline:
+                raise
+            await asyncio.sleep(0.05)
+
+    request = {
+        "method": "mcp.call_function",
+        "params": {"function_name": function_name, "parameters": parameters},
+        "id": 1,
+    }
+    writer.write(f"{json.dumps(request)}\n".encode())
+    await writer.drain()
+    response = json.loads(await asyncio.wait_for(reader.readline(), timeout))
+    writer.close()
+    await writer.wait_closed()
+    return response
+
+
+@pytest.mark.asyncio
+async def test_database_server_started_by_supervisor(generator, tmp_path):
+    """Ein Datenbank-Server legt seine Datenbank im eigenen Serververzeichnis an."""
+    port = free_port()
+    server_id = generator._create_server_from_template({
+        "name": "Datenbank",
+        "template": "database",
+        "parameters": {"port": port},
+    })["server_id"]
+
+    result = await generator._start_server({"server_id": server_id})
+    assert result["success"], result
+
+    response = await call_function(port, "create_table", {
+        "table_name": "items",
+        "columns": [{"name": "name", "type": "TEXT"}],
+    })
+
+    assert response["result"] == {"success": True, "message": "Table created: items"}
+    assert (tmp_path / server_id / "database.db").is_file()
+
+
+@pytest.mark.asyncio
+async def test_database_server_without_server_id(generator, tmp_path):
+    """Auch ohne --server-id findet ein Datenbank-Server seine Datenbank."""
+    port = free_port()
+    server_id = generator._create_server_from_template({
+        "name": "Datenbank",
+        "template": "database",
+        "parameters": {"port": port},
+    })["server_id"]
+
+    await generator.supervisor.start(server_id)
+    response = await call_function(port, "create_table", {
+        "table_name": "items",
+        "columns": [{"name": "name", "type": "TEXT"}],
+    })
+
+    assert response["result"]["success"], response
+    assert (tmp_path / server_id / "database.db").is_file()
+
+
+TICKING_SERVER = """
+import sys
+import time
+
+print("gestartet", sys.argv[1:])
+while True:
+    print("tick")
+    time.sleep(0.05)
+"""
+
+
+def write_server(servers_dir, server_id, code):
+    """Lege die server.py eines Servers an."""
+    server_dir = servers_dir / server_id
+    server_dir.mkdir(parents=True, exist_ok=True)
+    (server_dir / "server.py").write_text(code)
+    return server_dir
+
+
+async def wait_for(condition, timeout=10.0):
+    """Warte, bis eine Bedingung erfüllt ist."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "Zeitüberschreitung"
+        await asyncio.sleep(0.05)
+
+
+@pytest.mark.asyncio
+async def test_supervisor_writes_output_to_log(generator_module, tmp_path):
+    """Die Ausgabe eines Servers landet in seiner Logdatei."""
+    server_dir = write_server(tmp_path, "ticker", TICKING_SERVER)
+    supervisor = generator_module.ProcessSupervisor(str(tmp_path))
+    await supervisor.prewarm()
+
+    try:
+        await supervisor.start("ticker", ["--server-id", "ticker"])
+        log = server_dir / "server.log"
+        await wait_for(lambda: log.is_file() and "tick" in log.read_text())
+
+        assert "gestartet ['--server-id', 'ticker']" in log.read_text()
+        assert supervisor.get_status("ticker")["status"] == "running"
+    finally:
+        await supervisor.shutdown()
+
+    assert supervisor.get_status("ticker")["status"] == "stopped"
+
+
+@pytest.mark.asyncio
+async def test_supervisor_rotates_large_log_on_start(generator_module, tmp_path):
+    """Eine zu große Logdatei wird vor dem Start rotiert."""
+    server_dir = write_server(tmp_path, "ticker", TICKING_SERVER)
+    (server_dir / "server.log").write_text("alt\n" * 100)
+    supervisor = generator_module.ProcessSupervisor(str(tmp_path), warm_pool_size=0, log_max_bytes=100)
+
+    try:
+        await supervisor.start("ticker")
+        log = server_dir / "server.log"
+        await wait_for(lambda: log.is_file() and "tick" in log.read_text())
+    finally:
+        await supervisor.shutdown()
+
+    assert (server_dir / "server.log.1").read_text() == "alt\n" * 100
+    assert "alt" not in (server_dir / "server.log").read_text()
+
+
+@pytest.mark.asyncio
+async def test_supervisor_reports_exit(generator_module, tmp_path):
+    """Das Ende eines Servers wird mit seinem Exit-Code gemeldet."""
+    write_server(tmp_path, "exit", "import sys\nsys.exit(3)\n")
+    exits = []
+    supervisor = generator_module.ProcessSupervisor(
+        str(tmp_path), warm_pool_size=0, on_exit=lambda server_id, code: exits.append((server_id, code))
+    )
+
+    try:
+        await supervisor.start("exit")
+        await wait_for(lambda: exits)
+
+        assert exits == [("exit", 3)]
+        assert supervisor.get_status("exit") == {"status": "stopped", "returncode": 3}
+    finally:
+        await supervisor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_adopted_server_survives_previous_generator(generator_module, tmp_path):
+    """Ein übernommener Server läuft weiter und schreibt Logs, nachdem sein Generator beendet wurde."""
+    server_dir = write_server(tmp_path, "ticker", TICKING_SERVER)
+    # Der erste Generator startet den Server und stürzt ab, ohne ihn zu stoppen
+    starter = (
+        "import asyncio, os, sys\n"
+        "from src.mcp.generator_server import ProcessSupervisor\n"
+        "async def main():\n"
+        "    supervisor = ProcessSupervisor(sys.argv[1], warm_pool_size=0)\n"
+        "    print(await supervisor.start('ticker'), flush=True)\n"
+        "    os._exit(0)\n"
+        "asyncio.run(main())\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, os.path.join(ROOT, "scripts", "common", "python")]))
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", starter, str(tmp_path), cwd=str(tmp_path), env=env, stdout=asyncio.subprocess.PIPE
+    )
+    stdout, _ = await asyncio.wait_for(process.communicate(), 30)
+    pid = int(stdout.decode().split()[-1])
+
+    supervisor = generator_module.ProcessSupervisor(str(tmp_path), warm_pool_size=0)
+    try:
+        assert supervisor.adopt("ticker", pid)
+        log = server_dir / "server.log"
+        await wait_for(log.is_file)
+        size = log.stat().st_size
+        await wait_for(lambda: log.stat().st_size > size + 50)
+        assert supervisor.is_running("ticker")
+    finally:
+        await supervisor.stop("ticker")
+
+    assert not supervisor.is_running("ticker")
@@ -0,0 +1,70 @@
+"""
+Tests für den Artefakt-Cache des MCP Hub.
+"""
+
+import os
+
+import pytest
+
+from src.mcp_hub import artifact_cache as artifact_cache_module
+from src.mcp_hub.artifact_cache import ArtifactCache
+
+
+@pytest.fixture
+def artifact_cache(tmp_path):
+    """Fixture für einen leeren Artefakt-Cache."""
+    return ArtifactCache(str(tmp_path / "cache"))
+
+
+def write_package(server_dir, content):
+    """Lege ein Paket in den node_modules eines Servers an."""
+    package_dir = server_dir / "node_modules" / "left-pad"
+    package_dir.mkdir(parents=True, exist_ok=True)
+    (package_dir / "index.js").write_text(content)
+    return package_dir / "index.js"
+
+
+def test_restored_node_modules_do_not_share_files_with_cache(artifact_cache, tmp_path):
+    """Änderungen in einem Server dürfen den Cache-Eintrag nicht verändern."""
+    first = tmp_path / "first"
+    write_package(first, "original")
+    artifact_cache.save_node_modules("key", str(first))
+
+    second = tmp_path / "second"
+    second.mkdir()
+    assert artifact_cache.restore_node_modules("key", str(second))
+
+    # Wie patch-package: die Datei wird an Ort und Stelle überschrieben
+    (second / "node_modules" / "left-pad" / "index.js").write_text("patched")
+
+    third = tmp_path / "third"
+    third.mkdir()
+    assert artifact_cache.restore_node_modules("key", str(third))
+    assert (third / "node_modules" / "left-pad" / "index.js").read_text() == "original"
+
+    # Auch Änderungen am ursprünglichen Server erreichen den Cache nicht
+    (first / "node_modules" / "left-pad" / "index.js").write_text("changed")
+    cached = os.path.join(artifact_cache.node_modules_dir, "key", "left-pad", "index.js")
+    with open(cached) as f:
+        assert f.read() == "original"
+
+
+def test_restore_without_cache_entry(artifact_cache, tmp_path):
+    """Ohne Cache-Eintrag wird nichts wiederhergestellt."""
+    assert not artifact_cache.restore_node_modules("missing", str(tmp_path))
+    assert not (tmp_path / "node_modules").exists()
+
+
+def test_npm_key_depends_on_node_runtime(artifact_cache, tmp_path, monkeypatch):
+    """Der npm-Schlüssel ändert sich mit Node.js-Version, Plattform und Architektur."""
+    (tmp_path / "package.json").write_text('{"name": "server"}')
+    monkeypatch.setattr(artifact_cache_module, "node_version", lambda: "v18.0.0")
+    key = artifact_cache.npm_key(str(tmp_path))
+    assert artifact_cache.npm_key(str(tmp_path)) == key
+
+    monkeypatch.setattr(artifact_cache_module, "node_version", lambda: "v20.0.0")
+    upgraded = artifact_cache.npm_key(str(tmp_path))
+    assert upgraded != key
+
+    monkeypatch.setattr(artifact_cache_module.platform, "machine", lambda: "other-arch")
+    assert artifact_cache.npm_key(str(tmp_path)) not in (key, upgraded)
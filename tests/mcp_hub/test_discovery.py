@@ -0,0 +1,144 @@
+"""
+Tests für die Discovery-Engine des MCP Hub.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.mcp_hub.core.config import settings
+from src.mcp_hub.core.discovery import DiscoveryEngine, expand_hosts, expand_ports
+from src.mcp_hub.models.server import ServerInfo, ServerProtocol, ServerStatus, ServerType
+
+
+@pytest.fixture
+def engine():
+    """Fixture für eine Discovery-Engine mit festen TTLs."""
+    return DiscoveryEngine(hosts=["localhost"], ports=["8000"], cache_ttl=60, negative_cache_ttl=10)
+
+
+def make_container(labels, status="running", attrs=None):
+    """Erstelle einen Docker-Container mit Labels."""
+    return SimpleNamespace(
+        id="abc123",
+        name="mcp-container",
+        status=status,
+        labels=labels,
+        attrs=attrs or {},
+    )
+
+
+def test_expand_hosts_with_networks():
+    """Hostnamen bleiben erhalten, Netze werden zu ihren Hosts erweitert."""
+    hosts = expand_hosts(["localhost", "10.0.0.0/30", "10.0.0.1", "192.168.1.7/32", "localhost"])
+
+    assert hosts == ["localhost", "10.0.0.1", "10.0.0.2", "192.168.1.7"]
+
+
+def test_expand_hosts_rejects_large_network():
+    """Netze über dem Limit werden abgelehnt, ohne sie zu erweitern."""
+    assert len(expand_hosts(["10.0.0.0/24"], limit=254)) == 254
+
+    with pytest.raises(ValueError, match="10.0.0.0/8"):
+        expand_hosts(["10.0.0.0/8"], limit=1000)
+    with pytest.raises(ValueError):
+        expand_hosts(["10.0.0.0/24", "localhost"], limit=254)
+
+
+def test_expand_ports_with_ranges():
+    """Portbereiche werden erweitert, doppelte Ports entfernt."""
+    assert expand_ports(["8000", "3456-3458", "3457", 9000]) == [8000, 3456, 3457, 3458, 9000]
+
+
+@pytest.mark.parametrize("entry", ["0", "65536", "90-80", "http"])
+def test_expand_ports_rejects_invalid_entries(entry):
+    """Ungültige Ports und Bereiche werden abgelehnt."""
+    with pytest.raises(ValueError):
+        expand_ports([entry])
+
+
+def test_get_targets_respects_maximum(monkeypatch):
+    """Die Anzahl der Ziele ist durch DISCOVERY_MAX_TARGETS begrenzt."""
+    monkeypatch.setattr(settings, "DISCOVERY_MAX_TARGETS", 100)
+
+    assert len(DiscoveryEngine(hosts=["10.0.0.0/27"], ports=["1-3"]).get_targets()) == 90
+
+    with pytest.raises(ValueError, match="Zu viele Discovery-Ziele"):
+        DiscoveryEngine(hosts=["10.0.0.0/26"], ports=["1-2"]).get_targets()
+    with pytest.raises(ValueError, match="Zu viele Discovery-Ziele"):
+        DiscoveryEngine(hosts=["10.0.0.0/8"], ports=["80"]).get_targets()
+
+
+def test_cached_entries_expire(engine):
+    """Gefundene und nicht erreichbare Ziele haben eigene TTLs."""
+    server = ServerInfo(
+        name="server", description="", version="1.0", type=ServerType.CUSTOM, protocol=ServerProtocol.HTTP
+    )
+    engine._cache[("localhost", 8000)] = (100.0, server)
+    engine._cache[("localhost", 8001)] = (100.0, None)
+
+    assert engine._cached(("localhost", 8000), 159.9) == (True, server)
+    assert engine._cached(("localhost", 8000), 160.0) == (False, None)
+    assert engine._cached(("localhost", 8001), 109.9) == (True, None)
+    assert engine._cached(("localhost", 8001), 110.0) == (False, None)
+    assert engine._cached(("localhost", 8002), 100.0) == (False, None)
+
+    engine.clear_cache()
+    assert engine._cached(("localhost", 8000), 100.0) == (False, None)
+
+
+def test_server_from_container_labels(engine):
+    """Die Labels eines Containers beschreiben den Server, veröffentlichte Ports werden bevorzugt."""
+    container = make_container(
+        {
+            "mcp.server": "true",
+            "mcp.server.name": "n8n",
+            "mcp.server.description": "Workflows",
+            "mcp.server.version": "2.0.0",
+            "mcp.server.type": "n8n",
+            "mcp.server.port": "5678",
+            "mcp.server.image": "n8nio/n8n",
+        },
+        attrs={"NetworkSettings": {
+            "Ports": {"5678/tcp": [{"HostIp": "0.0.0.0", "HostPort": "15678"}]},
+            "Networks": {"bridge": {"IPAddress": "172.17.0.2"}},
+        }},
+    )
+
+    server = engine._server_from_container(container)
+
+    assert (server.name, server.description, server.version) == ("n8n", "Workflows", "2.0.0")
+    assert server.type == ServerType.N8N
+    assert server.protocol == ServerProtocol.HTTP
+    assert str(server.url).rstrip("/") == "http://localhost:15678"
+    assert server.status == ServerStatus.ONLINE
+    assert server.metadata == {"container_id": "abc123", "image": "n8nio/n8n"}
+
+
+def test_server_from_container_defaults(engine):
+    """Ohne weitere Labels gelten Standardwerte; ohne veröffentlichten Port die Container-IP."""
+    container = make_container(
+        {"mcp.server": "true", "mcp.server.port": "3000"},
+        status="exited",
+        attrs={"NetworkSettings": {"Networks": {"bridge": {"IPAddress": "172.17.0.2"}}}},
+    )
+
+    server = engine._server_from_container(container)
+
+    assert server.name == "mcp-container"
+    assert server.type == ServerType.DOCKER
+    assert str(server.url).rstrip("/") == "http://172.17.0.2:3000"
+    assert server.status == ServerStatus.OFFLINE
+
+
+def test_server_from_container_stdio_has_no_url(engine):
+    """Server mit stdio-Protokoll erhalten keine URL."""
+    container = make_container({"mcp.server.protocol": "stdio", "mcp.server.port": "3000"})
+
+    assert engine._server_from_container(container).url is None
+
+
+def test_server_from_container_invalid_labels(engine):
+    """Ungültige Labels führen zu keinem Server."""
+    assert engine._server_from_container(make_container({"mcp.server.type": "unbekannt"})) is None
+    assert engine._server_from_container(make_container({"mcp.server.protocol": "ftp"})) is None
@@ -0,0 +1,172 @@
+"""
+Tests für die Lifecycle-Verwaltung des MCP Hub.
+"""
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from src.mcp_hub.artifact_cache import ArtifactCache
+from src.mcp_hub.lifecycle import PID_FILE, DependencyError, ServerLifecycle, dependency_levels
+
+
+@pytest.fixture
+def lifecycle(tmp_path):
+    """Fixture für eine Lifecycle-Verwaltung mit eigenem Artefakt-Cache."""
+    return ServerLifecycle(max_parallel=8, artifact_cache=ArtifactCache(str(tmp_path / "cache")))
+
+
+class RecordingOperation:
+    """Operation, die Beginn und Ende je Server aufzeichnet."""
+
+    def __init__(self, failures=(), delay=0.02):
+        self.failures = set(failures)
+        self.delay = delay
+        self.events = []
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, server_id, server_info):
+        self.events.append(("start", server_id))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        self.events.append(("end", server_id))
+        return server_id not in self.failures
+
+    def index(self, event, server_id):
+        return self.events.index((event, server_id))
+
+
+def test_dependency_levels_in_start_order():
+    """Server stehen in der Ebene nach ihren Abhängigkeiten."""
+    levels = dependency_levels(
+        ["web", "api", "db", "cache"],
+        {"web": ["api"], "api": ["db", "cache"], "db": ["extern"], "cache": ["cache"]},
+    )
+
+    assert levels == [["cache", "db"], ["api"], ["web"]]
+
+
+def test_dependency_levels_reject_cycles():
+    """Zyklische Abhängigkeiten werden mit den beteiligten Servern gemeldet."""
+    with pytest.raises(DependencyError, match="a, b, c"):
+        dependency_levels(["a", "b", "c", "d"], {"a": ["c"], "b": ["a"], "c": ["b"]})
+
+
+@pytest.mark.asyncio
+async def test_run_ordered_waits_only_for_own_dependencies(lifecycle):
+    """Ein Server startet nach seinen Abhängigkeiten, unabhängige Server laufen parallel."""
+    operation = RecordingOperation()
+    operation_delays = {"slow": 0.2}
+
+    async def run(server_id, server_info):
+        if server_id in operation_delays:
+            await asyncio.sleep(operation_delays[server_id])
+        return await operation(server_id, server_info)
+
+    servers = {server_id: {} for server_id in ["db", "api", "slow", "worker"]}
+    results = await lifecycle._run_ordered(
+        servers, {"api": ["db"], "worker": ["slow"]}, run, reverse=False
+    )
+
+    assert results == {"db": True, "api": True, "slow": True, "worker": True}
+    assert operation.index("end", "db") < operation.index("start", "api")
+    assert operation.index("end", "slow") < operation.index("start", "worker")
+    # api wartet nicht auf slow, obwohl beide in derselben Ebene liegen
+    assert operation.index("end", "api") < operation.index("start", "slow")
+
+
+@pytest.mark.asyncio
+async def test_run_ordered_skips_dependents_of_failed_start(lifecycle):
+    """Schlägt der Start einer Abhängigkeit fehl, wird der abhängige Server nicht gestartet."""
+    operation = RecordingOperation(failures={"db"})
+
+    results = await lifecycle._run_ordered(
+        {"db": {}, "api": {}, "cache": {}}, {"api": ["db"]}, operation, reverse=False
+    )
+
+    assert results == {"db": False, "api": False, "cache": True}
+    assert ("start", "api") not in operation.events
+
+
+@pytest.mark.asyncio
+async def test_run_ordered_stops_dependents_first(lifecycle):
+    """Beim Stoppen werden abhängige Server vor ihren Abhängigkeiten gestoppt."""
+    operation = RecordingOperation(failures={"api"})
+
+    results = await lifecycle._run_ordered(
+        {"db": {}, "api": {}, "web": {}}, {"web": ["api"], "api": ["db"]}, operation, reverse=True
+    )
+
+    assert results == {"db": True, "api": False, "web": True}
+    assert operation.index("end", "web") < operation.index("start", "api")
+    assert operation.index("end", "api") < operation.index("start", "db")
+
+
+@pytest.mark.asyncio
+async def test_run_ordered_limits_parallelism(tmp_path):
+    """Es laufen höchstens max_parallel Operationen gleichzeitig."""
+    lifecycle = ServerLifecycle(max_parallel=2, artifact_cache=ArtifactCache(str(tmp_path / "cache")))
+    operation = RecordingOperation()
+
+    await lifecycle._run_ordered({str(index): {} for index in range(6)}, {}, operation, reverse=False)
+
+    assert operation.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_run_ordered_rejects_cycles_before_running(lifecycle):
+    """Bei zyklischen Abhängigkeiten wird keine Operation ausgeführt."""
+    operation = RecordingOperation()
+
+    with pytest.raises(DependencyError):
+        await lifecycle._run_ordered({"a": {}, "b": {}}, {"a": ["b"], "b": ["a"]}, operation, reverse=False)
+
+    assert operation.events == []
+
+
+@pytest.mark.asyncio
+async def test_server_started_by_other_hub_can_be_stopped(tmp_path):
+    """Ein späterer Hub-Aufruf findet einen gestarteten Server über die PID-Datei."""
+    server_dir = tmp_path / "server"
+    server_dir.mkdir()
+    (server_dir / "main.py").write_text("import time\ntime.sleep(60)\n")
+    server_info = {"path": str(server_dir), "type": "python"}
+
+    first = ServerLifecycle(artifact_cache=ArtifactCache(str(tmp_path / "cache")))
+    assert await first.start("server", server_info)
+    process = first.processes["server"]
+    # Der erste Hub räumt seinen Kindprozess wie ein beendeter Elternprozess ab
+    threading.Thread(target=process.wait, daemon=True).start()
+
+    second = ServerLifecycle(artifact_cache=ArtifactCache(str(tmp_path / "cache")))
+    assert second.status("server", server_info, None) == {"status": "running", "type": "python", "pid": process.pid}
+    assert await second.start("server", server_info)
+    assert second.processes == {}
+
+    assert await second.stop("server", server_info)
+    await asyncio.sleep(0.1)
+
+    assert process.poll() is not None
+    assert not (server_dir / PID_FILE).exists()
+    assert second.status("server", server_info, None) == {"status": "unknown", "type": "python"}
+    assert not await second.stop("server", server_info)
+
+
+@pytest.mark.asyncio
+async def test_stale_pid_file_is_ignored(lifecycle, tmp_path):
+    """Eine PID-Datei ohne laufenden Prozess wird verworfen."""
+    server_dir = tmp_path / "server"
+    server_dir.mkdir()
+    process = await asyncio.create_subprocess_exec("true")
+    await process.wait()
+    (server_dir / PID_FILE).write_text(str(process.pid))
+
+    status = lifecycle.status("server", {"path": str(server_dir), "type": "nodejs"}, None)
+
+    assert status == {"status": "unknown", "type": "nodejs"}
+    assert not os.path.exists(server_dir / PID_FILE)
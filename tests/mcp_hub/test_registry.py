@@ -23,6 +23,10 @@ def registry_file():
     
     # Aufräumen
     os.unlink(f.name)
+    for suffix in (".db", ".db-wal", ".db-shm"):
+        db_file = Path(f.name).with_suffix(suffix)
+        if db_file.exists():
+            db_file.unlink()
 
 
 @pytest.fixture
@@ -186,6 +190,24 @@ def test_list_servers(registry_manager):
     assert any(s.name == "test-server-2" for s in servers)
 
 
+def test_failed_write_keeps_registry(registry_manager):
+    """Teste, ob die Registry bei einem Fehler der Datenbank unverändert bleibt."""
+    registry_manager.store.close()
+    
+    # Schreibvorgänge auf die geschlossene Datenbank schlagen fehl
+    registry_manager.add_repository("https://github.com/example/repo")
+    registry_manager.add_server(ServerConfig(
+        name="test-server",
+        description="Test Server",
+        type=ServerType.DOCKER,
+        protocol=ServerProtocol.HTTP,
+        url="http://mcp.example.com:3458",
+    ))
+    
+    assert "https://github.com/example/repo" not in registry_manager.registry.repositories
+    assert "test-server" not in registry_manager.registry.servers
+
+
 @pytest.mark.asyncio
 async def test_discover_servers(registry_manager):
     """Teste das Entdecken von Servern."""
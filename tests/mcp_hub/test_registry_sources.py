@@ -0,0 +1,51 @@
+"""
+Tests für die Repository-Quellen der MCP Server Registry.
+"""
+
+import subprocess
+
+import pytest
+
+from src.mcp_hub.registry import MCPServerRegistry
+
+
+def make_repository(path, readme):
+    """Lege ein Git-Repository mit einer README.md an und gib den Commit zurück."""
+    path.mkdir(parents=True)
+    (path / "README.md").write_text(readme)
+    git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    subprocess.run(git + ["init", "-q"], cwd=path, check=True)
+    subprocess.run(git + ["add", "README.md"], cwd=path, check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "init"], cwd=path, check=True)
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=path, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Fixture für eine Registry mit eigenem Cache-Verzeichnis."""
+    return MCPServerRegistry(cache_dir=str(tmp_path / "cache"))
+
+
+def test_cache_dir_depends_on_full_url(registry):
+    """Gleichnamige Repositories verschiedener Besitzer erhalten eigene Verzeichnisse."""
+    first = registry._repo_cache_dir("https://github.com/org-a/servers")
+    second = registry._repo_cache_dir("https://github.com/org-b/servers")
+
+    assert first != second
+    assert first == registry._repo_cache_dir("https://github.com/org-a/servers")
+
+
+def test_repositories_with_same_name_are_cloned_separately(registry, tmp_path):
+    """Jedes Repository wird aus seiner eigenen URL geklont."""
+    commit_a = make_repository(tmp_path / "org-a" / "servers", "# Server A\n")
+    commit_b = make_repository(tmp_path / "org-b" / "servers", "# Server B\n")
+    url_a = (tmp_path / "org-a" / "servers").as_uri()
+    url_b = (tmp_path / "org-b" / "servers").as_uri()
+
+    state_a, _ = registry._update_from_repository(url_a)
+    state_b, _ = registry._update_from_repository(url_b)
+
+    assert state_a["commit"] == commit_a
+    assert state_b["commit"] == commit_b
@@ -0,0 +1,80 @@
+"""
+Tests für den Suchindex des MCP Hub.
+"""
+
+import pytest
+
+from src.mcp_hub.search_index import SearchIndex, edit_distance
+
+
+@pytest.fixture
+def search_index():
+    """Fixture für einen Suchindex mit einigen Servern."""
+    servers = {
+        "postgres-mcp": {
+            "id": "postgres-mcp",
+            "name": "Postgres MCP",
+            "description": "Query PostgreSQL databases",
+            "source": "github",
+            "tags": ["databases"],
+        },
+        "sqlite-mcp": {
+            "id": "sqlite-mcp",
+            "name": "SQLite",
+            "description": "SQLite server",
+            "source": "github",
+            "tags": ["databases"],
+        },
+        "puppeteer-mcp": {
+            "id": "puppeteer-mcp",
+            "name": "Puppeteer",
+            "description": "Browser automation server",
+            "source": "docker_hub",
+            "tags": ["browser"],
+        },
+    }
+    return SearchIndex.build(servers)
+
+
+def test_search_ranks_name_matches_first(search_index):
+    """Teste, dass Treffer im Namen vor Treffern in der Beschreibung stehen."""
+    results = search_index.search("sqlite")
+
+    assert [server["id"] for server in results] == ["sqlite-mcp"]
+
+
+def test_search_prefix_and_typo(search_index):
+    """Teste die Suche nach Präfixen und mit Tippfehlern."""
+    assert [server["id"] for server in search_index.search("postg")] == ["postgres-mcp"]
+    assert [server["id"] for server in search_index.search("puppeter")] == ["puppeteer-mcp"]
+
+
+def test_search_requires_all_tokens(search_index):
+    """Teste, dass jedes Token der Suchanfrage passen muss."""
+    assert [server["id"] for server in search_index.search("browser server")] == ["puppeteer-mcp"]
+    assert search_index.search("browser postgres") == []
+
+
+def test_search_tag_filter(search_index):
+    """Teste das Filtern nach Tags."""
+    assert [server["id"] for server in search_index.search("server", tags=["databases"])] == ["sqlite-mcp"]
+    assert [server["id"] for server in search_index.search("", tags=["docker_hub"])] == ["puppeteer-mcp"]
+
+
+def test_save_and_load(search_index, tmp_path):
+    """Teste das Speichern und Laden des Suchindex."""
+    index_file = str(tmp_path / "search_index.json")
+    search_index.save(index_file)
+
+    loaded = SearchIndex.load(index_file)
+
+    assert loaded is not None
+    assert loaded.search("postgres") == search_index.search("postgres")
+    assert loaded.get_tags() == search_index.get_tags()
+
+
+def test_edit_distance():
+    """Teste die Levenshtein-Distanz mit frühem Abbruch."""
+    assert edit_distance("server", "srver", 1) == 1
+    assert edit_distance("server", "sever", 2) == 1
+    assert edit_distance("server", "browser", 1) == 2
@@ -0,0 +1,99 @@
+"""
+Tests für den SQLite-Speicher der Registry des MCP Hub.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from src.mcp_hub.core.store import RegistryStore
+from src.mcp_hub.models.server import ServerConfig, ServerProtocol, ServerRegistry, ServerType
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    """Fixture für den Pfad einer Registry-Datenbank."""
+    return tmp_path / "registry.db"
+
+
+@pytest.fixture
+def store(db_file):
+    """Fixture für einen Registry-Speicher."""
+    store = RegistryStore(db_file)
+    yield store
+    store.close()
+
+
+def make_server(name="test-server"):
+    """Erstelle eine Serverkonfiguration."""
+    return ServerConfig(
+        name=name,
+        description="Test Server",
+        type=ServerType.DOCKER,
+        protocol=ServerProtocol.HTTP,
+        url="http://mcp.example.com:3458",
+    )
+
+
+def test_point_updates_persist(store, db_file):
+    """Teste, ob Einzelaktualisierungen nach einem Neustart erhalten bleiben."""
+    last_updated = datetime(2024, 1, 1, 12, 0)
+    store.add_repository("https://github.com/example/repo")
+    store.add_repository("https://github.com/example/other")
+    store.add_repository("https://github.com/example/third")
+    store.remove_repository("https://github.com/example/other")
+    store.add_docker_hub_user("example")
+    store.put_server(make_server())
+    store.put_server(make_server("removed"))
+    store.delete_server("removed", last_updated)
+
+    reloaded = RegistryStore(db_file).load()
+
+    assert reloaded.repositories == ["https://github.com/example/repo", "https://github.com/example/third"]
+    assert reloaded.docker_hub_users == ["example"]
+    assert list(reloaded.servers) == ["test-server"]
+    assert reloaded.servers["test-server"] == make_server()
+    assert reloaded.last_updated == last_updated
+
+
+def test_repository_is_added_once(store):
+    """Teste, ob ein Repository nur einmal gespeichert wird."""
+    store.add_repository("https://github.com/example/repo")
+    store.add_repository("https://github.com/example/repo")
+
+    assert store.load().repositories == ["https://github.com/example/repo"]
+
+
+def test_replace_and_export(store, tmp_path):
+    """Teste das Übernehmen einer ganzen Registry und den Export als JSON."""
+    assert not store.initialized
+    store.put_server(make_server("old"))
+
+    store.replace(ServerRegistry(
+        servers={"test-server": make_server()},
+        repositories=["https://github.com/example/repo"],
+        docker_hub_users=["example"],
+    ), source="registry.json")
+
+    assert store.initialized
+    registry = store.load()
+    assert list(registry.servers) == ["test-server"]
+    assert registry.repositories == ["https://github.com/example/repo"]
+
+    path = tmp_path / "export.json"
+    store.export_json(path)
+    with open(path) as f:
+        data = json.load(f)
+    assert data["docker_hub_users"] == ["example"]
+    assert data["servers"]["test-server"]["url"].rstrip("/") == "http://mcp.example.com:3458"
+
+
+def test_failed_transaction_is_rolled_back(store):
+    """Teste, ob eine fehlgeschlagene Transaktion keine Änderungen hinterlässt."""
+    with pytest.raises(RuntimeError):
+        with store._transaction() as connection:
+            connection.execute("INSERT INTO repositories (url, position) VALUES ('partial', 0)")
+            raise RuntimeError("Abbruch")
+
+    assert store.load().repositories == []
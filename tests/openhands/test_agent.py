@@ -0,0 +1,29 @@
+"""
+Tests für die Konfiguration des OpenHands Agents.
+"""
+
+import copy
+
+from src.common.config_manager import ConfigManager
+from src.openhands.agent import DEFAULT_CONFIG, load_agent_config
+
+
+def test_changed_config_keeps_default(tmp_path):
+    """Änderungen an der geladenen Konfiguration verändern die Standardkonfiguration nicht."""
+    expected = copy.deepcopy(DEFAULT_CONFIG)
+
+    config = load_agent_config(ConfigManager(str(tmp_path)))
+    config["openhands"]["model"] = "anderes-modell"
+    config["openhands"]["mcp_servers"].append({"name": "extra", "url": "http://localhost:3999"})
+
+    assert DEFAULT_CONFIG == expected
+    assert load_agent_config(ConfigManager(str(tmp_path / "neu"))) == expected
+
+
+def test_config_file_overrides_default(tmp_path):
+    """Eine vorhandene Konfigurationsdatei wird geladen."""
+    (tmp_path / "agent.json").write_text('{"openhands": {"model": "lokal"}}')
+
+    config = load_agent_config(ConfigManager(str(tmp_path)), "agent")
+
+    assert config["openhands"]["model"] == "lokal"
@@ -0,0 +1,138 @@
+"""
+Tests für die parallele Ausführung von Schritten im asynchronen OpenHands Agent.
+"""
+
+import asyncio
+
+import pytest
+
+from src.openhands.async_agent import AsyncOpenHandsAgent, StepStatus
+
+
+class FakeOpenHands:
+    """Ersetzt die Anfragen an OpenHands und zeichnet die Parallelität auf."""
+
+    def __init__(self, delays=None, failures=()):
+        self.delays = delays or {}
+        self.failures = set(failures)
+        self.running = 0
+        self.max_running = 0
+        self.contexts = {}
+        self.cancelled = []
+
+    async def execute_task(self, task, context=None, timeout=None):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.contexts[task] = context
+        try:
+            await asyncio.sleep(self.delays.get(task, 0.05))
+            if task in self.failures:
+                raise Exception(f"{task} fehlgeschlagen")
+            return {"task": task}
+        except asyncio.CancelledError:
+            self.cancelled.append(task)
+            raise
+        finally:
+            self.running -= 1
+
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    """Fixture für einen Agent, dessen Anfragen an OpenHands ersetzt sind."""
+    monkeypatch.chdir(tmp_path)
+    agent = AsyncOpenHandsAgent(max_concurrent_steps=8)
+    agent.fake = FakeOpenHands()
+    monkeypatch.setattr(agent, "execute_task", agent.fake.execute_task)
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_run_concurrently(agent):
+    """Unabhängige Schritte laufen gleichzeitig, abhängige erhalten deren Ergebnisse."""
+    results = await agent.run_steps([
+        {"id": "a", "task": "a"},
+        {"id": "b", "task": "b"},
+        {"id": "c", "task": "c", "depends_on": ["a", "b"]},
+    ])
+
+    assert {step_id: result.status for step_id, result in results.items()} == {
+        "a": StepStatus.COMPLETED,
+        "b": StepStatus.COMPLETED,
+        "c": StepStatus.COMPLETED,
+    }
+    assert agent.fake.max_running == 2
+    assert agent.fake.contexts["c"]["dependencies"] == {"a": {"task": "a"}, "b": {"task": "b"}}
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_limited(agent):
+    """Es laufen nie mehr als max_concurrent_steps Schritte gleichzeitig."""
+    agent.max_concurrent_steps = 2
+
+    results = await agent.run_steps([{"id": str(index), "task": str(index)} for index in range(6)])
+
+    assert all(result.status == StepStatus.COMPLETED for result in results.values())
+    assert agent.fake.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_dependency_skips_dependents(agent):
+    """Schlägt eine Abhängigkeit fehl, wird der abhängige Schritt übersprungen."""
+    agent.fake.failures.add("a")
+
+    results = await agent.run_steps([
+        {"id": "a", "task": "a"},
+        {"id": "b", "task": "b", "depends_on": ["a"]},
+    ])
+
+    assert results["a"].status == StepStatus.FAILED
+    assert results["a"].error == "a fehlgeschlagen"
+    assert results["b"].status == StepStatus.SKIPPED
+    assert "b" not in agent.fake.contexts
+
+
+@pytest.mark.asyncio
+async def test_step_timeout(agent):
+    """Ein Schritt, der sein Timeout überschreitet, wird abgebrochen."""
+    agent.fake.delays["slow"] = 5.0
+
+    results = await agent.run_steps([{"id": "slow", "task": "slow", "timeout": 0.05}])
+
+    assert results["slow"].status == StepStatus.TIMEOUT
+    assert agent.fake.cancelled == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_cancels_running_steps(agent):
+    """Mit fail_fast werden laufende Schritte beim ersten Fehler abgebrochen."""
+    agent.fake.failures.add("a")
+    agent.fake.delays["slow"] = 5.0
+
+    results = await asyncio.wait_for(agent.run_steps([
+        {"id": "a", "task": "a"},
+        {"id": "slow", "task": "slow"},
+        {"id": "after", "task": "after", "depends_on": ["slow"]},
+    ], fail_fast=True), 2)
+
+    assert results["a"].status == StepStatus.FAILED
+    assert results["slow"].status == StepStatus.CANCELLED
+    assert results["after"].status == StepStatus.SKIPPED
+    assert agent.fake.cancelled == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_caller_cancels_steps(agent):
+    """Wird der Aufrufer abgebrochen, werden alle laufenden Schritte abgebrochen."""
+    agent.fake.delays.update({"a": 5.0, "b": 5.0})
+    task = asyncio.ensure_future(agent.run_steps([
+        {"id": "a", "task": "a"},
+        {"id": "b", "task": "b"},
+    ]))
+    await asyncio.sleep(0.05)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert sorted(agent.fake.cancelled) == ["a", "b"]
+    assert agent.fake.running == 0
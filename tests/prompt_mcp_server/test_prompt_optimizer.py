@@ -0,0 +1,100 @@
+"""
+Tests für den Prompt-Optimierer des Prompt MCP Servers.
+"""
+
+import asyncio
+
+import pytest
+
+from src.prompt_mcp_server.prompt_mcp_server.core import template_manager as template_manager_module
+from src.prompt_mcp_server.prompt_mcp_server.core.prompt_optimizer import PromptOptimizer
+from src.prompt_mcp_server.prompt_mcp_server.core.template_manager import TemplateManager
+from src.prompt_mcp_server.prompt_mcp_server.models.template import TemplateCreate, TemplateUpdate
+
+
+@pytest.fixture
+def template_manager(tmp_path, monkeypatch):
+    """Fixture für einen Template-Manager mit eigenem Verzeichnis."""
+    monkeypatch.setattr(template_manager_module.settings, "TEMPLATES_DIRECTORY", str(tmp_path))
+    return TemplateManager()
+
+
+@pytest.fixture
+def template(template_manager):
+    """Fixture für ein Template, das Prompt und Analyse ausgibt."""
+    return template_manager.create_template(
+        TemplateCreate(name="strukturiert", content="{{ user_prompt }} ({{ prompt_type }}, {{ sprache }})")
+    )
+
+
+def test_wiederholter_prompt_wird_aus_dem_cache_geliefert(template_manager, template):
+    """Ein wiederholter Prompt mit gleichem Kontext wird nur einmal gerendert."""
+    optimizer = PromptOptimizer(template_manager)
+    context = {"sprache": "de"}
+
+    first = asyncio.run(optimizer.optimize_prompt("Was ist ein Graph?", template.id, context))
+    second = asyncio.run(optimizer.optimize_prompt("Was ist ein Graph?", template.id, {"sprache": "de"}))
+
+    assert first == second == "Was ist ein Graph? (question, de)"
+    assert context == {"sprache": "de"}
+    stats = optimizer.get_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+
+def test_anderer_kontext_wird_neu_gerendert(template_manager, template):
+    """Ein abweichender Kontext trifft keinen Cache-Eintrag eines anderen Kontexts."""
+    optimizer = PromptOptimizer(template_manager)
+
+    german = asyncio.run(optimizer.optimize_prompt("Was ist ein Graph?", template.id, {"sprache": "de"}))
+    english = asyncio.run(optimizer.optimize_prompt("Was ist ein Graph?", template.id, {"sprache": "en"}))
+
+    assert german.endswith("de)")
+    assert english.endswith("en)")
+    assert optimizer.get_cache_stats()["hits"] == 0
+
+
+def test_template_aenderung_macht_cache_ungueltig(template_manager, template):
+    """Nach einer Änderung des Templates wird der neue Inhalt gerendert."""
+    optimizer = PromptOptimizer(template_manager)
+    asyncio.run(optimizer.optimize_prompt("Hallo", template.id, {"sprache": "de"}))
+
+    template_manager.update_template(template.id, TemplateUpdate(content="Neu: {{ user_prompt }}"))
+    rendered = asyncio.run(optimizer.optimize_prompt("Hallo", template.id, {"sprache": "de"}))
+
+    assert rendered == "Neu: Hallo"
+
+
+def test_cache_ist_begrenzt(template_manager, template):
+    """Der Render-Cache verdrängt die ältesten Einträge, sobald er voll ist."""
+    optimizer = PromptOptimizer(template_manager, cache_size=2)
+
+    for prompt in ["eins", "zwei", "drei"]:
+        asyncio.run(optimizer.optimize_prompt(prompt, template.id, {"sprache": "de"}))
+
+    stats = optimizer.get_cache_stats()
+    assert (stats["size"], stats["evictions"]) == (2, 1)
+
+
+def test_batch_optimierung_behaelt_reihenfolge(template_manager, template):
+    """Die Batch-Optimierung liefert die Ergebnisse in Eingabereihenfolge und nutzt den Cache."""
+    optimizer = PromptOptimizer(template_manager)
+
+    results = asyncio.run(
+        optimizer.optimize_prompts(["Schreibe Code", "Was ist das?", "Schreibe Code"], template.id, {"sprache": "de"})
+    )
+
+    assert results == [
+        "Schreibe Code (instruction, de)",
+        "Was ist das? (question, de)",
+        "Schreibe Code (instruction, de)",
+    ]
+    assert optimizer.get_cache_stats()["hits"] == 1
+
+
+def test_batch_ohne_template_liefert_rohprompts(template_manager):
+    """Ohne passendes Template gibt die Batch-Optimierung die Rohprompts zurück."""
+    optimizer = PromptOptimizer(template_manager)
+
+    results = asyncio.run(optimizer.optimize_prompts(["a", "b"], "fehlt"))
+
+    assert results == ["a", "b"]
@@ -0,0 +1,132 @@
+"""
+Tests for the task cost estimator of the Prompt MCP Server.
+"""
+
+import asyncio
+
+import pytest
+
+from src.prompt_mcp_server.prompt_mcp_server.core import task_cost_estimator as task_cost_estimator_module
+from src.prompt_mcp_server.prompt_mcp_server.core.llm_selector import LLMSelector
+from src.prompt_mcp_server.prompt_mcp_server.core.task_cost_estimator import PriceMatrix, TaskCostEstimator
+from src.prompt_mcp_server.prompt_mcp_server.core.template_manager import TemplateManager
+from src.prompt_mcp_server.prompt_mcp_server.models.llm import LLMModel, ModelType
+
+PROMPTS = ["Summarise this paragraph.", "Write a sorting function in Python " * 20, "Hi"]
+
+
+def make_model(model_id, input_cost, output_cost):
+    """Create a model with the given prices per 1M tokens."""
+    return LLMModel(
+        id=model_id,
+        name=model_id.title(),
+        provider="Test",
+        type=ModelType.CLOUD,
+        context_length=8192,
+        input_cost=input_cost,
+        output_cost=output_cost,
+        complexity_handling=5.0,
+        quality_score=5.0,
+        token_processing_speed=100,
+    )
+
+
+@pytest.fixture
+def estimator(tmp_path, monkeypatch):
+    """Fixture for an estimator over a known catalogue, counting tokens with the heuristic."""
+    settings = task_cost_estimator_module.settings
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", None)
+    monkeypatch.setattr(settings, "ANTHROPIC_API_KEY", None)
+    monkeypatch.setattr(settings, "COHERE_API_KEY", None)
+    monkeypatch.setattr(settings, "USE_LOCAL_MODELS", False)
+    monkeypatch.setattr(settings, "TEMPLATES_DIRECTORY", str(tmp_path))
+    monkeypatch.setattr(settings, "TOKENIZER_VOCAB_DIRECTORY", None)
+
+    selector = LLMSelector()
+    selector.models = {
+        "gpt-3.5-turbo": make_model("gpt-3.5-turbo", 0.5, 1.5),
+        "pricey": make_model("pricey", 30.0, 60.0),
+        "cheap": make_model("cheap", 0.1, 0.2),
+        "middle": make_model("middle", 3.0, 15.0),
+    }
+    return TaskCostEstimator(selector, TemplateManager())
+
+
+def expected_costs(estimator, prompt, model_ids):
+    """Compute the total cost of a prompt per model directly from the model prices."""
+    input_tokens = estimator.estimate_tokens(prompt)
+    output_tokens = int(input_tokens * 1.5)
+    models = estimator.llm_selector.models
+    return {
+        model_id: (input_tokens * models[model_id].input_cost + output_tokens * models[model_id].output_cost) / 1_000_000
+        for model_id in model_ids
+    }
+
+
+def test_estimates_are_ordered_cheapest_first(estimator):
+    """Test that every requested model is priced and the estimates are sorted by total cost."""
+    result = asyncio.run(estimator.estimate_cost(PROMPTS[1]))
+
+    expected = expected_costs(estimator, PROMPTS[1], estimator.llm_selector.models)
+    assert [e["model"] for e in result["cost_estimates"]] == sorted(expected, key=expected.get)
+    for estimate in result["cost_estimates"]:
+        assert estimate["total_cost"] == pytest.approx(expected[estimate["model"]])
+        assert estimate["input_cost"] + estimate["output_cost"] == pytest.approx(estimate["total_cost"])
+    assert result["recommended_model"]["id"] in estimator.llm_selector.models
+
+
+def test_model_selection_and_top_k(estimator):
+    """Test that unknown models are skipped and top_k keeps only the cheapest models."""
+    selected = asyncio.run(estimator.estimate_cost(PROMPTS[0], model_ids=["pricey", "unknown", "middle"]))
+    cheapest = asyncio.run(estimator.estimate_cost(PROMPTS[0], top_k=2))
+
+    assert [e["model"] for e in selected["cost_estimates"]] == ["middle", "pricey"]
+    assert [e["model"] for e in cheapest["cost_estimates"]] == ["cheap", "gpt-3.5-turbo"]
+
+
+def test_batch_matches_single_estimates(estimator):
+    """Test that the batch endpoint returns the top-k single-prompt estimates in prompt order."""
+    batch = asyncio.run(estimator.estimate_costs_batch(PROMPTS, top_k=3))
+
+    assert len(batch) == len(PROMPTS)
+    for prompt, result in zip(PROMPTS, batch):
+        single = asyncio.run(estimator.estimate_cost(prompt, top_k=3))
+        assert result["estimated_input_tokens"] == single["estimated_input_tokens"]
+        assert result["complexity"] == single["complexity"]
+        assert [e["model"] for e in result["cost_estimates"]] == [e["model"] for e in single["cost_estimates"]]
+        assert [e["total_cost"] for e in result["cost_estimates"]] == pytest.approx(
+            [e["total_cost"] for e in single["cost_estimates"]]
+        )
+
+
+def test_batch_uses_expected_output_lengths(estimator):
+    """Test that expected output lengths set the output tokens and must match the prompts."""
+    batch = asyncio.run(estimator.estimate_costs_batch(PROMPTS[:2], expected_output_lengths=[400, None]))
+
+    assert batch[0]["estimated_output_tokens"] == 100
+    assert batch[1]["estimated_output_tokens"] == int(batch[1]["estimated_input_tokens"] * 1.5)
+    with pytest.raises(ValueError):
+        asyncio.run(estimator.estimate_costs_batch(PROMPTS, expected_output_lengths=[400]))
+
+
+def test_price_matrix_follows_catalogue_changes(estimator):
+    """Test that the price matrix is reused until the model catalogue changes."""
+    matrix = estimator._get_price_matrix()
+    assert estimator._get_price_matrix() is matrix
+
+    estimator.llm_selector.models["free"] = make_model("free", 0.0, 0.0)
+    result = asyncio.run(estimator.estimate_cost(PROMPTS[0], top_k=1))
+
+    assert estimator._get_price_matrix() is not matrix
+    assert [e["model"] for e in result["cost_estimates"]] == ["free"]
+
+
+def test_heap_and_sort_agree_on_cheapest_columns():
+    """Test that selecting the top k with a heap gives the prefix of the full ordering."""
+    costs = [5.0, 1.0, 4.0, 2.0, 3.0]
+    columns = [10, 11, 12, 13, 14]
+
+    ordered = PriceMatrix.cheapest(costs, columns)
+
+    assert ordered == [(1, 11), (3, 13), (4, 14), (2, 12), (0, 10)]
+    assert PriceMatrix.cheapest(costs, columns, top_k=2) == ordered[:2]
@@ -0,0 +1,127 @@
+"""
+Tests for the template manager of the Prompt MCP Server.
+"""
+
+import json
+
+import pytest
+
+from src.prompt_mcp_server.prompt_mcp_server.core import template_manager as template_manager_module
+from src.prompt_mcp_server.prompt_mcp_server.core.template_manager import (
+    INDEX_FILE,
+    JOURNAL_FILE,
+    TemplateManager,
+)
+from src.prompt_mcp_server.prompt_mcp_server.models.template import TemplateCreate, TemplateUpdate
+
+
+@pytest.fixture
+def templates_dir(tmp_path, monkeypatch):
+    """Fixture pointing the template manager at an empty directory."""
+    settings = template_manager_module.settings
+    monkeypatch.setattr(settings, "TEMPLATES_DIRECTORY", str(tmp_path))
+    monkeypatch.setattr(settings, "TEMPLATE_JOURNAL_COMPACT_THRESHOLD", 100)
+    monkeypatch.setattr(settings, "TEMPLATE_CACHE_SIZE", 128)
+    return tmp_path
+
+
+def read_journal(templates_dir):
+    """Read the records of the index journal."""
+    with open(templates_dir / JOURNAL_FILE) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_changes_are_journaled_and_reloaded(templates_dir):
+    """Test that every change appends one journal record and survives a restart."""
+    manager = TemplateManager()
+    kept = manager.create_template(TemplateCreate(name="kept", content="Hello {{ name }}"))
+    dropped = manager.create_template(TemplateCreate(name="dropped", content="Bye"))
+    manager.update_template(kept.id, TemplateUpdate(description="greeting"))
+    manager.delete_template(dropped.id)
+
+    assert not (templates_dir / INDEX_FILE).exists()
+    assert [record["op"] for record in read_journal(templates_dir)] == ["put", "put", "put", "delete"]
+    assert all("content" not in record.get("template", {}) for record in read_journal(templates_dir))
+    assert not (templates_dir / f"{dropped.id}.j2").exists()
+
+    reloaded = TemplateManager()
+    assert list(reloaded.templates) == [kept.id]
+    assert reloaded.get_template(kept.id).description == "greeting"
+    assert reloaded.get_template(kept.id).content == "Hello {{ name }}"
+
+
+def test_metadata_update_does_not_rewrite_content(templates_dir):
+    """Test that a metadata-only update leaves the content file untouched."""
+    manager = TemplateManager()
+    template = manager.create_template(TemplateCreate(name="greeting", content="Hello"))
+    content_file = templates_dir / f"{template.id}.j2"
+    mtime = content_file.stat().st_mtime_ns
+
+    manager.update_template(template.id, TemplateUpdate(tags=["a"]))
+
+    assert content_file.stat().st_mtime_ns == mtime
+
+
+def test_journal_is_compacted_into_index(templates_dir, monkeypatch):
+    """Test that the journal is folded into the index once it reaches the threshold."""
+    monkeypatch.setattr(template_manager_module.settings, "TEMPLATE_JOURNAL_COMPACT_THRESHOLD", 3)
+    manager = TemplateManager()
+    first = manager.create_template(TemplateCreate(name="b", content="B"))
+    second = manager.create_template(TemplateCreate(name="a", content="A"))
+    assert (templates_dir / JOURNAL_FILE).exists()
+
+    manager.update_template(first.id, TemplateUpdate(name="c"))
+
+    assert not (templates_dir / JOURNAL_FILE).exists()
+    with open(templates_dir / INDEX_FILE) as f:
+        index = json.load(f)
+    assert [entry["id"] for entry in index] == [second.id, first.id]
+    assert all("content" not in entry for entry in index)
+
+    reloaded = TemplateManager()
+    assert [template.name for template in reloaded.list_templates()] == ["a", "c"]
+    assert reloaded.get_template(first.id).content == "B"
+
+
+def test_torn_journal_entry_is_ignored(templates_dir):
+    """Test that a partially written trailing journal record does not lose earlier changes."""
+    manager = TemplateManager()
+    template = manager.create_template(TemplateCreate(name="greeting", content="Hello"))
+    with open(templates_dir / JOURNAL_FILE, "a") as f:
+        f.write('{"op":"delete","id"')
+
+    reloaded = TemplateManager()
+
+    assert reloaded.get_template(template.id).content == "Hello"
+
+
+def test_list_templates_is_ordered_by_name(templates_dir):
+    """Test that listing follows the name order, also after a rename."""
+    manager = TemplateManager()
+    for name in ["beta", "Alpha", "gamma"]:
+        manager.create_template(TemplateCreate(name=name, content=name))
+    gamma = next(t for t in manager.templates.values() if t.name == "gamma")
+
+    manager.update_template(gamma.id, TemplateUpdate(name="aardvark"))
+
+    assert [t.name for t in manager.list_templates()] == ["aardvark", "Alpha", "beta"]
+    assert [t.name for t in manager.list_templates(skip=1, limit=1)] == ["Alpha"]
+
+
+def test_templates_are_compiled_lazily(templates_dir, monkeypatch):
+    """Test that templates compile on first use into a bounded cache that content updates invalidate."""
+    monkeypatch.setattr(template_manager_module.settings, "TEMPLATE_CACHE_SIZE", 1)
+    manager = TemplateManager()
+    first = manager.create_template(TemplateCreate(name="first", content="Hello {{ name }}"))
+    second = manager.create_template(TemplateCreate(name="second", content="Bye {{ name }}"))
+    assert len(manager.promplate_templates) == 0
+
+    assert manager.render_template(first.id, {"name": "Ada"}) == "Hello Ada"
+    assert manager.get_promplate_template(first.id) is manager.get_promplate_template(first.id)
+
+    manager.render_template(second.id, {"name": "Ada"})
+    assert list(manager.promplate_templates) == [second.id]
+
+    manager.update_template(second.id, TemplateUpdate(content="Ciao {{ name }}"))
+    assert second.id not in manager.promplate_templates
+    assert manager.render_template(second.id, {"name": "Ada"}) == "Ciao Ada"
@@ -0,0 +1,98 @@
+"""
+Tests for the token counters of the Prompt MCP Server.
+"""
+
+import base64
+
+import pytest
+
+from src.prompt_mcp_server.prompt_mcp_server.core import token_counter as token_counter_module
+from src.prompt_mcp_server.prompt_mcp_server.core.token_counter import (
+    BPETokenCounter,
+    CachedTokenCounter,
+    HeuristicTokenCounter,
+    TokenCounter,
+    get_token_counter,
+    load_vocab,
+)
+
+MERGES = [b"he", b"ll", b"hell", b"hello"]
+
+
+class RecordingCounter(TokenCounter):
+    """Token counter that records the texts it was asked to count."""
+
+    name = "recording"
+
+    def __init__(self):
+        self.counted = []
+
+    def count(self, text):
+        self.counted.append(text)
+        return len(text)
+
+
+@pytest.fixture
+def vocab_dir(tmp_path):
+    """Fixture for a directory with a small ``.tiktoken`` vocabulary."""
+    tokens = [bytes([i]) for i in range(256)] + MERGES
+    with open(tmp_path / "tiny.tiktoken", "wb") as f:
+        for rank, token in enumerate(tokens):
+            f.write(base64.b64encode(token) + b" " + str(rank).encode() + b"\n")
+    return tmp_path
+
+
+def test_heuristic_counts_characters_per_token():
+    """Test that the heuristic counter divides the length by the characters per token."""
+    counter = HeuristicTokenCounter()
+
+    assert counter.count("") == 0
+    assert counter.count("abcdefghi") == 2
+    assert counter.count_batch(["abcd", "abcdefgh"]) == [1, 2]
+
+
+def test_missing_vocabulary_falls_back_to_heuristic(tmp_path):
+    """Test that a missing vocabulary file yields a shared heuristic counter."""
+    counter = get_token_counter("missing", str(tmp_path), cache_size=8)
+
+    assert counter.name == "heuristic"
+    assert counter.count("abcdefgh") == 2
+    assert get_token_counter("missing", str(tmp_path), cache_size=8) is counter
+
+
+def test_bpe_counter_merges_by_rank(vocab_dir):
+    """Test that the BPE counter applies the vocabulary's merges."""
+    counter = get_token_counter("tiny", str(vocab_dir), cache_size=8)
+
+    assert counter.name == "bpe"
+    assert counter.count("hello") == 1
+    assert counter.count("hellx") == 2
+    assert counter.count("xyz") == 3
+    assert counter.count("") == 0
+
+
+def test_bpe_batch_matches_single_counts_in_worker_processes(vocab_dir, monkeypatch):
+    """Test that a batch above the parallel threshold counts the same as one text at a time."""
+    counter = BPETokenCounter("tiny", load_vocab(vocab_dir / "tiny.tiktoken"))
+    texts = ["hello", "hellx", "xyz", "hello hello"]
+    monkeypatch.setattr(token_counter_module, "PARALLEL_BATCH_THRESHOLD", 1)
+
+    assert counter.count_batch(texts, max_workers=2) == [counter.count(text) for text in texts]
+
+
+def test_cached_counter_memoises_counts():
+    """Test that repeated texts are counted once and batches only delegate misses."""
+    inner = RecordingCounter()
+    counter = CachedTokenCounter(inner, max_size=2)
+
+    assert counter.count("abc") == 3
+    assert counter.count("abc") == 3
+    assert counter.count_batch(["abc", "de", "abc", "f"]) == [3, 2, 3, 1]
+
+    assert inner.counted == ["abc", "de", "f"]
+    stats = counter.get_stats()
+    assert (stats["size"], stats["hits"], stats["misses"]) == (2, 3, 3)
+
+    # "abc" was evicted by the bounded cache and is counted again
+    counter.count("abc")
+    assert inner.counted[-1] == "abc"
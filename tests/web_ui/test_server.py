@@ -0,0 +1,69 @@
+"""
+Tests für die Ereignis-Routen der Web-UI.
+"""
+
+import asyncio
+import importlib
+import json
+import os
+import sys
+
+import aiohttp
+import pytest
+
+from src.workflow.orchestrator import (
+    DelayNodeExecutor, WorkflowDefinition, WorkflowNode, WorkflowOrchestrator
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="module")
+def web_ui(tmp_path_factory):
+    """Fixture für das Modul der Web-UI, das beim Import Log-Dateien im Arbeitsverzeichnis anlegt."""
+    sys.path.append(os.path.join(ROOT, "scripts", "common", "python"))
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("web_ui"))
+    try:
+        yield importlib.import_module("src.web_ui.server")
+    finally:
+        os.chdir(cwd)
+
+
+def test_main_uses_workflow_orchestrator(web_ui):
+    """Der Server aus main() bekommt den globalen Orchestrator."""
+    from src.workflow.orchestrator import orchestrator
+
+    assert web_ui.load_orchestrator() is orchestrator
+
+
+@pytest.mark.asyncio
+async def test_execution_events_as_server_sent_events(web_ui, tmp_path):
+    """Die Ereignisse einer Ausführung werden als Server-Sent Events gestreamt."""
+    orchestrator = WorkflowOrchestrator()
+    orchestrator.register_node_executor(DelayNodeExecutor())
+    orchestrator.register_workflow(WorkflowDefinition(
+        id="delay",
+        name="Delay",
+        nodes={"wait": WorkflowNode(id="wait", type="delay", name="Wait", config={"duration": 0.2})},
+    ))
+    server = web_ui.DevServerWebUI(tmp_path / "config.json", orchestrator=orchestrator)
+    runner = await server.start_server("127.0.0.1", 0)
+    host, port = runner.addresses[0][:2]
+
+    try:
+        execution_id = await orchestrator.execute_workflow("delay")
+        url = f"http://{host}:{port}/api/workflows/executions/{execution_id}/events"
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                assert response.headers["Content-Type"] == "text/event-stream"
+                body = await asyncio.wait_for(response.text(), 5)
+    finally:
+        await runner.cleanup()
+
+    types = [line[len("event: "):] for line in body.splitlines() if line.startswith("event: ")]
+    # Was vor dem Abonnement geschah, steht im Snapshot
+    assert types[0] == "snapshot"
+    assert types[-2:] == ["node_completed", "workflow_completed"]
+    data = [json.loads(line[len("data: "):]) for line in body.splitlines() if line.startswith("data: ")]
+    assert {event["execution_id"] for event in data} == {execution_id}
@@ -0,0 +1,16 @@
+"""
+Fixtures for the workflow tests.
+"""
+
+import pytest
+
+from src.workflow.orchestrator import DelayNodeExecutor, TransformNodeExecutor, WorkflowOrchestrator
+
+
+@pytest.fixture
+def orchestrator():
+    """Fixture for an orchestrator with delay and transform nodes."""
+    orchestrator = WorkflowOrchestrator()
+    orchestrator.register_node_executor(DelayNodeExecutor())
+    orchestrator.register_node_executor(TransformNodeExecutor())
+    return orchestrator
@@ -0,0 +1,87 @@
+"""
+Tests for the admission control of workflow executions.
+"""
+
+import asyncio
+
+import pytest
+
+from src.workflow.admission import AdmissionController, AdmissionRejectedError
+from src.workflow.orchestrator import WorkflowDefinition, WorkflowExecution, WorkflowNode, WorkflowStatus
+
+
+def delay_workflow(workflow_id="delay", duration=0.05, **metadata):
+    """Create a workflow with a single delay node."""
+    return WorkflowDefinition(
+        id=workflow_id,
+        name=workflow_id,
+        nodes={"wait": WorkflowNode(id="wait", type="delay", name="Wait", config={"duration": duration})},
+        metadata=metadata,
+    )
+
+
+@pytest.mark.asyncio
+async def test_queued_execution_starts_after_release(orchestrator):
+    """Test that a queued execution starts when the running one finishes."""
+    orchestrator.admission = AdmissionController(max_concurrent=1)
+    orchestrator.register_workflow(delay_workflow())
+
+    first = await orchestrator.execute_workflow("delay")
+    second = await orchestrator.execute_workflow("delay")
+    assert orchestrator.get_execution(second).status == WorkflowStatus.PENDING
+
+    await asyncio.sleep(0.3)
+
+    assert orchestrator.get_execution(first).status == WorkflowStatus.COMPLETED
+    assert orchestrator.get_execution(second).status == WorkflowStatus.COMPLETED
+    assert orchestrator.admission.get_metrics()["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_before_start_releases_slot(orchestrator):
+    """Test that canceling an execution before its task ran releases the admission slot."""
+    orchestrator.admission = AdmissionController(max_concurrent=1)
+    orchestrator.register_workflow(delay_workflow())
+
+    first = await orchestrator.execute_workflow("delay")
+    await orchestrator.cancel_execution(first)
+    await asyncio.sleep(0.01)
+
+    assert orchestrator.admission.get_metrics()["running"] == 0
+
+    second = await orchestrator.execute_workflow("delay")
+    await asyncio.sleep(0.2)
+    assert orchestrator.get_execution(second).status == WorkflowStatus.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_rejected_resume_stays_paused(orchestrator):
+    """Test that a paused execution stays paused if resuming it is rejected."""
+    orchestrator.admission = AdmissionController(max_concurrent=1)
+    orchestrator.register_workflow(delay_workflow(duration=1, admission_policy="reject"))
+    await orchestrator.execute_workflow("delay")
+
+    paused = WorkflowExecution(id="paused", workflow_id="delay", status=WorkflowStatus.PAUSED)
+    orchestrator.executions[paused.id] = paused
+
+    with pytest.raises(AdmissionRejectedError):
+        await orchestrator.resume_execution(paused.id)
+    assert paused.status == WorkflowStatus.PAUSED
+
+
+@pytest.mark.asyncio
+async def test_queued_resume_is_pending(orchestrator):
+    """Test that a resumed execution waiting for a slot is reported as pending until it runs."""
+    orchestrator.admission = AdmissionController(max_concurrent=1)
+    orchestrator.register_workflow(delay_workflow(duration=0.1))
+    running = await orchestrator.execute_workflow("delay")
+
+    paused = WorkflowExecution(id="paused", workflow_id="delay", status=WorkflowStatus.PAUSED)
+    orchestrator.executions[paused.id] = paused
+
+    await orchestrator.resume_execution(paused.id)
+    assert paused.status == WorkflowStatus.PENDING
+
+    await asyncio.sleep(0.4)
+    assert orchestrator.get_execution(running).status == WorkflowStatus.COMPLETED
+    assert paused.status == WorkflowStatus.COMPLETED
@@ -0,0 +1,257 @@
+"""
+Tests for the workflow execution checkpoints.
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+
+import pytest
+
+from src.workflow.checkpoint import CheckpointStore, decode, encode
+from src.workflow.orchestrator import (
+    NodeExecution, NodeExecutor, NodeStatus, WorkflowDefinition, WorkflowExecution, WorkflowNode,
+    WorkflowOrchestrator, WorkflowStatus
+)
+
+
+class CountingNodeExecutor(NodeExecutor):
+    """Executor adding one to its input value and recording the executed nodes."""
+
+    def __init__(self):
+        super().__init__("count")
+        self.executed = []
+
+    async def execute(self, node, inputs, context):
+        self.executed.append(node.id)
+        return {"value": inputs.get("value", 0) + 1}
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    """Fixture for the path of a checkpoint database."""
+    return tmp_path / "checkpoints.db"
+
+
+@pytest.fixture
+def store(db_file):
+    """Fixture for a checkpoint store."""
+    store = CheckpointStore(db_file)
+    yield store
+    store.close()
+
+
+def chain_workflow(version="1.0.0"):
+    """Create a workflow of two counting nodes, where b depends on a."""
+    return WorkflowDefinition(
+        id="chain",
+        name="Chain",
+        version=version,
+        nodes={
+            "a": WorkflowNode(id="a", type="count", name="A", inputs={"value": 1}),
+            "b": WorkflowNode(id="b", type="count", name="B", inputs={"value": "node.a.value"}, dependencies=["a"]),
+        },
+        outputs={"result": "node.b.value"},
+    )
+
+
+def interrupted_execution(status=WorkflowStatus.RUNNING):
+    """Create an execution of the chain workflow that stopped after node a."""
+    return WorkflowExecution(
+        id="interrupted",
+        workflow_id="chain",
+        status=status,
+        node_executions={"a": NodeExecution(node_id="a", status=NodeStatus.COMPLETED, outputs={"value": 2})},
+    )
+
+
+def checkpoint(db_file, execution, version="1.0.0"):
+    """Checkpoint an execution and its nodes as if the process stopped afterwards."""
+    store = CheckpointStore(db_file)
+    store.save_execution(execution, version)
+    for node_execution in execution.node_executions.values():
+        store.save_node(execution.id, node_execution)
+    store.close()
+
+
+def recovering_orchestrator(db_file, version="1.0.0"):
+    """Create an orchestrator as after a restart."""
+    orchestrator = WorkflowOrchestrator(checkpoints=CheckpointStore(db_file))
+    executor = CountingNodeExecutor()
+    orchestrator.register_node_executor(executor)
+    orchestrator.register_workflow(chain_workflow(version))
+    return orchestrator, executor
+
+
+async def wait_for_status(orchestrator, execution_id, status):
+    """Wait until an execution reached a status."""
+    for _ in range(200):
+        if orchestrator.get_execution(execution_id).status == status:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Execution did not reach status {status}")
+
+
+def test_encode_roundtrip():
+    """Test that small and large values are encoded compactly and decoded again."""
+    small = {"a": 1}
+    large = {"items": ["value"] * 1000}
+
+    assert encode(None) is None
+    assert encode(small) == b'j{"a":1}'
+    assert decode(encode(small)) == small
+    assert encode(large)[:1] == b"z"
+    assert decode(encode(large)) == large
+
+
+def test_save_and_load_unfinished(store):
+    """Test that unfinished executions are loaded with their settled nodes."""
+    execution = interrupted_execution()
+    execution.inputs = {"x": 1}
+    store.save_execution(execution, "1.0.0")
+    store.save_node(execution.id, execution.node_executions["a"])
+
+    finished = WorkflowExecution(id="finished", workflow_id="chain", status=WorkflowStatus.COMPLETED)
+    # Writes are queued in order, so the others are stored once the last one is
+    store.save_execution(finished, "1.0.0").result()
+
+    loaded = store.load_unfinished()
+    assert len(loaded) == 1
+    version, data = loaded[0]
+    assert version == "1.0.0"
+    assert data["id"] == "interrupted"
+    assert data["status"] == "running"
+    assert data["inputs"] == {"x": 1}
+    assert data["node_executions"]["a"]["status"] == "completed"
+    assert data["node_executions"]["a"]["outputs"] == {"value": 2}
+
+
+def test_finished_execution_drops_nodes(store):
+    """Test that the nodes of an execution are deleted once it finished."""
+    execution = interrupted_execution()
+    store.save_execution(execution, "1.0.0")
+    store.save_node(execution.id, execution.node_executions["a"])
+
+    execution.status = WorkflowStatus.COMPLETED
+    store.save_execution(execution, "1.0.0").result()
+
+    assert store.load_unfinished() == []
+    with store._lock:
+        assert store._connection.execute("SELECT COUNT(*) FROM nodes").fetchone()[0] == 0
+
+
+def test_save_snapshots_execution(store):
+    """Test that changes made after queueing a checkpoint do not reach it."""
+    release = threading.Event()
+    store.defer(release.wait)
+
+    execution = interrupted_execution()
+    execution.metadata = {"step": 1}
+    store.save_execution(execution, "1.0.0")
+    store.save_node(execution.id, execution.node_executions["a"])
+
+    # The event loop keeps changing the execution while the writer is busy
+    execution.metadata["step"] = 2
+    execution.node_executions["a"].outputs["value"] = 99
+    release.set()
+
+    (version, data), = asyncio.run(store.call(store.load_unfinished))
+    assert data["metadata"] == {"step": 1}
+    assert data["node_executions"]["a"]["outputs"] == {"value": 2}
+
+
+@pytest.mark.asyncio
+async def test_recover_continues_after_settled_nodes(db_file):
+    """Test that a recovered execution only runs the nodes that had not settled."""
+    checkpoint(db_file, interrupted_execution())
+    orchestrator, executor = recovering_orchestrator(db_file)
+
+    assert await orchestrator.recover_executions() == ["interrupted"]
+    await wait_for_status(orchestrator, "interrupted", WorkflowStatus.COMPLETED)
+
+    assert executor.executed == ["b"]
+    assert orchestrator.get_execution("interrupted").outputs == {"result": 3}
+
+    orchestrator.checkpoints.close()
+    assert CheckpointStore(db_file).load_unfinished() == []
+
+
+@pytest.mark.asyncio
+async def test_recover_restarts_changed_workflow(db_file):
+    """Test that an execution of a workflow that changed since the checkpoint starts over."""
+    checkpoint(db_file, interrupted_execution())
+    orchestrator, executor = recovering_orchestrator(db_file, version="2.0.0")
+
+    await orchestrator.recover_executions()
+    await wait_for_status(orchestrator, "interrupted", WorkflowStatus.COMPLETED)
+
+    assert executor.executed == ["a", "b"]
+    assert orchestrator.get_execution("interrupted").outputs == {"result": 3}
+    orchestrator.checkpoints.close()
+
+
+@pytest.mark.asyncio
+async def test_recovered_paused_execution_resumes(db_file):
+    """Test that a paused execution stays paused after recovery until it is resumed."""
+    checkpoint(db_file, interrupted_execution(WorkflowStatus.PAUSED))
+    orchestrator, executor = recovering_orchestrator(db_file)
+
+    await orchestrator.recover_executions()
+    await asyncio.sleep(0.05)
+    assert orchestrator.get_execution("interrupted").status == WorkflowStatus.PAUSED
+    assert executor.executed == []
+
+    await orchestrator.resume_execution("interrupted")
+    await wait_for_status(orchestrator, "interrupted", WorkflowStatus.COMPLETED)
+
+    assert executor.executed == ["b"]
+    orchestrator.checkpoints.close()
+
+
+@pytest.mark.asyncio
+async def test_memoized_outputs_are_reused(db_file):
+    """Test that memoised node outputs are reused by executions after a restart."""
+    for expected in (["a", "b"], ["b"]):
+        orchestrator, executor = recovering_orchestrator(db_file)
+        orchestrator.get_workflow("chain").nodes["a"].metadata["memoize"] = True
+
+        execution_id = await orchestrator.execute_workflow("chain")
+        await wait_for_status(orchestrator, execution_id, WorkflowStatus.COMPLETED)
+
+        assert executor.executed == expected
+        assert orchestrator.get_execution(execution_id).outputs == {"result": 3}
+        orchestrator.checkpoints.close()
+
+
+@pytest.mark.parametrize("outputs", [
+    {"when": datetime(2024, 1, 1)},
+    {"pair": (1, 2)},
+    {"by_id": {1: "a"}},
+    {"data": b"bytes"},
+])
+def test_outputs_changed_by_json_are_not_stored(store, outputs):
+    """Test that node outputs which JSON would restore with other types are not stored."""
+    execution = interrupted_execution()
+    execution.node_executions["a"].outputs = outputs
+
+    assert store.put_memo("key", outputs) is None
+    assert store.save_node(execution.id, execution.node_executions["a"]) is None
+    store.save_execution(execution, "1.0.0").result()
+
+    assert store.get_memo("key") is None
+    assert store.load_unfinished()[0][1]["node_executions"] == {}
+
+
+@pytest.mark.asyncio
+async def test_node_without_checkpoint_runs_again(db_file):
+    """Test that a settled node that could not be checkpointed runs again on recovery."""
+    execution = interrupted_execution()
+    execution.node_executions["a"].outputs = {"value": 2, "at": datetime(2024, 1, 1)}
+    checkpoint(db_file, execution)
+    orchestrator, executor = recovering_orchestrator(db_file)
+
+    await orchestrator.recover_executions()
+    await wait_for_status(orchestrator, "interrupted", WorkflowStatus.COMPLETED)
+
+    assert executor.executed == ["a", "b"]
+    orchestrator.checkpoints.close()
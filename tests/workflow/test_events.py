@@ -0,0 +1,136 @@
+"""
+Tests for the workflow execution events.
+"""
+
+import asyncio
+
+import pytest
+
+from src.workflow import events
+from src.workflow.events import ExecutionEventBus
+from src.workflow.orchestrator import WorkflowDefinition, WorkflowNode
+
+
+def publish(bus, count, execution_id="e1", workflow_id="w1", type=events.NODE_COMPLETED):
+    """Publish a number of node events."""
+    for i in range(count):
+        bus.publish(type, execution_id, workflow_id, node_id=f"n{i}")
+
+
+async def drain(subscription):
+    """Collect the events delivered to a subscription until it ends."""
+    return [event async for event in subscription]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_and_unsubscribe():
+    """Test that a closed subscription ends and receives no further events."""
+    bus = ExecutionEventBus()
+    assert not bus.active
+
+    async with bus.subscribe() as subscription:
+        assert bus.active
+        publish(bus, 2)
+        assert [(await subscription.next()).node_id for _ in range(2)] == ["n0", "n1"]
+        assert await subscription.next(timeout=0.01) is None
+
+    assert not bus.active
+    publish(bus, 1)
+    with pytest.raises(StopAsyncIteration):
+        await subscription.next()
+
+
+@pytest.mark.asyncio
+async def test_filters():
+    """Test that subscribers only receive events of their execution or workflow."""
+    bus = ExecutionEventBus()
+    by_execution = bus.subscribe(execution_id="e1")
+    by_workflow = bus.subscribe(workflow_id="w2")
+    everything = bus.subscribe()
+
+    publish(bus, 1, execution_id="e1", workflow_id="w1")
+    publish(bus, 1, execution_id="e2", workflow_id="w2")
+    publish(bus, 1, execution_id="e3", workflow_id="w2", type=events.WORKFLOW_COMPLETED)
+    publish(bus, 1, execution_id="e1", workflow_id="w1", type=events.WORKFLOW_COMPLETED)
+    by_workflow.close()
+    everything.close()
+
+    assert [event.execution_id for event in await drain(by_execution)] == ["e1", "e1"]
+    assert [event.execution_id for event in await drain(by_workflow)] == ["e2", "e3"]
+    assert [event.execution_id for event in await drain(everything)] == ["e1", "e2", "e3", "e1"]
+    assert not bus.active
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_gets_resync():
+    """Test that a subscriber falling behind gets a resync instead of the dropped events."""
+    bus = ExecutionEventBus()
+    slow = bus.subscribe(max_queue_size=3)
+    fast = bus.subscribe()
+
+    publish(bus, 5)
+
+    resync = await slow.next()
+    assert resync.type == events.RESYNC
+    assert resync.data == {"dropped": 4}
+    assert (await slow.next()).node_id == "n4"
+    assert slow.dropped == 4
+
+    # Other subscribers are not affected
+    assert [(await fast.next()).node_id for _ in range(5)] == ["n0", "n1", "n2", "n3", "n4"]
+
+
+@pytest.mark.asyncio
+async def test_repeated_overflow_counts_all_dropped_events():
+    """Test that a resync replacing an earlier one accounts for its dropped events."""
+    bus = ExecutionEventBus()
+    subscription = bus.subscribe(max_queue_size=2)
+
+    publish(bus, 5)
+
+    resync = await subscription.next()
+    assert resync.type == events.RESYNC
+    assert resync.data == {"dropped": 5}
+    assert subscription.dropped == 5
+    assert await subscription.next(timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_dropped_terminal_event_ends_execution_subscription():
+    """Test that a subscription to one execution ends when its last event was dropped."""
+    bus = ExecutionEventBus()
+    subscription = bus.subscribe(execution_id="e1", max_queue_size=2)
+
+    publish(bus, 2)
+    publish(bus, 1, type=events.WORKFLOW_COMPLETED)
+
+    received = await drain(subscription)
+    assert [event.type for event in received] == [events.RESYNC]
+    assert not bus.active
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_streams_one_execution(orchestrator):
+    """Test that a subscriber to an execution receives a snapshot and only its events."""
+    orchestrator.register_workflow(WorkflowDefinition(
+        id="delay",
+        name="Delay",
+        nodes={"wait": WorkflowNode(id="wait", type="delay", name="Wait", config={"duration": 0.01})},
+    ))
+    first = await orchestrator.execute_workflow("delay")
+    second = await orchestrator.execute_workflow("delay")
+
+    subscription = orchestrator.subscribe(execution_id=first)
+    received = await asyncio.wait_for(drain(subscription), 5)
+
+    assert received[0].type == events.SNAPSHOT
+    assert received[0].data["status"] == "pending"
+    assert [event.type for event in received[1:]] == [
+        events.WORKFLOW_STARTED, events.NODE_STARTED, events.NODE_COMPLETED, events.WORKFLOW_COMPLETED
+    ]
+    assert {event.execution_id for event in received} == {first}
+    assert second != first
+
+    # Subscribing to a finished execution only delivers its snapshot
+    finished = await drain(orchestrator.subscribe(execution_id=first))
+    assert [(event.type, event.data["status"]) for event in finished] == [(events.SNAPSHOT, "completed")]
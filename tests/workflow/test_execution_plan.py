@@ -0,0 +1,186 @@
+"""
+Tests for compiled workflow execution plans.
+"""
+
+import asyncio
+import pickle
+
+import pytest
+
+from src.workflow.orchestrator import (
+    ExecutionContext,
+    ExecutionPlan,
+    NodeExecutor,
+    NodeStatus,
+    WorkflowDefinition,
+    WorkflowNode,
+    WorkflowStatus,
+    WorkflowValidationError,
+)
+
+
+class RecordingNodeExecutor(NodeExecutor):
+    """Executor that returns its "value" input and records the context it saw."""
+
+    def __init__(self):
+        super().__init__("record")
+        self.contexts = {}
+
+    async def execute(self, node, inputs, context):
+        self.contexts[node.id] = context
+        return {"value": inputs.get("value")}
+
+
+def record_node(node_id, inputs=None, **kwargs):
+    """Create a recording node."""
+    return WorkflowNode(id=node_id, type="record", name=node_id.upper(), inputs=inputs or {}, **kwargs)
+
+
+def pipeline_workflow(version="1.0.0"):
+    """Create a workflow with explicit, edge-only and conditional dependencies.
+
+    a -> b (explicit), a -> c (edge only), b and c -> d, e runs only if a produced a large value.
+    """
+    return WorkflowDefinition(
+        id="pipeline",
+        name="Pipeline",
+        version=version,
+        nodes={
+            "d": record_node("d", {"value": "node.b.value", "other": "node.c.value"}, dependencies=["b", "c"]),
+            "b": record_node("b", {"value": "node.a.value", "unknown": "node.missing.value"}, dependencies=["a"]),
+            "c": record_node("c", {"value": "context.workflow_id"}),
+            "a": record_node("a", {"value": "workflow.inputs.start", "fixed": 3}),
+            "e": record_node("e", {"value": 1}, dependencies=["a"], condition="node_a_outputs['value'] > 10"),
+        },
+        edges=[{"source": "a", "target": "c"}],
+        outputs={"result": "node.d.value", "skipped": "node.e.value"},
+    )
+
+
+@pytest.fixture
+def recorder(orchestrator):
+    """Fixture for a recording executor registered with the orchestrator."""
+    executor = RecordingNodeExecutor()
+    orchestrator.register_node_executor(executor)
+    return executor
+
+
+async def run(orchestrator, workflow_id, inputs):
+    """Execute a workflow and wait until it finished."""
+    execution_id = await orchestrator.execute_workflow(workflow_id, inputs)
+    for _ in range(200):
+        execution = orchestrator.get_execution(execution_id)
+        if execution.status in (WorkflowStatus.COMPLETED, WorkflowStatus.FAILED):
+            return execution
+        await asyncio.sleep(0.01)
+    raise AssertionError("Execution did not finish")
+
+
+def test_compile_orders_nodes_and_collects_dependencies():
+    """Test that a plan maps nodes to topological slots and merges edge dependencies."""
+    plan = ExecutionPlan.compile(pipeline_workflow())
+
+    assert set(plan.order) == {"a", "b", "c", "d", "e"}
+    assert plan.order.index("a") < plan.order.index("b") < plan.order.index("d")
+    assert plan.order.index("c") < plan.order.index("d")
+    assert {node_id: plan.index[node_id] for node_id in plan.order} == {
+        node_id: slot for slot, node_id in enumerate(plan.order)
+    }
+    assert plan.dependencies[plan.index["c"]] == ("a",)
+    assert sorted(plan.dependents[plan.index["a"]]) == sorted(plan.index[n] for n in ("b", "c", "e"))
+    assert plan.dependency_slots[plan.index["d"]] == (plan.index["b"], plan.index["c"])
+
+
+def test_compile_parses_references_and_conditions():
+    """Test that references become bindings and conditions are compiled once."""
+    plan = ExecutionPlan.compile(pipeline_workflow())
+
+    a_inputs = dict((name, (kind, key, slot)) for name, kind, key, slot in plan.inputs[plan.index["a"]])
+    b_inputs = dict((name, (kind, key, slot)) for name, kind, key, slot in plan.inputs[plan.index["b"]])
+    assert a_inputs["fixed"][1:] == (3, -1)
+    assert a_inputs["value"][1] == "start"
+    assert b_inputs["value"][1:] == ("value", plan.index["a"])
+    # References to unknown nodes can never resolve and are left out
+    assert "unknown" not in b_inputs
+
+    condition = plan.conditions[plan.index["e"]]
+    assert condition is not None and not isinstance(condition, str)
+    assert plan.conditions[plan.index["a"]] is None
+
+
+def test_dependency_cycles_are_rejected(orchestrator):
+    """Test that cycles through explicit dependencies fail validation and compilation."""
+    workflow = WorkflowDefinition(
+        id="cycle",
+        name="Cycle",
+        nodes={
+            "a": record_node("a", dependencies=["b"]),
+            "b": record_node("b", dependencies=["a"]),
+        },
+    )
+
+    assert "Workflow contains cycles" in workflow.validate()
+    with pytest.raises(WorkflowValidationError):
+        orchestrator.register_workflow(workflow)
+    with pytest.raises(WorkflowValidationError):
+        ExecutionPlan.compile(workflow)
+
+
+def test_plan_is_cached_until_the_workflow_changes(orchestrator):
+    """Test that the plan is reused and recompiled for a new version or definition."""
+    workflow = pipeline_workflow()
+    orchestrator.register_workflow(workflow)
+    plan = orchestrator._get_plan(workflow)
+    assert orchestrator._get_plan(workflow) is plan
+
+    workflow.version = "1.1.0"
+    recompiled = orchestrator._get_plan(workflow)
+    assert recompiled is not plan
+    assert recompiled.version == "1.1.0"
+
+    replacement = pipeline_workflow("1.1.0")
+    orchestrator.register_workflow(replacement)
+    assert orchestrator._get_plan(replacement).workflow is replacement
+
+
+@pytest.mark.asyncio
+async def test_execution_resolves_bindings_from_slots(orchestrator, recorder):
+    """Test that node inputs, conditions and workflow outputs are resolved from the plan."""
+    orchestrator.register_workflow(pipeline_workflow())
+
+    execution = await run(orchestrator, "pipeline", {"start": 5})
+
+    assert execution.status == WorkflowStatus.COMPLETED
+    nodes = execution.node_executions
+    assert nodes["a"].inputs == {"value": 5, "fixed": 3}
+    assert nodes["b"].outputs == {"value": 5}
+    assert nodes["c"].outputs == {"value": "pipeline"}
+    assert nodes["d"].inputs == {"value": 5, "other": "pipeline"}
+    assert nodes["e"].status == NodeStatus.SKIPPED
+    assert execution.outputs == {"result": 5}
+
+    # Condition on a completed node's outputs
+    execution = await run(orchestrator, "pipeline", {"start": 50})
+    assert execution.node_executions["e"].status == NodeStatus.COMPLETED
+    assert execution.outputs["skipped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_node_outputs_are_read_from_slots(orchestrator, recorder):
+    """Test that the context serves node outputs without copying them into its values."""
+    orchestrator.register_workflow(pipeline_workflow())
+
+    await run(orchestrator, "pipeline", {"start": 5})
+
+    context = recorder.contexts["d"]
+    assert isinstance(context, ExecutionContext)
+    assert context["node_a_outputs"] == {"value": 5}
+    assert context["node_b_outputs"] == {"value": 5}
+    assert "node_a_outputs" not in context.values
+    assert "node_e_outputs" not in context
+    assert context["workflow_id"] == "pipeline"
+    assert len(context) == len(list(context))
+
+    copied = pickle.loads(pickle.dumps(context))
+    assert type(copied) is dict
+    assert copied == dict(context)
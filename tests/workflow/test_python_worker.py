@@ -0,0 +1,153 @@
+"""
+Tests for the Python node worker pool.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.workflow.orchestrator import PythonNodeExecutor, WorkflowDefinition, WorkflowNode, WorkflowStatus
+from src.workflow.python_worker import CPUTimeLimitExceeded, PythonWorkerPool, RemoteTraceback
+
+
+@pytest.fixture
+def pool():
+    """Fixture for a pool with a single worker."""
+    pool = PythonWorkerPool(size=1)
+    yield pool
+    asyncio.run(pool.close())
+
+
+async def run(pool, code, **kwargs):
+    """Run node code in the pool."""
+    return await pool.run(
+        key=str(hash(code)),
+        code=code,
+        node_id="node",
+        inputs=kwargs.pop("inputs", {}),
+        context={},
+        allowed_modules=kwargs.pop("allowed_modules", []),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_outputs(pool):
+    """Test that the outputs of the code are returned."""
+    outputs = await run(pool, "outputs = {'sum': inputs['a'] + inputs['b']}", inputs={"a": 1, "b": 2})
+    assert outputs == {"sum": 3}
+
+
+@pytest.mark.asyncio
+async def test_timeout_replaces_worker(pool):
+    """Test that a worker exceeding the timeout is replaced by a fresh one."""
+    await pool.start()
+    worker = pool._workers[0]
+
+    with pytest.raises(TimeoutError):
+        await run(pool, "while True:\n    pass", timeout=0.5)
+
+    assert not worker.process.is_alive()
+    assert len(pool._workers) == 1
+    assert pool._workers[0] is not worker
+    assert pool.get_stats()["timeouts"] == 1
+
+    # The replacement executes the next node
+    assert await run(pool, "outputs = 42") == {"result": 42}
+
+
+@pytest.mark.asyncio
+async def test_cpu_time_limit(pool):
+    """Test that code exceeding its CPU time limit is stopped without losing the worker."""
+    await pool.start()
+    worker = pool._workers[0]
+
+    with pytest.raises(CPUTimeLimitExceeded):
+        await run(pool, "while True:\n    pass", cpu_time_limit=1, timeout=30)
+
+    # The limit is lifted again, so the worker keeps running further nodes
+    assert pool._workers == [worker]
+    assert await run(pool, "outputs = sum(range(1000))") == {"result": 499500}
+
+
+@pytest.mark.asyncio
+async def test_disallowed_module(pool):
+    """Test that only allowed modules are available to the code."""
+    code = "outputs = {'value': json.dumps([1])}"
+
+    with pytest.raises(NameError) as info:
+        await run(pool, code)
+    assert isinstance(info.value.__cause__, RemoteTraceback)
+
+    assert await run(pool, code, allowed_modules=["json"]) == {"value": "[1]"}
+
+
+@pytest.mark.asyncio
+async def test_disallowed_import(pool):
+    """Test that the code cannot import modules that are not allowed."""
+    with pytest.raises(ImportError, match="'os' is not allowed"):
+        await run(pool, "import os\noutputs = os.getcwd()")
+
+    with pytest.raises(ImportError, match="'os.path' is not allowed"):
+        await run(pool, "from os.path import join", allowed_modules=["json"])
+
+    code = "import json.decoder\noutputs = {'value': json.decoder.JSONDecoder().decode('[1]')}"
+    assert await run(pool, code, allowed_modules=["json"]) == {"value": [1]}
+
+
+@pytest.mark.asyncio
+async def test_node_gets_context_values_only(orchestrator, pool):
+    """Test that Python nodes get the context values, and earlier outputs only through their inputs."""
+    orchestrator.register_node_executor(PythonNodeExecutor(pool=pool))
+    orchestrator.register_workflow(WorkflowDefinition(
+        id="python",
+        name="Python",
+        nodes={
+            "first": WorkflowNode(id="first", type="python", name="First", config={"code": "outputs = {'value': 1}"}),
+            "second": WorkflowNode(
+                id="second",
+                type="python",
+                name="Second",
+                config={"code": "outputs = {'keys': sorted(context), 'value': inputs['value'] + 1}"},
+                inputs={"value": "node.first.value"},
+                dependencies=["first"],
+            ),
+        },
+        outputs={"keys": "node.second.keys", "value": "node.second.value"},
+    ))
+
+    execution_id = await orchestrator.execute_workflow("python")
+    for _ in range(100):
+        execution = orchestrator.get_execution(execution_id)
+        if execution.status == WorkflowStatus.COMPLETED:
+            break
+        await asyncio.sleep(0.05)
+
+    assert execution.outputs == {"keys": ["execution_id", "inputs", "metadata", "workflow_id"], "value": 2}
+
+
+def test_unguarded_script_gets_clear_error(tmp_path):
+    """Test that a script without a main module guard is told to add one."""
+    script = tmp_path / "script.py"
+    script.write_text(
+        "import asyncio\n"
+        "from src.workflow.python_worker import PythonWorkerPool\n"
+        "pool = PythonWorkerPool(size=1, start_method='forkserver')\n"
+        "asyncio.run(pool.run('key', 'outputs = 1', 'node', {}, {}, [], timeout=30))\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    result = subprocess.run(
+        [sys.executable, str(script)],
+        cwd=tmp_path,
+        env=dict(os.environ, PYTHONPATH=root),
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode != 0
+    assert "if __name__ == \"__main__\":" in result.stderr
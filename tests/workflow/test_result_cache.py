@@ -0,0 +1,160 @@
+"""
+Tests for the node result cache.
+"""
+
+import asyncio
+
+import pytest
+
+from src.workflow.orchestrator import HttpNodeExecutor, WorkflowDefinition, WorkflowNode, WorkflowStatus
+from src.workflow.result_cache import NodeResultCache
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Fixture for a manually advanced clock."""
+    return Clock()
+
+
+@pytest.fixture
+def cache(clock):
+    """Fixture for a small result cache."""
+    return NodeResultCache(max_entries=2, default_ttl=10, clock=clock)
+
+
+def test_get_returns_copy(cache):
+    """Test that changing returned outputs does not change the cached ones."""
+    cache.put("k", {"value": 1})
+
+    outputs = cache.get("w", "n", "k")
+    outputs["value"] = 2
+
+    assert cache.get("w", "n", "k") == {"value": 1}
+
+
+def test_nested_outputs_are_copied(cache):
+    """Test that changing nested outputs after a put or a hit does not change the cached ones."""
+    outputs = {"items": [{"id": 1}]}
+    cache.put("k", outputs)
+    outputs["items"].append({"id": 2})
+
+    hit = cache.get("w", "n", "k")
+    hit["items"][0]["id"] = 3
+    hit["items"].append({"id": 4})
+
+    assert cache.get("w", "n", "k") == {"items": [{"id": 1}]}
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    """Test that the least recently used entry is evicted when the cache is full."""
+    cache.put("a", {"value": "a"})
+    cache.put("b", {"value": "b"})
+    assert cache.get("w", "n", "a") is not None
+
+    cache.put("c", {"value": "c"})
+
+    assert cache.get("w", "n", "b") is None
+    assert cache.get("w", "n", "a") == {"value": "a"}
+    assert cache.get("w", "n", "c") == {"value": "c"}
+    assert len(cache) == 2
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_entries_expire(cache, clock):
+    """Test that entries expire after their time-to-live."""
+    cache.put("default", {"value": 1})
+    cache.put("short", {"value": 2}, ttl=1)
+    cache.put("disabled", {"value": 3}, ttl=0)
+
+    clock.now += 1
+    assert cache.get("w", "n", "short") is None
+    assert cache.get("w", "n", "default") == {"value": 1}
+    assert cache.get("w", "n", "disabled") is None
+
+    clock.now += 9
+    assert cache.get("w", "n", "default") is None
+    assert len(cache) == 0
+    assert cache.get_stats()["expirations"] == 2
+
+
+def test_stats_per_node(cache):
+    """Test that hits and misses are counted per workflow and node."""
+    cache.put("k", {"value": 1})
+    cache.get("w1", "a", "k")
+    cache.get("w1", "a", "k")
+    cache.get("w1", "a", "missing")
+    cache.get("w1", "b", "missing")
+    cache.get("w2", "a", "k")
+
+    stats = cache.get_stats()
+    assert stats["entries"] == 1
+    assert stats["max_entries"] == 2
+    assert stats["nodes"]["w1"]["a"] == {"hits": 2, "misses": 1, "hit_rate": pytest.approx(2 / 3)}
+    assert stats["nodes"]["w1"]["b"] == {"hits": 0, "misses": 1, "hit_rate": 0.0}
+    assert cache.get_stats("w2")["nodes"] == {"w2": {"a": {"hits": 1, "misses": 0, "hit_rate": 1.0}}}
+
+    cache.clear()
+    assert cache.get_stats()["nodes"] == {}
+    assert len(cache) == 0
+
+
+def test_http_cacheability():
+    """Test that only successful reads of HTTP nodes are cached."""
+    executor = HttpNodeExecutor()
+    get = WorkflowNode(id="get", type="http", name="Get", config={"method": "GET"})
+    post = WorkflowNode(id="post", type="http", name="Post", config={"method": "POST"})
+
+    assert executor.is_cacheable(get, {})
+    assert not executor.is_cacheable(post, {})
+    assert executor.is_cacheable_result(get, {"status": 404})
+    assert not executor.is_cacheable_result(get, {"status": 503})
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_reuses_cached_outputs(orchestrator):
+    """Test that executions with the same node inputs reuse the cached outputs."""
+    orchestrator.register_workflow(WorkflowDefinition(
+        id="transform",
+        name="Transform",
+        inputs={"data": {"type": "object"}},
+        nodes={
+            "map": WorkflowNode(
+                id="map",
+                type="transform",
+                name="Map",
+                config={"type": "map", "mapping": {"name": "$.user"}},
+                inputs={"data": "workflow.inputs.data"},
+                metadata={"cache": True},
+            ),
+        },
+        outputs={"result": "node.map.result"},
+    ))
+
+    execution_ids = []
+    for user in ("alice", "alice", "bob"):
+        execution_ids.append(await orchestrator.execute_workflow("transform", {"data": {"user": user}}))
+        await asyncio.sleep(0.05)
+
+    executions = [orchestrator.get_execution(execution_id) for execution_id in execution_ids]
+    assert all(execution.status == WorkflowStatus.COMPLETED for execution in executions)
+    assert [execution.outputs["result"] for execution in executions] == [
+        {"name": "alice"}, {"name": "alice"}, {"name": "bob"}
+    ]
+    assert [execution.node_executions["map"].metadata.get("cache_hit", False) for execution in executions] == [
+        False, True, False
+    ]
+
+    stats = orchestrator.get_result_cache_stats("transform")
+    assert stats["entries"] == 2
+    assert stats["nodes"]["transform"]["map"]["hits"] == 1
+    assert stats["nodes"]["transform"]["map"]["misses"] == 2